@@ -49,6 +49,8 @@ TAILWIND_APP_NAME = "theme"
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Serves collected static files with far-future caching (see STORAGES)
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -120,6 +122,21 @@ USE_I18N = True
 USE_TZ = True
 
 
+# Caches
+# "pages" holds the rendered main_site pages (main_site.cache). It is
+# file-based so every worker on the host shares it and sees invalidations.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.page_cache',
+    },
+}
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
@@ -131,6 +148,22 @@ STATICFILES_DIRS = [
 # for production later:
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# collectstatic writes content-hashed copies of every file (main.abc123.js)
+# plus .gz and .br versions, and {% static %} resolves to the hashed names.
+# WhiteNoise serves hashed files as immutable, so repeat visitors don't
+# re-download JS/CSS until a deploy changes them. With DEBUG on, the
+# unhashed originals are used and collectstatic isn't needed.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+# Don't compress formats that are already compressed.
+WHITENOISE_SKIP_COMPRESS_EXTENSIONS = ["jpg", "jpeg", "png", "gif", "webp", "zip", "gz", "tgz", "bz2", "tbz", "xz", "br", "woff", "woff2", "pdf"]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -141,7 +174,23 @@ REST_FRAMEWORK = {
         'rest_framework.renderers.JSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    # Sliding-window limits used by api.throttling, per view throttle_scope
+    'DEFAULT_THROTTLE_RATES': {
+        'checkout_ip': '30/min',
+        'checkout_session': '10/min',
+        'order_status_ip': '120/min',
+        'order_status_session': '60/min',
+        # Waiting room polls come every 1-30 seconds
+        'queue_status_ip': '120/min',
+    },
 }
+# Use api.throttling.CacheWindowStore with a shared cache when running
+# more than one process.
+API_THROTTLE_STORE = 'api.throttling.LocalWindowStore'
+
+# Stripe checkout sessions expire 31-61 minutes after creation (Stripe's
+# minimum is 30), in windows of this many seconds; see CreateCheckoutSessionView.
+CHECKOUT_SESSION_TTL = 30 * 60
 
 STRIPE_SECRET_KEY = 'sk_test_51SZ0XBBzBUhSO3HmggAfeq9QUm0MHLmfnUsQP0H75oCnWfoym3IRvHgR7aV2MVT1Xo5aaYuRASCCkuI2ksyqsTOt0098VRSCQ2'  # Replace with your actual secret key
 STRIPE_PUBLISHABLE_KEY = 'pk_test_51SZ0XBBzBUhSO3HmkTTICWKMvWlOI7QYw5wrG83bh5eCdSUuPBPtfSeC430Q2YAJFU7s5ntRcVclaa0KdJhufEtR00eCr16f5I'  # Replace with your actual publishable key
@@ -151,6 +200,70 @@ STRIPE_WEBHOOK_SECRET = 'whsec_479cc753ae59ad1b171441dd0428a9375e00c9322f930bc0d
 STRIPE_RETURN_URL = 'http://localhost:8123/tickets/success'  # For development
 # STRIPE_RETURN_URL = 'https://yourdomain.com/checkout/return'  # For production
 
+# Prometheus metrics (/metrics). When running several worker processes, point
+# METRICS_MULTIPROCESS_DIR at an empty directory shared by them (clear it on deploy).
+METRICS_MULTIPROCESS_DIR = None
+METRICS_ALLOWED_IPS = ['127.0.0.1', '::1']
+
+# Rendered ticket documents (see ticketing.rendering).
+TICKET_RENDER_DIR = BASE_DIR / 'rendered_tickets'
+TICKET_RENDER_WORKERS = 2
+
+# Waiting room (ticketing.waiting_room): buyers admitted to checkout per
+# second, how many may be admitted at once after a quiet spell, and how long
+# an admission lasts. The queue is kept in the database so every worker
+# shares it; CacheQueueStore keeps it in the default cache instead, once that
+# is shared (Redis, memcached). LocalQueueStore is for a single process only.
+WAITING_ROOM_ENABLED = True
+WAITING_ROOM_ADMIT_RATE = 5
+WAITING_ROOM_BURST = 20
+WAITING_ROOM_ADMISSION_TTL = 15 * 60
+WAITING_ROOM_STORE = 'ticketing.waiting_room.DatabaseQueueStore'
+
+# Transactional email (ticketing.outbox, sent by `manage.py send_outbox`)
+DEFAULT_FROM_EMAIL = 'Kelvin Symphony Orchestra <tickets@kelvin-ensemble.co.uk>'
+EMAIL_OUTBOX_BATCH_SIZE = 50
+EMAIL_OUTBOX_RATE_PER_MINUTE = 120
+
+# Concurrent Stripe refund calls when refunding a cancelled concert
+# (ticketing.refunds). Stripe allows around 100 requests a second in live mode.
+REFUND_WORKERS = 8
+
+# Events handled at once by `manage.py catch_up_stripe_events`
+# (ticketing.stripe_events); each holds a database connection.
+STRIPE_EVENT_WORKERS = 4
+# Catch-up runs that may fail to handle an event before it is given up on
+# (logged as an error and left for staff), so the checkpoint can move past it.
+STRIPE_EVENT_MAX_ATTEMPTS = 5
+if DEBUG:
+    EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+# Structured logging for the ticketing and api apps. Handlers only enqueue
+# records; a background thread writes them out as JSON lines.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'correlation': {'()': 'ticketing.log.CorrelationFilter'},
+        'sampling': {
+            '()': 'ticketing.log.SamplingFilter',
+            # Fraction of DEBUG records kept per logger
+            'rates': {'ticketing.webhook': 0.1},
+        },
+    },
+    'handlers': {
+        'background': {
+            '()': 'ticketing.log.BackgroundHandler',
+            'stream': 'ext://sys.stdout',
+            'filters': ['correlation', 'sampling'],
+        },
+    },
+    'loggers': {
+        'ticketing': {'handlers': ['background'], 'level': 'DEBUG' if DEBUG else 'INFO', 'propagate': False},
+        'api': {'handlers': ['background'], 'level': 'DEBUG' if DEBUG else 'INFO', 'propagate': False},
+    },
+}
+
 
 if DEBUG:
     # Add django_browser_reload only in DEBUG mode
@@ -30,6 +30,7 @@ urlpatterns = [
 
     path("tickets/", ts_views.ticketing_page, name="ticketing_home"),
     path("tickets/success", ts_views.ticketing_success, name="ticketing_success"),
+    path("metrics", ts_views.metrics, name="metrics"),
 
     path('api/', include('api.urls')),  # Add this line
 
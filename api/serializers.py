@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from main_site import models as ms_models
 from ticketing import models as ts_models
 
 
@@ -14,6 +15,7 @@ class TicketTypeSummarySerializer(serializers.ModelSerializer):
             "display_ticket",
             "price",
             "description",
+            "seated",
         )
 
 
@@ -35,3 +37,20 @@ class ConcertSerializer(serializers.ModelSerializer):
             "concert_location",
             "concert_description",
         ]
+
+
+class PastConcertSearchResultSerializer(serializers.ModelSerializer):
+    date = serializers.DateField(format="%d/%m/%Y")
+    rank = serializers.FloatField()
+
+    class Meta:
+        model = ms_models.PastConcert
+        fields = [
+            "id",
+            "title",
+            "date",
+            "venue",
+            "conductor",
+            "programme",
+            "rank",
+        ]
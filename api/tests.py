@@ -1,3 +1,177 @@
-from django.test import TestCase
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api.throttling import CacheWindowStore, LocalWindowStore, parse_rate
+from main_site.models import PastConcert
+from ticketing import waiting_room
+from ticketing.codes import make_ticket_code
+from ticketing.tests import make_concert, make_ticket, make_ticket_type
+
+
+class CheckInViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user("door", is_staff=True))
+        self.concert = make_concert()
+        self.ticket = make_ticket(make_ticket_type(self.concert))
+        self.code = make_ticket_code(self.ticket.pk, self.concert.pk)
+
+    def test_offline_batch_with_naive_scan_time(self):
+        response = self.client.post("/api/tickets/check-in/", {
+            "concert_id": self.concert.pk,
+            "scans": [{"code": self.code, "scanned_at": "2020-10-19T10:00:00"}],
+        }, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["result"], "admitted")
+
+    def test_non_numeric_concert_id_is_rejected(self):
+        response = self.client.post("/api/tickets/check-in/", {"concert_id": "abc", "code": self.code}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_results_line_up_with_a_batch_holding_non_scans(self):
+        response = self.client.post("/api/tickets/check-in/", {
+            "concert_id": self.concert.pk, "scans": [None, {"code": self.code}],
+        }, format="json")
+
+        self.assertEqual([r["result"] for r in response.data["results"]], ["invalid_code", "admitted"])
+
+
+class CheckoutSessionTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        self.ticket_type = make_ticket_type(self.concert, display_ticket=True)
+        self.sessions = 0
+
+    def create_session(self, **kwargs):
+        self.sessions += 1
+        return SimpleNamespace(id=f"cs_test_{self.sessions}", client_secret=f"secret_{self.sessions}")
+
+    def checkout(self, client):
+        return client.post("/api/tickets/create-checkout-session/", {
+            "concert_id": self.concert.pk,
+            "line_items": [{"ticket_type_id": self.ticket_type.pk, "quantity": 2}],
+        }, format="json")
+
+    @override_settings(WAITING_ROOM_ENABLED=False)
+    def test_repeat_request_reuses_session_but_other_buyers_do_not(self):
+        # Both buyers share an IP address (and without the waiting room, a queue position).
+        buyer, other_buyer = APIClient(), APIClient()
+        with mock.patch("stripe.checkout.Session.create", side_effect=self.create_session):
+            first = self.checkout(buyer)
+            repeat = self.checkout(buyer)
+            other = self.checkout(other_buyer)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(repeat.data["session_id"], first.data["session_id"])
+        self.assertNotEqual(other.data["session_id"], first.data["session_id"])
+        self.assertEqual(self.sessions, 2)
+
+
+@override_settings(
+    WAITING_ROOM_ENABLED=True, WAITING_ROOM_BURST=1, WAITING_ROOM_ADMIT_RATE=0.001,
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+)
+class QueueStatusTests(TestCase):
+    def setUp(self):
+        waiting_room._store = None
+        self.addCleanup(setattr, waiting_room, "_store", None)
+
+    def test_polling_never_hands_out_places(self):
+        for _ in range(5):
+            response = APIClient().get("/api/tickets/queue/")
+            self.assertEqual(response.data, {"admitted": False, "queued": False})
+            self.assertNotIn(waiting_room.COOKIE_NAME, response.cookies)
+
+    def test_joining_from_the_tickets_page(self):
+        first, second = APIClient(), APIClient()
+        first.get("/tickets/")
+        second.get("/tickets/")
+
+        self.assertTrue(first.get("/api/tickets/queue/").data["admitted"])
+        queued = second.get("/api/tickets/queue/").data
+        self.assertEqual((queued["admitted"], queued["queued"], queued["ahead"]), (False, True, 1))
+
+    def test_polling_with_an_expired_admission_does_not_rejoin(self):
+        client = APIClient()
+        client.get("/tickets/")
+        client.cookies[waiting_room.COOKIE_NAME] = signing.dumps(
+            {"position": 1, "admitted_until": int(time.time()) - 1}, salt=waiting_room._SALT, compress=True,
+        )
+
+        with mock.patch.object(waiting_room.DatabaseQueueStore, "issue") as issue:
+            response = client.get("/api/tickets/queue/")
+
+        self.assertEqual(response.data, {"admitted": False, "queued": False})
+        issue.assert_not_called()
+
+
+class PastConcertSearchViewTests(TestCase):
+    def setUp(self):
+        self.symphony = PastConcert.objects.create(title="Beethoven's Ninth", date=date(2024, 3, 1))
+        self.overture = PastConcert.objects.create(
+            title="Spring Concert", date=date(2025, 3, 1), programme="Beethoven: Egmont Overture",
+        )
+
+    def test_results_are_ranked(self):
+        response = APIClient().get("/api/past-concerts/search/", {"q": "beethoven"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["id"] for result in response.data], [self.symphony.pk, self.overture.pk])
+        self.assertGreater(response.data[0]["rank"], response.data[1]["rank"])
+        self.assertEqual(response.data[0]["date"], "01/03/2024")
+
+    def test_query_is_required(self):
+        self.assertEqual(APIClient().get("/api/past-concerts/search/", {"q": " "}).status_code, 400)
+
+
+class SlidingWindowStoreTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def check_store(self, store):
+        hit = lambda now: store.hit("queue:ip:1.2.3.4", 3, 60, now)
+
+        self.assertEqual([hit(0) for _ in range(3)], [(True, 0)] * 3)
+        self.assertEqual(hit(10), (False, 50))
+        # Half-way through the next window, half the last window's requests still count.
+        self.assertEqual(hit(90), (True, 0))
+        allowed, retry_after = hit(90)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(retry_after, 10)
+        self.assertEqual(hit(100), (True, 0))
+        # Two windows on, nothing counts.
+        self.assertEqual([hit(250) for _ in range(3)], [(True, 0)] * 3)
+        # Other clients have counters of their own.
+        self.assertEqual(store.hit("queue:ip:5.6.7.8", 3, 60, 250), (True, 0))
+
+    def test_local_store(self):
+        self.check_store(LocalWindowStore())
+
+    def test_cache_store(self):
+        self.check_store(CacheWindowStore())
+
+    def test_local_store_evicts_stale_clients(self):
+        store = LocalWindowStore()
+        store.MAX_KEYS = 2
+        store.hit("a", 1, 60, 0)
+        store.hit("b", 1, 60, 0)
+        store.hit("c", 1, 60, 200)
+
+        self.assertEqual(list(store._counters), ["c"])
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("20/min"), (20, 60))
+        self.assertEqual(parse_rate("1000/day"), (1000, 86400))
@@ -0,0 +1,177 @@
+"""
+Sliding-window rate limits for the public API endpoints.
+
+Each client key keeps just two counters: the current fixed window and the
+previous one. The request count over the last window is estimated by
+weighting the previous window by how much of it still overlaps, which
+closely approximates a true sliding log at a fraction of the memory.
+
+Rates come from REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] under
+"<view.throttle_scope>_ip" and "<view.throttle_scope>_session". Counters
+live in API_THROTTLE_STORE:
+- LocalWindowStore: this process only.
+- CacheWindowStore: the default cache, shared between processes when that
+  cache is shared.
+
+DRF checks throttles before calling the handler. A limited request
+therefore gets a 429 with Retry-After without any ORM or Stripe work.
+"""
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from ticketing import waiting_room
+
+
+def parse_rate(rate):
+    """
+    "20/min" -> (20, 60)
+    """
+    count, period = rate.split("/")
+    return int(count), {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+
+
+def _estimate(prev, curr, elapsed, window):
+    return prev * (1 - elapsed / window) + curr
+
+
+def _retry_after(prev, curr, elapsed, window, limit):
+    """
+    Seconds until one more request would fit under the limit.
+    """
+    if curr + 1 > limit or not prev:
+        return window - elapsed
+    # prev * (1 - t / window) + curr + 1 <= limit, solved for t
+    return window * (1 - (limit - curr - 1) / prev) - elapsed
+
+
+class LocalWindowStore:
+    """
+    Counters in this process' memory: {key: [window number, previous, current]}.
+    """
+    MAX_KEYS = 100_000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def hit(self, key, limit, window, now):
+        number, elapsed = divmod(now, window)
+        number = int(number)
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None or counter[0] < number - 1:
+                counter = [number, 0, 0]
+            elif counter[0] == number - 1:
+                counter = [number, counter[2], 0]
+            _, prev, curr = counter
+
+            if _estimate(prev, curr, elapsed, window) + 1 > limit:
+                self._counters[key] = counter
+                return False, _retry_after(prev, curr, elapsed, window, limit)
+
+            counter[2] += 1
+            self._counters[key] = counter
+            if len(self._counters) > self.MAX_KEYS:
+                self._evict(number)
+            return True, 0
+
+    def _evict(self, number):
+        stale = [key for key, counter in self._counters.items() if counter[0] < number - 1]
+        for key in stale:
+            del self._counters[key]
+
+
+class CacheWindowStore:
+    """
+    Counters in the default cache, one short-lived key per client and window.
+    """
+    PREFIX = "api:throttle:"
+
+    def hit(self, key, limit, window, now):
+        number, elapsed = divmod(now, window)
+        number = int(number)
+        curr_key = f"{self.PREFIX}{key}:{number}"
+        prev_key = f"{self.PREFIX}{key}:{number - 1}"
+        counts = cache.get_many([prev_key, curr_key])
+        prev, curr = counts.get(prev_key, 0), counts.get(curr_key, 0)
+
+        if _estimate(prev, curr, elapsed, window) + 1 > limit:
+            return False, _retry_after(prev, curr, elapsed, window, limit)
+
+        if not cache.add(curr_key, 1, timeout=2 * window):
+            cache.incr(curr_key)
+        return True, 0
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = import_string(settings.API_THROTTLE_STORE)()
+    return _store
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    Base class: subclasses name the rate suffix and say how to identify a client.
+    """
+    rate_suffix = None
+
+    def get_ident_key(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        scope = getattr(view, "throttle_scope", None)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(f"{scope}_{self.rate_suffix}") if scope else None
+        ident = self.get_ident_key(request)
+        if rate is None or ident is None:
+            return True
+
+        limit, window = parse_rate(rate)
+        allowed, wait = get_store().hit(f"{scope}:{self.rate_suffix}:{ident}", limit, window, time.time())
+        if not allowed:
+            self.wait_seconds = max(1, math.ceil(wait))
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class IPThrottle(SlidingWindowThrottle):
+    """
+    Per client IP (honouring NUM_PROXIES, like DRF's own throttles).
+    """
+    rate_suffix = "ip"
+
+    def get_ident_key(self, request):
+        return self.get_ident(request)
+
+
+class ClientSessionThrottle(SlidingWindowThrottle):
+    """
+    Per browser session: the Django session cookie, or failing that the
+    waiting room cookie. Clients with neither are covered by IPThrottle.
+    """
+    rate_suffix = "session"
+
+    def get_ident_key(self, request):
+        cookie = (
+            request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+            or request.COOKIES.get(waiting_room.COOKIE_NAME)
+        )
+        if not cookie:
+            return None
+        return hashlib.blake2b(cookie.encode(), digest_size=8).hexdigest()
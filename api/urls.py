@@ -2,15 +2,25 @@ from django.urls import path
 from .views import (
     ConcertsView,
     ConcertTicketTypesView,
+    ConcertSeatsView,
+    PastConcertSearchView,
     CreateCheckoutSessionView,
     StripeWebhookView,
+    QueueStatusView,
     OrderStatusView,
+    CheckInView,
+    DoorBundleView,
 )
 
 urlpatterns = [
     path('tickets/concerts/', ConcertsView.as_view(), name='concerts'),
     path('tickets/concert/tickettypes', ConcertTicketTypesView.as_view(), name='concert-ticket-types'),
+    path('tickets/concert/seats', ConcertSeatsView.as_view(), name='concert-seats'),
     path('tickets/create-checkout-session/', CreateCheckoutSessionView.as_view(), name='create-checkout-session'),
+    path('tickets/queue/', QueueStatusView.as_view(), name='queue-status'),
     path('tickets/stripe-webhook/', StripeWebhookView.as_view(), name='stripe-webhook'),
     path('tickets/order-status/', OrderStatusView.as_view(), name='order-status'),
+    path('tickets/check-in/', CheckInView.as_view(), name='check-in'),
+    path('tickets/door-bundle/', DoorBundleView.as_view(), name='door-bundle'),
+    path('past-concerts/search/', PastConcertSearchView.as_view(), name='past-concert-search'),
 ]
\ No newline at end of file
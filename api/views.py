@@ -1,17 +1,36 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from django.db import IntegrityError
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.conf import settings
+from django.utils import timezone
+from datetime import datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal
+import base64
+import logging
+import time
 import stripe
 
+from main_site import search as ms_search
+from ticketing import cart
+from ticketing import metrics as ts_metrics
+from ticketing import checkin
+from ticketing import door_bundle
 from ticketing import models as ts_models
+from ticketing import seating
+from ticketing import waiting_room
 from ticketing.webhook_handler import handle_webhook
-from .serializers import ConcertSerializer, TicketTypeSummarySerializer
+from .throttling import ClientSessionThrottle, IPThrottle
+from .serializers import (
+    ConcertSerializer,
+    PastConcertSearchResultSerializer,
+    TicketTypeSummarySerializer,
+)
 
-# Initialize Stripe with your secret key
-stripe.api_key = settings.STRIPE_SECRET_KEY
+logger = logging.getLogger("api.checkout")
 
 
 class ConcertsView(APIView):
@@ -47,6 +66,57 @@ class ConcertTicketTypesView(APIView):
         return Response(serializer.data)
 
 
+class ConcertSeatsView(APIView):
+    """
+    GET /api/tickets/concert/seats?concert_id=<ID>
+    The concert's seating plan for a seat picker: its rows and a bitmap of
+    the seats taken (sold or held), base64 encoded, bit n for seat n counting
+    along each row from the front.
+    """
+
+    def get(self, request):
+        concert_id = request.query_params.get("concert_id")
+        if not concert_id:
+            return Response(
+                {"detail": "concert_id query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        seat_map = get_object_or_404(ts_models.SeatMap, concert_id=concert_id)
+        layout, taken = seating.availability(seat_map)
+        return Response(
+            {
+                "rows": [{"label": label, "seats": length} for label, _, length in layout.rows],
+                "capacity": layout.capacity,
+                "taken": base64.b64encode(taken).decode("ascii"),
+            },
+            headers={"Cache-Control": "no-store"},
+        )
+
+
+class PastConcertSearchView(APIView):
+    """
+    GET /api/past-concerts/search/?q=<text>[&limit=<n>]
+    Past concerts matching title, conductor, venue or programme, best match first.
+    """
+    MAX_LIMIT = 50
+
+    def get(self, request):
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            return Response(
+                {"detail": "q query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            limit = min(int(request.query_params.get("limit", 20)), self.MAX_LIMIT)
+        except ValueError:
+            return Response({"detail": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = ms_search.search(text, limit=max(limit, 1))
+        return Response(PastConcertSearchResultSerializer(results, many=True).data)
+
+
 class CreateCheckoutSessionView(APIView):
     """
     POST /api/tickets/create-checkout-session/
@@ -58,14 +128,82 @@ class CreateCheckoutSessionView(APIView):
         "line_items": [
             {"ticket_type_id": 1, "quantity": 2},
             {"ticket_type_id": 2, "quantity": 1}
-        ]
+        ],
+        "seats": ["C12", "C13", "C14"]
     }
+
+    "seats" is optional: seated ticket types get the best seats available
+    unless the buyer picked them, one per seated ticket.
     """
     # Disable CSRF for webhooks
     authentication_classes = []
     permission_classes = []
+    throttle_classes = [IPThrottle, ClientSessionThrottle]
+    throttle_scope = "checkout"
+    # Don't hand back a session with less than this left to pay in
+    REUSE_MARGIN = timedelta(minutes=5)
 
     def post(self, request):
+        # Turn buyers away cheaply until the waiting room admits them.
+        token, queue = waiting_room.check(request)
+        if not queue["admitted"]:
+            if not queue["queued"]:
+                return Response(
+                    {"detail": "Open the tickets page to join the queue.", "queue": queue},
+                    status=status.HTTP_429_TOO_MANY_REQUESTS,
+                )
+            response = Response(
+                {"detail": "You're in the queue for tickets.", "queue": queue},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(queue["retry_after"])},
+            )
+            return waiting_room.set_cookie(response, token)
+
+        start = time.perf_counter()
+        self.new_client = None
+        response = self.create_checkout_session(request)
+        if self.new_client:
+            cart.set_client_cookie(response, self.new_client)
+
+        if response.status_code < 400:
+            outcome = "created"
+        elif response.status_code < 500:
+            outcome = "rejected"
+        else:
+            outcome = "error"
+        ts_metrics.CHECKOUT_SESSION_SECONDS.observe(time.perf_counter() - start, outcome=outcome)
+        return response
+
+    def client_identity(self, request):
+        """
+        Who is checking out, for scoping idempotency keys: the browser's
+        random client id (a new one is set on the response).
+        """
+        client, new = cart.client_id(request)
+        if new:
+            self.new_client = client
+        return client
+
+    def reusable(self, order):
+        return (
+            order.status == 'pending'
+            and order.client_secret
+            and order.expires_at is not None
+            and order.expires_at > timezone.now() + self.REUSE_MARGIN
+        )
+
+    def session_response(self, order):
+        data = {
+            "client_secret": order.client_secret,
+            "session_id": order.stripe_session_id,
+        }
+        hold = ts_models.SeatHold.objects.filter(order=order).select_related("seat_map").first()
+        if hold is not None:
+            layout = seating.Layout(hold.seat_map.rows)
+            data["seats"] = [layout.label(seat) for seat in hold.seats]
+        return Response(data)
+
+    def create_checkout_session(self, request):
         line_items_data = request.data.get("line_items", [])
 
         if not line_items_data:
@@ -73,100 +211,187 @@ class CreateCheckoutSessionView(APIView):
                 {"detail": "line_items are required."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        if not isinstance(request.data.get("seats") or [], list):
+            return Response(
+                {"detail": "seats must be a list of seat labels."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         try:
-
-            # Build Stripe line items and calculate total
-            stripe_line_items = []
-            total_amount = Decimal('0.00')
-            order_items_data = []
-
-            for item in line_items_data:
-                ticket_type_id = item.get("ticket_type_id")
-                quantity = item.get("quantity", 0)
-
-                if quantity <= 0:
-                    continue
-
-                ticket_type = get_object_or_404(
-                    ts_models.TicketType,
-                    pk=ticket_type_id,
+            # Check the whole cart (availability per linked cluster) in one query
+            lines, errors = cart.validate_cart(request.data.get("concert_id"), line_items_data)
+            if errors:
+                if any(error["code"] == cart.INSUFFICIENT for error in errors):
+                    ts_metrics.OVERSELL_REJECTIONS.inc()
+                return Response(
+                    {"detail": errors[0]["detail"], "errors": errors},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
 
-                # Validate availability
-                if quantity > ticket_type.qty_available:
-                    return Response(
-                        {
-                            "detail": f"Only {ticket_type.qty_available} {ticket_type.ticket_label} tickets available."
-                        },
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-
-                # Use the price_id from your ticket type model
-                stripe_line_items.append({
-                    "price": ticket_type.price_id,
-                    "quantity": quantity,
-                })
-
-                # Store order item data for pending order
-                order_items_data.append({
-                    'ticket_type': ticket_type,
-                    'quantity': quantity,
-                    'price_per_ticket': ticket_type.price,
-                })
-
-                total_amount += Decimal(str(ticket_type.price)) * quantity
-
-            if not stripe_line_items:
+            if not lines:
                 return Response(
                     {"detail": "No valid line items provided."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Create Stripe checkout session
+            # Build Stripe line items and calculate total
+            stripe_line_items = [
+                {"price": line.ticket_type.price_id, "quantity": line.quantity}
+                for line in lines
+            ]
+            total_amount = sum(
+                (Decimal(str(line.ticket_type.price)) * line.quantity for line in lines),
+                Decimal('0.00'),
+            )
+
+            # A repeat of a recent request (double click, retry) gets the same
+            # session back instead of a new one.
+            key = cart.idempotency_key(
+                self.client_identity(request),
+                request.data.get("concert_id"),
+                lines,
+                request.headers.get("Idempotency-Key") or request.data.get("idempotency_key", ""),
+                seats=request.data.get("seats") or (),
+            )
+            existing = ts_models.Order.objects.filter(idempotency_key=key).first()
+            replaces = 0
+            if existing is not None:
+                if self.reusable(existing):
+                    logger.info("Checkout session reused", extra={"order_id": existing.id})
+                    return self.session_response(existing)
+                # Finished or about to expire: free the key for a new session.
+                ts_models.Order.objects.filter(pk=existing.pk).update(idempotency_key=None)
+                if existing.status == 'pending':
+                    seating.release_for_order(existing)
+                replaces = existing.pk
+
+            # Stripe's idempotency key (and the expiry, which must match on a
+            # replay) are fixed per time window and per replaced order.
+            # Concurrent requests get one session, while later requests for
+            # the same cart get a fresh one.
+            ttl = settings.CHECKOUT_SESSION_TTL
+            window = int(time.time() // ttl)
+            expires_at = (window + 2) * ttl + 60  # a minute's grace for clock skew
+
+            # Hold seats before creating the session, so nobody pays for
+            # seats that are gone.
+            hold = None
+            seated = sum(line.quantity for line in lines if line.ticket_type.seated)
+            if seated:
+                try:
+                    hold = seating.reserve(
+                        request.data.get("concert_id"), seated,
+                        labels=request.data.get("seats") or None,
+                        expires_at=datetime.fromtimestamp(expires_at, tz=dt_timezone.utc),
+                    )
+                except seating.SeatsUnavailable as e:
+                    return Response(
+                        {"detail": str(e), "errors": [{"code": "seats_unavailable", "detail": str(e)}]},
+                        status=status.HTTP_409_CONFLICT,
+                    )
+            try:
+                return self.start_session(
+                    key, window, replaces, expires_at, stripe_line_items, total_amount, hold,
+                    lines[0].ticket_type.for_concert_id,
+                )
+            except Exception:
+                if hold is not None:
+                    seating.release(hold)
+                raise
+
+        except stripe.error.StripeError as e:
+            logger.warning("Stripe rejected checkout session: %s", e)
+            return Response(
+                {"detail": f"Stripe error: {str(e)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            logger.exception("Error creating checkout session")
+            return Response(
+                {"detail": f"Error creating checkout session: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def start_session(self, key, window, replaces, expires_at, stripe_line_items, total_amount, hold, concert_id):
+        """
+        Create the Stripe session and its pending order (holding `hold`'s seats).
+        """
+        # Create Stripe checkout session
+        with ts_metrics.stripe_call("checkout.Session.create"):
             checkout_session = stripe.checkout.Session.create(
                 ui_mode='embedded',
                 line_items=stripe_line_items,
                 mode='payment',
                 redirect_on_completion='never',
                 automatic_tax={'enabled': True},
+                expires_at=expires_at,
                 metadata={
                 },
+                idempotency_key=f"checkout-{key}-{window}-{replaces}",
             )
 
-            # Create pending order in database
+        # Create pending order in database
+        try:
             order = ts_models.Order.objects.create(
                 stripe_session_id=checkout_session.id,
                 status='pending',
+                concert_id=concert_id,
                 customer_email='',  # Will be filled by webhook
                 total_amount=total_amount,
                 currency='GBP',
+                idempotency_key=key,
+                client_secret=checkout_session.client_secret,
+                expires_at=datetime.fromtimestamp(expires_at, tz=dt_timezone.utc),
             )
+        except IntegrityError:
+            # A concurrent identical request saved its order first.
+            order = ts_models.Order.objects.filter(idempotency_key=key).first()
+            if order is None:
+                raise
+            if hold is not None:
+                seating.release(hold)
+            return self.session_response(order)
+
+        if hold is not None:
+            ts_models.SeatHold.objects.filter(pk=hold.pk).update(order=order)
+
+        # Create order items
+        # for item_data in order_items_data:
+        #     ts_models.OrderItem.objects.create(
+        #         order=order,
+        #         ticket_type=item_data['ticket_type'],
+        #         quantity=item_data['quantity'],
+        #         price_per_ticket=item_data['price_per_ticket'],
+        #     )
+
+        logger.info(
+            "Checkout session created",
+            extra={"order_id": order.id, "session_id": checkout_session.id},
+        )
+
+        return self.session_response(order)
+
+
+class QueueStatusView(APIView):
+    """
+    GET /api/tickets/queue/
+    The buyer's waiting room status: {"admitted": true, "admitted_until": ...}
+    or {"admitted": false, "queued": true, "ahead": n, "retry_after": seconds}.
+    Buyers who haven't joined from the tickets page get {"admitted": false,
+    "queued": false}: polling never hands out places. Cheap enough to poll:
+    no session access, one small read of the queue store.
+    """
+    authentication_classes = []
+    permission_classes = []
+    throttle_classes = [IPThrottle]
+    throttle_scope = "queue_status"
 
-            # Create order items
-            # for item_data in order_items_data:
-            #     ts_models.OrderItem.objects.create(
-            #         order=order,
-            #         ticket_type=item_data['ticket_type'],
-            #         quantity=item_data['quantity'],
-            #         price_per_ticket=item_data['price_per_ticket'],
-            #     )
-
-            return Response({
-                "client_secret": checkout_session.client_secret,
-                "session_id": checkout_session.id,
-            })
-
-        except stripe.error.StripeError as e:
-            return Response(
-                {"detail": f"Stripe error: {str(e)}"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        except Exception as e:
-            return Response(
-                {"detail": f"Error creating checkout session: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    def get(self, request):
+        token, queue = waiting_room.check(request)
+        headers = {"Cache-Control": "no-store"}
+        if "retry_after" in queue:
+            headers["Retry-After"] = str(queue["retry_after"])
+        return waiting_room.set_cookie(Response(queue, headers=headers), token)
 
 
 class StripeWebhookView(APIView):
@@ -206,6 +431,11 @@ class OrderStatusView(APIView):
     GET /api/tickets/order-status/?session_id=<SESSION_ID>
     Returns the order status, polling this until status is 'confirmed' or 'failed'.
     """
+    # Public, and no authentication means no session lookup before throttling
+    authentication_classes = []
+    permission_classes = []
+    throttle_classes = [IPThrottle, ClientSessionThrottle]
+    throttle_scope = "order_status"
 
     def get(self, request):
         session_id = request.query_params.get("session_id")
@@ -239,4 +469,103 @@ class OrderStatusView(APIView):
             return Response(
                 {"detail": "Order not found"},
                 status=status.HTTP_404_NOT_FOUND,
-            )
\ No newline at end of file
+            )
+
+
+class CheckInView(APIView):
+    """
+    POST /api/tickets/check-in/
+    Admits scanned tickets at the door. Staff only.
+
+    Single scan:
+    {"concert_id": 1, "code": "<ticket code>"}
+
+    Batch from a device that was offline:
+    {
+        "concert_id": 1,
+        "device": "door-2",
+        "scans": [
+            {"code": "<ticket code>", "scanned_at": "2025-12-01T19:24:10Z"},
+            ...
+        ]
+    }
+    """
+    permission_classes = [IsAdminUser]
+
+    MAX_BATCH = 1000
+
+    SINGLE_SCAN_STATUS = {
+        checkin.ADMITTED: status.HTTP_200_OK,
+        checkin.INVALID_CODE: status.HTTP_400_BAD_REQUEST,
+        checkin.NOT_FOUND: status.HTTP_404_NOT_FOUND,
+    }
+
+    def post(self, request):
+        concert_id = request.data.get("concert_id")
+        if concert_id not in (None, ""):
+            try:
+                concert_id = int(concert_id)
+            except (TypeError, ValueError):
+                return Response(
+                    {"detail": "concert_id must be a concert ID."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            concert_id = None
+        device = str(request.data.get("device", ""))[:40]
+        scans = request.data.get("scans")
+
+        if scans is None:
+            code = request.data.get("code")
+            if not code:
+                return Response(
+                    {"detail": "code or scans is required."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            result = checkin.check_in([{"code": code}], concert_id=concert_id, device=device)[0]
+            return Response(
+                result,
+                status=self.SINGLE_SCAN_STATUS.get(result["result"], status.HTTP_409_CONFLICT),
+            )
+
+        if not isinstance(scans, list) or len(scans) > self.MAX_BATCH:
+            return Response(
+                {"detail": f"scans must be a list of at most {self.MAX_BATCH} scans."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = checkin.check_in(scans, concert_id=concert_id, device=device)
+        return Response({"results": results})
+
+
+class DoorBundleView(APIView):
+    """
+    GET /api/tickets/door-bundle/?concert_id=<ID>[&since=<WATERMARK>]
+    Binary ticket bundle for offline door validation (see ticketing.door_bundle).
+    Pass the X-Bundle-Watermark of the last bundle as `since` to get only changes.
+    Staff only.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        concert_id = request.query_params.get("concert_id")
+        if not concert_id:
+            return Response(
+                {"detail": "concert_id query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            since = int(request.query_params.get("since") or 0)
+        except ValueError:
+            return Response(
+                {"detail": "since must be a watermark returned by a previous bundle."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        concert = get_object_or_404(ts_models.Concert, pk=concert_id)
+        data, watermark = door_bundle.build_bundle(concert, since=since or None)
+
+        response = HttpResponse(data, content_type="application/octet-stream")
+        response["X-Bundle-Watermark"] = str(watermark)
+        response["Content-Disposition"] = f'attachment; filename="concert-{concert.pk}.nkdb"'
+        return response
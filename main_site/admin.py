@@ -1,10 +1,35 @@
+import re
+from datetime import timedelta
+
 from django import forms
-from django.contrib import admin
-from django.urls import reverse
-from django.utils.html import format_html_join
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Case, Count, F, Prefetch, When
+from django.db.models.functions import Upper
+from django.http import Http404, HttpResponseRedirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
 
 from main_site.models import CommitteeMember, PastConcert
-from ticketing.models import Concert, TicketType, Ticket, Order
+from ticketing.models import (
+    Concert,
+    TicketType,
+    Ticket,
+    TicketEvent,
+    TicketRemoval,
+    Order,
+    OutboxEmail,
+    SalesRollup,
+    SeatMap,
+    VersionConflict,
+    defer_quantity_recalculation,
+)
+from ticketing import exports, refunds, sales, seating
+from ticketing.paginators import EstimatedCountPaginator
 
 # from import_export.admin import ExportMixin
 # from import_export.admin import ImportExportModelAdmin
@@ -12,11 +37,79 @@ from ticketing.models import Concert, TicketType, Ticket, Order
 # from import_export.widgets import ForeignKeyWidget
 
 
+class CascadesTicketHistory:
+    """
+    For admins of models whose deletion cascades to tickets: a ticket's
+    history goes with it, though staff can't delete history on its own.
+    """
+
+    def get_deleted_objects(self, objs, request):
+        deleted, model_count, perms_needed, protected = super().get_deleted_objects(objs, request)
+        perms_needed.discard(TicketEvent._meta.verbose_name)
+        return deleted, model_count, perms_needed, protected
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist settings for tables that grow with ticket sales: no full
+    COUNT(*) queries, and whole identifiers looked up through an index.
+
+    A term that is a whole Stripe session id (session_search_field) or a
+    whole email address (email_search_field) is first matched exactly,
+    through the transaction ID and UPPER(email) indexes. Anything else,
+    or an exact lookup that finds nothing, gets the usual substring search
+    over search_fields.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+    email_search_field = None
+    session_search_field = None
+
+    SESSION_ID = re.compile(r"cs_(test|live)_\w{20,}")
+    EMAIL = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+    def exact_search(self, queryset, term):
+        if self.session_search_field and self.SESSION_ID.fullmatch(term):
+            return queryset.filter(**{self.session_search_field: term})
+        if self.email_search_field and self.EMAIL.fullmatch(term):
+            # Spelled out as UPPER(field) = ..., the expression the index is on.
+            return queryset.alias(search_email=Upper(self.email_search_field)).filter(search_email=term.upper())
+        return None
+
+    def get_search_results(self, request, queryset, search_term):
+        exact = self.exact_search(queryset, search_term.strip())
+        if exact is not None and exact.exists():
+            return exact, False
+        return super().get_search_results(request, queryset, search_term)
+
+
 class TicketTypeAdminForm(forms.ModelForm):
+    # Digest of the editable fields when the form was opened. Sales move the
+    # counters (and the row's version) all the time, so only a change to
+    # these fields counts as a conflicting edit.
+    edit_digest = forms.CharField(widget=forms.HiddenInput, required=False)
+
     class Meta:
         model = TicketType
         fields = "__all__"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields["edit_digest"].initial = self.instance.edit_digest()
+
+    def clean(self):
+        cleaned_data = super().clean()
+        opened = cleaned_data.get("edit_digest")
+        # self.instance still holds the database values at this point.
+        if self.instance.pk and opened and opened != self.instance.edit_digest():
+            raise forms.ValidationError(
+                "Someone else changed this ticket type while you had it open. "
+                "Reload the page to see their changes, then make yours again."
+            )
+        return cleaned_data
+
     def clean_linked_tickets(self):
         linked = self.cleaned_data.get("linked_tickets")
         if self.instance.pk and linked.filter(pk=self.instance.pk).exists():
@@ -24,10 +117,31 @@ class TicketTypeAdminForm(forms.ModelForm):
             raise forms.ValidationError("A ticket type cannot be linked to itself.")
         return linked
 
+class MoveTicketTypeForm(forms.Form):
+    ticket_type = forms.ModelChoiceField(
+        queryset=TicketType.objects.select_related("for_concert").order_by("for_concert", "position"),
+        help_text="The selected tickets will be moved to this ticket type (and its concert).",
+    )
+
+
+class TicketAdminForm(forms.ModelForm):
+    add_note = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={"rows": 2}),
+        help_text="Optional note to add to this ticket's history. "
+                  "I recommend adding one when editing tickets manually.",
+    )
+
+    class Meta:
+        model = Ticket
+        fields = "__all__"
+
+
 @admin.register(Concert)
-class ConcertAdmin(admin.ModelAdmin):
+class ConcertAdmin(CascadesTicketHistory, admin.ModelAdmin):
     list_display = ("concert_name", "concert_date", "concert_time", "concert_location")
-    readonly_fields = ("concert_ticket_types_display",)
+    readonly_fields = ("concert_ticket_types_display", "exports_display", "sales_display", "refunds_display")
+    actions = ["cancel_and_refund"]
 
     fields = (
         "concert_name",
@@ -36,11 +150,20 @@ class ConcertAdmin(admin.ModelAdmin):
         "concert_location",
         "concert_description",
         "concert_ticket_types_display",
+        "exports_display",
+        "sales_display",
+        "refunds_display",
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related(
+            Prefetch("ticket_types", queryset=TicketType.objects.order_by("position"))
+        )
+
     def concert_ticket_types_display(self, obj):
-        tickets = obj.concert_ticket_types.order_by("position")
-        if not tickets.exists():
+        # Uses the prefetched ticket types; no extra queries per concert.
+        tickets = obj.ticket_types.all()
+        if not tickets:
             return "No ticket types"
 
         return format_html_join(
@@ -57,13 +180,217 @@ class ConcertAdmin(admin.ModelAdmin):
 
     concert_ticket_types_display.short_description = "Ticket types (read-only)"
 
+    def get_urls(self):
+        return [
+            path(
+                "<path:object_id>/export/<str:kind>.<str:fmt>",
+                self.admin_site.admin_view(self.export_view),
+                name="ticketing_concert_export",
+            ),
+            path(
+                "<path:object_id>/sales/",
+                self.admin_site.admin_view(self.sales_view),
+                name="ticketing_concert_sales",
+            ),
+        ] + super().get_urls()
+
+    def export_view(self, request, object_id, kind, fmt):
+        concert = self.get_object(request, object_id)
+        if concert is None or kind not in exports.EXPORTS or fmt not in exports.FORMATS:
+            raise Http404
+        if not self.has_view_permission(request, concert):
+            raise PermissionDenied
+        return exports.streaming_export_response(concert, kind, fmt)
+
+    def exports_display(self, obj):
+        if obj.pk is None:
+            return "Save the concert first"
+        return format_html_join(
+            " | ",
+            '<a href="{}">{} ({})</a>',
+            (
+                (
+                    reverse("admin:ticketing_concert_export", args=[obj.pk, kind, fmt]),
+                    kind.capitalize(),
+                    fmt.upper(),
+                )
+                for kind in exports.EXPORTS
+                for fmt in exports.FORMATS
+            ),
+        )
+
+    exports_display.short_description = "Exports"
+
+    def sales_display(self, obj):
+        if obj.pk is None:
+            return "Save the concert first"
+        return format_html('<a href="{}">Sales dashboard</a>', reverse("admin:ticketing_concert_sales", args=[obj.pk]))
+
+    sales_display.short_description = "Sales"
+
+    def refunds_display(self, obj):
+        if obj.pk is None:
+            return "-"
+        counts = dict(
+            refunds.concert_orders(obj).filter(status__in=["confirmed", "refunding", "refunded"])
+            .values_list("status").annotate(n=Count("pk")).order_by()
+        )
+        if not counts.get("refunding") and not counts.get("refunded"):
+            return "None"
+        return (
+            f"{counts.get('refunded', 0)} refunded, {counts.get('refunding', 0)} in progress, "
+            f"{counts.get('confirmed', 0)} not refunded"
+        )
+
+    refunds_display.short_description = "Refunds"
+
+    @admin.action(description="Cancel selected concerts and refund all their orders")
+    def cancel_and_refund(self, request, queryset):
+        if "apply" not in request.POST:
+            return TemplateResponse(request, "admin/ticketing/concert/cancel_and_refund.html", {
+                **self.admin_site.each_context(request),
+                "title": "Cancel concerts and refund all orders",
+                "opts": self.model._meta,
+                "concerts": [
+                    (concert, refunds.concert_orders(concert).filter(status__in=["confirmed", "refunding"]).count())
+                    for concert in queryset
+                ],
+                "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+            })
+
+        for concert in queryset:
+            if refunds.start_in_background(concert):
+                self.message_user(
+                    request,
+                    f"Refunding {concert} in the background. Its page shows progress; if this server "
+                    f"restarts, finish with `manage.py refund_concert {concert.pk}`.",
+                    messages.SUCCESS,
+                )
+            else:
+                self.message_user(request, f"Refunds for {concert} are already running.", messages.WARNING)
+        return None
+
+    def sales_view(self, request, object_id):
+        concert = self.get_object(request, object_id)
+        if concert is None:
+            raise Http404
+        if not self.has_view_permission(request, concert):
+            raise PermissionDenied
+
+        # Everything below comes from the rollups: one small query.
+        rollups = SalesRollup.objects.filter(concert=concert).select_related("ticket_type").order_by(
+            "day", "ticket_type__position"
+        )
+        days = {}
+        ticket_types = {}
+        for rollup in rollups:
+            day = days.setdefault(rollup.day, {"day": rollup.day, "tickets": 0, "revenue": 0})
+            day["tickets"] += rollup.tickets
+            day["revenue"] += rollup.revenue
+            ticket_type = ticket_types.setdefault(
+                rollup.ticket_type_id, {"label": rollup.ticket_type.ticket_label, "tickets": 0, "revenue": 0}
+            )
+            ticket_type["tickets"] += rollup.tickets
+            ticket_type["revenue"] += rollup.revenue
+
+        days = list(days.values())
+        most_tickets = max([day["tickets"] for day in days] + [1])
+        most_revenue = max([day["revenue"] for day in days] + [1])
+        total_tickets = total_revenue = 0
+        for day in days:
+            total_tickets += day["tickets"]
+            total_revenue += day["revenue"]
+            day["total_tickets"] = total_tickets
+            day["total_revenue"] = total_revenue
+            day["tickets_width"] = max(day["tickets"], 0) * 100 // most_tickets
+            day["revenue_width"] = int(max(day["revenue"], 0) * 100 / most_revenue)
+
+        last_week = [day for day in days if day["day"] > timezone.localdate() - timedelta(days=7)]
+        return TemplateResponse(request, "admin/ticketing/concert/sales.html", {
+            **self.admin_site.each_context(request),
+            "title": f"Sales: {concert}",
+            "opts": self.model._meta,
+            "original": concert,
+            "days": days,
+            "ticket_types": list(ticket_types.values()),
+            "total_tickets": total_tickets,
+            "total_revenue": total_revenue,
+            "week_tickets": sum(day["tickets"] for day in last_week),
+            "week_revenue": sum(day["revenue"] for day in last_week),
+        })
+
+
+class SeatMapAdminForm(forms.ModelForm):
+    class Meta:
+        model = SeatMap
+        fields = "__all__"
+
+    def clean_rows(self):
+        rows = self.cleaned_data.get("rows")
+        if not isinstance(rows, list) or not rows:
+            raise forms.ValidationError('Enter a list of rows, e.g. [{"label": "A", "seats": 24}].')
+        labels = set()
+        for row in rows:
+            valid = (
+                isinstance(row, dict) and str(row.get("label", "")).isalpha()
+                and isinstance(row.get("seats"), int) and row["seats"] > 0
+            )
+            if not valid:
+                raise forms.ValidationError(f"{row!r} is not a row: give it a letter label and a number of seats.")
+            if str(row["label"]).upper() in labels:
+                raise forms.ValidationError(f"Row {row['label']} appears twice.")
+            labels.add(str(row["label"]).upper())
+
+        # Seat numbers are bit positions: once any are sold or held, the layout is fixed.
+        instance = self.instance
+        if instance.pk and rows != instance.rows and (seating.to_int(instance.sold) or seating.to_int(instance.held)):
+            raise forms.ValidationError("Seats on this plan have been sold or held, so its rows can't change.")
+        return rows
+
+
+@admin.register(SeatMap)
+class SeatMapAdmin(admin.ModelAdmin):
+    form = SeatMapAdminForm
+    list_display = ["concert", "capacity", "seats_sold", "seats_held"]
+    list_select_related = ["concert"]
+    readonly_fields = ["plan"]
+
+    def capacity(self, obj):
+        return seating.Layout(obj.rows).capacity
+
+    def seats_sold(self, obj):
+        return bin(seating.to_int(obj.sold)).count("1")
+
+    def seats_held(self, obj):
+        return bin(seating.to_int(obj.held)).count("1")
+
+    def plan(self, obj):
+        """
+        The plan as text: one line per row, # sold, + held, . free.
+        """
+        if obj.pk is None:
+            return "Save the plan first"
+        layout = seating.Layout(obj.rows)
+        sold, held = seating.to_int(obj.sold), seating.to_int(obj.held)
+        lines = []
+        for label, start, length in layout.rows:
+            seats = "".join(
+                "#" if sold >> seat & 1 else "+" if held >> seat & 1 else "."
+                for seat in range(start, start + length)
+            )
+            lines.append(f"{label:>3} {seats}")
+        return format_html('<pre style="margin: 0">{}</pre>', "\n".join(lines))
+
+    plan.short_description = "Plan (# sold, + held, . free)"
+
 
 @admin.register(TicketType)
-class TicketTypeAdmin(admin.ModelAdmin):
+class TicketTypeAdmin(CascadesTicketHistory, admin.ModelAdmin):
     form = TicketTypeAdminForm  # <-- use the custom form
 
     readonly_fields = ["qty_available", "qty_sold"]
 
+    list_select_related = ("for_concert",)
     list_display = (
         "ticket_label",
         "for_concert",
@@ -71,6 +398,7 @@ class TicketTypeAdmin(admin.ModelAdmin):
         "qty_available",
         "qty_sold",
         "display_ticket",
+        "seated",
     )
     list_filter = ("for_concert", "display_ticket")
     search_fields = ("ticket_label",)
@@ -84,16 +412,235 @@ class TicketTypeAdmin(admin.ModelAdmin):
                 field.queryset = field.queryset.exclude(pk=object_id)
         return field
 
+    def save_model(self, request, obj, form, change):
+        for attempt in range(3):
+            try:
+                return super().save_model(request, obj, form, change)
+            except VersionConflict:
+                # The row moved since it was loaded for this request. If only
+                # the counters moved (a sale), nothing edited here is stale.
+                current = TicketType.objects.get(pk=obj.pk)
+                if attempt == 2 or current.edit_digest() != form.cleaned_data.get("edit_digest"):
+                    raise
+                obj.version = current.version
+
+    def changeform_view(self, request, object_id=None, form_url="", extra_context=None):
+        try:
+            return super().changeform_view(request, object_id, form_url, extra_context)
+        except VersionConflict:
+            # The save's transaction has rolled back; show the current values.
+            self.message_user(
+                request,
+                "Someone else changed this ticket type while you were saving it. "
+                "Your changes were not saved; check theirs below, then make yours again.",
+                messages.ERROR,
+            )
+            return HttpResponseRedirect(request.get_full_path())
+
 
 @admin.register(Ticket)
 # class ticketAdmin(ExportMixin, admin.ModelAdmin):
-class ticketAdmin(admin.ModelAdmin):
+class ticketAdmin(CascadesTicketHistory, LargeTableAdmin):
     # resource_class = ticketResource
+    form = TicketAdminForm
     list_display = ["name", "email", "transaction_ID", "ticket_type", "validity"]
+    list_select_related = ["ticket_type"]
     list_filter = ["for_concert", "ticket_type", "validity"]
     search_fields = ["name", "email", "transaction_ID"]
+    email_search_field = "email"
+    session_search_field = "transaction_ID"
     search_help_text = "Search for matching name, email or transaction ID."
+    readonly_fields = ["code", "seat_label", "admitted_at", "history"]
+    actions = ["invalidate_tickets", "validate_tickets", "move_to_ticket_type"]
+
+    HISTORY_PREVIEW = 10
+
+    def history(self, obj):
+        """
+        Show only the latest few events; the full history is one click away.
+        """
+        if obj.pk is None:
+            return "No history yet"
+
+        events = list(obj.events.all()[:self.HISTORY_PREVIEW + 1])
+        if not events:
+            return "No history yet"
+
+        rows = format_html_join(
+            "",
+            "<li>[{}] {}: {}</li>",
+            ((e.created_at, e.get_kind_display(), e.message) for e in events[:self.HISTORY_PREVIEW]),
+        )
+        link = ""
+        if len(events) > self.HISTORY_PREVIEW:
+            link = format_html(
+                '<a href="{}?ticket__id__exact={}">View full history</a>',
+                reverse("admin:ticketing_ticketevent_changelist"),
+                obj.pk,
+            )
+        return format_html("<ul>{}</ul>{}", rows, link)
+
+    history.short_description = "History"
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic(), sales.tracking([obj.pk] if change else []):
+            if change and obj.validity and "validity" in form.changed_data and seating.clashes([obj.pk]).exists():
+                obj.seat = None
+                self.message_user(request, "This ticket's seat has been sold again, so it no longer has a seat.", messages.WARNING)
+            super().save_model(request, obj, form, change)
+            if change and {"validity", "for_concert"} & set(form.changed_data):
+                seating.sync_sold([obj.for_concert_id, form.initial.get("for_concert")])
+            if change and "for_concert" in form.changed_data:
+                TicketRemoval.log([(obj.pk, form.initial.get("for_concert"))])
+
+        user = request.user.get_username()
+        if change:
+            if "validity" in form.changed_data:
+                kind = TicketEvent.VALIDATED if obj.validity else TicketEvent.INVALIDATED
+                TicketEvent.log([obj], f"{kind.capitalize()} by {user}.", kind=kind)
+            changed = ", ".join(f for f in form.changed_data if f not in ("validity", "add_note"))
+            if changed:
+                TicketEvent.log([obj], f"{user} changed {changed}.", kind=TicketEvent.CHANGED)
+        else:
+            TicketEvent.log([obj], f"Ticket added by {user}.", kind=TicketEvent.ISSUED)
+
+        note = form.cleaned_data.get("add_note")
+        if note:
+            TicketEvent.log([obj], f"{note} ({user})", kind=TicketEvent.NOTE)
+
+    # Bulk actions: one UPDATE for the whole selection, one bulk insert of
+    # history, and one quantity recalculation per affected cluster.
+
+    def _set_validity(self, request, queryset, validity):
+        kind = TicketEvent.VALIDATED if validity else TicketEvent.INVALIDATED
+        with transaction.atomic(), defer_quantity_recalculation() as pending:
+            rows = list(
+                queryset.exclude(validity=validity).values_list("pk", "ticket_type_id", "for_concert_id")
+            )
+            ids = [pk for pk, _, _ in rows]
+            # Tickets whose seats were sold on come back unseated.
+            unseated = seating.clashes(ids).update(seat=None) if validity else 0
+            with sales.tracking(ids):
+                Ticket.objects.filter(pk__in=ids).update(validity=validity, updated_at=timezone.now())
+            TicketEvent.log(ids, f"{kind.capitalize()} by {request.user.get_username()} (bulk action).", kind=kind)
+            pending.update(ticket_type_id for _, ticket_type_id, _ in rows)
+            seating.sync_sold(concert_id for _, _, concert_id in rows)
+
+        self.message_user(request, f"{len(ids)} ticket(s) {kind}.", messages.SUCCESS)
+        if unseated:
+            self.message_user(
+                request, f"{unseated} of them no longer have a seat: it was sold again.", messages.WARNING
+            )
+
+    @admin.action(description="Invalidate selected tickets")
+    def invalidate_tickets(self, request, queryset):
+        self._set_validity(request, queryset, False)
+
+    @admin.action(description="Mark selected tickets as valid")
+    def validate_tickets(self, request, queryset):
+        self._set_validity(request, queryset, True)
+
+    @admin.action(description="Move selected tickets to another ticket type")
+    def move_to_ticket_type(self, request, queryset):
+        form = MoveTicketTypeForm(request.POST if "apply" in request.POST else None)
+
+        if form.is_valid():
+            target = form.cleaned_data["ticket_type"]
+            with transaction.atomic(), defer_quantity_recalculation() as pending:
+                rows = list(
+                    queryset.exclude(ticket_type=target).values_list("pk", "ticket_type_id", "for_concert_id")
+                )
+                ids = [pk for pk, _, _ in rows]
+                with sales.tracking(ids):
+                    Ticket.objects.filter(pk__in=ids).update(
+                        ticket_type=target, for_concert=target.for_concert_id, updated_at=timezone.now(),
+                        # A seat only means something at its own concert.
+                        seat=Case(When(for_concert=target.for_concert_id, then=F("seat")), default=None),
+                    )
+                TicketEvent.log(
+                    ids,
+                    f"Moved to '{target}' by {request.user.get_username()} (bulk action).",
+                    kind=TicketEvent.CHANGED,
+                )
+                TicketRemoval.log(
+                    (pk, concert_id) for pk, _, concert_id in rows if concert_id != target.for_concert_id
+                )
+                pending.update(ticket_type_id for _, ticket_type_id, _ in rows)
+                pending.add(target.pk)
+                seating.sync_sold([concert_id for _, _, concert_id in rows] + [target.for_concert_id])
+
+            self.message_user(request, f"{len(ids)} ticket(s) moved to {target}.", messages.SUCCESS)
+            return None
+
+        return TemplateResponse(request, "admin/ticketing/ticket/move_ticket_type.html", {
+            **self.admin_site.each_context(request),
+            "title": "Move tickets to another ticket type",
+            "opts": self.model._meta,
+            "form": form,
+            "selected": list(queryset.values_list("pk", flat=True)),
+            "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+        })
+
+    def delete_queryset(self, request, queryset):
+        # Used by the "Delete selected" action: recalc once per cluster rather than per ticket.
+        with transaction.atomic(), defer_quantity_recalculation():
+            concert_ids = set(queryset.values_list("for_concert_id", flat=True))
+            with sales.tracking(queryset.values_list("pk", flat=True)):
+                super().delete_queryset(request, queryset)
+            seating.sync_sold(concert_ids)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic(), sales.tracking([obj.pk]):
+            super().delete_model(request, obj)
+            seating.sync_sold([obj.for_concert_id])
+
+
+@admin.register(TicketEvent)
+class TicketEventAdmin(admin.ModelAdmin):
+    list_display = ["created_at", "ticket", "kind", "message"]
+    list_filter = ["kind"]
+    list_select_related = ["ticket"]
+    raw_id_fields = ["ticket"]
+    date_hierarchy = "created_at"
+
+    # History is append-only: readable here, written only by TicketEvent.log().
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Order)
+class OrderAdmin(LargeTableAdmin):
+    list_display = ["id", "customer_name", "customer_email", "status", "total_amount", "created_at"]
+    list_filter = ["status"]
+    search_fields = ["customer_name", "customer_email", "stripe_session_id"]
+    email_search_field = "customer_email"
+    session_search_field = "stripe_session_id"
+    search_help_text = "Search for matching name, email or Stripe session ID."
+
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(LargeTableAdmin):
+    list_display = ["id", "to_email", "subject", "status", "attempts", "next_attempt_at", "sent_at"]
+    list_filter = ["status"]
+    search_fields = ["to_email", "subject"]
+    raw_id_fields = ["order"]
+    readonly_fields = ["claimed_by", "claimed_at", "last_error", "created_at", "sent_at"]
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry selected emails now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboxEmail.SENT).update(
+            status=OutboxEmail.PENDING, next_attempt_at=timezone.now(), claimed_by=""
+        )
+        self.message_user(request, f"{updated} email(s) queued for sending.", messages.SUCCESS)
+
 
 admin.site.register(CommitteeMember)
 admin.site.register(PastConcert)
-admin.site.register(Order)
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class MainSiteConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main_site'
+
+    def ready(self):
+        # Cached views register their invalidation signals on import;
+        # search keeps the SQLite full-text index in sync.
+        from main_site import search, views  # noqa: F401
@@ -0,0 +1,98 @@
+"""
+Whole-page caching for the public site pages.
+
+Pages are rendered once and served from the "pages" cache until something
+they show changes. Each page declares the models it depends on, and saving
+or deleting one of those re-renders just the affected pages (after the
+transaction commits). The cache therefore never goes cold under traffic.
+``manage.py warm_page_cache`` re-renders every page, e.g. after a deploy.
+
+Only plain anonymous GETs without a query string are cached; these pages
+don't vary by user.
+"""
+import functools
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpRequest, HttpResponse
+from django.urls import reverse
+
+logger = logging.getLogger("main_site.cache")
+
+CACHE_ALIAS = "pages"
+
+# url name -> view, for every cached page
+_pages = {}
+# model -> url names of the pages that show it
+_dependents = defaultdict(set)
+
+
+def _key(name):
+    return f"main_site:page:{name}"
+
+
+def cached_page(name, depends_on=()):
+    """
+    Cache a view's response under the url name ``name``, refreshing it when
+    any model in ``depends_on`` is saved or deleted.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD") or request.GET:
+                return view(request, *args, **kwargs)
+            cached = caches[CACHE_ALIAS].get(_key(name))
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+            return _store(name, view(request, *args, **kwargs))
+
+        _pages[name] = view
+        for model in depends_on:
+            _dependents[model].add(name)
+            post_save.connect(_on_change, sender=model, dispatch_uid=f"main_site.cache.{model._meta.label}")
+            post_delete.connect(_on_change, sender=model, dispatch_uid=f"main_site.cache.{model._meta.label}")
+        return wrapper
+
+    return decorator
+
+
+def _store(name, response):
+    if response.status_code == 200 and not response.streaming and not response.cookies:
+        caches[CACHE_ALIAS].set(
+            _key(name), (response.content, response["Content-Type"]), settings.PAGE_CACHE_TIMEOUT
+        )
+    return response
+
+
+def refresh(name):
+    """
+    Re-render one page into the cache. If rendering fails, the stale entry is
+    dropped instead so the next request renders it.
+    """
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = reverse(name)
+    request.META = {"SERVER_NAME": "localhost", "SERVER_PORT": "443"}
+    try:
+        _store(name, _pages[name](request))
+    except Exception:
+        logger.exception("Re-rendering cached page failed", extra={"page": name})
+        caches[CACHE_ALIAS].delete(_key(name))
+
+
+def refresh_all():
+    for name in _pages:
+        refresh(name)
+    return list(_pages)
+
+
+def _on_change(sender, raw=False, **kwargs):
+    if raw:  # loaddata
+        return
+    for name in _dependents[sender]:
+        transaction.on_commit(functools.partial(refresh, name))
@@ -0,0 +1,78 @@
+"""
+Resized, recompressed variants of uploaded photos for responsive <img> markup.
+
+Each original gets a WebP and a JPEG copy at every width in VARIANT_WIDTHS
+that is no wider than the original, and at its own width if that is
+narrower than the largest. The copies are written next to it under
+variants/. A file Pillow can't read gets no variants (an empty dict). The result is stored on the model as a dict:
+
+    {"source": original name, "width": w, "height": h,
+     "webp": [[width, name], ...], "jpeg": [[width, name], ...]}
+
+where width/height are the largest variant's, for the <img> size hint.
+"""
+import io
+import logging
+import posixpath
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+logger = logging.getLogger("main_site.images")
+
+VARIANT_WIDTHS = (320, 640, 960)
+
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+
+def _variant_name(name, width, ext):
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, "variants", f"{stem}-{width}w.{ext}")
+
+
+def generate_variants(field_file):
+    """
+    Write the variants for an ImageField's file and return the variants dict.
+    """
+    storage = field_file.storage
+    try:
+        with storage.open(field_file.name, "rb") as f:
+            original = ImageOps.exif_transpose(Image.open(f))
+            original = original.convert("RGB")
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.warning("Could not read image; no variants made", exc_info=True, extra={"image": field_file.name})
+        return {}
+
+    widths = [w for w in VARIANT_WIDTHS if w <= original.width] or [original.width]
+    if original.width < VARIANT_WIDTHS[-1] and original.width not in widths:
+        widths.append(original.width)
+
+    variants = {"source": field_file.name}
+    for width in widths:
+        height = round(original.height * width / original.width)
+        resized = original.resize((width, height), Image.LANCZOS)
+        for ext, options in FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, **options)
+            name = _variant_name(field_file.name, width, ext)
+            if storage.exists(name):
+                storage.delete(name)
+            saved = storage.save(name, ContentFile(buffer.getvalue()))
+            variants.setdefault(ext, []).append([width, saved])
+        variants["width"], variants["height"] = width, height
+    return variants
+
+
+def delete_variants(storage, variants):
+    for ext in FORMATS:
+        for _, name in variants.get(ext, []):
+            if storage.exists(name):
+                storage.delete(name)
+
+
+def srcset(storage, variants, ext):
+    return ", ".join(f"{storage.url(name)} {width}w" for width, name in variants.get(ext, []))
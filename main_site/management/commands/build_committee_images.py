@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from main_site.models import CommitteeMember
+
+
+class Command(BaseCommand):
+    help = "Generate resized WebP/JPEG variants for committee photos that don't have them yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Regenerate variants for every photo.")
+
+    def handle(self, *args, force=False, **options):
+        built = failed = 0
+        for member in CommitteeMember.objects.exclude(image="").exclude(image__isnull=True):
+            if member.image_variants.get("source") == member.image.name and not force:
+                continue
+            # Clearing the source makes save() rebuild them.
+            member.image_variants.pop("source", None)
+            try:
+                member.save()
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"{member}: {e}")
+            else:
+                if not member.image_variants:
+                    failed += 1
+                    self.stderr.write(f"{member}: not a readable image")
+                    continue
+                built += 1
+                self.stdout.write(f"{member}: {len(member.image_variants.get('webp', []))} sizes")
+        self.stdout.write(f"Built variants for {built} photo(s), {failed} failed.")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from main_site import cache
+
+
+class Command(BaseCommand):
+    help = "Re-render every cached main_site page (run after a deploy)."
+
+    def handle(self, *args, **options):
+        for name in cache.refresh_all():
+            self.stdout.write(f"Warmed {name}")
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_site', '0010_alter_pastconcert_venue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='committeemember',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies of image (see main_site.images).'),
+        ),
+    ]
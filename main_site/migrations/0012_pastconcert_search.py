@@ -0,0 +1,55 @@
+from django.db import migrations, models
+
+# See main_site.search. The Postgres column is generated, so it needs no
+# syncing; the SQLite FTS5 table is kept in sync by signals.
+CREATE = {
+    "sqlite": [
+        "CREATE VIRTUAL TABLE main_site_pastconcert_fts USING fts5("
+        "title, conductor, venue, programme, tokenize='unicode61 remove_diacritics 2')",
+        "INSERT INTO main_site_pastconcert_fts (rowid, title, conductor, venue, programme) "
+        "SELECT id, title, conductor, coalesce(venue, ''), programme FROM main_site_pastconcert",
+    ],
+    "postgresql": [
+        "ALTER TABLE main_site_pastconcert ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(conductor, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(venue, '')), 'C') || "
+        "setweight(to_tsvector('english', coalesce(programme, '')), 'D')) STORED",
+        "CREATE INDEX main_site_pastconcert_search ON main_site_pastconcert USING GIN (search_vector)",
+    ],
+}
+
+DROP = {
+    "sqlite": [
+        "DROP TABLE IF EXISTS main_site_pastconcert_fts",
+    ],
+    "postgresql": [
+        "DROP INDEX IF EXISTS main_site_pastconcert_search",
+        "ALTER TABLE main_site_pastconcert DROP COLUMN IF EXISTS search_vector",
+    ],
+}
+
+
+def create_index(apps, schema_editor):
+    for sql in CREATE.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_index(apps, schema_editor):
+    for sql in DROP.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_site', '0011_committeemember_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pastconcert',
+            index=models.Index(fields=['-date', '-id'], name='pastconcert_date_id'),
+        ),
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -1,11 +1,45 @@
 from django.db import models
 
+from main_site import images
+
 class CommitteeMember(models.Model):
     name = models.CharField(max_length=100, unique=False)
     role = models.CharField(max_length=100, unique=False)
     email= models.EmailField(unique=False)
     image = models.ImageField(upload_to='static/img/committee/', blank=True, unique=False)
     order = models.IntegerField(blank=True, null=True)
+    image_variants = models.JSONField(
+        default=dict, blank=True, editable=False,
+        help_text="Resized copies of image (see main_site.images).",
+    )
+
+    def save(self, *args, **kwargs):
+        # Rebuild the variants whenever the photo is replaced or removed.
+        if self.image_variants.get("source") != (self.image.name or None):
+            if self.image_variants:
+                images.delete_variants(self.image.storage, self.image_variants)
+            self.image_variants = {}
+            if self.image:
+                super().save(*args, **kwargs)  # commit the upload before reading it back
+                self.image_variants = images.generate_variants(self.image)
+                kwargs = {"update_fields": ["image_variants"]}
+        super().save(*args, **kwargs)
+
+    @property
+    def webp_srcset(self):
+        return images.srcset(self.image.storage, self.image_variants, "webp")
+
+    @property
+    def jpeg_srcset(self):
+        return images.srcset(self.image.storage, self.image_variants, "jpeg")
+
+    @property
+    def variant_url(self):
+        """
+        Middle-sized JPEG, for browsers that ignore srcset.
+        """
+        jpegs = self.image_variants.get("jpeg") or []
+        return self.image.storage.url(jpegs[len(jpegs) // 2][1]) if jpegs else self.image.url
 
 
     def __str__(self):
@@ -23,6 +57,10 @@ class PastConcert(models.Model):
     class Meta:
         ordering = ['-date']  # Most recent first
         verbose_name_plural = "Past Concerts"
+        indexes = [
+            # Keyset pagination on the archive page
+            models.Index(fields=["-date", "-id"], name="pastconcert_date_id"),
+        ]
 
     def __str__(self):
         return f"{self.title}"
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Full-text search over the PastConcert archive (title, conductor, venue and
+programme), ranked by relevance.
+
+SQLite uses an FTS5 table (main_site_pastconcert_fts, rowid = concert id)
+that is kept in sync by the save/delete signals below. Postgres uses a
+generated, GIN-indexed tsvector column (search_vector) on the concert table
+itself, so it needs no syncing. Both are created by migration 0012.
+Other databases fall back to unranked substring matching.
+"""
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from main_site.models import PastConcert
+
+FTS_TABLE = "main_site_pastconcert_fts"
+FIELDS = ("title", "conductor", "venue", "programme")
+# bm25 column weights, in FIELDS order
+WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+
+def _fts5_query(text):
+    # Each word becomes a quoted prefix term, so punctuation in user input
+    # can't be read as FTS5 syntax ("beethov sym" matches Beethoven Symphony).
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search(text, limit=20):
+    """
+    Return up to ``limit`` PastConcerts matching ``text``, best match first,
+    each annotated with ``rank`` (higher is better).
+    """
+    if connection.vendor == "sqlite":
+        query = _fts5_query(text)
+        sql = (
+            f"SELECT rowid, -bm25({FTS_TABLE}, {', '.join(map(str, WEIGHTS))}) AS rank "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %(query)s ORDER BY rank DESC LIMIT %(limit)s"
+        )
+    elif connection.vendor == "postgresql":
+        query = text.strip()
+        sql = (
+            "SELECT id, ts_rank(search_vector, websearch_to_tsquery('english', %(query)s)) AS rank "
+            "FROM main_site_pastconcert WHERE search_vector @@ websearch_to_tsquery('english', %(query)s) "
+            "ORDER BY rank DESC LIMIT %(limit)s"
+        )
+    else:
+        return _substring_search(text, limit)
+
+    if not query:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {"query": query, "limit": limit})
+        ranks = dict(cursor.fetchall())
+
+    concerts = PastConcert.objects.in_bulk(list(ranks))
+    results = []
+    for pk, rank in ranks.items():
+        if pk in concerts:
+            concerts[pk].rank = rank
+            results.append(concerts[pk])
+    return results
+
+
+def _substring_search(text, limit):
+    # Every word must appear in some field; newest first, all ranked equal.
+    words = re.findall(r"\w+", text)
+    if not words:
+        return []
+    concerts = PastConcert.objects.order_by("-date", "-id")
+    for word in words:
+        concerts = concerts.filter(reduce(or_, (Q(**{f"{field}__icontains": word}) for field in FIELDS)))
+    results = list(concerts[:limit])
+    for concert in results:
+        concert.rank = 0.0
+    return results
+
+
+@receiver(post_save, sender=PastConcert)
+def index_concert(sender, instance, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [instance.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, conductor, venue, programme) VALUES (%s, %s, %s, %s, %s)",
+            [instance.pk] + [getattr(instance, field) or "" for field in FIELDS],
+        )
+
+
+@receiver(post_delete, sender=PastConcert)
+def unindex_concert(sender, instance, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [instance.pk])
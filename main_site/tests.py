@@ -1,3 +1,365 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+from datetime import date
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from PIL import Image
+
+from main_site import cache, search
+from main_site.models import CommitteeMember, PastConcert
+from ticketing.models import Ticket, TicketEvent, TicketRemoval, TicketType, VersionConflict
+from ticketing.tests import make_concert, make_ticket, make_ticket_type
+
+# Admin pages without a collectstatic manifest.
+PLAIN_STATIC_FILES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# Public pages cached in memory rather than in .page_cache/.
+PAGE_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "pages": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "pages"},
+}
+
+
+def change_form_data(client, url, **changes):
+    form = client.get(url).context["adminform"].form
+    data = {name: form[name].value() for name in form.fields if form[name].value() is not None}
+    data.update(changes)
+    return data
+
+
+class TicketAdminSearchTests(TestCase):
+    def setUp(self):
+        ticket_type = make_ticket_type(make_concert())
+        self.ada = make_ticket(ticket_type, transaction_ID="cs_test_a1B2c3D4e5F6g7H8i9J0kLmn")
+        self.john = make_ticket(
+            ticket_type, name="John Smith", email="john.smith@example.org", transaction_ID="cs_test_zZ9yY8xX7wW6vV5uU4tT3sSr",
+        )
+        self.model_admin = admin.site._registry[Ticket]
+        self.request = RequestFactory().get("/admin/ticketing/ticket/")
+        self.request.user = User.objects.create_superuser("admin")
+
+    def search(self, term):
+        results, _ = self.model_admin.get_search_results(self.request, Ticket.objects.all(), term)
+        return list(results)
+
+    def test_substring_search(self):
+        for term in ["John Smith", "smith", "SMITH@EXAMPLE", "zZ9yY8"]:
+            self.assertEqual(self.search(term), [self.john], term)
+
+    def test_whole_email_and_session_id_are_matched_exactly(self):
+        self.assertEqual(self.search(" ADA@example.com "), [self.ada])
+        self.assertEqual(self.search("cs_test_a1B2c3D4e5F6g7H8i9J0kLmn"), [self.ada])
+        self.assertIn("UPPER", str(self.model_admin.exact_search(Ticket.objects.all(), "ada@example.com").query))
+
+    def test_whole_email_with_no_exact_match_falls_back_to_substring(self):
+        self.assertEqual(self.search("smith@example.org"), [self.john])
+
+
+@override_settings(STORAGES=PLAIN_STATIC_FILES)
+class TicketTypeAdminTests(TestCase):
+    def setUp(self):
+        self.ticket_type = make_ticket_type(make_concert())
+        self.client.force_login(User.objects.create_superuser("admin"))
+        self.url = f"/admin/ticketing/tickettype/{self.ticket_type.pk}/change/"
+
+    def test_conflicting_save_is_reported_not_a_server_error(self):
+        data = change_form_data(self.client, self.url, ticket_label="Renamed", linked_tickets=[])
+
+        with mock.patch.object(TicketType, "save", side_effect=VersionConflict("moved")):
+            response = self.client.post(self.url, data)
+
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
+        messages = [str(message) for message in response.wsgi_request._messages]
+        self.assertIn("Your changes were not saved", messages[0])
+        self.assertEqual(TicketType.objects.get(pk=self.ticket_type.pk).ticket_label, "Standard")
+
+    def test_edit_made_while_the_form_was_open_is_reported(self):
+        data = change_form_data(self.client, self.url, ticket_label="Mine", linked_tickets=[])
+        theirs = TicketType.objects.get(pk=self.ticket_type.pk)
+        theirs.ticket_label = "Theirs"
+        theirs.save()
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Someone else changed this ticket type", str(response.context["adminform"].form.errors))
+        self.assertEqual(TicketType.objects.get(pk=self.ticket_type.pk).ticket_label, "Theirs")
+
+    def test_sales_do_not_block_a_capacity_edit(self):
+        data = change_form_data(self.client, self.url, qty_total=50, linked_tickets=[])
+        make_ticket(self.ticket_type)  # while the form was open
+        save_if_unchanged = TicketType._save_if_unchanged
+        sold_during_save = []
+
+        def sell_then_save(ticket_type, *args, **kwargs):
+            if not sold_during_save:
+                sold_during_save.append(make_ticket(self.ticket_type))
+            return save_if_unchanged(ticket_type, *args, **kwargs)
+
+        with mock.patch.object(TicketType, "_save_if_unchanged", autospec=True, side_effect=sell_then_save):
+            response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 302)
+        ticket_type = TicketType.objects.get(pk=self.ticket_type.pk)
+        self.assertEqual((ticket_type.qty_total, ticket_type.qty_sold, ticket_type.qty_available), (50, 2, 48))
+
+
+@override_settings(STORAGES=PLAIN_STATIC_FILES)
+class TicketAdminTests(TestCase):
+    def setUp(self):
+        self.ticket = make_ticket(make_ticket_type(make_concert()))
+        self.client.force_login(User.objects.create_superuser("admin"))
+        self.url = f"/admin/ticketing/ticket/{self.ticket.pk}/change/"
+
+    def test_every_changed_field_is_logged(self):
+        data = change_form_data(self.client, self.url, name="Ada King", email="ada@example.org")
+        del data["validity"]  # unticked
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            set(TicketEvent.objects.values_list("kind", "message")),
+            {(TicketEvent.INVALIDATED, "Invalidated by admin."), (TicketEvent.CHANGED, "admin changed name, email.")},
+        )
+
+    def test_history_is_read_only(self):
+        TicketEvent.log([self.ticket], "Issued.", kind=TicketEvent.ISSUED)
+        event = TicketEvent.objects.get()
+
+        self.assertEqual(self.client.get("/admin/ticketing/ticketevent/add/").status_code, 403)
+        self.assertEqual(self.client.post(f"/admin/ticketing/ticketevent/{event.pk}/delete/", {"post": "yes"}).status_code, 403)
+        self.assertEqual(self.client.get(f"/admin/ticketing/ticketevent/{event.pk}/change/").status_code, 200)
+
+    def test_deleting_a_ticket_takes_its_history(self):
+        TicketEvent.log([self.ticket], "Issued.", kind=TicketEvent.ISSUED)
+
+        response = self.client.post(f"/admin/ticketing/ticket/{self.ticket.pk}/delete/", {"post": "yes"})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Ticket.objects.exists())
+        self.assertFalse(TicketEvent.objects.exists())
+
+
+@override_settings(STORAGES=PLAIN_STATIC_FILES)
+class TicketBulkActionTests(TestCase):
+    def setUp(self):
+        concert = make_concert()
+        self.standard = make_ticket_type(concert, qty_total=10)
+        self.concession = make_ticket_type(concert, ticket_label="Concession", price_id="price_concession", qty_total=10)
+        self.standard.linked_tickets.add(self.concession)
+        self.other = make_ticket_type(make_concert(concert_name="Spring Concert"), qty_total=10)
+        self.tickets = [make_ticket(ticket_type) for ticket_type in (self.standard, self.standard, self.concession, self.other)]
+        self.client.force_login(User.objects.create_superuser("admin"))
+
+    def act(self, action, tickets, **data):
+        recalculate = TicketType.recalculate_quantities_for_cluster
+        with mock.patch.object(TicketType, "recalculate_quantities_for_cluster", wraps=recalculate) as spy:
+            response = self.client.post("/admin/ticketing/ticket/", {
+                "action": action, "_selected_action": [ticket.pk for ticket in tickets], **data,
+            })
+        self.recalculated = {ticket_type.cluster_id for ticket_type, in (c.args for c in spy.call_args_list)}
+        self.assertEqual(len(self.recalculated), spy.call_count)  # once per cluster
+        return response
+
+    def sold(self, ticket_type):
+        return TicketType.objects.get(pk=ticket_type.pk).qty_sold
+
+    def test_invalidate_and_validate_recalculate_each_cluster_once(self):
+        self.act("invalidate_tickets", self.tickets)
+
+        self.assertEqual(self.recalculated, {self.standard.pk, self.other.pk})
+        self.assertFalse(Ticket.objects.filter(validity=True).exists())
+        self.assertEqual((self.sold(self.standard), self.sold(self.concession), self.sold(self.other)), (0, 0, 0))
+        self.assertEqual(TicketEvent.objects.filter(kind=TicketEvent.INVALIDATED).count(), 4)
+
+        self.act("validate_tickets", self.tickets[:3])
+
+        self.assertEqual(self.recalculated, {self.standard.pk})
+        self.assertEqual((self.sold(self.standard), self.sold(self.concession), self.sold(self.other)), (3, 3, 0))
+
+    def test_move_asks_for_a_ticket_type_then_moves(self):
+        response = self.act("move_to_ticket_type", self.tickets[:3])
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Move tickets to another ticket type")
+        self.assertEqual(self.recalculated, set())
+
+        self.act("move_to_ticket_type", self.tickets[:3], apply="1", ticket_type=self.other.pk)
+
+        self.assertEqual(self.recalculated, {self.standard.pk, self.other.pk})
+        self.assertEqual(
+            set(Ticket.objects.values_list("ticket_type", "for_concert")),
+            {(self.other.pk, self.other.for_concert_id)},
+        )
+        self.assertEqual((self.sold(self.standard), self.sold(self.other)), (0, 4))
+        self.assertEqual(TicketRemoval.objects.count(), 3)
+
+
+class PastConcertSearchTests(TestCase):
+    def setUp(self):
+        self.symphony = PastConcert.objects.create(
+            title="Beethoven's Ninth", date=date(2024, 3, 1), conductor="Ann Lee", programme="Symphony No. 9",
+        )
+        self.requiem = PastConcert.objects.create(
+            title="A German Requiem", date=date(2025, 3, 1), programme="Brahms: Requiem\nBeethoven: Egmont Overture",
+        )
+
+    def test_title_matches_rank_first(self):
+        results = search.search("beethov")
+
+        self.assertEqual(results, [self.symphony, self.requiem])
+        self.assertGreater(results[0].rank, results[1].rank)
+
+    def test_index_follows_saves_and_deletes(self):
+        self.symphony.title = "Mahler's Fifth"
+        self.symphony.programme = "Symphony No. 5"
+        self.symphony.save()
+        self.assertEqual(search.search("beethoven"), [self.requiem])
+        self.assertEqual(search.search("mahler"), [self.symphony])
+
+        self.requiem.delete()
+        self.assertEqual(search.search("beethoven"), [])
+
+    def test_other_databases_fall_back_to_substring_matching(self):
+        with mock.patch("main_site.search.connection", vendor="mysql"):
+            results = search.search("BEETHOVEN symph")
+
+        self.assertEqual(results, [self.symphony])
+        self.assertEqual(results[0].rank, 0.0)
+
+
+@override_settings(STORAGES=PLAIN_STATIC_FILES, CACHES=PAGE_CACHES)
+class PastConcertsPageTests(TestCase):
+    def setUp(self):
+        caches["pages"].clear()
+        self.concerts = [
+            PastConcert.objects.create(title=f"Concert {n}", date=date(2024, 1 + n // 2, 1)) for n in range(5)
+        ]
+
+    @mock.patch("main_site.views.PAST_CONCERTS_PER_PAGE", 2)
+    def test_pages_follow_the_before_cursor(self):
+        seen = []
+        response = self.client.get("/about/past_concerts")
+        while True:
+            seen += response.context["past_concerts"]
+            cursor = response.context["next_cursor"]
+            if cursor is None:
+                break
+            response = self.client.get("/about/past_concerts", {"before": cursor})
+            self.assertContains(response, "Concert")
+
+        self.assertEqual(seen, sorted(self.concerts, key=lambda concert: (concert.date, concert.pk), reverse=True))
+
+    def test_bad_cursor_is_not_found(self):
+        for cursor in ["nonsense", "2024-13-01.1", "2024-01-01.x"]:
+            self.assertEqual(self.client.get("/about/past_concerts", {"before": cursor}).status_code, 404, cursor)
+
+
+@override_settings(STORAGES=PLAIN_STATIC_FILES, CACHES=PAGE_CACHES)
+class PageCacheTests(TestCase):
+    def setUp(self):
+        caches["pages"].clear()
+
+    def cached(self, name):
+        return caches["pages"].get(cache._key(name))
+
+    def test_saves_re_render_only_dependent_pages_after_commit(self):
+        for save, page in [
+            (lambda: CommitteeMember.objects.create(name="Ada", role="President", email="ada@example.com"), "committee"),
+            (lambda: PastConcert.objects.create(title="Winter Concert", date=date(2024, 12, 1)), "pastconcerts"),
+            (lambda: make_concert(), None),
+        ]:
+            with mock.patch("main_site.cache.refresh") as refresh:
+                with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                    save()
+                    refresh.assert_not_called()
+            self.assertEqual([c.args for c in refresh.call_args_list], [(page,)] if page else [], page)
+            self.assertEqual(len(callbacks), 1 if page else 0)
+
+    def test_changes_show_without_a_cold_cache(self):
+        self.client.get("/about/committee")
+        with self.captureOnCommitCallbacks(execute=True):
+            CommitteeMember.objects.create(name="Ada Lovelace", role="President", email="ada@example.com")
+
+        self.assertIn(b"Ada Lovelace", self.cached("committee")[0])
+        self.assertContains(self.client.get("/about/committee"), "Ada Lovelace")
+
+    def test_only_plain_gets_are_served_from_the_cache(self):
+        caches["pages"].set(cache._key("about"), (b"cached about", "text/html"))
+
+        self.assertEqual(self.client.get("/about").content, b"cached about")
+        self.assertNotEqual(self.client.get("/about", {"utm_source": "x"}).content, b"cached about")
+        self.assertNotEqual(self.client.post("/about").content, b"cached about")
+
+    def test_query_string_requests_are_not_stored(self):
+        self.assertEqual(self.client.get("/about", {"utm_source": "x"}).status_code, 200)
+        self.assertIsNone(self.cached("about"))
+        self.client.get("/about")
+        self.assertIsNotNone(self.cached("about"))
+
+    def test_warm_page_cache(self):
+        out = io.StringIO()
+        call_command("warm_page_cache", stdout=out)
+
+        for name in ["home", "about", "committee", "pastconcerts"]:
+            self.assertIn(f"Warmed {name}", out.getvalue())
+            self.assertIsNotNone(self.cached(name), name)
+
+
+def photo(width, height=100, name="ada.png"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "teal").save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class CommitteeImageTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def member(self, image):
+        return CommitteeMember.objects.create(name="Ada", role="President", email="ada@example.com", image=image)
+
+    def test_variant_widths(self):
+        for width, expected in [(1200, [320, 640, 960]), (960, [320, 640, 960]), (500, [320, 500]), (200, [200])]:
+            variants = self.member(photo(width)).image_variants
+            self.assertEqual([w for w, _ in variants["webp"]], expected, width)
+            self.assertEqual([w for w, _ in variants["jpeg"]], expected, width)
+            self.assertEqual(variants["width"], expected[-1])
+
+    def test_replacing_or_removing_the_photo_deletes_its_variants(self):
+        member = self.member(photo(700))
+        storage = member.image.storage
+        old = [name for ext in ("webp", "jpeg") for _, name in member.image_variants[ext]]
+
+        member.image = photo(400, name="ada-new.png")
+        member.save()
+        self.assertFalse(any(storage.exists(name) for name in old))
+        new = [name for ext in ("webp", "jpeg") for _, name in member.image_variants[ext]]
+        self.assertTrue(all(storage.exists(name) for name in new))
+
+        member.image = None
+        member.save()
+        self.assertEqual(member.image_variants, {})
+        self.assertFalse(any(storage.exists(name) for name in new))
+
+    def test_unreadable_upload_is_saved_without_variants(self):
+        with self.assertLogs("main_site.images", "WARNING"):
+            member = self.member(SimpleUploadedFile("ada.jpg", b"not a jpeg", content_type="image/jpeg"))
+
+        member.refresh_from_db()
+        self.assertEqual(member.image_variants, {})
+        self.assertEqual(member.variant_url, member.image.url)
@@ -1,28 +1,64 @@
+import datetime
+
+from django.db.models import Q
+from django.http import Http404
 from django.shortcuts import render
+from main_site.cache import cached_page
 from main_site.models import CommitteeMember,PastConcert
 
 # Create your views here.
 
+# The highlights are written into home.html, not read from Concert.
+@cached_page("home")
 def home(request):
     """
     Homepage view displaying upcoming concert highlights
     """
     return render(request, 'website/../home.html')
 
+@cached_page("about")
 def about(request):
     """
     About view
     """
     return render(request, 'website/../about.html')
 
+@cached_page("committee", depends_on=[CommitteeMember])
 def committee(request):
     committee_members = CommitteeMember.objects.all().order_by('order')
     return render(request, 'website/../committee.html', {
         'committee_members': committee_members
     })
 
+PAST_CONCERTS_PER_PAGE = 20
+
+
+@cached_page("pastconcerts", depends_on=[PastConcert])
 def pastconcerts(request):
-    past_concerts = PastConcert.objects.all()
+    """
+    The concert archive, newest first, paged by a (date, id) keyset cursor
+    in ?before= so deep pages cost the same as the first.
+    """
+    concerts = PastConcert.objects.order_by('-date', '-id')
+
+    cursor = request.GET.get('before')
+    if cursor:
+        try:
+            date, pk = cursor.split('.')
+            date, pk = datetime.date.fromisoformat(date), int(pk)
+        except ValueError:
+            raise Http404("Invalid page.")
+        concerts = concerts.filter(Q(date__lt=date) | Q(date=date, id__lt=pk))
+
+    page = list(concerts[:PAST_CONCERTS_PER_PAGE + 1])
+    next_cursor = None
+    if len(page) > PAST_CONCERTS_PER_PAGE:
+        page = page[:PAST_CONCERTS_PER_PAGE]
+        next_cursor = f"{page[-1].date.isoformat()}.{page[-1].pk}"
+
     return render(request, 'past_concerts.html', {
-        'past_concerts': past_concerts
-    })
\ No newline at end of file
+        'past_concerts': page,
+        'next_cursor': next_cursor,
+        'is_first_page': not cursor,
+        'total_concerts': PastConcert.objects.count() if not cursor else None,
+    })
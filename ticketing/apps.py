@@ -1,6 +1,15 @@
+import stripe
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class TicketingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ticketing'
+
+    def ready(self):
+        # Connects the snapshot's invalidation signals.
+        from ticketing import catalogue  # noqa: F401
+
+        # Set once here for web requests and management commands alike.
+        stripe.api_key = settings.STRIPE_SECRET_KEY
@@ -0,0 +1,171 @@
+"""
+Checkout cart validation.
+
+validate_cart() checks a whole cart in one query: every requested ticket
+type together with the rest of its linked cluster (via cluster_id). Demand
+is summed per cluster, because linked types draw on one shared pool. It
+returns every problem with the cart at once rather than stopping at the
+first.
+"""
+import hashlib
+import json
+import secrets
+from collections import namedtuple
+
+from django.conf import settings
+from django.db.models import Q
+
+from ticketing.models import TicketType
+
+CartLine = namedtuple("CartLine", ["ticket_type", "quantity"])
+
+# Error codes
+INVALID_CONCERT = "invalid_concert"
+INVALID_ITEM = "invalid_item"
+UNKNOWN_TICKET_TYPE = "unknown_ticket_type"
+WRONG_CONCERT = "wrong_concert"
+NOT_ON_SALE = "not_on_sale"
+INSUFFICIENT = "insufficient_availability"
+
+
+CLIENT_COOKIE = "nk_client"
+_CLIENT_SALT = "ticketing.cart.client"
+
+
+def _error(code, detail, **extra):
+    return {"code": code, "detail": detail, **extra}
+
+
+def _as_int(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def validate_cart(concert_id, line_items):
+    """
+    Return (lines, errors) for the requested concert_id and line_items
+    ([{"ticket_type_id": ..., "quantity": ...}, ...]). lines is a list of
+    CartLine, one per ticket type, and is only meaningful if errors is empty.
+    Lines with a quantity of zero or less are ignored.
+    """
+    errors = []
+    concert_id = _as_int(concert_id)
+    if concert_id is None:
+        errors.append(_error(INVALID_CONCERT, "concert_id is required."))
+
+    # ticket type id -> total quantity, in the order first requested
+    demand = {}
+    for index, item in enumerate(line_items):
+        ticket_type_id = _as_int(item.get("ticket_type_id")) if isinstance(item, dict) else None
+        quantity = _as_int(item.get("quantity", 0)) if isinstance(item, dict) else None
+        if ticket_type_id is None or quantity is None:
+            errors.append(_error(INVALID_ITEM, f"Line item {index + 1} is not valid.", index=index))
+            continue
+        if quantity > 0:
+            demand[ticket_type_id] = demand.get(ticket_type_id, 0) + quantity
+
+    if not demand:
+        return [], errors
+
+    requested = TicketType.objects.filter(pk__in=demand)
+    ticket_types = {
+        ticket_type.pk: ticket_type
+        for ticket_type in TicketType.objects.filter(
+            Q(pk__in=demand) | Q(cluster_id__in=requested.values("cluster_id"))
+        )
+    }
+
+    lines = []
+    for ticket_type_id, quantity in demand.items():
+        ticket_type = ticket_types.get(ticket_type_id)
+        if ticket_type is None:
+            errors.append(_error(
+                UNKNOWN_TICKET_TYPE, f"Ticket type {ticket_type_id} does not exist.",
+                ticket_type_id=ticket_type_id,
+            ))
+            continue
+        if concert_id is not None and ticket_type.for_concert_id != concert_id:
+            errors.append(_error(
+                WRONG_CONCERT, f"{ticket_type.ticket_label} tickets are not for this concert.",
+                ticket_type_id=ticket_type_id,
+            ))
+            continue
+        if not ticket_type.display_ticket or not ticket_type.price_id:
+            errors.append(_error(
+                NOT_ON_SALE, f"{ticket_type.ticket_label} tickets are not on sale.",
+                ticket_type_id=ticket_type_id,
+            ))
+            continue
+        lines.append(CartLine(ticket_type, quantity))
+
+    # Sum demand per cluster and compare with the cluster's shared pool. Every
+    # member should report the same qty_available; take the lowest to be safe.
+    available = {}
+    for ticket_type in ticket_types.values():
+        cluster = ticket_type.cluster_id or ticket_type.pk
+        available[cluster] = min(available.get(cluster, ticket_type.qty_available), ticket_type.qty_available)
+
+    cluster_lines = {}
+    for line in lines:
+        cluster_lines.setdefault(line.ticket_type.cluster_id or line.ticket_type.pk, []).append(line)
+
+    for cluster, members in cluster_lines.items():
+        wanted = sum(line.quantity for line in members)
+        if wanted <= available[cluster]:
+            continue
+        labels = " and ".join(line.ticket_type.ticket_label for line in members)
+        if len(members) > 1:
+            detail = f"Only {available[cluster]} tickets available across {labels}."
+        else:
+            detail = f"Only {available[cluster]} {labels} tickets available."
+        errors.append(_error(
+            INSUFFICIENT, detail,
+            ticket_type_ids=[line.ticket_type.pk for line in members],
+            available=available[cluster],
+            requested=wanted,
+        ))
+
+    return lines, errors
+
+
+def client_id(request):
+    """
+    This browser's checkout identity: a random id kept in a signed cookie.
+    Returns (client id, is new); store a new one with set_client_cookie().
+    """
+    client = request.get_signed_cookie(CLIENT_COOKIE, default=None, salt=_CLIENT_SALT)
+    if client:
+        return client, False
+    return secrets.token_urlsafe(24), True
+
+
+def set_client_cookie(response, client):
+    response.set_signed_cookie(
+        CLIENT_COOKIE,
+        client,
+        salt=_CLIENT_SALT,
+        max_age=24 * 60 * 60,
+        httponly=True,
+        samesite="Lax",
+        secure=not settings.DEBUG,
+    )
+    return response
+
+
+def idempotency_key(client, concert_id, lines, requested_key="", seats=()):
+    """
+    Key identifying a checkout request: the same client asking for the same
+    cart and seats (and the same Idempotency-Key, if it sent one) gets the
+    same key. `client` is the browser's unguessable client_id(), so nobody
+    else can arrive at the key and pick up its session.
+    """
+    cart = sorted((line.ticket_type.pk, line.quantity) for line in lines)
+    payload = [client, requested_key or "", int(concert_id), cart]
+    if seats:
+        payload.append(sorted(str(seat).upper() for seat in seats))
+    payload = json.dumps(payload)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
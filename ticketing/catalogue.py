@@ -0,0 +1,56 @@
+"""
+Snapshot of upcoming concerts and their ticket types, embedded in the ticket
+purchase page so the React app can render without waiting on the API.
+
+The snapshot uses the API's serializers, so it has the same shape as
+/api/tickets/concerts/ and /api/tickets/concert/tickettypes. It is cached
+briefly and dropped whenever a concert or ticket type changes (including
+the quantity recalculation after every sale). The app still re-fetches
+ticket types before checkout, so a slightly stale snapshot only affects
+what's displayed.
+"""
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from ticketing.models import Concert, TicketType, quantities_changed
+
+CACHE_KEY = "ticketing:catalogue:v1"
+CACHE_TIMEOUT = 60
+
+
+def build_snapshot():
+    from api.serializers import ConcertSerializer, TicketTypeSummarySerializer
+
+    concerts = (
+        Concert.objects.filter(concert_date__gte=timezone.localdate())
+        .order_by("concert_date", "concert_time")
+        .prefetch_related(
+            Prefetch("ticket_types", queryset=TicketType.objects.order_by("position"))
+        )
+    )
+    return {
+        "concerts": ConcertSerializer(concerts, many=True).data,
+        # JSON object keys are strings; the frontend looks these up by id.
+        "ticket_types": {
+            str(concert.pk): TicketTypeSummarySerializer(concert.ticket_types.all(), many=True).data
+            for concert in concerts
+        },
+    }
+
+
+def get_snapshot():
+    snapshot = cache.get(CACHE_KEY)
+    if snapshot is None:
+        snapshot = build_snapshot()
+        cache.set(CACHE_KEY, snapshot, CACHE_TIMEOUT)
+    return snapshot
+
+
+@receiver([post_save, post_delete], sender=Concert)
+@receiver([post_save, post_delete], sender=TicketType)
+@receiver(quantities_changed)
+def invalidate_snapshot(sender, **kwargs):
+    cache.delete(CACHE_KEY)
@@ -0,0 +1,118 @@
+"""
+Streaming CSV / JSON Lines exports of a concert's tickets, orders and sales.
+
+Rows are read with values_list() and QuerySet.iterator(), and written out one
+at a time, so memory use doesn't depend on how many tickets a concert has.
+"""
+import csv
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.http import StreamingHttpResponse
+
+from ticketing.models import Order, Ticket, TicketType
+
+
+CHUNK_SIZE = 2000
+
+FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+
+def _tickets(concert):
+    header = ["id", "name", "email", "ticket_type", "validity", "transaction_ID"]
+    rows = (
+        Ticket.objects.filter(for_concert=concert)
+        .order_by("pk")
+        .values_list("pk", "name", "email", "ticket_type__ticket_label", "validity", "transaction_ID")
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    return header, rows
+
+
+def _orders(concert):
+    header = [
+        "id", "stripe_session_id", "status", "customer_name", "customer_email",
+        "total_amount", "currency", "created_at", "confirmed_at",
+    ]
+    session_ids = Ticket.objects.filter(for_concert=concert).values("transaction_ID")
+    rows = (
+        Order.objects.filter(stripe_session_id__in=session_ids)
+        .order_by("pk")
+        .values_list(*(["pk"] + header[1:]))
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    return header, rows
+
+
+def _sales(concert):
+    header = [
+        "ticket_type_id", "ticket_label", "price", "qty_total",
+        "tickets_valid", "tickets_invalid", "revenue",
+    ]
+    ticket_types = (
+        TicketType.objects.filter(for_concert=concert)
+        .order_by("position", "pk")
+        .annotate(
+            tickets_valid=Count("ticket", filter=Q(ticket__validity=True)),
+            tickets_invalid=Count("ticket", filter=Q(ticket__validity=False)),
+            # At the price each ticket was sold at; see ticketing.sales.
+            revenue=Coalesce(
+                Sum(Coalesce("ticket__price", F("price")), filter=Q(ticket__validity=True)),
+                Value(Decimal("0.00")),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            ),
+        )
+        .values_list("pk", "ticket_label", "price", "qty_total", "tickets_valid", "tickets_invalid", "revenue")
+    )
+    rows = ticket_types.iterator(chunk_size=CHUNK_SIZE)
+    return header, rows
+
+
+EXPORTS = {
+    "tickets": _tickets,
+    "orders": _orders,
+    "sales": _sales,
+}
+
+
+class _Echo:
+    """
+    File-like object whose write() hands the value back, for csv.writer.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_export(concert, kind, fmt):
+    """
+    Yield the export as text chunks (one per row, after the header).
+    """
+    header, rows = EXPORTS[kind](concert)
+
+    if fmt == "csv":
+        writer = csv.writer(_Echo())
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+    elif fmt == "jsonl":
+        encoder = DjangoJSONEncoder()
+        for row in rows:
+            yield encoder.encode(dict(zip(header, row))) + "\n"
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+
+def export_filename(concert, kind, fmt):
+    return f"concert-{concert.pk}-{kind}.{fmt}"
+
+
+def streaming_export_response(concert, kind, fmt):
+    response = StreamingHttpResponse(iter_export(concert, kind, fmt), content_type=FORMATS[fmt])
+    response["Content-Disposition"] = f'attachment; filename="{export_filename(concert, kind, fmt)}"'
+    return response
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { Check } from 'lucide-react';
 import { Concert, TicketType, TicketQuantities, FormData } from './types';
-import { api } from './services/api';
+import { api, getSnapshot, getEmbeddedQueueStatus, QueuedError, QueueStatus } from './services/api';
 import { ProgressSteps } from './components/ProgressSteps';
 import { ConcertSelection } from './components/ConcertSelection';
 import { TicketSelection } from './components/TicketSelection';
@@ -10,22 +10,45 @@ import { OrderSummary } from './components/OrderSummary';
 
 export default function TicketsPage() {
   const [step, setStep] = useState(1);
-  const [concerts, setConcerts] = useState<Concert[]>([]);
+  const snapshot = getSnapshot();
+  const [concerts, setConcerts] = useState<Concert[]>(snapshot?.concerts ?? []);
   const [selectedConcertId, setSelectedConcertId] = useState<number | null>(null);
   const [ticketTypes, setTicketTypes] = useState<TicketType[]>([]);
   const [ticketQuantities, setTicketQuantities] = useState<TicketQuantities>({});
   const [clientSecret, setClientSecret] = useState<string | null>(null);
   const [sessionId, setSessionId] = useState<string | null>(null);
-  const [loadingConcerts, setLoadingConcerts] = useState(true);
+  const [loadingConcerts, setLoadingConcerts] = useState(!snapshot);
   const [loadingTickets, setLoadingTickets] = useState(false);
   const [validating, setValidating] = useState(false);
   const [creatingCheckout, setCreatingCheckout] = useState(false);
+  const [queue, setQueue] = useState<QueueStatus>(getEmbeddedQueueStatus);
 
-  // Fetch concerts on mount
+  // Fetch concerts on mount, unless the page embedded them
   useEffect(() => {
-    fetchConcerts();
+    if (!snapshot) {
+      fetchConcerts();
+    }
   }, []);
 
+  // While in the waiting room, poll until admitted
+  useEffect(() => {
+    if (queue.admitted) return;
+    if (queue.queued === false) {
+      // Lost our place (e.g. cookies cleared): reloading the page joins the queue
+      window.location.reload();
+      return;
+    }
+    const timer = window.setTimeout(async () => {
+      try {
+        setQueue(await api.getQueueStatus());
+      } catch (error) {
+        console.error('Error checking queue status:', error);
+        setQueue(prev => ({ ...prev }));  // try again after the same delay
+      }
+    }, (queue.retry_after || 5) * 1000);
+    return () => window.clearTimeout(timer);
+  }, [queue]);
+
   const fetchConcerts = async () => {
     setLoadingConcerts(true);
     try {
@@ -39,18 +62,28 @@ export default function TicketsPage() {
     }
   };
 
+  const showTicketTypes = (data: TicketType[]) => {
+    setTicketTypes(data);
+
+    // Initialize ticket quantities
+    const initialQuantities: TicketQuantities = {};
+    data.forEach(type => {
+      initialQuantities[type.id] = 0;
+    });
+    setTicketQuantities(initialQuantities);
+  };
+
   const fetchTicketTypes = async (concertId: number) => {
+    // Availability is re-checked against the API before checkout
+    const embedded = snapshot?.ticket_types[String(concertId)];
+    if (embedded) {
+      showTicketTypes(embedded);
+      return;
+    }
+
     setLoadingTickets(true);
     try {
-      const data = await api.getTicketTypes(concertId);
-      setTicketTypes(data);
-
-      // Initialize ticket quantities
-      const initialQuantities: TicketQuantities = {};
-      data.forEach(type => {
-        initialQuantities[type.id] = 0;
-      });
-      setTicketQuantities(initialQuantities);
+      showTicketTypes(await api.getTicketTypes(concertId));
     } catch (error) {
       console.error('Error fetching ticket types:', error);
       alert('Failed to load ticket types. Please try again.');
@@ -120,6 +153,11 @@ export default function TicketsPage() {
   };
 
   const handleContinueToCheckout = async () => {
+    if (!queue.admitted) {
+      alert("You're still in the queue for tickets. Checkout will open as soon as it's your turn.");
+      return;
+    }
+
     const isValid = await validateAvailability();
     if (!isValid) return;
 
@@ -138,6 +176,11 @@ export default function TicketsPage() {
       setSessionId(session.session_id);
       setStep(3);
     } catch (error) {
+      if (error instanceof QueuedError) {
+        // Admission expired; back into the queue
+        setQueue(error.queue);
+        return;
+      }
       console.error('Error creating checkout session:', error);
       alert('Failed to create checkout session. Please try again.');
     } finally {
@@ -159,6 +202,16 @@ export default function TicketsPage() {
 
   return (
     <div className="max-w-6xl mx-auto">
+      {!queue.admitted && (
+        <div className="mb-8 rounded-lg border border-[#008888] bg-white p-6 text-center shadow">
+          <p className="text-lg font-semibold text-gray-900">You're in the queue</p>
+          <p className="text-gray-600">
+            {queue.ahead ? `${queue.ahead} ${queue.ahead === 1 ? 'person is' : 'people are'} ahead of you. ` : ''}
+            You can choose your tickets now; checkout opens when it's your turn. Please keep this page open.
+          </p>
+        </div>
+      )}
+
       {/* Progress Steps */}
       <ProgressSteps currentStep={step} />
 
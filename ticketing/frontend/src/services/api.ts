@@ -12,6 +12,53 @@ interface CheckoutSession {
   session_id: string;
 }
 
+export interface CatalogueSnapshot {
+  concerts: Concert[];
+  ticket_types: { [concertId: string]: TicketType[] };
+}
+
+export interface QueueStatus {
+  admitted: boolean;
+  queued?: boolean;  // false: no place yet; only the tickets page hands them out
+  admitted_until?: number;
+  ahead?: number;
+  retry_after?: number;
+}
+
+export class QueuedError extends Error {
+  queue: QueueStatus;
+
+  constructor(message: string, queue: QueueStatus) {
+    super(message);
+    this.queue = queue;
+  }
+}
+
+// Waiting room status at page load, embedded by the ticketing_page view.
+export function getEmbeddedQueueStatus(): QueueStatus {
+  const element = document.getElementById('ticketing-queue');
+  try {
+    return (element && JSON.parse(element.textContent || 'null')) || { admitted: true };
+  } catch {
+    return { admitted: true };
+  }
+}
+
+// Embedded by the ticketing_page view (json_script) so the first render needs no API calls.
+let snapshot: CatalogueSnapshot | null | undefined;
+
+export function getSnapshot(): CatalogueSnapshot | null {
+  if (snapshot === undefined) {
+    const element = document.getElementById('ticketing-catalogue');
+    try {
+      snapshot = element ? JSON.parse(element.textContent || 'null') : null;
+    } catch {
+      snapshot = null;
+    }
+  }
+  return snapshot ?? null;
+}
+
 export const api = {
   async getConcerts(): Promise<Concert[]> {
     const response = await fetch(`${API_BASE}/concerts/`);
@@ -25,6 +72,12 @@ export const api = {
     return response.json();
   },
 
+  async getQueueStatus(): Promise<QueueStatus> {
+    const response = await fetch(`${API_BASE}/queue/`, { credentials: 'same-origin' });
+    if (!response.ok) throw new Error('Failed to fetch queue status');
+    return response.json();
+  },
+
   async createCheckoutSession(concertId: number, lineItems: CheckoutLineItem[]): Promise<CheckoutSession> {
     const response = await fetch(`${API_BASE}/create-checkout-session/`, {
       method: 'POST',
@@ -39,6 +92,9 @@ export const api = {
 
     if (!response.ok) {
       const error = await response.json();
+      if (response.status === 429 && error.queue) {
+        throw new QueuedError(error.detail, error.queue);
+      }
       throw new Error(error.detail || 'Failed to create checkout session');
     }
 
@@ -0,0 +1,103 @@
+"""
+Checking the denormalised TicketType counters against the tickets themselves.
+
+qty_sold/qty_available are kept up to date by recalculate_quantities_for_cluster(),
+but a crash between a ticket write and its recalculation (or manual SQL)
+leaves them wrong. ``find_drift()`` streams ticket types a batch of
+clusters at a time and compares each batch with one grouped count of valid
+tickets; ``repair()`` fixes the drifted rows in one UPDATE per batch.
+
+Both are safe during a live sale. Each batch's rows are read before its
+ticket count, and repairs only apply to rows whose version is unchanged
+since they were read. A row that moved in between was just recalculated by
+the sale that moved it, so it is left alone.
+"""
+from collections import namedtuple
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+from ticketing.models import Ticket, TicketType, quantities_changed
+
+Drift = namedtuple(
+    "Drift",
+    "ticket_type_id cluster_id version qty_sold expected_sold qty_available expected_available",
+)
+
+
+def _batches(batch_size):
+    """
+    Ticket type rows in cluster order, batched without splitting a cluster.
+    """
+    rows = (
+        TicketType.objects.annotate(cluster=Coalesce("cluster_id", "pk", output_field=IntegerField()))
+        .order_by("cluster", "pk")
+        .values_list("pk", "cluster", "version", "qty_total", "qty_sold", "qty_available")
+    )
+    batch = []
+    for row in rows.iterator(chunk_size=batch_size):
+        if len(batch) >= batch_size and row[1] != batch[-1][1]:
+            yield batch
+            batch = []
+        batch.append(row)
+    if batch:
+        yield batch
+
+
+def _sold_per_cluster(cluster_ids):
+    # Clustered the same way as _batches(): a type that isn't linked to any
+    # other (no cluster_id) is a cluster of its own, keyed by its pk.
+    counts = (
+        Ticket.objects.filter(
+            Q(ticket_type__cluster_id__in=cluster_ids)
+            | Q(ticket_type__cluster_id__isnull=True, ticket_type_id__in=cluster_ids),
+            validity=True,
+        )
+        .annotate(cluster=Coalesce("ticket_type__cluster_id", "ticket_type_id", output_field=IntegerField()))
+        .values("cluster")
+        .annotate(sold=Count("pk"))
+        .order_by()
+    )
+    return {row["cluster"]: row["sold"] for row in counts}
+
+
+def find_drift(batch_size=500):
+    """
+    Yield lists of Drift, one list per batch of clusters (empty when the batch is fine).
+    """
+    for batch in _batches(batch_size):
+        sold = _sold_per_cluster({row[1] for row in batch})
+        drifted = []
+        for pk, cluster, version, qty_total, qty_sold, qty_available in batch:
+            expected_sold = sold.get(cluster, 0)
+            expected_available = max(qty_total - expected_sold, 0)
+            if (qty_sold, qty_available) != (expected_sold, expected_available):
+                drifted.append(Drift(
+                    pk, cluster, version, qty_sold, expected_sold, qty_available, expected_available,
+                ))
+        yield drifted
+
+
+def repair(drifted):
+    """
+    Write the expected counters for a batch of Drift rows whose version is
+    unchanged. Returns how many rows were written.
+    """
+    if not drifted:
+        return 0
+    unchanged = Q()
+    for drift in drifted:
+        unchanged |= Q(pk=drift.ticket_type_id, version=drift.version)
+    expected_sold = Case(
+        *[When(pk=drift.ticket_type_id, then=Value(drift.expected_sold)) for drift in drifted],
+        output_field=IntegerField(),
+    )
+    with transaction.atomic():
+        written = TicketType.objects.filter(unchanged).update(
+            qty_sold=expected_sold,
+            qty_available=Greatest(F("qty_total") - expected_sold, Value(0)),
+            version=F("version") + 1,
+        )
+    quantities_changed.send(sender=TicketType, ticket_type_ids=[drift.ticket_type_id for drift in drifted])
+    return written
@@ -0,0 +1,160 @@
+"""
+Structured, non-blocking logging for the ticketing and api apps.
+
+Request threads only put records on an in-memory queue; a background listener
+thread formats them as JSON lines and does the actual I/O. Records carry the
+order/session ids bound with ``bind()`` so a single purchase can be followed
+through checkout and the webhook. See LOGGING in settings for the wiring.
+"""
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+_correlation = contextvars.ContextVar("ticketing_log_correlation", default={})
+
+CORRELATION_FIELDS = ("order_id", "session_id")
+
+# Attributes present on every LogRecord; anything else was passed via extra=.
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+@contextmanager
+def bind(**ids):
+    """
+    Attach correlation ids (order_id, session_id) to every record logged in
+    this context, e.g. ``with bind(session_id=session["id"]): ...``.
+    """
+    token = _correlation.set({**_correlation.get(), **ids})
+    try:
+        yield
+    finally:
+        _correlation.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """
+    Copies the bound correlation ids onto the record. Attach it to the handler:
+    handler filters run in the logging thread, where the context variable is set.
+    """
+
+    def filter(self, record):
+        bound = _correlation.get()
+        for field in CORRELATION_FIELDS:
+            if not hasattr(record, field):
+                setattr(record, field, bound.get(field))
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of DEBUG records for the configured loggers.
+
+    ``rates`` maps a logger name (or parent name) to the fraction to keep,
+    e.g. {"ticketing.webhook": 0.05}. Records at INFO and above always pass.
+    """
+
+    def __init__(self, rates=None):
+        super().__init__()
+        self.rates = dict(rates or {})
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or not self.rates:
+            return True
+        name = record.name
+        while name:
+            if name in self.rates:
+                return random.random() < self.rates[name]
+            name = name.rpartition(".")[0]
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, including correlation ids and any extra= fields.
+    """
+
+    converter = time.gmtime
+
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in CORRELATION_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in CORRELATION_FIELDS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class BackgroundHandler(logging.handlers.QueueHandler):
+    """
+    Queue-backed handler whose writes happen on a background thread.
+
+    The queue is bounded; if the writer falls behind, records are dropped
+    (and counted) rather than blocking the request. The listener is started
+    lazily per process, so it survives forking app servers.
+    """
+
+    def __init__(self, stream=None, filename=None, maxsize=10000):
+        super().__init__(queue.Queue(maxsize=maxsize))
+        if filename:
+            target = logging.FileHandler(filename, delay=True)
+        else:
+            target = logging.StreamHandler(stream or sys.stderr)
+        target.setFormatter(JsonFormatter())
+        self.target = target
+        self.dropped = 0
+        self._listener = None
+        self._listener_pid = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_listener(self):
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._start_lock:
+            if self._listener_pid != pid:
+                self._listener = logging.handlers.QueueListener(
+                    self.queue, self.target, respect_handler_level=True
+                )
+                self._listener.start()
+                self._listener_pid = pid
+                atexit.register(self._listener.stop)
+
+    def prepare(self, record):
+        # Resolve the message and exception text here (they may reference
+        # objects that change later), but leave JSON formatting to the writer.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ticketing import sales
+from ticketing.models import Concert
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the daily sales rollups behind the admin sales dashboard from tickets "
+        "and orders. Run once after deploying them, or to correct them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concert", type=int, help="Only rebuild this concert's rollups.")
+
+    def handle(self, *args, concert=None, **options):
+        if concert is not None:
+            try:
+                concert = Concert.objects.get(pk=concert)
+            except Concert.DoesNotExist:
+                raise CommandError(f"Concert {concert} does not exist.")
+
+        cells = sales.rebuild(concert)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {cells} sales rollup row(s)."))
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+import stripe
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ticketing import stripe_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Handle Stripe events missed by the webhook (while the site was down or failing) "
+        "from the Events API, since the last run. Safe to run often, e.g. every few minutes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, help="Events handled at once (default STRIPE_EVENT_WORKERS).")
+        parser.add_argument(
+            "--since-hours",
+            type=float,
+            help="Look back this many hours instead of from the checkpoint (backfill). "
+                 "Stripe keeps events for 30 days.",
+        )
+        parser.add_argument(
+            "--api-base",
+            help="Stripe API base URL, e.g. http://localhost:12111 for stripe-mock. "
+                 "Uses a checkpoint of its own.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only show how many events would be handled.",
+        )
+
+    def handle(self, *args, workers=None, since_hours=None, api_base=None, dry_run=False, **options):
+        checkpoint = stripe_events.DEFAULT_CHECKPOINT
+        if api_base:
+            stripe.api_base = api_base
+            checkpoint = api_base
+        since = None
+        if since_hours is not None:
+            if since_hours <= 0:
+                raise CommandError("--since-hours must be positive.")
+            since = timezone.now() - timedelta(hours=since_hours)
+
+        if dry_run:
+            events, todo = stripe_events.pending_events(since, checkpoint)
+            self.stdout.write(f"{len(todo)} of {len(events)} listed event(s) to handle.")
+            return
+
+        last = [0]
+
+        def progress(handled, failed, remaining):
+            if handled + failed - last[0] >= 100:
+                last[0] = handled + failed
+                self.stdout.write(f"  {handled} handled, {failed} failed, {remaining} to go")
+
+        result = stripe_events.catch_up(since=since, workers=workers, checkpoint=checkpoint, progress=progress)
+        style = self.style.SUCCESS if not result.failed else self.style.WARNING
+        self.stdout.write(style(
+            f"Listed {result.listed} event(s): {result.handled} handled, "
+            f"{result.skipped} already handled, {result.failed} failed"
+            + (f" ({result.gave_up} given up on after too many attempts, the rest will be retried next run)."
+               if result.gave_up else " (they'll be retried next run)." if result.failed else ".")
+        ))
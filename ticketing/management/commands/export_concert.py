@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ticketing.exports import EXPORTS, FORMATS, iter_export
+from ticketing.models import Concert
+
+
+class Command(BaseCommand):
+    help = "Stream a concert's tickets, orders or per-ticket-type sales as CSV or JSON Lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("concert_id", type=int)
+        parser.add_argument("kind", choices=sorted(EXPORTS))
+        parser.add_argument("--format", dest="fmt", choices=sorted(FORMATS), default="csv")
+        parser.add_argument(
+            "--output", "-o",
+            help="File to write to (defaults to stdout).",
+        )
+
+    def handle(self, *args, concert_id, kind, fmt, output=None, **options):
+        try:
+            concert = Concert.objects.get(pk=concert_id)
+        except Concert.DoesNotExist:
+            raise CommandError(f"Concert {concert_id} does not exist.")
+
+        if output:
+            with open(output, "w", newline="", encoding="utf-8") as f:
+                for chunk in iter_export(concert, kind, fmt):
+                    f.write(chunk)
+        else:
+            for chunk in iter_export(concert, kind, fmt):
+                self.stdout.write(chunk, ending="")
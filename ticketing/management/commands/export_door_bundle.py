@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ticketing.door_bundle import build_bundle
+from ticketing.models import Concert
+
+
+class Command(BaseCommand):
+    help = "Write a concert's offline door-validation bundle (full, or a delta with --since)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("concert_id", type=int)
+        parser.add_argument("output", help="File to write the bundle to.")
+        parser.add_argument(
+            "--since",
+            type=int,
+            default=0,
+            help="Watermark printed for a previous bundle; only changes since then are included.",
+        )
+
+    def handle(self, *args, concert_id, output, since, **options):
+        try:
+            concert = Concert.objects.get(pk=concert_id)
+        except Concert.DoesNotExist:
+            raise CommandError(f"Concert {concert_id} does not exist.")
+
+        data, watermark = build_bundle(concert, since=since or None)
+        with open(output, "wb") as f:
+            f.write(data)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(data)} bytes to {output}. Watermark for the next delta: {watermark}"
+        ))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from ticketing import inventory
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare every ticket type's qty_sold/qty_available with its cluster's valid "
+        "tickets and report (or --repair) any drift. Safe to run during a sale."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Write the correct counters for drifted ticket types.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500, help="Ticket types checked per query.")
+
+    def handle(self, *args, repair=False, batch_size=500, **options):
+        found = repaired = 0
+        for drifted in inventory.find_drift(batch_size=batch_size):
+            for drift in drifted:
+                self.stdout.write(
+                    f"Ticket type {drift.ticket_type_id} (cluster {drift.cluster_id}): "
+                    f"sold {drift.qty_sold} -> {drift.expected_sold}, "
+                    f"available {drift.qty_available} -> {drift.expected_available}"
+                )
+            found += len(drifted)
+            if repair:
+                repaired += inventory.repair(drifted)
+
+        if not found:
+            self.stdout.write(self.style.SUCCESS("No drift found."))
+        elif repair:
+            skipped = found - repaired
+            self.stdout.write(self.style.SUCCESS(
+                f"Repaired {repaired} of {found} drifted ticket type(s)"
+                + (f"; {skipped} changed during the check and were left to their own recalculation." if skipped else ".")
+            ))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"{found} ticket type(s) have drifted. Run with --repair to fix them."
+            ))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ticketing import refunds
+from ticketing.models import Concert
+
+
+class Command(BaseCommand):
+    help = (
+        "Cancel a concert: take its tickets off sale, expire checkouts in progress, refund every "
+        "confirmed order through Stripe and invalidate the tickets. Run again to resume an interrupted run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("concert_id", type=int)
+        parser.add_argument("--workers", type=int, help="Concurrent Stripe calls (default REFUND_WORKERS).")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only show how many orders would be refunded.",
+        )
+
+    def handle(self, *args, concert_id, workers=None, dry_run=False, **options):
+        try:
+            concert = Concert.objects.get(pk=concert_id)
+        except Concert.DoesNotExist:
+            raise CommandError(f"Concert {concert_id} does not exist.")
+
+        orders = refunds.concert_orders(concert)
+        to_refund = orders.filter(status__in=["confirmed", "refunding"]).count()
+        if dry_run:
+            self.stdout.write(f"{to_refund} order(s) to refund for {concert}.")
+            return
+
+        self.stdout.write(f"Refunding {to_refund} order(s) for {concert}...")
+        last = [0]
+
+        def progress(refunded, failed):
+            if refunded + failed - last[0] >= 100:
+                last[0] = refunded + failed
+                self.stdout.write(f"  {refunded} refunded, {failed} failed")
+
+        result = refunds.refund_concert(concert, workers=workers, progress=progress)
+        style = self.style.SUCCESS if not result.failed else self.style.WARNING
+        self.stdout.write(style(
+            f"Refunded {result.refunded} order(s), {result.failed} failed, "
+            f"{result.expired} checkout(s) in progress expired"
+            + (" (run again to retry them)." if result.failed else ".")
+        ))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from ticketing import rendering
+from ticketing.models import Order, Ticket
+
+
+class Command(BaseCommand):
+    help = (
+        "Render (or re-render) ticket documents for confirmed orders in the rendering "
+        "process pool, e.g. after changing the ticket template."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concert", type=int, help="Only orders with tickets for this concert.")
+        parser.add_argument("--order", type=int, help="Only this order.")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render even if a cached document exists.",
+        )
+
+    def handle(self, *args, concert=None, order=None, force=False, **options):
+        orders = Order.objects.filter(status="confirmed").order_by("pk")
+        if order:
+            orders = orders.filter(pk=order)
+        if concert:
+            session_ids = Ticket.objects.filter(for_concert_id=concert).values("transaction_ID")
+            orders = orders.filter(stripe_session_id__in=session_ids)
+
+        rendered = failed = 0
+        for order_pk, result in rendering.render_orders(orders, force=force):
+            if isinstance(result, Exception):
+                failed += 1
+                self.stderr.write(f"Order {order_pk}: {result!r}")
+            else:
+                rendered += 1
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"Order {order_pk}: {result}")
+
+        self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} order(s), {failed} failed."))
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ticketing import outbox
+
+
+class Command(BaseCommand):
+    help = "Send queued transactional emails in batches over a reused connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, help="Emails claimed per batch.")
+        parser.add_argument("--rate", type=int, help="Maximum emails per minute (0 for no limit).")
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, polling for new emails every --interval seconds.",
+        )
+        parser.add_argument("--interval", type=float, default=5.0)
+
+    def handle(self, *args, batch_size=None, rate=None, loop=False, interval=5.0, **options):
+        while True:
+            sent, failed = outbox.drain(batch_size=batch_size, rate_per_minute=rate)
+            if sent or failed or not loop:
+                self.stdout.write(f"Sent {sent} email(s), {failed} failed.")
+            if not loop:
+                return
+            time.sleep(interval)
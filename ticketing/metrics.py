@@ -0,0 +1,368 @@
+"""
+Prometheus text-format metrics for the ticketing flow.
+
+Counters and histograms are updated in-process with no I/O: either in a plain
+dict, or (when METRICS_MULTIPROCESS_DIR is set) in a small memory-mapped file
+per worker process, so that gunicorn-style deployments can be scraped as one.
+Gauges that describe the database (pending orders, cluster availability) are
+only computed when the /metrics endpoint is scraped.
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0, 21600.0)
+
+
+class _MemoryStore:
+    """
+    Per-process sample storage used when no multiprocess directory is configured.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, key, amount):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def items(self):
+        with self._lock:
+            return list(self._values.items())
+
+
+class _MmapStore:
+    """
+    Sample storage backed by a memory-mapped file owned by this process.
+
+    Layout: an 8 byte header holding the number of used bytes, followed by
+    entries of (uint32 key length, utf-8 key padded to 8 bytes, float64 value).
+    Updates are a struct.pack_into() on the mapping, so they never block on
+    disk; the scraper reads every process' file and sums the samples.
+    """
+
+    INITIAL_SIZE = 64 * 1024
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a+b")
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.truncate(self.INITIAL_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._offsets = {}
+        used = struct.unpack_from("Q", self._map, 0)[0]
+        if used == 0:
+            used = 8
+            struct.pack_into("Q", self._map, 0, used)
+        for key, _value, offset in self._entries(self._map, used):
+            self._offsets[key] = offset
+
+    @staticmethod
+    def _entries(buf, used):
+        pos = 8
+        while pos < used:
+            key_len = struct.unpack_from("I", buf, pos)[0]
+            key_end = pos + 4 + key_len
+            value_offset = key_end + (-key_end % 8)
+            key = bytes(buf[pos + 4:key_end]).decode("utf-8")
+            yield key, struct.unpack_from("d", buf, value_offset)[0], value_offset
+            pos = value_offset + 8
+
+    def _allocate(self, key):
+        encoded = key.encode("utf-8")
+        used = struct.unpack_from("Q", self._map, 0)[0]
+        key_end = used + 4 + len(encoded)
+        value_offset = key_end + (-key_end % 8)
+        needed = value_offset + 8
+        if needed > len(self._map):
+            size = len(self._map)
+            while size < needed:
+                size *= 2
+            self._map.close()
+            self._file.truncate(size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        struct.pack_into("I", self._map, used, len(encoded))
+        self._map[used + 4:key_end] = encoded
+        struct.pack_into("d", self._map, value_offset, 0.0)
+        # Publish the entry only once it is fully written.
+        struct.pack_into("Q", self._map, 0, needed)
+        self._offsets[key] = value_offset
+        return value_offset
+
+    def inc(self, key, amount):
+        with self._lock:
+            offset = self._offsets.get(key)
+            if offset is None:
+                offset = self._allocate(key)
+            value = struct.unpack_from("d", self._map, offset)[0]
+            struct.pack_into("d", self._map, offset, value + amount)
+
+    @classmethod
+    def read_directory(cls, directory):
+        totals = {}
+        for path in Path(directory).glob("metrics_*.db"):
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < 8:
+                continue
+            used = min(struct.unpack_from("Q", data, 0)[0], len(data))
+            for key, value, _offset in cls._entries(data, used):
+                totals[key] = totals.get(key, 0.0) + value
+        return list(totals.items())
+
+
+_store = None
+_store_pid = None
+_store_lock = threading.Lock()
+
+
+def _get_store():
+    """
+    Return the sample store for the current process, recreating it after a fork.
+    """
+    global _store, _store_pid
+    pid = os.getpid()
+    if _store_pid != pid:
+        with _store_lock:
+            if _store_pid != pid:
+                directory = getattr(settings, "METRICS_MULTIPROCESS_DIR", None)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                    _store = _MmapStore(os.path.join(directory, f"metrics_{pid}.db"))
+                else:
+                    _store = _MemoryStore()
+                _store_pid = pid
+    return _store
+
+
+def _collected_samples():
+    directory = getattr(settings, "METRICS_MULTIPROCESS_DIR", None)
+    if directory:
+        return _MmapStore.read_directory(directory)
+    return _get_store().items()
+
+
+_registry = {}
+_collectors = []
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _registry[name] = self
+
+    def _key(self, suffix, labels, extra=()):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        pairs = [[name, str(labels[name])] for name in self.labelnames]
+        pairs.extend([list(pair) for pair in extra])
+        return json.dumps([self.name, suffix, pairs], separators=(",", ":"))
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        _get_store().inc(self._key("_total", labels), amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        store = _get_store()
+        # Buckets are stored non-cumulatively (one increment per observation)
+        # and accumulated when rendering.
+        bound = "+Inf"
+        for upper in self.buckets:
+            if value <= upper:
+                bound = repr(upper)
+                break
+        store.inc(self._key("_bucket", labels, [("le", bound)]), 1)
+        store.inc(self._key("_sum", labels), value)
+        store.inc(self._key("_count", labels), 1)
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+def register_collector(func):
+    """
+    Register a callable returning (name, help, [(labels_dict, value), ...]) gauge
+    families. Collectors only run when /metrics is scraped.
+    """
+    _collectors.append(func)
+    return func
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ""
+    escaped = []
+    for name, value in pairs:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value):
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def render():
+    """
+    Render every registered metric in the Prometheus text exposition format.
+    """
+    samples = {}
+    for key, value in _collected_samples():
+        name, suffix, pairs = json.loads(key)
+        samples.setdefault(name, []).append((suffix, [tuple(p) for p in pairs], value))
+
+    lines = []
+    for name, metric in sorted(_registry.items()):
+        lines.append(f"# HELP {name} {metric.documentation}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        metric_samples = samples.get(name, [])
+
+        if metric.kind == "counter":
+            for suffix, pairs, value in sorted(metric_samples):
+                lines.append(f"{name}{suffix}{_format_labels(pairs)} {_format_value(value)}")
+            continue
+
+        # Histograms: rebuild cumulative buckets per label set.
+        series = {}
+        for suffix, pairs, value in metric_samples:
+            if suffix == "_bucket":
+                labels, bound = tuple(pairs[:-1]), pairs[-1][1]
+                series.setdefault(labels, {}).setdefault("buckets", {})[bound] = value
+            else:
+                series.setdefault(tuple(pairs), {})[suffix] = value
+        for labels, data in sorted(series.items()):
+            cumulative = 0.0
+            buckets = data.get("buckets", {})
+            for upper in [repr(b) for b in metric.buckets] + ["+Inf"]:
+                cumulative += buckets.get(upper, 0.0)
+                pairs = list(labels) + [("le", upper)]
+                lines.append(f"{name}_bucket{_format_labels(pairs)} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(data.get('_sum', 0.0))}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(data.get('_count', 0.0))}")
+
+    for collector in _collectors:
+        for name, documentation, values in collector():
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in values:
+                lines.append(f"{name}{_format_labels(sorted(labels.items()))} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Ticketing metrics
+# ---------------------------------------------------------------------------
+
+CHECKOUT_SESSION_SECONDS = Histogram(
+    "nk_checkout_session_seconds",
+    "Time taken to create a checkout session, including validation and Stripe.",
+    ["outcome"],
+)
+STRIPE_CALL_SECONDS = Histogram(
+    "nk_stripe_call_seconds",
+    "Duration of outbound Stripe API calls.",
+    ["call"],
+)
+WEBHOOK_PROCESSING_SECONDS = Histogram(
+    "nk_webhook_processing_seconds",
+    "Time taken to process a Stripe webhook event.",
+    ["event_type"],
+)
+WEBHOOK_LAG_SECONDS = Histogram(
+    "nk_webhook_lag_seconds",
+    "Delay between Stripe creating an event and us processing it.",
+    ["event_type"],
+    buckets=LAG_BUCKETS,
+)
+TICKETS_ISSUED = Counter(
+    "nk_tickets_issued",
+    "Tickets created for confirmed orders.",
+)
+OVERSELL_REJECTIONS = Counter(
+    "nk_oversell_rejections",
+    "Checkout attempts rejected because not enough tickets were available.",
+)
+ORDERS_FAILED = Counter(
+    "nk_orders_failed",
+    "Orders marked as failed.",
+    ["reason"],
+)
+ORDERS_REFUNDED = Counter(
+    "nk_orders_refunded",
+    "Orders refunded, by bulk concert refunds or charge.refunded webhooks.",
+    ["source"],
+)
+STRIPE_EVENTS_CAUGHT_UP = Counter(
+    "nk_stripe_events_caught_up",
+    "Missed Stripe events handled from the Events API by the catch-up.",
+    ["event_type"],
+)
+
+
+@contextmanager
+def stripe_call(call):
+    """
+    Time an outbound Stripe API call, e.g. ``with stripe_call("checkout.Session.create"):``.
+    """
+    with STRIPE_CALL_SECONDS.time(call=call):
+        yield
+
+
+@register_collector
+def _inventory_gauges():
+    from ticketing.models import Order, TicketType
+
+    pending = Order.objects.filter(status="pending").count()
+
+    # Linked ticket types share one pool, so report each cluster once,
+    # labelled by its cluster id (the lowest ticket type id in it).
+    clusters = {}
+    rows = TicketType.objects.order_by("pk").values_list("cluster_id", "pk", "for_concert_id", "qty_available")
+    for cluster_id, pk, concert_id, available in rows:
+        clusters.setdefault(cluster_id or pk, (concert_id, available))
+
+    return [
+        ("nk_orders_pending", "Orders awaiting payment confirmation.", [({}, pending)]),
+        (
+            "nk_cluster_tickets_available",
+            "Tickets still available per linked ticket type cluster.",
+            [
+                ({"cluster": root, "concert": concert_id or ""}, available)
+                for root, (concert_id, available) in sorted(clusters.items())
+            ],
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:07
+
+import re
+from datetime import datetime
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+# Automated entries were appended as "[<timestamp>] - <message>" with no separator.
+LOG_ENTRY = re.compile(r"\[([^\]]+)\] - (.*?)(?=\[[^\]]+\] - |\Z)", re.DOTALL)
+
+
+def split_change_logs(apps, schema_editor):
+    Ticket = apps.get_model("ticketing", "Ticket")
+    TicketEvent = apps.get_model("ticketing", "TicketEvent")
+    migrated_at = django.utils.timezone.now()
+
+    events = []
+    tickets = Ticket.objects.exclude(change_log="").values_list("pk", "change_log")
+    for ticket_id, change_log in tickets.iterator(chunk_size=2000):
+        matches = list(LOG_ENTRY.finditer(change_log))
+        leading = change_log[:matches[0].start()] if matches else change_log
+        if leading.strip():
+            # Hand-written notes that don't follow the automated format.
+            events.append(TicketEvent(
+                ticket_id=ticket_id, created_at=migrated_at, kind="note", message=leading.strip(),
+            ))
+        for match in matches:
+            try:
+                created_at = datetime.fromisoformat(match.group(1).strip())
+            except ValueError:
+                created_at = migrated_at
+            message = match.group(2).strip()
+            kind = "issued" if message == "Ticket added to database." else "note"
+            events.append(TicketEvent(
+                ticket_id=ticket_id, created_at=created_at, kind=kind, message=message,
+            ))
+
+        if len(events) >= 2000:
+            TicketEvent.objects.bulk_create(events)
+            events = []
+    TicketEvent.objects.bulk_create(events)
+
+
+def join_change_logs(apps, schema_editor):
+    Ticket = apps.get_model("ticketing", "Ticket")
+    TicketEvent = apps.get_model("ticketing", "TicketEvent")
+
+    logs = {}
+    events = TicketEvent.objects.order_by("ticket_id", "created_at", "id")
+    for ticket_id, created_at, message in events.values_list("ticket_id", "created_at", "message").iterator():
+        logs[ticket_id] = logs.get(ticket_id, "") + f"[{created_at}] - {message}"
+    for ticket_id, change_log in logs.items():
+        Ticket.objects.filter(pk=ticket_id).update(change_log=change_log)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0012_delete_orderitem'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('kind', models.CharField(choices=[('issued', 'Issued'), ('validated', 'Validated'), ('invalidated', 'Invalidated'), ('changed', 'Changed'), ('note', 'Note')], default='note', max_length=20)),
+                ('message', models.TextField(blank=True, default='')),
+                ('ticket', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='events', to='ticketing.ticket')),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['ticket', 'created_at'], name='ticketevent_ticket_time')],
+            },
+        ),
+        migrations.RunPython(split_change_logs, join_change_logs),
+        migrations.RemoveField(
+            model_name='ticket',
+            name='change_log',
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:09
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0013_ticketevent'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ticket',
+            name='transaction_ID',
+            field=models.CharField(db_index=True, default='', help_text='Autogenerated transaction ID from STRIPE', max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'created_at'], name='order_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(django.db.models.functions.text.Upper('customer_email'), name='order_email_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='ticket_name_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='ticket_email_upper'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0014_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='admitted_at',
+            field=models.DateTimeField(blank=True, help_text='Set when the ticket is scanned at the door.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='ticketevent',
+            name='kind',
+            field=models.CharField(choices=[('issued', 'Issued'), ('validated', 'Validated'), ('invalidated', 'Invalidated'), ('changed', 'Changed'), ('admitted', 'Admitted'), ('note', 'Note')], default='note', max_length=20),
+        ),
+    ]
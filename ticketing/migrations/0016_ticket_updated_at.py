@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0015_ticket_admitted_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['for_concert', 'updated_at'], name='ticket_concert_updated'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:25
+
+from django.db import migrations, models
+
+
+def fill_cluster_ids(apps, schema_editor):
+    TicketType = apps.get_model('ticketing', 'TicketType')
+    parent = {pk: pk for pk in TicketType.objects.values_list('pk', flat=True)}
+
+    def find(pk):
+        while parent[pk] != pk:
+            pk = parent[pk]
+        return pk
+
+    links = TicketType.linked_tickets.through.objects.values_list('from_tickettype_id', 'to_tickettype_id')
+    for a, b in links:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    for pk in parent:
+        TicketType.objects.filter(pk=pk).update(cluster_id=find(pk))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0017_outboxemail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tickettype',
+            name='cluster_id',
+            field=models.IntegerField(blank=True, db_index=True, editable=False, help_text='Lowest id among this ticket type and those linked to it.', null=True),
+        ),
+        migrations.RunPython(fill_cluster_ids, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0018_tickettype_cluster_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='client_secret',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, help_text='When the Stripe session expires.', null=True),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='idempotency_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0019_order_idempotency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tickettype',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0021_salesrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeatHold',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seats', models.JSONField(default=list)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SeatMap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rows', models.JSONField(default=list, help_text='Rows from the front, e.g. [{"label": "A", "seats": 24}, {"label": "B", "seats": 26}]. Seats are numbered from 1 along each row.')),
+                ('sold', models.BinaryField(default=b'')),
+                ('held', models.BinaryField(default=b'')),
+                ('version', models.PositiveIntegerField(default=1, editable=False)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='seat',
+            field=models.IntegerField(blank=True, editable=False, help_text="Seat number on the concert's seating plan, for seated ticket types.", null=True),
+        ),
+        migrations.AddField(
+            model_name='tickettype',
+            name='seated',
+            field=models.BooleanField(default=False, help_text="When ticked, each ticket is allocated a seat from the concert's seating plan."),
+        ),
+        migrations.AddConstraint(
+            model_name='ticket',
+            constraint=models.UniqueConstraint(condition=models.Q(('seat__isnull', False), ('validity', True)), fields=('for_concert', 'seat'), name='ticket_unique_seat'),
+        ),
+        migrations.AddField(
+            model_name='seathold',
+            name='order',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='seat_hold', to='ticketing.order'),
+        ),
+        migrations.AddField(
+            model_name='seatmap',
+            name='concert',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='seat_map', to='ticketing.concert'),
+        ),
+        migrations.AddField(
+            model_name='seathold',
+            name='seat_map',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='holds', to='ticketing.seatmap'),
+        ),
+    ]
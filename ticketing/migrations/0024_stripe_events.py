@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0023_order_refunds'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StripeEventCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('processed_through', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StripeEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.CharField(max_length=255, unique=True)),
+                ('event_type', models.CharField(max_length=100)),
+                ('created', models.DateTimeField(help_text='When Stripe created the event.')),
+                ('source', models.CharField(choices=[('webhook', 'Webhook'), ('catch_up', 'Catch-up')], default='webhook', max_length=20)),
+                ('processed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created'],
+                'indexes': [models.Index(fields=['created'], name='stripeevent_created')],
+            },
+        ),
+    ]
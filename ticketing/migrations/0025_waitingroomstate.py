@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0024_stripe_events'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitingRoomState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('issued', models.BigIntegerField(default=0)),
+                ('served', models.BigIntegerField(default=0)),
+                ('tokens', models.FloatField(default=0)),
+                ('refilled_at', models.FloatField(default=0, help_text='Epoch seconds of the last token refill.')),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0025_waitingroomstate'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ticket',
+            name='ticket_name_upper',
+        ),
+    ]
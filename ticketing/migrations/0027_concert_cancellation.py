@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0026_drop_ticket_name_upper'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='concert',
+            name='cancelled_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='concert',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='ticketing.concert'),
+        ),
+    ]
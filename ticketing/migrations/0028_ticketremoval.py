@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:11
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0027_concert_cancellation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketRemoval',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ticket_id', models.BigIntegerField()),
+                ('removed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('concert', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='ticketing.concert')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['concert', 'removed_at'], name='ticketremoval_concert_time')],
+            },
+        ),
+    ]
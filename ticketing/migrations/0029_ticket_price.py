@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0028_ticketremoval'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='price',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Price paid for this ticket, from its order. Empty for tickets added in the admin.', max_digits=10, null=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticketing', '0029_ticket_price'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stripeevent',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='Failed attempts to handle it.'),
+        ),
+        migrations.AddField(
+            model_name='stripeevent',
+            name='last_error',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='stripeevent',
+            name='status',
+            field=models.CharField(choices=[('handled', 'Handled'), ('failed', 'Failed, will retry'), ('gave_up', 'Gave up')], default='handled', max_length=20),
+        ),
+    ]
@@ -1,8 +1,31 @@
-from django.db import models
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
+import hashlib
+import json
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest, Upper
+from django.db.models.signals import m2m_changed, post_save, post_delete
+from django.dispatch import Signal, receiver
+from django.utils import timezone
 # Create your models here.
 
+logger = logging.getLogger("ticketing.models")
+
+_deferred = threading.local()
+
+# Sent after qty_sold/qty_available are recalculated. Those writes use
+# update(), so post_save doesn't fire for them.
+quantities_changed = Signal()
+
+
+class VersionConflict(Exception):
+    """
+    Raised when saving a TicketType that someone else has written since it was loaded.
+    """
+
 
 class Concert(models.Model):
     concert_name = models.CharField(max_length=100, unique=False)
@@ -11,6 +34,8 @@ class Concert(models.Model):
     concert_location = models.CharField(max_length=100)
     concert_description = models.TextField()
     conductor = models.CharField(max_length=100, unique=False, null=True, blank=True)
+    # Set when refunds for the concert start; orders paid after that are refunded, not issued.
+    cancelled_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     def __str__(self):
         return f"{self.concert_name} - {self.concert_date}, {self.concert_time}"
@@ -57,6 +82,25 @@ class TicketType(models.Model):
         help_text="When ticked, this will show as a purchasable ticket. "
                   "This should only be false for complimentary tickets.",
     )
+    seated = models.BooleanField(
+        default=False,
+        help_text="When ticked, each ticket is allocated a seat from the concert's seating plan.",
+    )
+    # Denormalised from linked_tickets by refresh_cluster_ids(), so a cluster
+    # can be loaded (or grouped by) in one query.
+    cluster_id = models.IntegerField(
+        null=True, blank=True, editable=False, db_index=True,
+        help_text="Lowest id among this ticket type and those linked to it.",
+    )
+    # Bumped by every write. Quantity recalculation and save() only write a
+    # row whose version is unchanged since they read it, so concurrent
+    # writers notice each other instead of overwriting.
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    # Written by recalculate_quantities_for_cluster()/refresh_cluster_ids()
+    # only, never by save() on an existing row.
+    MANAGED_FIELDS = ("qty_sold", "qty_available", "cluster_id", "version")
+    RECALCULATE_ATTEMPTS = 5
 
     def __str__(self):
         return f"{self.ticket_label}"
@@ -66,6 +110,9 @@ class TicketType(models.Model):
         Returns a queryset of all TicketTypes in the same 'pool' as this one:
         this ticket type + anything linked to it (symmetric).
         """
+        if self.cluster_id is not None:
+            return TicketType.objects.filter(cluster_id=self.cluster_id)
+
         visited_ids = set()
         to_visit = [self]
 
@@ -80,27 +127,87 @@ class TicketType(models.Model):
 
         return TicketType.objects.filter(pk__in=visited_ids)
 
+    @classmethod
+    def refresh_cluster_ids(cls):
+        """
+        Recompute cluster_id for every ticket type from the links between them.
+        Called whenever links change or a ticket type is deleted.
+        """
+        parent = {pk: pk for pk in cls.objects.values_list("pk", flat=True)}
+
+        def find(pk):
+            while parent[pk] != pk:
+                parent[pk] = parent[parent[pk]]
+                pk = parent[pk]
+            return pk
+
+        for a, b in cls.linked_tickets.through.objects.values_list("from_tickettype_id", "to_tickettype_id"):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        clusters = {}
+        for pk in parent:
+            clusters.setdefault(find(pk), []).append(pk)
+        for root, members in clusters.items():
+            cls.objects.filter(pk__in=members).exclude(cluster_id=root).update(cluster_id=root)
+
     @classmethod
     def recalculate_quantities_for_cluster(cls, root_ticket_type):
         """
         Recalculate qty_sold and qty_available for the entire 'cluster'
         of linked TicketTypes around root_ticket_type.
-        """
-        # if Ticket is in the same models.py, no import needed; otherwise:
-        # from .models import Ticket
 
+        Each row is only written if its version hasn't moved since the count
+        was taken; if another sale or edit got in first, count again. No
+        locks are held while counting.
+        """
         cluster = root_ticket_type.get_linked_cluster()
 
-        sold_count = Ticket.objects.filter(
-            ticket_type__in=cluster,
-            validity=True,
-        ).count()
+        for attempt in range(cls.RECALCULATE_ATTEMPTS):
+            versions = dict(cluster.values_list("pk", "version"))
+            sold_count = Ticket.objects.filter(
+                ticket_type__in=list(versions),
+                validity=True,
+            ).count()
+            written = sum(
+                cls._write_quantities(cls.objects.filter(pk=pk, version=version), sold_count)
+                for pk, version in versions.items()
+            )
+            if written == len(versions):
+                break
+        else:
+            # Still contended: the freshest count wins.
+            logger.warning(
+                "Quantity recalculation kept conflicting",
+                extra={"ticket_type_id": root_ticket_type.pk, "attempts": cls.RECALCULATE_ATTEMPTS},
+            )
+            versions = dict(cluster.values_list("pk", "version"))
+            sold_count = Ticket.objects.filter(ticket_type__in=list(versions), validity=True).count()
+            cls._write_quantities(cls.objects.filter(pk__in=list(versions)), sold_count)
+
+        quantities_changed.send(sender=cls, ticket_type_ids=list(versions))
+
+    @staticmethod
+    def _write_quantities(queryset, sold_count):
+        return queryset.update(
+            qty_sold=sold_count,
+            qty_available=Greatest(F("qty_total") - sold_count, Value(0)),
+            version=F("version") + 1,
+        )
 
-        for tt in cluster:
-            tt.qty_sold = sold_count
-            remaining = tt.qty_total - sold_count
-            tt.qty_available = remaining if remaining > 0 else 0
-            tt.save(update_fields=["qty_sold", "qty_available"])
+    @classmethod
+    def recalculate_quantities_for_clusters(cls, ticket_type_ids):
+        """
+        Recalculate every distinct cluster touched by ticket_type_ids exactly once.
+        """
+        done = set()
+        for ticket_type in cls.objects.filter(pk__in=set(ticket_type_ids) - {None}):
+            if ticket_type.pk in done:
+                continue
+            cluster_ids = set(ticket_type.get_linked_cluster().values_list("pk", flat=True))
+            done |= cluster_ids
+            cls.recalculate_quantities_for_cluster(ticket_type)
 
     def save(self, *args, **kwargs):
         # Detect if qty_total changed (or this is new)
@@ -112,7 +219,14 @@ class TicketType(models.Model):
                 pass
 
         # Save this TicketType first
-        super().save(*args, **kwargs)
+        if self._state.adding or kwargs.get("update_fields") is not None or kwargs.get("force_insert"):
+            super().save(*args, **kwargs)
+        else:
+            self._save_if_unchanged(*args, **kwargs)
+        if self.cluster_id is None:
+            # New and not linked to anything yet: a cluster of its own.
+            self.cluster_id = self.pk
+            TicketType.objects.filter(pk=self.pk).update(cluster_id=self.pk)
 
         # If new or qty_total changed, propagate to cluster and recalc
         if old_total is None or old_total != self.qty_total:
@@ -124,13 +238,60 @@ class TicketType(models.Model):
 
             # Now recalc sold/available for the cluster
             TicketType.recalculate_quantities_for_cluster(self)
+            self.refresh_from_db(fields=["qty_total", "qty_sold", "qty_available", "version"])
+
+    def _save_if_unchanged(self, *args, **kwargs):
+        """
+        Save an existing row only if its version still matches, raising
+        VersionConflict otherwise. The counters are left out of the write:
+        recalculate_quantities_for_cluster() owns them.
+        """
+        fields = [
+            f.name for f in self._meta.concrete_fields
+            if not f.primary_key and f.name not in self.MANAGED_FIELDS
+        ]
+        with transaction.atomic():
+            bumped = TicketType.objects.filter(pk=self.pk, version=self.version).update(
+                version=F("version") + 1
+            )
+            if not bumped:
+                raise VersionConflict(f"Ticket type {self.pk} has changed since it was loaded.")
+            self.version += 1
+            kwargs["update_fields"] = fields
+            super().save(*args, **kwargs)
+
+    def edit_digest(self):
+        """
+        Digest of the fields staff edit (not the counters sales keep moving),
+        used by the admin to spot edits made while a form was open.
+        """
+        values = {
+            f.attname: getattr(self, f.attname) for f in self._meta.concrete_fields
+            if not f.primary_key and f.name not in self.MANAGED_FIELDS
+        }
+        if self.pk:
+            values["linked_tickets"] = sorted(self.linked_tickets.values_list("pk", flat=True))
+        encoded = json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+@receiver(m2m_changed, sender=TicketType.linked_tickets.through)
+def update_cluster_ids_on_link(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        TicketType.refresh_cluster_ids()
+
+
+@receiver(post_delete, sender=TicketType)
+def update_cluster_ids_on_delete(sender, instance, **kwargs):
+    # Removing a ticket type can split the cluster it joined together.
+    TicketType.refresh_cluster_ids()
 
 
 class Ticket(models.Model):
     name = models.CharField(max_length=60, help_text="Customer's Name", default="")
     email = models.CharField(max_length=100, help_text="Customer's Email", default="")
     transaction_ID = models.CharField(
-        max_length=100, help_text="Autogenerated transaction ID from STRIPE", default=""
+        max_length=100, help_text="Autogenerated transaction ID from STRIPE", default="", db_index=True
     )
     for_concert = models.ForeignKey(
         Concert, on_delete=models.CASCADE, null=True, default=None
@@ -141,24 +302,178 @@ class Ticket(models.Model):
     validity = models.BooleanField(
         help_text="If ticked, this ticket is valid.", default=True
     )
-    change_log = models.TextField(
-        help_text="Will log any changes by automatic systems. I recommend adding any changes here if editing manually.",
-        blank=True,
-        default="",
+    admitted_at = models.DateTimeField(
+        null=True, blank=True, help_text="Set when the ticket is scanned at the door."
+    )
+    seat = models.IntegerField(
+        null=True, blank=True, editable=False,
+        help_text="Seat number on the concert's seating plan, for seated ticket types.",
     )
+    price = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True, editable=False,
+        help_text="Price paid for this ticket, from its order. Empty for tickets added in the admin.",
+    )
+    # Bulk queryset.update() calls must set this too; door bundle deltas rely on it.
+    updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Backs the admin's whole-email search (UPPER(email) = ...).
+            models.Index(Upper("email"), name="ticket_email_upper"),
+            models.Index(fields=["for_concert", "updated_at"], name="ticket_concert_updated"),
+        ]
+        constraints = [
+            # Belt and braces under the seat map's bitmaps: never issue one seat twice.
+            models.UniqueConstraint(
+                fields=["for_concert", "seat"], condition=models.Q(validity=True, seat__isnull=False),
+                name="ticket_unique_seat",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    @property
+    def seat_label(self):
+        if self.seat is None:
+            return ""
+        from ticketing.seating import Layout
+        return Layout(self.for_concert.seat_map.rows).label(self.seat)
+
+    @property
+    def code(self):
+        """
+        Signed code to print/render as a QR code on the ticket.
+        """
+        from ticketing.codes import make_ticket_code
+        return make_ticket_code(self.pk, self.for_concert_id)
+
+
+class TicketEvent(models.Model):
+    """
+    Append-only audit history for a Ticket. Rows are never updated, so
+    recording an event is a single (or bulk) insert via TicketEvent.log().
+    """
+    ISSUED = "issued"
+    VALIDATED = "validated"
+    INVALIDATED = "invalidated"
+    CHANGED = "changed"
+    ADMITTED = "admitted"
+    NOTE = "note"
+    KIND_CHOICES = [
+        (ISSUED, "Issued"),
+        (VALIDATED, "Validated"),
+        (INVALIDATED, "Invalidated"),
+        (CHANGED, "Changed"),
+        (ADMITTED, "Admitted"),
+        (NOTE, "Note"),
+    ]
+
+    ticket = models.ForeignKey(
+        Ticket, on_delete=models.CASCADE, related_name="events", db_index=False
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default=NOTE)
+    message = models.TextField(blank=True, default="")
+
+    class Meta:
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            models.Index(fields=["ticket", "created_at"], name="ticketevent_ticket_time"),
+        ]
+
+    def __str__(self):
+        return f"[{self.created_at}] {self.get_kind_display()}: {self.message}"
+
+    @classmethod
+    def log(cls, tickets, message, kind=NOTE, when=None):
+        """
+        Record the same event against many tickets (instances or pks) in one insert.
+        """
+        when = when or timezone.now()
+        return cls.objects.bulk_create(
+            [
+                cls(ticket_id=getattr(t, "pk", t), created_at=when, kind=kind, message=message)
+                for t in tickets
+            ],
+            batch_size=500,
+        )
+
+
+class TicketRemoval(models.Model):
+    """
+    A ticket that left a concert (deleted, or moved to another concert), so
+    door bundle deltas can tell devices to drop it. See ticketing.door_bundle.
+    """
+    # No database constraint: deleting a concert records its tickets' removal
+    # as they're deleted, after the concert's own rows were collected.
+    concert = models.ForeignKey(Concert, on_delete=models.CASCADE, related_name="+", db_constraint=False)
+    ticket_id = models.BigIntegerField()
+    removed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["concert", "removed_at"], name="ticketremoval_concert_time"),
+        ]
+
+    @classmethod
+    def log(cls, rows, when=None):
+        """
+        Record (ticket pk, concert pk) pairs in one insert.
+        """
+        when = when or timezone.now()
+        return cls.objects.bulk_create(
+            [cls(ticket_id=pk, concert_id=concert_id, removed_at=when) for pk, concert_id in rows if concert_id],
+            batch_size=500,
+        )
+
+
+@receiver(post_delete, sender=Ticket)
+def record_ticket_removal_on_delete(sender, instance, **kwargs):
+    TicketRemoval.log([(instance.pk, instance.for_concert_id)])
+
+
+@contextmanager
+def defer_quantity_recalculation():
+    """
+    Collect the cluster recalculations that Ticket saves/deletes would trigger
+    and run them once per cluster when the block exits. Use around bulk edits:
+
+        with defer_quantity_recalculation() as pending:
+            queryset.delete()
+            pending.update(other_ticket_type_ids)  # e.g. after a queryset.update()
+    """
+    if getattr(_deferred, "pending", None) is not None:
+        # Nested: the outermost block does the work.
+        yield _deferred.pending
+        return
+
+    _deferred.pending = set()
+    try:
+        yield _deferred.pending
+        pending = _deferred.pending
+    finally:
+        _deferred.pending = None
+    TicketType.recalculate_quantities_for_clusters(pending)
+
+
+def _recalculate_for_ticket(instance):
+    if not instance.ticket_type_id:
+        return
+    pending = getattr(_deferred, "pending", None)
+    if pending is not None:
+        pending.add(instance.ticket_type_id)
+    else:
+        TicketType.recalculate_quantities_for_cluster(instance.ticket_type)
+
+
 @receiver(post_save, sender=Ticket)
 def update_tickettype_quantities_on_save(sender, instance, **kwargs):
     """
     Whenever a Ticket is created or updated, recalc the quantities
     for its TicketType cluster.
     """
-    if instance.ticket_type_id:
-        TicketType.recalculate_quantities_for_cluster(instance.ticket_type)
+    _recalculate_for_ticket(instance)
 
 
 @receiver(post_delete, sender=Ticket)
@@ -167,8 +482,7 @@ def update_tickettype_quantities_on_delete(sender, instance, **kwargs):
     Whenever a Ticket is deleted, recalc the quantities
     for its TicketType cluster.
     """
-    if instance.ticket_type_id:
-        TicketType.recalculate_quantities_for_cluster(instance.ticket_type)
+    _recalculate_for_ticket(instance)
 
 
 class Order(models.Model):
@@ -177,10 +491,22 @@ class Order(models.Model):
         ('confirmed', 'Confirmed'),
         ('failed', 'Failed'),
         ('cancelled', 'Cancelled'),
+        ('refunding', 'Refunding'),
+        ('refunded', 'Refunded'),
     ]
 
     stripe_session_id = models.CharField(max_length=255, unique=True, db_index=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    # Lets a cancellation find orders still in checkout, which have no tickets yet.
+    concert = models.ForeignKey(
+        Concert, null=True, blank=True, on_delete=models.SET_NULL, related_name="orders", editable=False,
+    )
+
+    # Repeat checkout requests for the same cart reuse this order's session
+    # while it's still open (see ticketing.cart.idempotency_key).
+    idempotency_key = models.CharField(max_length=64, null=True, blank=True, unique=True, editable=False)
+    client_secret = models.CharField(max_length=255, blank=True, default="", editable=False)
+    expires_at = models.DateTimeField(null=True, blank=True, help_text="When the Stripe session expires.")
 
     customer_email = models.EmailField()
     customer_name = models.CharField(max_length=255, blank=True)
@@ -192,13 +518,203 @@ class Order(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     confirmed_at = models.DateTimeField(null=True, blank=True)
 
+    # Set from the Stripe session on confirmation; refunds are made against it.
+    payment_intent_id = models.CharField(max_length=255, blank=True, default="", db_index=True)
+    refund_id = models.CharField(max_length=255, blank=True, default="")
+    refunded_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="order_status_created"),
+            models.Index(Upper("customer_email"), name="order_email_upper"),
+        ]
 
     def __str__(self):
         return f"Order {self.id} - {self.stripe_session_id[:20]} - {self.status}"
 
 
+class SeatMap(models.Model):
+    """
+    Allocated seating for a concert. Seats are numbered row by row in `rows`
+    order; which are sold or held is kept in bitmaps managed by
+    ticketing.seating, never by save().
+    """
+    concert = models.OneToOneField(Concert, on_delete=models.CASCADE, related_name="seat_map")
+    rows = models.JSONField(
+        default=list,
+        help_text='Rows from the front, e.g. [{"label": "A", "seats": 24}, {"label": "B", "seats": 26}]. '
+                  "Seats are numbered from 1 along each row.",
+    )
+    sold = models.BinaryField(default=b"", editable=False)
+    held = models.BinaryField(default=b"", editable=False)
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    def __str__(self):
+        return f"Seating plan for {self.concert}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # Don't write back bitmaps loaded before a sale changed them.
+            kwargs["update_fields"] = ["concert", "rows"]
+        super().save(*args, **kwargs)
+
+
+class SeatHold(models.Model):
+    """
+    Seats held for one checkout until its order is confirmed or fails.
+    """
+    seat_map = models.ForeignKey(SeatMap, on_delete=models.CASCADE, related_name="holds")
+    order = models.OneToOneField(
+        Order, on_delete=models.CASCADE, null=True, blank=True, related_name="seat_hold"
+    )
+    seats = models.JSONField(default=list)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{len(self.seats)} seat(s) held until {self.expires_at}"
+
+
+class SalesRollup(models.Model):
+    """
+    Tickets sold and revenue for one concert, ticket type and day, net of
+    invalidations. Maintained incrementally by ticketing.sales; rebuild with
+    ``manage.py backfill_sales``.
+    """
+    concert = models.ForeignKey(Concert, on_delete=models.CASCADE, related_name="sales")
+    ticket_type = models.ForeignKey(TicketType, on_delete=models.CASCADE, related_name="sales")
+    day = models.DateField()
+    tickets = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["day"]
+        constraints = [
+            models.UniqueConstraint(fields=["concert", "ticket_type", "day"], name="salesrollup_cell"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.ticket_type}: {self.tickets}"
+
+
+class OutboxEmail(models.Model):
+    """
+    Transactional email waiting to be sent. Rows are written in the same
+    transaction as the change they announce (e.g. order confirmation) and
+    delivered later, in batches, by ``manage.py send_outbox``.
+    """
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (SENDING, "Sending"),
+        (SENT, "Sent"),
+        (FAILED, "Failed"),
+    ]
+
+    order = models.ForeignKey(
+        Order, on_delete=models.SET_NULL, null=True, blank=True, related_name="emails"
+    )
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    attach_tickets = models.BooleanField(
+        default=False, help_text="Attach the order's rendered ticket PDF when sending."
+    )
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_by = models.CharField(max_length=32, blank=True, default="")
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email} ({self.status})"
+
+
+class WaitingRoomState(models.Model):
+    """
+    The waiting room queue (see ticketing.waiting_room.DatabaseQueueStore):
+    a single row shared by every worker process.
+    """
+    issued = models.BigIntegerField(default=0)
+    served = models.BigIntegerField(default=0)
+    tokens = models.FloatField(default=0)
+    refilled_at = models.FloatField(default=0, help_text="Epoch seconds of the last token refill.")
+
+    def __str__(self):
+        return f"Served {self.served} of {self.issued}"
+
+
+class StripeEvent(models.Model):
+    """
+    A Stripe event we've handled, whether it arrived as a webhook or was
+    caught up from the Events API (see ticketing.stripe_events), so that
+    neither handles it again. Events the catch-up failed to handle are
+    recorded too, counting attempts until it gives up on them.
+    """
+    WEBHOOK = "webhook"
+    CATCH_UP = "catch_up"
+    SOURCE_CHOICES = [
+        (WEBHOOK, "Webhook"),
+        (CATCH_UP, "Catch-up"),
+    ]
+
+    HANDLED = "handled"
+    FAILED = "failed"
+    GAVE_UP = "gave_up"
+    STATUS_CHOICES = [
+        (HANDLED, "Handled"),
+        (FAILED, "Failed, will retry"),
+        (GAVE_UP, "Gave up"),
+    ]
+
+    event_id = models.CharField(max_length=255, unique=True)
+    event_type = models.CharField(max_length=100)
+    created = models.DateTimeField(help_text="When Stripe created the event.")
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES, default=WEBHOOK)
+    processed_at = models.DateTimeField(auto_now_add=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=HANDLED)
+    attempts = models.PositiveIntegerField(default=0, help_text="Failed attempts to handle it.")
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [
+            models.Index(fields=["created"], name="stripeevent_created"),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} ({self.event_type})"
+
+
+class StripeEventCheckpoint(models.Model):
+    """
+    How far the Stripe event catch-up has got: every event created before
+    ``processed_through`` has been handled. One row per Stripe endpoint
+    (the live API, or a local stand-in used for testing).
+    """
+    name = models.CharField(max_length=100, unique=True)
+    processed_through = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.processed_through}"
+
+
 # class OrderItem(models.Model):
 #     order = models.ForeignKey(Order, related_name='items', on_delete=models.CASCADE)
 #     ticket_type = models.ForeignKey(TicketType, on_delete=models.CASCADE)
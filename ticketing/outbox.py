@@ -0,0 +1,211 @@
+"""
+Transactional email outbox.
+
+``queue_order_confirmation()`` writes an OutboxEmail inside the caller's
+transaction. ``drain()`` claims due emails in batches and sends them over
+one reused backend connection, retrying failures with exponential backoff
+and keeping to a per-minute rate limit. Waits for the rate limit happen
+between batches, with no connection open: each batch only claims as many
+emails as the limit allows right away. It works with any EMAIL_BACKEND,
+including locmem and console for local testing.
+"""
+import logging
+import time
+import uuid
+from collections import deque
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from ticketing.models import OutboxEmail, Ticket
+
+logger = logging.getLogger("ticketing.outbox")
+
+MAX_ATTEMPTS = 8
+BASE_BACKOFF = timedelta(seconds=30)
+MAX_BACKOFF = timedelta(hours=1)
+# A worker that dies mid-batch leaves rows "sending"; reclaim them after this.
+CLAIM_TIMEOUT = timedelta(minutes=10)
+# Ticket PDFs render in the background after the order commits. Hold an
+# email back for up to this long waiting for its attachment, then send
+# without it (the body carries the ticket codes).
+RENDER_GRACE = timedelta(minutes=5)
+RENDER_POLL = timedelta(seconds=20)
+
+
+class _AttachmentNotReady(Exception):
+    pass
+
+
+def queue_order_confirmation(order):
+    """
+    Queue the confirmation email for a newly confirmed order. Call inside the
+    transaction that confirms the order, so the two commit (or not) together.
+    """
+    tickets = (
+        Ticket.objects.filter(transaction_ID=order.stripe_session_id, validity=True)
+        .select_related("ticket_type", "for_concert__seat_map")
+        .order_by("pk")
+    )
+    context = {"order": order, "tickets": tickets}
+    return OutboxEmail.objects.create(
+        order=order,
+        to_email=order.customer_email,
+        subject=render_to_string("emails/order_confirmation_subject.txt", context).strip(),
+        body=render_to_string("emails/order_confirmation.txt", context),
+        attach_tickets=True,
+    )
+
+
+def _backoff(attempts):
+    return min(BASE_BACKOFF * (2 ** (attempts - 1)), MAX_BACKOFF)
+
+
+def _claim(batch_size):
+    """
+    Mark up to batch_size due emails as ours. The conditional UPDATE means two
+    workers can never claim the same row.
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    due = Q(status=OutboxEmail.PENDING, next_attempt_at__lte=now) | Q(
+        status=OutboxEmail.SENDING, claimed_at__lt=now - CLAIM_TIMEOUT
+    )
+    ids = list(OutboxEmail.objects.filter(due).order_by("next_attempt_at").values_list("pk", flat=True)[:batch_size])
+    if not ids:
+        return []
+    OutboxEmail.objects.filter(due, pk__in=ids).update(
+        status=OutboxEmail.SENDING, claimed_by=token, claimed_at=now
+    )
+    return list(OutboxEmail.objects.filter(claimed_by=token, status=OutboxEmail.SENDING).select_related("order"))
+
+
+def _build_message(email, connection):
+    message = EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[email.to_email],
+        connection=connection,
+    )
+    if email.attach_tickets and email.order_id:
+        # Imported lazily: rendering pulls in Pillow/qrcode.
+        from ticketing.rendering import order_document_path
+
+        path = order_document_path(email.order)
+        if path:
+            message.attach_file(path, mimetype="application/pdf")
+        elif timezone.now() - email.created_at < RENDER_GRACE:
+            raise _AttachmentNotReady()
+    return message
+
+
+class _RateLimiter:
+    """
+    At most `per_minute` sends in any 60 second window.
+    """
+
+    def __init__(self, per_minute):
+        self.per_minute = per_minute
+        self.sent = deque()
+
+    def available(self, limit):
+        """
+        How many of `limit` sends can go now, sleeping until at least one can.
+        """
+        if not self.per_minute:
+            return limit
+        now = time.monotonic()
+        while self.sent and now - self.sent[0] >= 60:
+            self.sent.popleft()
+        if len(self.sent) >= self.per_minute:
+            time.sleep(60 - (now - self.sent[0]))
+            self.sent.popleft()
+        return min(limit, self.per_minute - len(self.sent))
+
+    def record(self):
+        if self.per_minute:
+            self.sent.append(time.monotonic())
+
+
+def drain(batch_size=None, rate_per_minute=None, max_batches=None):
+    """
+    Send due emails until none are left (or max_batches is reached).
+    Returns (sent, failed) counts.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    limiter = _RateLimiter(
+        settings.EMAIL_OUTBOX_RATE_PER_MINUTE if rate_per_minute is None else rate_per_minute
+    )
+    sent = failed = batches = 0
+
+    while max_batches is None or batches < max_batches:
+        emails = _claim(limiter.available(batch_size))
+        if not emails:
+            break
+        batches += 1
+
+        # One connection (one SMTP handshake) per batch.
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+            for email in emails:
+                try:
+                    message = _build_message(email, connection)
+                except _AttachmentNotReady:
+                    OutboxEmail.objects.filter(pk=email.pk).update(
+                        status=OutboxEmail.PENDING, claimed_by="",
+                        next_attempt_at=timezone.now() + RENDER_POLL,
+                    )
+                    continue
+                except Exception as e:
+                    # E.g. an unreadable attachment: back this one off, send the rest.
+                    failed += 1
+                    _record_failure(email, e)
+                    continue
+                limiter.record()
+                try:
+                    message.send()
+                except Exception as e:
+                    failed += 1
+                    _record_failure(email, e)
+                else:
+                    sent += 1
+                    OutboxEmail.objects.filter(pk=email.pk).update(
+                        status=OutboxEmail.SENT, sent_at=timezone.now(),
+                        attempts=email.attempts + 1, last_error="", claimed_by="",
+                    )
+        except Exception as error:
+            # Couldn't connect at all: put the rest of the batch back.
+            logger.warning("Email backend unavailable: %s", error)
+            unsent = OutboxEmail.objects.filter(
+                pk__in=[email.pk for email in emails], status=OutboxEmail.SENDING
+            )
+            for email in unsent:
+                failed += 1
+                _record_failure(email, error)
+            break
+        finally:
+            connection.close()
+
+    return sent, failed
+
+
+def _record_failure(email, error):
+    attempts = email.attempts + 1
+    give_up = attempts >= MAX_ATTEMPTS
+    OutboxEmail.objects.filter(pk=email.pk).update(
+        status=OutboxEmail.FAILED if give_up else OutboxEmail.PENDING,
+        attempts=attempts,
+        next_attempt_at=timezone.now() + _backoff(attempts),
+        last_error=repr(error)[:2000],
+        claimed_by="",
+    )
+    logger.warning(
+        "Sending email failed",
+        extra={"email_id": email.pk, "order_id": email.order_id, "attempts": attempts, "gave_up": give_up},
+    )
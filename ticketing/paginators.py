@@ -0,0 +1,36 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin paginator that avoids a full COUNT(*) over large tables.
+
+    Unfiltered changelists on PostgreSQL use the planner's row estimate.
+    Otherwise the count is capped: at most COUNT_LIMIT rows are counted, and
+    the changelist simply stops paging there (refine the search to go further).
+    """
+
+    COUNT_LIMIT = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, "query", None)
+        if query is None:
+            return super().count
+
+        if not query.where and connections[queryset.db].vendor == "postgresql":
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 until the table has been analysed
+            if row and row[0] >= self.COUNT_LIMIT:
+                return row[0]
+
+        # COUNT over a LIMITed subquery stops scanning once the cap is reached.
+        return queryset.order_by()[:self.COUNT_LIMIT].count()
@@ -0,0 +1,301 @@
+"""
+Refunding every order for a cancelled concert.
+
+``refund_concert()`` marks the concert cancelled and takes its tickets off
+sale, expires the Stripe sessions of orders still in checkout, then refunds
+its confirmed orders through a small pool of threads that only talk to Stripe.
+The calling thread does all the database work as refunds complete, and
+invalidates the refunded orders' tickets in bulk, one quantity
+recalculation per batch.
+
+Progress is checkpointed on the orders themselves: each moves from
+confirmed to refunding (claimed) to refunded, so an interrupted run
+(crash, deploy, Ctrl-C) is resumed by running it again. Refunds use a
+Stripe idempotency key per order, so an order caught between Stripe
+refunding it and us recording that isn't refunded twice.
+
+A checkout completed before its session could be expired is refunded by
+``refund_unissued()`` when its webhook arrives, instead of issuing tickets.
+
+``charge.refunded`` webhooks (including refunds made in the Stripe
+dashboard) go through ``record_refund()`` too, which does nothing if the
+order is already refunded.
+"""
+import logging
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import stripe
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ticketing import catalogue
+from ticketing import metrics as ts_metrics
+from ticketing import sales, seating
+from ticketing.models import Concert, Order, Ticket, TicketEvent, TicketType, defer_quantity_recalculation
+
+logger = logging.getLogger("ticketing.refunds")
+
+BATCH_SIZE = 100
+MAX_ATTEMPTS = 5
+
+RefundResult = namedtuple("RefundResult", ["refunded", "failed", "expired"])
+
+_running = set()
+_running_lock = threading.Lock()
+
+
+def concert_orders(concert):
+    """
+    Orders for this concert: those with its tickets, and those still in
+    checkout (or paid without tickets being issued).
+    """
+    session_ids = Ticket.objects.filter(for_concert=concert).values("transaction_ID")
+    return Order.objects.filter(Q(concert=concert) | Q(stripe_session_id__in=session_ids))
+
+
+def _expire_session(session_id):
+    """
+    Runs in a worker thread: no database access. True if the session is
+    expired, False if it was completed first.
+    """
+    try:
+        with ts_metrics.stripe_call("checkout.Session.expire"):
+            stripe.checkout.Session.expire(session_id)
+        return True
+    except stripe.error.InvalidRequestError:
+        # Only open sessions can be expired: see whether it expired or was paid.
+        with ts_metrics.stripe_call("checkout.Session.retrieve"):
+            return stripe.checkout.Session.retrieve(session_id)["status"] == "expired"
+
+
+def expire_open_orders(orders, pool):
+    """
+    Expire the Stripe sessions of these orders that are still in checkout and
+    cancel the orders. Sessions paid first are left to their webhook. Returns
+    the number cancelled.
+    """
+    pending = list(orders.filter(status="pending"))
+    futures = {pool.submit(_expire_session, order.stripe_session_id): order for order in pending}
+    cancelled = 0
+    for future, order in futures.items():
+        try:
+            expired = future.result()
+        except Exception as e:
+            # Left pending: running again retries it.
+            logger.warning("Expiring checkout session failed", extra={"order_id": order.pk, "error": repr(e)})
+            continue
+        if expired and Order.objects.filter(pk=order.pk, status="pending").update(status="cancelled"):
+            seating.release_for_order(order)
+            cancelled += 1
+    return cancelled
+
+
+def _stripe_refund(order_id, session_id, payment_intent_id):
+    """
+    Runs in a worker thread: no database access. Returns (payment intent id,
+    refund id), retrying rate limits and connection errors with backoff.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            if not payment_intent_id:
+                with ts_metrics.stripe_call("checkout.Session.retrieve"):
+                    payment_intent_id = stripe.checkout.Session.retrieve(session_id)["payment_intent"]
+            with ts_metrics.stripe_call("Refund.create"):
+                refund = stripe.Refund.create(
+                    payment_intent=payment_intent_id,
+                    reason="requested_by_customer",
+                    metadata={"order_id": order_id},
+                    idempotency_key=f"refund-order-{order_id}",
+                )
+            return payment_intent_id, refund["id"]
+        except stripe.error.InvalidRequestError as e:
+            if getattr(e, "code", None) == "charge_already_refunded":
+                return payment_intent_id, ""
+            raise
+        except (stripe.error.RateLimitError, stripe.error.APIConnectionError):
+            if attempt == MAX_ATTEMPTS:
+                raise
+            time.sleep(min(2 ** attempt, 30))
+
+
+def invalidate_orders(order_ids, message):
+    """
+    Invalidate every valid ticket of these orders in one UPDATE, with one
+    quantity recalculation per affected cluster. Returns the ticket count.
+    """
+    session_ids = Order.objects.filter(pk__in=order_ids).values("stripe_session_id")
+    with transaction.atomic(), defer_quantity_recalculation() as pending:
+        rows = list(
+            Ticket.objects.filter(transaction_ID__in=session_ids, validity=True)
+            .values_list("pk", "ticket_type_id", "for_concert_id")
+        )
+        ids = [pk for pk, _, _ in rows]
+        with sales.tracking(ids):
+            Ticket.objects.filter(pk__in=ids).update(validity=False, updated_at=timezone.now())
+        TicketEvent.log(ids, message, kind=TicketEvent.INVALIDATED)
+        pending.update(ticket_type_id for _, ticket_type_id, _ in rows)
+        seating.sync_sold(concert_id for _, _, concert_id in rows)
+    return len(ids)
+
+
+def record_refund(order, refund_id="", payment_intent_id="", source="bulk"):
+    """
+    Mark an order refunded and invalidate its tickets. Idempotent.
+    """
+    with transaction.atomic():
+        updated = Order.objects.filter(pk=order.pk).exclude(status="refunded").update(
+            status="refunded",
+            refund_id=refund_id,
+            refunded_at=timezone.now(),
+            payment_intent_id=payment_intent_id or F("payment_intent_id"),
+        )
+        if not updated:
+            return False
+        invalidate_orders([order.pk], f"Invalidated: order {order.pk} refunded ({source}).")
+    ts_metrics.ORDERS_REFUNDED.inc(source=source)
+    return True
+
+
+def refund_unissued(order, session, concert):
+    """
+    Refund a checkout completed after its concert was cancelled, without
+    issuing tickets. Called from the checkout.session.completed webhook in
+    place of confirming the order. If the refund fails the order is left
+    confirmed (with no tickets), for ``refund_concert`` to retry.
+    """
+    claimed = Order.objects.filter(pk=order.pk, status__in=["pending", "failed", "cancelled"]).update(
+        status="refunding",
+        concert=concert,
+        customer_email=session.get("customer_details", {}).get("email", ""),
+        customer_name=session.get("customer_details", {}).get("name", ""),
+        payment_intent_id=session.get("payment_intent") or "",
+    )
+    if not claimed:
+        return False
+    seating.release_for_order(order)
+    try:
+        payment_intent_id, refund_id = _stripe_refund(order.pk, order.stripe_session_id, session.get("payment_intent"))
+    except Exception:
+        Order.objects.filter(pk=order.pk, status="refunding").update(status="confirmed")
+        raise
+    recorded = Order.objects.filter(pk=order.pk).exclude(status="refunded").update(
+        status="refunded", refund_id=refund_id, refunded_at=timezone.now(), payment_intent_id=payment_intent_id or "",
+    )
+    if recorded:
+        ts_metrics.ORDERS_REFUNDED.inc(source="cancelled")
+    return True
+
+
+def _claim(orders, limit):
+    ids = list(orders.filter(status__in=["confirmed", "refunding"]).order_by("pk").values_list("pk", flat=True)[:limit])
+    Order.objects.filter(pk__in=ids, status="confirmed").update(status="refunding")
+    return list(Order.objects.filter(pk__in=ids, status="refunding").order_by("pk"))
+
+
+def refund_concert(concert, workers=None, progress=None):
+    """
+    Cancel a concert: expire its orders still in checkout, refund every
+    confirmed order (and any left mid-refund by an earlier run) and
+    invalidate its tickets. Safe to run again to resume. ``progress`` is
+    called with (refunded, failed) as the run goes. Returns a RefundResult.
+    """
+    workers = workers or settings.REFUND_WORKERS
+    # From here on, checkouts that complete are refunded rather than issued.
+    Concert.objects.filter(pk=concert.pk, cancelled_at__isnull=True).update(cancelled_at=timezone.now())
+    # Nothing more goes on sale while we refund.
+    TicketType.objects.filter(for_concert=concert).update(display_ticket=False, version=F("version") + 1)
+    catalogue.invalidate_snapshot(sender=TicketType)
+
+    orders = concert_orders(concert)
+    refunded = failed = 0
+    failed_ids = set()
+    done = []
+
+    def flush():
+        # Invalidate finished orders' tickets in bulk (the orders are already
+        # marked refunded, so a crash here is picked up by the sweep below).
+        if done:
+            invalidate_orders(done, "Invalidated: concert cancelled and order refunded.")
+            done.clear()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="refund") as pool:
+        expired = expire_open_orders(orders, pool)
+        in_flight = {}
+        queue = []
+        while True:
+            if not queue and len(in_flight) < workers:
+                busy = failed_ids | {order.pk for order in in_flight.values()}
+                queue = _claim(orders.exclude(pk__in=busy), BATCH_SIZE)
+            # Keep the pool busy without queueing more than it can take.
+            while queue and len(in_flight) < workers * 2:
+                order = queue.pop(0)
+                future = pool.submit(_stripe_refund, order.pk, order.stripe_session_id, order.payment_intent_id)
+                in_flight[future] = order
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                order = in_flight.pop(future)
+                try:
+                    payment_intent_id, refund_id = future.result()
+                except Exception as e:
+                    failed += 1
+                    failed_ids.add(order.pk)
+                    Order.objects.filter(pk=order.pk, status="refunding").update(status="confirmed")
+                    logger.warning("Refund failed", extra={"order_id": order.pk, "error": repr(e)})
+                    continue
+                refunded += 1
+                # The charge.refunded webhook may have recorded it already.
+                recorded = Order.objects.filter(pk=order.pk).exclude(status="refunded").update(
+                    status="refunded", refund_id=refund_id, refunded_at=timezone.now(),
+                    payment_intent_id=payment_intent_id or "",
+                )
+                if recorded:
+                    ts_metrics.ORDERS_REFUNDED.inc(source="bulk")
+                    done.append(order.pk)
+            if len(done) >= BATCH_SIZE:
+                flush()
+            if progress:
+                progress(refunded, failed)
+    flush()
+
+    # Sweep up tickets of orders refunded by an earlier, interrupted run.
+    leftover = list(orders.filter(status="refunded").values_list("pk", flat=True))
+    invalidate_orders(leftover, "Invalidated: concert cancelled and order refunded.")
+
+    logger.info(
+        "Concert refunds finished",
+        extra={"concert_id": concert.pk, "refunded": refunded, "failed": failed, "expired": expired},
+    )
+    return RefundResult(refunded, failed, expired)
+
+
+def start_in_background(concert):
+    """
+    Run refund_concert() in a background thread of this process (used by the
+    admin). Returns False if it's already running here. If the process dies,
+    ``manage.py refund_concert`` resumes from where it got to.
+    """
+    with _running_lock:
+        if concert.pk in _running:
+            return False
+        _running.add(concert.pk)
+
+    def run():
+        try:
+            refund_concert(concert)
+        except Exception:
+            logger.exception("Concert refunds stopped", extra={"concert_id": concert.pk})
+        finally:
+            with _running_lock:
+                _running.discard(concert.pk)
+            connections.close_all()
+
+    threading.Thread(target=run, name=f"refund-concert-{concert.pk}", daemon=True).start()
+    return True
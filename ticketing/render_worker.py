@@ -0,0 +1,86 @@
+"""
+Ticket rendering functions that run inside the rendering process pool.
+
+Nothing here touches Django: workers are handed plain dicts prepared by
+ticketing.rendering, so they can be spawned without setting Django up.
+"""
+import os
+import tempfile
+
+import qrcode
+from PIL import Image, ImageDraw, ImageFont
+
+
+PAGE_SIZE = (1240, 620)
+BRAND = (0, 136, 136)
+TEXT = (17, 24, 39)
+MUTED = (75, 85, 99)
+
+
+def _atomic_save(image, path, **kwargs):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        image.save(tmp_path, **kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def render_ticket_page(ticket, path):
+    """
+    Draw one ticket (a dict from ticketing.rendering.ticket_data) to a PNG at path.
+    """
+    page = Image.new("RGB", PAGE_SIZE, "white")
+    draw = ImageDraw.Draw(page)
+    title = ImageFont.load_default(size=48)
+    body = ImageFont.load_default(size=30)
+    small = ImageFont.load_default(size=22)
+
+    draw.rectangle([0, 0, PAGE_SIZE[0], 24], fill=BRAND)
+    draw.text((60, 70), ticket["concert_name"], font=title, fill=TEXT)
+    lines = [
+        f"{ticket['concert_date']}  {ticket['concert_time']}",
+        ticket["concert_location"],
+        "",
+        f"{ticket['ticket_label']}   Seat {ticket['seat']}" if ticket.get("seat") else ticket["ticket_label"],
+        ticket["name"],
+    ]
+    y = 160
+    for line in lines:
+        draw.text((60, y), line, font=body, fill=MUTED if y < 260 else TEXT)
+        y += 48
+    draw.text((60, PAGE_SIZE[1] - 60), f"Ticket #{ticket['pk']}   {ticket['code']}", font=small, fill=MUTED)
+
+    qr = qrcode.QRCode(border=2, box_size=10, error_correction=qrcode.constants.ERROR_CORRECT_M)
+    qr.add_data(ticket["code"])
+    qr_image = qr.make_image(fill_color="black", back_color="white").get_image().convert("RGB")
+    qr_image = qr_image.resize((400, 400), Image.NEAREST)
+    page.paste(qr_image, (PAGE_SIZE[0] - 460, (PAGE_SIZE[1] - 400) // 2))
+
+    _atomic_save(page, path, format="PNG", optimize=True)
+    return path
+
+
+def render_order_document(pages, pdf_path, force=False):
+    """
+    Render any missing ticket pages, then combine them into one PDF.
+
+    ``pages`` is a list of (ticket dict, png path). Pages already on disk are
+    reused unless ``force`` is set.
+    """
+    images = []
+    for ticket, png_path in pages:
+        if force or not os.path.exists(png_path):
+            render_ticket_page(ticket, png_path)
+        with Image.open(png_path) as image:
+            images.append(image.convert("RGB"))
+
+    if not images:
+        return None
+    first, rest = images[0], images[1:]
+    _atomic_save(first, pdf_path, format="PDF", save_all=True, append_images=rest, resolution=150)
+    return pdf_path
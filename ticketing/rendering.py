@@ -0,0 +1,156 @@
+"""
+Ticket documents (one PDF per order, one page per ticket) rendered in a
+process pool and cached on disk.
+
+Files live under TICKET_RENDER_DIR/v<TEMPLATE_VERSION>/ and are keyed by ticket
+(or order) plus a digest of the data drawn on them, so edits to a ticket and
+template changes both produce new files. Bump TEMPLATE_VERSION whenever
+render_worker's layout changes, then run ``manage.py render_tickets``.
+"""
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+
+from ticketing import render_worker
+from ticketing.models import Ticket
+
+logger = logging.getLogger("ticketing.rendering")
+
+TEMPLATE_VERSION = 1
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Shared rendering pool for this process. Workers are spawned (not forked)
+    so they don't inherit the web process' threads or DB connections.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.TICKET_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_pid = os.getpid()
+    return _pool
+
+
+def _render_dir():
+    return Path(settings.TICKET_RENDER_DIR) / f"v{TEMPLATE_VERSION}"
+
+
+def _digest(value):
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=6).hexdigest()
+
+
+def ticket_data(tickets):
+    """
+    Everything the worker needs to draw each ticket, loaded in one query.
+    """
+    rows = tickets.select_related("ticket_type", "for_concert__seat_map").order_by("pk")
+    data = []
+    for ticket in rows:
+        concert = ticket.for_concert
+        data.append({
+            "pk": ticket.pk,
+            "code": ticket.code,
+            "name": ticket.name,
+            "ticket_label": ticket.ticket_type.ticket_label if ticket.ticket_type else "",
+            "concert_name": concert.concert_name if concert else "",
+            "concert_date": concert.concert_date.strftime("%d/%m/%Y") if concert else "",
+            "concert_time": concert.concert_time.strftime("%H:%M") if concert else "",
+            "concert_location": concert.concert_location if concert else "",
+        })
+        if ticket.seat is not None:
+            # Only seated tickets carry the key, so other tickets' digests are unchanged.
+            data[-1]["seat"] = ticket.seat_label
+    return data
+
+
+def ticket_page_path(ticket):
+    return str(_render_dir() / "tickets" / f"ticket-{ticket['pk']}-{_digest(ticket)}.png")
+
+
+def _order_job(order):
+    tickets = ticket_data(Ticket.objects.filter(transaction_ID=order.stripe_session_id, validity=True))
+    pages = [(ticket, ticket_page_path(ticket)) for ticket in tickets]
+    pdf_path = _render_dir() / "orders" / f"order-{order.pk}-{_digest([p for _, p in pages])}.pdf"
+    return pages, str(pdf_path)
+
+
+def order_document_path(order):
+    """
+    Path of the order's PDF if it has been rendered for its current tickets, else None.
+    """
+    pages, pdf_path = _order_job(order)
+    return pdf_path if pages and os.path.exists(pdf_path) else None
+
+
+def submit_order_render(order, force=False):
+    """
+    Queue an order's document for rendering once the current transaction
+    commits. Returns immediately; rendering happens in the pool.
+    """
+    def submit():
+        pages, pdf_path = _order_job(order)
+        if not pages or (os.path.exists(pdf_path) and not force):
+            return
+        future = get_pool().submit(render_worker.render_order_document, pages, pdf_path, force)
+        future.add_done_callback(_log_failure(order.pk))
+
+    transaction.on_commit(submit)
+
+
+def _log_failure(order_pk):
+    def callback(future):
+        error = future.exception()
+        if error is not None:
+            logger.error("Rendering tickets failed", extra={"order_id": order_pk, "error": repr(error)})
+    return callback
+
+
+def render_orders(orders, force=False, batch_size=200):
+    """
+    Render many orders in the pool, yielding (order pk, pdf path or exception)
+    as each completes. Orders are submitted in batches to bound memory.
+    Used by the render_tickets command.
+    """
+    batch = []
+    for order in orders.iterator(chunk_size=batch_size):
+        batch.append(order)
+        if len(batch) >= batch_size:
+            yield from _render_batch(batch, force)
+            batch = []
+    yield from _render_batch(batch, force)
+
+
+def _render_batch(orders, force):
+    futures = {}
+    for order in orders:
+        pages, pdf_path = _order_job(order)
+        if not pages:
+            continue
+        if os.path.exists(pdf_path) and not force:
+            yield order.pk, pdf_path
+            continue
+        future = get_pool().submit(render_worker.render_order_document, pages, pdf_path, force)
+        futures[future] = order.pk
+
+    for future in as_completed(futures):
+        try:
+            yield futures[future], future.result()
+        except Exception as e:
+            yield futures[future], e
@@ -0,0 +1,112 @@
+"""
+Daily sales rollups: tickets sold and revenue per concert, ticket type and
+day, so the admin's sales dashboard reads a handful of small rows instead of
+counting tickets.
+
+A ticket counts as a sale on the day its order was confirmed, for as long as
+it's valid; complimentary tickets added in the admin have no order and
+aren't counted. Revenue is the price each ticket was sold at (tickets issued
+before prices were recorded count at their type's current price), as in
+the sales export.
+
+Rollups are adjusted with F() increments in the same transaction as the
+change they follow. Wrap anything that changes tickets' validity, type or
+existence in ``tracking()``; new tickets are counted with ``add()``.
+``manage.py backfill_sales`` rebuilds them from scratch.
+"""
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from ticketing.models import Order, SalesRollup, Ticket
+
+
+def _cells(tickets):
+    """
+    Valid, sold tickets grouped into rollup cells (one query).
+    """
+    # Keyed on confirmed_at rather than status, so a refunded order's tickets
+    # still come out of the day they were sold on.
+    confirmed_at = Order.objects.filter(
+        stripe_session_id=OuterRef("transaction_ID"), confirmed_at__isnull=False
+    ).values("confirmed_at")[:1]
+    return (
+        tickets.filter(validity=True, for_concert__isnull=False, ticket_type__isnull=False)
+        .annotate(day=TruncDate(Subquery(confirmed_at)))
+        .exclude(day=None)
+        .values("for_concert_id", "ticket_type_id", "day")
+        .annotate(tickets=Count("pk"), revenue=Sum(Coalesce("price", "ticket_type__price")))
+        .order_by()
+    )
+
+
+def _bump(cell, sign):
+    key = {"concert_id": cell["for_concert_id"], "ticket_type_id": cell["ticket_type_id"], "day": cell["day"]}
+    change = {
+        "tickets": F("tickets") + sign * cell["tickets"],
+        "revenue": F("revenue") + sign * cell["revenue"],
+        "updated_at": timezone.now(),
+    }
+    if SalesRollup.objects.filter(**key).update(**change):
+        return
+    try:
+        with transaction.atomic():
+            SalesRollup.objects.create(**key, tickets=sign * cell["tickets"], revenue=sign * cell["revenue"])
+    except IntegrityError:
+        # Someone else created the cell first.
+        SalesRollup.objects.filter(**key).update(**change)
+
+
+def _apply(ticket_ids, sign):
+    ticket_ids = list(ticket_ids)
+    if not ticket_ids:
+        return
+    for cell in _cells(Ticket.objects.filter(pk__in=ticket_ids)):
+        _bump(cell, sign)
+
+
+def add(ticket_ids):
+    """
+    Count these tickets (e.g. just issued for a confirmed order).
+    """
+    _apply(ticket_ids, 1)
+
+
+@contextmanager
+def tracking(ticket_ids):
+    """
+    Take these tickets out of the rollups, run the block, then count them
+    again as they are afterwards. Use inside the change's transaction.
+    """
+    ticket_ids = list(ticket_ids)
+    _apply(ticket_ids, -1)
+    yield
+    _apply(ticket_ids, 1)
+
+
+def rebuild(concert=None):
+    """
+    Recompute rollups from tickets and orders. Returns the number of cells.
+    """
+    tickets = Ticket.objects.all()
+    rollups = SalesRollup.objects.all()
+    if concert is not None:
+        tickets = tickets.filter(for_concert=concert)
+        rollups = rollups.filter(concert=concert)
+
+    with transaction.atomic():
+        rollups.delete()
+        cells = SalesRollup.objects.bulk_create(
+            [
+                SalesRollup(
+                    concert_id=cell["for_concert_id"], ticket_type_id=cell["ticket_type_id"],
+                    day=cell["day"], tickets=cell["tickets"], revenue=cell["revenue"],
+                )
+                for cell in _cells(tickets).iterator(chunk_size=2000)
+            ],
+            batch_size=500,
+        )
+    return len(cells)
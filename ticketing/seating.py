@@ -0,0 +1,294 @@
+"""
+Allocated seating.
+
+A concert's SeatMap numbers its seats 0..capacity-1 row by row, front to
+back, and keeps two bitmaps (bit n = seat n): seats sold and seats held by
+checkouts in progress. A 2,000 seat hall is two 250 byte columns on one
+row, so nothing on the checkout path touches per-seat rows.
+
+Every change reads the map, works on the bitmaps as Python ints and writes
+them back only if the map's version is unchanged, retrying otherwise (the
+same optimistic scheme as TicketType quantities). A reservation of many
+seats is a single conditional UPDATE, so it either gets all of them or none.
+
+Each checkout's seats are recorded on a SeatHold until the order is
+confirmed (held -> sold) or fails. Holds outlive their Stripe session by
+HOLD_GRACE, so a payment completed at the last moment still finds its
+seats. Expired holds are swept by the next reservation.
+"""
+import logging
+import random
+import re
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+
+from ticketing.models import SeatHold, SeatMap, Ticket, TicketEvent
+
+logger = logging.getLogger("ticketing.seating")
+
+ATTEMPTS = 10
+HOLD_GRACE = timedelta(minutes=10)
+
+_LABEL = re.compile(r"^\s*([A-Za-z]+)\s*-?\s*(\d+)\s*$")
+
+
+class SeatsUnavailable(Exception):
+    pass
+
+
+# Bitmaps
+
+def to_int(bitmap):
+    return int.from_bytes(bytes(bitmap or b""), "little")
+
+
+def to_bytes(value, capacity):
+    return value.to_bytes((capacity + 7) // 8, "little")
+
+
+def _bits(value):
+    seats = []
+    while value:
+        low = value & -value
+        seats.append(low.bit_length() - 1)
+        value ^= low
+    return seats
+
+
+def _mask(seats):
+    value = 0
+    for seat in seats:
+        value |= 1 << seat
+    return value
+
+
+# Layout
+
+class Layout:
+    """
+    Seat numbering for a map's rows: [{"label": "A", "seats": 24}, ...].
+    """
+
+    def __init__(self, rows):
+        self.rows = []
+        offset = 0
+        for row in rows:
+            self.rows.append((str(row["label"]).upper(), offset, int(row["seats"])))
+            offset += int(row["seats"])
+        self.capacity = offset
+        self._by_label = {label: (start, length) for label, start, length in self.rows}
+
+    def label(self, seat):
+        for label, start, length in self.rows:
+            if start <= seat < start + length:
+                return f"{label}{seat - start + 1}"
+        raise ValueError(f"Seat {seat} is not on this map.")
+
+    def seat(self, label):
+        match = _LABEL.match(str(label))
+        if match:
+            row, number = match.group(1).upper(), int(match.group(2))
+            if row in self._by_label:
+                start, length = self._by_label[row]
+                if 1 <= number <= length:
+                    return start + number - 1
+        raise SeatsUnavailable(f"There is no seat {label}.")
+
+    def best_available(self, taken, count):
+        """
+        Seats for `count` people: the front-most row with `count` free seats
+        together, as close to the middle of it as possible. If no row has
+        room, the front-most free seats. None if there aren't enough.
+        """
+        free_all = ~taken & ((1 << self.capacity) - 1)
+        if bin(free_all).count("1") < count:
+            return None
+
+        for label, start, length in self.rows:
+            if length < count:
+                continue
+            free = (free_all >> start) & ((1 << length) - 1)
+            # Bit i of `runs` is set when seats i..i+count-1 are all free.
+            runs = free
+            for shift in range(1, count):
+                runs &= free >> shift
+            runs &= (1 << (length - count + 1)) - 1
+            if runs:
+                middle = (length - count) / 2
+                first = min(_bits(runs), key=lambda i: (abs(i - middle), i))
+                return [start + first + i for i in range(count)]
+
+        return _bits(free_all)[:count]
+
+
+# Reading and writing maps
+
+def _change(seat_map_id, apply):
+    """
+    Read the map, let apply(seat_map, layout, sold, held) return
+    (sold, held, result) and write the bitmaps back if the map hasn't changed
+    meanwhile. Retries on conflict; returns result.
+    """
+    for attempt in range(ATTEMPTS):
+        seat_map = SeatMap.objects.get(pk=seat_map_id)
+        layout = Layout(seat_map.rows)
+        sold, held, result = apply(seat_map, layout, to_int(seat_map.sold), to_int(seat_map.held))
+        written = SeatMap.objects.filter(pk=seat_map.pk, version=seat_map.version).update(
+            sold=to_bytes(sold, layout.capacity),
+            held=to_bytes(held, layout.capacity),
+            version=F("version") + 1,
+        )
+        if written:
+            return result
+        time.sleep(random.uniform(0, 0.005 * (attempt + 1)))
+    raise SeatsUnavailable("The seating plan is busy; please try again.")
+
+
+def reserve(concert_id, count, labels=None, expires_at=None):
+    """
+    Hold `count` seats for a checkout: the given seat labels, or the best
+    available. Returns the SeatHold (attach the order once it exists) or
+    raises SeatsUnavailable.
+    """
+    seat_map = SeatMap.objects.filter(concert_id=concert_id).only("pk").first()
+    if seat_map is None:
+        raise SeatsUnavailable("This concert has no seating plan.")
+    expires_at = (expires_at or timezone.now()) + HOLD_GRACE
+
+    def apply(seat_map, layout, sold, held):
+        # Sweep holds that have run out, then pick from what's left.
+        now = timezone.now()
+        expired = list(seat_map.holds.filter(expires_at__lte=now).values_list("pk", "seats"))
+        for _, seats in expired:
+            held &= ~_mask(seats)
+        taken = sold | held
+
+        if labels:
+            seats = [layout.seat(label) for label in labels]
+            if len(set(seats)) != count:
+                raise SeatsUnavailable(f"Choose {count} different seats.")
+            unavailable = [layout.label(seat) for seat in seats if taken >> seat & 1]
+            if unavailable:
+                raise SeatsUnavailable(f"Seat{'s' if len(unavailable) > 1 else ''} {', '.join(unavailable)} "
+                                       f"{'are' if len(unavailable) > 1 else 'is'} no longer available.")
+        else:
+            seats = layout.best_available(taken, count)
+            if seats is None:
+                raise SeatsUnavailable(f"There aren't {count} seats left.")
+
+        return sold, held | _mask(seats), (seats, [pk for pk, _ in expired])
+
+    with transaction.atomic():
+        seats, expired = _change(seat_map.pk, apply)
+        SeatHold.objects.filter(pk__in=expired).delete()
+        return SeatHold.objects.create(seat_map_id=seat_map.pk, seats=seats, expires_at=expires_at)
+
+
+def release(hold):
+    """
+    Give a hold's seats back (payment failed, checkout abandoned).
+    """
+    def apply(seat_map, layout, sold, held):
+        return sold, held & ~_mask(hold.seats), None
+
+    with transaction.atomic():
+        if SeatHold.objects.filter(pk=hold.pk).delete()[0]:
+            _change(hold.seat_map_id, apply)
+
+
+def release_for_order(order):
+    hold = SeatHold.objects.filter(order=order).first()
+    if hold is not None:
+        release(hold)
+
+
+def confirm(order, tickets):
+    """
+    Sell the order's held seats and assign them to `tickets` (all for the
+    seat map's concert). If the hold was swept, seat the tickets at the best
+    seats still available. Tickets that can't be seated (the concert sold
+    out around them) are logged and flagged in their history for staff to
+    seat by hand. Call inside the transaction issuing the tickets.
+    """
+    if not tickets:
+        return
+    hold = SeatHold.objects.filter(order=order).first()
+    if hold is not None:
+        seat_map_id, wanted = hold.seat_map_id, list(hold.seats)
+    else:
+        seat_map_id = SeatMap.objects.filter(concert_id=tickets[0].for_concert_id).values_list("pk", flat=True).first()
+        if seat_map_id is None:
+            _unseated(order, tickets, "the concert has no seating plan")
+            return
+        wanted = []
+
+    def apply(seat_map, layout, sold, held):
+        seats = wanted[:len(tickets)]
+        if hold is not None:
+            held &= ~_mask(hold.seats)
+        if len(seats) < len(tickets) or sold & _mask(seats):
+            # Our hold lapsed and (some of) the seats were sold on: reseat.
+            seats = layout.best_available(sold | held, len(tickets)) or []
+        return sold | _mask(seats), held, seats
+
+    seats = _change(seat_map_id, apply)
+    if hold is not None:
+        hold.delete()
+    for ticket, seat in zip(tickets, seats):
+        ticket.seat = seat
+    Ticket.objects.bulk_update(tickets, ["seat"])
+    if len(seats) < len(tickets):
+        _unseated(order, tickets[len(seats):], "its held seats were sold on and not enough seats were left")
+
+
+def _unseated(order, tickets, reason):
+    logger.warning(
+        "Seated tickets issued without seats",
+        extra={"order_id": order.pk, "ticket_ids": [ticket.pk for ticket in tickets], "reason": reason},
+    )
+    TicketEvent.log(tickets, f"Issued without a seat: {reason}. Seat this ticket by hand.", kind=TicketEvent.NOTE)
+
+
+def sync_sold(concert_ids):
+    """
+    Rebuild the sold bitmaps of these concerts' maps from their valid
+    tickets, after tickets are invalidated, revalidated, moved or deleted.
+    """
+    def apply(seat_map, layout, _sold, held):
+        # Read after the map, on every attempt: a sale committed since the
+        # map was read bumps its version, so a stale bitmap is never written.
+        sold = _mask(Ticket.objects.filter(
+            for_concert_id=seat_map.concert_id, validity=True, seat__isnull=False
+        ).values_list("seat", flat=True))
+        return sold, held & ~sold, None
+
+    for seat_map_id in SeatMap.objects.filter(concert_id__in=set(concert_ids) - {None}).values_list("pk", flat=True):
+        _change(seat_map_id, apply)
+
+
+def clashes(ticket_ids):
+    """
+    Those of these tickets whose seat another valid ticket now has, e.g.
+    invalidated tickets whose seats were sold on. Unseat them before
+    making them valid again.
+    """
+    taken = Ticket.objects.filter(
+        validity=True, for_concert=OuterRef("for_concert"), seat=OuterRef("seat")
+    ).exclude(pk=OuterRef("pk"))
+    return Ticket.objects.filter(pk__in=ticket_ids, seat__isnull=False).filter(Exists(taken))
+
+
+def availability(seat_map):
+    """
+    What a seat picker needs: the layout and one bitmap of seats taken.
+    """
+    layout = Layout(seat_map.rows)
+    now = timezone.now()
+    held = to_int(seat_map.held)
+    for seats in seat_map.holds.filter(expires_at__lte=now).values_list("seats", flat=True):
+        held &= ~_mask(seats)
+    return layout, to_bytes(to_int(seat_map.sold) | held, layout.capacity)
@@ -6,5 +6,5 @@ function Rf(o){return o&&o.__esModule&&Object.prototype.hasOwnProperty.call(o,"d
 `+s[a].replace(" at new "," at ");return t.displayName&&z.includes("<anonymous>")&&(z=z.replace("<anonymous>",t.displayName)),z}while(1<=a&&0<=u);break}}}finally{nc=!1,Error.prepareStackTrace=e}return(e=t?t.displayName||t.name:"")?je(e):""}function bm(t,l){switch(t.tag){case 26:case 27:case 5:return je(t.type);case 16:return je("Lazy");case 13:return t.child!==l&&l!==null?je("Suspense Fallback"):je("Suspense");case 19:return je("SuspenseList");case 0:case 15:return cc(t.type,!1);case 11:return cc(t.type.render,!1);case 1:return cc(t.type,!0);case 31:return je("Activity");default:return""}}function Gf(t){try{var l="",e=null;do l+=bm(t,e),e=t,t=t.return;while(t);return l}catch(a){return`
 Error generating stack: `+a.message+`
 `+a.stack}}var ic=Object.prototype.hasOwnProperty,fc=o.unstable_scheduleCallback,sc=o.unstable_cancelCallback,pm=o.unstable_shouldYield,Em=o.unstable_requestPaint,rl=o.unstable_now,Tm=o.unstable_getCurrentPriorityLevel,Xf=o.unstable_ImmediatePriority,Qf=o.unstable_UserBlockingPriority,Ru=o.unstable_NormalPriority,zm=o.unstable_LowPriority,Zf=o.unstable_IdlePriority,Am=o.log,xm=o.unstable_setDisableYieldValue,Ba=null,ol=null;function ne(t){if(typeof Am=="function"&&xm(t),ol&&typeof ol.setStrictMode=="function")try{ol.setStrictMode(Ba,t)}catch{}}var dl=Math.clz32?Math.clz32:Cm,_m=Math.log,Om=Math.LN2;function Cm(t){return t>>>=0,t===0?32:31-(_m(t)/Om|0)|0}var Hu=256,qu=262144,Bu=4194304;function Me(t){var l=t&42;if(l!==0)return l;switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return t&261888;case 262144:case 524288:case 1048576:case 2097152:return t&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return t&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return t}}function Yu(t,l,e){var a=t.pendingLanes;if(a===0)return 0;var u=0,n=t.suspendedLanes,c=t.pingedLanes;t=t.warmLanes;var i=a&134217727;return i!==0?(a=i&~n,a!==0?u=Me(a):(c&=i,c!==0?u=Me(c):e||(e=i&~t,e!==0&&(u=Me(e))))):(i=a&~n,i!==0?u=Me(i):c!==0?u=Me(c):e||(e=a&~t,e!==0&&(u=Me(e)))),u===0?0:l!==0&&l!==u&&(l&n)===0&&(n=u&-u,e=l&-l,n>=e||n===32&&(e&4194048)!==0)?l:u}function Ya(t,l){return(t.pendingLanes&~(t.suspendedLanes&~t.pingedLanes)&l)===0}function Nm(t,l){switch(t){case 1:case 2:case 4:case 8:case 64:return l+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return l+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Lf(){var t=Bu;return Bu<<=1,(Bu&62914560)===0&&(Bu=4194304),t}function rc(t){for(var l=[],e=0;31>e;e++)l.push(t);return l}function Ga(t,l){t.pendingLanes|=l,l!==268435456&&(t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0)}function jm(t,l,e,a,u,n){var c=t.pendingLanes;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0,t.expiredLanes&=e,t.entangledLanes&=e,t.errorRecoveryDisabledLanes&=e,t.shellSuspendCounter=0;var i=t.entanglements,s=t.expirationTimes,g=t.hiddenUpdates;for(e=c&~e;0<e;){var z=31-dl(e),O=1<<z;i[z]=0,s[z]=-1;var S=g[z];if(S!==null)for(g[z]=null,z=0;z<S.length;z++){var E=S[z];E!==null&&(E.lane&=-536870913)}e&=~O}a!==0&&Vf(t,a,0),n!==0&&u===0&&t.tag!==0&&(t.suspendedLanes|=n&~(c&~l))}function Vf(t,l,e){t.pendingLanes|=l,t.suspendedLanes&=~l;var a=31-dl(l);t.entangledLanes|=l,t.entanglements[a]=t.entanglements[a]|1073741824|e&261930}function Kf(t,l){var e=t.entangledLanes|=l;for(t=t.entanglements;e;){var a=31-dl(e),u=1<<a;u&l|t[a]&l&&(t[a]|=l),e&=~u}}function Jf(t,l){var e=l&-l;return e=(e&42)!==0?1:oc(e),(e&(t.suspendedLanes|l))!==0?0:e}function oc(t){switch(t){case 2:t=1;break;case 8:t=4;break;case 32:t=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:t=128;break;case 268435456:t=134217728;break;default:t=0}return t}function dc(t){return t&=-t,2<t?8<t?(t&134217727)!==0?32:268435456:8:2}function wf(){var t=j.p;return t!==0?t:(t=window.event,t===void 0?32:Dd(t.type))}function kf(t,l){var e=j.p;try{return j.p=t,l()}finally{j.p=e}}var ce=Math.random().toString(36).slice(2),Xt="__reactFiber$"+ce,el="__reactProps$"+ce,Fe="__reactContainer$"+ce,mc="__reactEvents$"+ce,Mm="__reactListeners$"+ce,Um="__reactHandles$"+ce,Wf="__reactResources$"+ce,Xa="__reactMarker$"+ce;function hc(t){delete t[Xt],delete t[el],delete t[mc],delete t[Mm],delete t[Um]}function Ie(t){var l=t[Xt];if(l)return l;for(var e=t.parentNode;e;){if(l=e[Fe]||e[Xt]){if(e=l.alternate,l.child!==null||e!==null&&e.child!==null)for(t=gd(t);t!==null;){if(e=t[Xt])return e;t=gd(t)}return l}t=e,e=t.parentNode}return null}function Pe(t){if(t=t[Xt]||t[Fe]){var l=t.tag;if(l===5||l===6||l===13||l===31||l===26||l===27||l===3)return t}return null}function Qa(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t.stateNode;throw Error(f(33))}function ta(t){var l=t[Wf];return l||(l=t[Wf]={hoistableStyles:new Map,hoistableScripts:new Map}),l}function Yt(t){t[Xa]=!0}var $f=new Set,Ff={};function Ue(t,l){la(t,l),la(t+"Capture",l)}function la(t,l){for(Ff[t]=l,t=0;t<l.length;t++)$f.add(l[t])}var Dm=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),If={},Pf={};function Rm(t){return ic.call(Pf,t)?!0:ic.call(If,t)?!1:Dm.test(t)?Pf[t]=!0:(If[t]=!0,!1)}function Gu(t,l,e){if(Rm(l))if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":t.removeAttribute(l);return;case"boolean":var a=l.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){t.removeAttribute(l);return}}t.setAttribute(l,""+e)}}function Xu(t,l,e){if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(l);return}t.setAttribute(l,""+e)}}function Gl(t,l,e,a){if(a===null)t.removeAttribute(e);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(e);return}t.setAttributeNS(l,e,""+a)}}function El(t){switch(typeof t){case"bigint":case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function ts(t){var l=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(l==="checkbox"||l==="radio")}function Hm(t,l,e){var a=Object.getOwnPropertyDescriptor(t.constructor.prototype,l);if(!t.hasOwnProperty(l)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var u=a.get,n=a.set;return Object.defineProperty(t,l,{configurable:!0,get:function(){return u.call(this)},set:function(c){e=""+c,n.call(this,c)}}),Object.defineProperty(t,l,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(c){e=""+c},stopTracking:function(){t._valueTracker=null,delete t[l]}}}}function vc(t){if(!t._valueTracker){var l=ts(t)?"checked":"value";t._valueTracker=Hm(t,l,""+t[l])}}function ls(t){if(!t)return!1;var l=t._valueTracker;if(!l)return!0;var e=l.getValue(),a="";return t&&(a=ts(t)?t.checked?"true":"false":t.value),t=a,t!==e?(l.setValue(t),!0):!1}function Qu(t){if(t=t||(typeof document<"u"?document:void 0),typeof t>"u")return null;try{return t.activeElement||t.body}catch{return t.body}}var qm=/[\n"\\]/g;function Tl(t){return t.replace(qm,function(l){return"\\"+l.charCodeAt(0).toString(16)+" "})}function yc(t,l,e,a,u,n,c,i){t.name="",c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?t.type=c:t.removeAttribute("type"),l!=null?c==="number"?(l===0&&t.value===""||t.value!=l)&&(t.value=""+El(l)):t.value!==""+El(l)&&(t.value=""+El(l)):c!=="submit"&&c!=="reset"||t.removeAttribute("value"),l!=null?gc(t,c,El(l)):e!=null?gc(t,c,El(e)):a!=null&&t.removeAttribute("value"),u==null&&n!=null&&(t.defaultChecked=!!n),u!=null&&(t.checked=u&&typeof u!="function"&&typeof u!="symbol"),i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?t.name=""+El(i):t.removeAttribute("name")}function es(t,l,e,a,u,n,c,i){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(t.type=n),l!=null||e!=null){if(!(n!=="submit"&&n!=="reset"||l!=null)){vc(t);return}e=e!=null?""+El(e):"",l=l!=null?""+El(l):e,i||l===t.value||(t.value=l),t.defaultValue=l}a=a??u,a=typeof a!="function"&&typeof a!="symbol"&&!!a,t.checked=i?t.checked:!!a,t.defaultChecked=!!a,c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"&&(t.name=c),vc(t)}function gc(t,l,e){l==="number"&&Qu(t.ownerDocument)===t||t.defaultValue===""+e||(t.defaultValue=""+e)}function ea(t,l,e,a){if(t=t.options,l){l={};for(var u=0;u<e.length;u++)l["$"+e[u]]=!0;for(e=0;e<t.length;e++)u=l.hasOwnProperty("$"+t[e].value),t[e].selected!==u&&(t[e].selected=u),u&&a&&(t[e].defaultSelected=!0)}else{for(e=""+El(e),l=null,u=0;u<t.length;u++){if(t[u].value===e){t[u].selected=!0,a&&(t[u].defaultSelected=!0);return}l!==null||t[u].disabled||(l=t[u])}l!==null&&(l.selected=!0)}}function as(t,l,e){if(l!=null&&(l=""+El(l),l!==t.value&&(t.value=l),e==null)){t.defaultValue!==l&&(t.defaultValue=l);return}t.defaultValue=e!=null?""+El(e):""}function us(t,l,e,a){if(l==null){if(a!=null){if(e!=null)throw Error(f(92));if(K(a)){if(1<a.length)throw Error(f(93));a=a[0]}e=a}e==null&&(e=""),l=e}e=El(l),t.defaultValue=e,a=t.textContent,a===e&&a!==""&&a!==null&&(t.value=a),vc(t)}function aa(t,l){if(l){var e=t.firstChild;if(e&&e===t.lastChild&&e.nodeType===3){e.nodeValue=l;return}}t.textContent=l}var Bm=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function ns(t,l,e){var a=l.indexOf("--")===0;e==null||typeof e=="boolean"||e===""?a?t.setProperty(l,""):l==="float"?t.cssFloat="":t[l]="":a?t.setProperty(l,e):typeof e!="number"||e===0||Bm.has(l)?l==="float"?t.cssFloat=e:t[l]=(""+e).trim():t[l]=e+"px"}function cs(t,l,e){if(l!=null&&typeof l!="object")throw Error(f(62));if(t=t.style,e!=null){for(var a in e)!e.hasOwnProperty(a)||l!=null&&l.hasOwnProperty(a)||(a.indexOf("--")===0?t.setProperty(a,""):a==="float"?t.cssFloat="":t[a]="");for(var u in l)a=l[u],l.hasOwnProperty(u)&&e[u]!==a&&ns(t,u,a)}else for(var n in l)l.hasOwnProperty(n)&&ns(t,n,l[n])}function Sc(t){if(t.indexOf("-")===-1)return!1;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Ym=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Gm=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Zu(t){return Gm.test(""+t)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":t}function Xl(){}var bc=null;function pc(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}var ua=null,na=null;function is(t){var l=Pe(t);if(l&&(t=l.stateNode)){var e=t[el]||null;t:switch(t=l.stateNode,l.type){case"input":if(yc(t,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name),l=e.name,e.type==="radio"&&l!=null){for(e=t;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll('input[name="'+Tl(""+l)+'"][type="radio"]'),l=0;l<e.length;l++){var a=e[l];if(a!==t&&a.form===t.form){var u=a[el]||null;if(!u)throw Error(f(90));yc(a,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(l=0;l<e.length;l++)a=e[l],a.form===t.form&&ls(a)}break t;case"textarea":as(t,e.value,e.defaultValue);break t;case"select":l=e.value,l!=null&&ea(t,!!e.multiple,l,!1)}}}var Ec=!1;function fs(t,l,e){if(Ec)return t(l,e);Ec=!0;try{var a=t(l);return a}finally{if(Ec=!1,(ua!==null||na!==null)&&(jn(),ua&&(l=ua,t=na,na=ua=null,is(l),t)))for(l=0;l<t.length;l++)is(t[l])}}function Za(t,l){var e=t.stateNode;if(e===null)return null;var a=e[el]||null;if(a===null)return null;e=a[l];t:switch(l){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(t=t.type,a=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!a;break t;default:t=!1}if(t)return null;if(e&&typeof e!="function")throw Error(f(231,l,typeof e));return e}var Ql=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Tc=!1;if(Ql)try{var La={};Object.defineProperty(La,"passive",{get:function(){Tc=!0}}),window.addEventListener("test",La,La),window.removeEventListener("test",La,La)}catch{Tc=!1}var ie=null,zc=null,Lu=null;function ss(){if(Lu)return Lu;var t,l=zc,e=l.length,a,u="value"in ie?ie.value:ie.textContent,n=u.length;for(t=0;t<e&&l[t]===u[t];t++);var c=e-t;for(a=1;a<=c&&l[e-a]===u[n-a];a++);return Lu=u.slice(t,1<a?1-a:void 0)}function Vu(t){var l=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&l===13&&(t=13)):t=l,t===10&&(t=13),32<=t||t===13?t:0}function Ku(){return!0}function rs(){return!1}function al(t){function l(e,a,u,n,c){this._reactName=e,this._targetInst=u,this.type=a,this.nativeEvent=n,this.target=c,this.currentTarget=null;for(var i in t)t.hasOwnProperty(i)&&(e=t[i],this[i]=e?e(n):n[i]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?Ku:rs,this.isPropagationStopped=rs,this}return H(l.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=Ku)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=Ku)},persist:function(){},isPersistent:Ku}),l}var De={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Ju=al(De),Va=H({},De,{view:0,detail:0}),Xm=al(Va),Ac,xc,Ka,wu=H({},Va,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Oc,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==Ka&&(Ka&&t.type==="mousemove"?(Ac=t.screenX-Ka.screenX,xc=t.screenY-Ka.screenY):xc=Ac=0,Ka=t),Ac)},movementY:function(t){return"movementY"in t?t.movementY:xc}}),os=al(wu),Qm=H({},wu,{dataTransfer:0}),Zm=al(Qm),Lm=H({},Va,{relatedTarget:0}),_c=al(Lm),Vm=H({},De,{animationName:0,elapsedTime:0,pseudoElement:0}),Km=al(Vm),Jm=H({},De,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),wm=al(Jm),km=H({},De,{data:0}),ds=al(km),Wm={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},$m={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Fm={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Im(t){var l=this.nativeEvent;return l.getModifierState?l.getModifierState(t):(t=Fm[t])?!!l[t]:!1}function Oc(){return Im}var Pm=H({},Va,{key:function(t){if(t.key){var l=Wm[t.key]||t.key;if(l!=="Unidentified")return l}return t.type==="keypress"?(t=Vu(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?$m[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Oc,charCode:function(t){return t.type==="keypress"?Vu(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?Vu(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),t0=al(Pm),l0=H({},wu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),ms=al(l0),e0=H({},Va,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Oc}),a0=al(e0),u0=H({},De,{propertyName:0,elapsedTime:0,pseudoElement:0}),n0=al(u0),c0=H({},wu,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),i0=al(c0),f0=H({},De,{newState:0,oldState:0}),s0=al(f0),r0=[9,13,27,32],Cc=Ql&&"CompositionEvent"in window,Ja=null;Ql&&"documentMode"in document&&(Ja=document.documentMode);var o0=Ql&&"TextEvent"in window&&!Ja,hs=Ql&&(!Cc||Ja&&8<Ja&&11>=Ja),vs=" ",ys=!1;function gs(t,l){switch(t){case"keyup":return r0.indexOf(l.keyCode)!==-1;case"keydown":return l.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Ss(t){return t=t.detail,typeof t=="object"&&"data"in t?t.data:null}var ca=!1;function d0(t,l){switch(t){case"compositionend":return Ss(l);case"keypress":return l.which!==32?null:(ys=!0,vs);case"textInput":return t=l.data,t===vs&&ys?null:t;default:return null}}function m0(t,l){if(ca)return t==="compositionend"||!Cc&&gs(t,l)?(t=ss(),Lu=zc=ie=null,ca=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(l.ctrlKey||l.altKey||l.metaKey)||l.ctrlKey&&l.altKey){if(l.char&&1<l.char.length)return l.char;if(l.which)return String.fromCharCode(l.which)}return null;case"compositionend":return hs&&l.locale!=="ko"?null:l.data;default:return null}}var h0={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function bs(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l==="input"?!!h0[t.type]:l==="textarea"}function ps(t,l,e,a){ua?na?na.push(a):na=[a]:ua=a,l=Bn(l,"onChange"),0<l.length&&(e=new Ju("onChange","change",null,e,a),t.push({event:e,listeners:l}))}var wa=null,ka=null;function v0(t){ad(t,0)}function ku(t){var l=Qa(t);if(ls(l))return t}function Es(t,l){if(t==="change")return l}var Ts=!1;if(Ql){var Nc;if(Ql){var jc="oninput"in document;if(!jc){var zs=document.createElement("div");zs.setAttribute("oninput","return;"),jc=typeof zs.oninput=="function"}Nc=jc}else Nc=!1;Ts=Nc&&(!document.documentMode||9<document.documentMode)}function As(){wa&&(wa.detachEvent("onpropertychange",xs),ka=wa=null)}function xs(t){if(t.propertyName==="value"&&ku(ka)){var l=[];ps(l,ka,t,pc(t)),fs(v0,l)}}function y0(t,l,e){t==="focusin"?(As(),wa=l,ka=e,wa.attachEvent("onpropertychange",xs)):t==="focusout"&&As()}function g0(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return ku(ka)}function S0(t,l){if(t==="click")return ku(l)}function b0(t,l){if(t==="input"||t==="change")return ku(l)}function p0(t,l){return t===l&&(t!==0||1/t===1/l)||t!==t&&l!==l}var ml=typeof Object.is=="function"?Object.is:p0;function Wa(t,l){if(ml(t,l))return!0;if(typeof t!="object"||t===null||typeof l!="object"||l===null)return!1;var e=Object.keys(t),a=Object.keys(l);if(e.length!==a.length)return!1;for(a=0;a<e.length;a++){var u=e[a];if(!ic.call(l,u)||!ml(t[u],l[u]))return!1}return!0}function _s(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function Os(t,l){var e=_s(t);t=0;for(var a;e;){if(e.nodeType===3){if(a=t+e.textContent.length,t<=l&&a>=l)return{node:e,offset:l-t};t=a}t:{for(;e;){if(e.nextSibling){e=e.nextSibling;break t}e=e.parentNode}e=void 0}e=_s(e)}}function Cs(t,l){return t&&l?t===l?!0:t&&t.nodeType===3?!1:l&&l.nodeType===3?Cs(t,l.parentNode):"contains"in t?t.contains(l):t.compareDocumentPosition?!!(t.compareDocumentPosition(l)&16):!1:!1}function Ns(t){t=t!=null&&t.ownerDocument!=null&&t.ownerDocument.defaultView!=null?t.ownerDocument.defaultView:window;for(var l=Qu(t.document);l instanceof t.HTMLIFrameElement;){try{var e=typeof l.contentWindow.location.href=="string"}catch{e=!1}if(e)t=l.contentWindow;else break;l=Qu(t.document)}return l}function Mc(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l&&(l==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||l==="textarea"||t.contentEditable==="true")}var E0=Ql&&"documentMode"in document&&11>=document.documentMode,ia=null,Uc=null,$a=null,Dc=!1;function js(t,l,e){var a=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;Dc||ia==null||ia!==Qu(a)||(a=ia,"selectionStart"in a&&Mc(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),$a&&Wa($a,a)||($a=a,a=Bn(Uc,"onSelect"),0<a.length&&(l=new Ju("onSelect","select",null,l,e),t.push({event:l,listeners:a}),l.target=ia)))}function Re(t,l){var e={};return e[t.toLowerCase()]=l.toLowerCase(),e["Webkit"+t]="webkit"+l,e["Moz"+t]="moz"+l,e}var fa={animationend:Re("Animation","AnimationEnd"),animationiteration:Re("Animation","AnimationIteration"),animationstart:Re("Animation","AnimationStart"),transitionrun:Re("Transition","TransitionRun"),transitionstart:Re("Transition","TransitionStart"),transitioncancel:Re("Transition","TransitionCancel"),transitionend:Re("Transition","TransitionEnd")},Rc={},Ms={};Ql&&(Ms=document.createElement("div").style,"AnimationEvent"in window||(delete fa.animationend.animation,delete fa.animationiteration.animation,delete fa.animationstart.animation),"TransitionEvent"in window||delete fa.transitionend.transition);function He(t){if(Rc[t])return Rc[t];if(!fa[t])return t;var l=fa[t],e;for(e in l)if(l.hasOwnProperty(e)&&e in Ms)return Rc[t]=l[e];return t}var Us=He("animationend"),Ds=He("animationiteration"),Rs=He("animationstart"),T0=He("transitionrun"),z0=He("transitionstart"),A0=He("transitioncancel"),Hs=He("transitionend"),qs=new Map,Hc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Hc.push("scrollEnd");function Ml(t,l){qs.set(t,l),Ue(l,[t])}var Wu=typeof reportError=="function"?reportError:function(t){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var l=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof t=="object"&&t!==null&&typeof t.message=="string"?String(t.message):String(t),error:t});if(!window.dispatchEvent(l))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",t);return}console.error(t)},zl=[],sa=0,qc=0;function $u(){for(var t=sa,l=qc=sa=0;l<t;){var e=zl[l];zl[l++]=null;var a=zl[l];zl[l++]=null;var u=zl[l];zl[l++]=null;var n=zl[l];if(zl[l++]=null,a!==null&&u!==null){var c=a.pending;c===null?u.next=u:(u.next=c.next,c.next=u),a.pending=u}n!==0&&Bs(e,u,n)}}function Fu(t,l,e,a){zl[sa++]=t,zl[sa++]=l,zl[sa++]=e,zl[sa++]=a,qc|=a,t.lanes|=a,t=t.alternate,t!==null&&(t.lanes|=a)}function Bc(t,l,e,a){return Fu(t,l,e,a),Iu(t)}function qe(t,l){return Fu(t,null,null,l),Iu(t)}function Bs(t,l,e){t.lanes|=e;var a=t.alternate;a!==null&&(a.lanes|=e);for(var u=!1,n=t.return;n!==null;)n.childLanes|=e,a=n.alternate,a!==null&&(a.childLanes|=e),n.tag===22&&(t=n.stateNode,t===null||t._visibility&1||(u=!0)),t=n,n=n.return;return t.tag===3?(n=t.stateNode,u&&l!==null&&(u=31-dl(e),t=n.hiddenUpdates,a=t[u],a===null?t[u]=[l]:a.push(l),l.lane=e|536870912),n):null}function Iu(t){if(50<Su)throw Su=0,Ji=null,Error(f(185));for(var l=t.return;l!==null;)t=l,l=t.return;return t.tag===3?t.stateNode:null}var ra={};function x0(t,l,e,a){this.tag=t,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=l,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function hl(t,l,e,a){return new x0(t,l,e,a)}function Yc(t){return t=t.prototype,!(!t||!t.isReactComponent)}function Zl(t,l){var e=t.alternate;return e===null?(e=hl(t.tag,l,t.key,t.mode),e.elementType=t.elementType,e.type=t.type,e.stateNode=t.stateNode,e.alternate=t,t.alternate=e):(e.pendingProps=l,e.type=t.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=t.flags&65011712,e.childLanes=t.childLanes,e.lanes=t.lanes,e.child=t.child,e.memoizedProps=t.memoizedProps,e.memoizedState=t.memoizedState,e.updateQueue=t.updateQueue,l=t.dependencies,e.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext},e.sibling=t.sibling,e.index=t.index,e.ref=t.ref,e.refCleanup=t.refCleanup,e}function Ys(t,l){t.flags&=65011714;var e=t.alternate;return e===null?(t.childLanes=0,t.lanes=l,t.child=null,t.subtreeFlags=0,t.memoizedProps=null,t.memoizedState=null,t.updateQueue=null,t.dependencies=null,t.stateNode=null):(t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.subtreeFlags=0,t.deletions=null,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,t.type=e.type,l=e.dependencies,t.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext}),t}function Pu(t,l,e,a,u,n){var c=0;if(a=t,typeof t=="function")Yc(t)&&(c=1);else if(typeof t=="string")c=jh(t,e,M.current)?26:t==="html"||t==="head"||t==="body"?27:5;else t:switch(t){case Pt:return t=hl(31,e,l,u),t.elementType=Pt,t.lanes=n,t;case ft:return Be(e.children,u,n,l);case Kt:c=8,u|=24;break;case Et:return t=hl(12,e,l,u|2),t.elementType=Et,t.lanes=n,t;case kt:return t=hl(13,e,l,u),t.elementType=kt,t.lanes=n,t;case qt:return t=hl(19,e,l,u),t.elementType=qt,t.lanes=n,t;default:if(typeof t=="object"&&t!==null)switch(t.$$typeof){case xt:c=10;break t;case pl:c=9;break t;case Jt:c=11;break t;case $:c=14;break t;case Bt:c=16,a=null;break t}c=29,e=Error(f(130,t===null?"null":typeof t,"")),a=null}return l=hl(c,e,l,u),l.elementType=t,l.type=a,l.lanes=n,l}function Be(t,l,e,a){return t=hl(7,t,a,l),t.lanes=e,t}function Gc(t,l,e){return t=hl(6,t,null,l),t.lanes=e,t}function Gs(t){var l=hl(18,null,null,0);return l.stateNode=t,l}function Xc(t,l,e){return l=hl(4,t.children!==null?t.children:[],t.key,l),l.lanes=e,l.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},l}var Xs=new WeakMap;function Al(t,l){if(typeof t=="object"&&t!==null){var e=Xs.get(t);return e!==void 0?e:(l={value:t,source:l,stack:Gf(l)},Xs.set(t,l),l)}return{value:t,source:l,stack:Gf(l)}}var oa=[],da=0,tn=null,Fa=0,xl=[],_l=0,fe=null,Hl=1,ql="";function Ll(t,l){oa[da++]=Fa,oa[da++]=tn,tn=t,Fa=l}function Qs(t,l,e){xl[_l++]=Hl,xl[_l++]=ql,xl[_l++]=fe,fe=t;var a=Hl;t=ql;var u=32-dl(a)-1;a&=~(1<<u),e+=1;var n=32-dl(l)+u;if(30<n){var c=u-u%5;n=(a&(1<<c)-1).toString(32),a>>=c,u-=c,Hl=1<<32-dl(l)+u|e<<u|a,ql=n+t}else Hl=1<<n|e<<u|a,ql=t}function Qc(t){t.return!==null&&(Ll(t,1),Qs(t,1,0))}function Zc(t){for(;t===tn;)tn=oa[--da],oa[da]=null,Fa=oa[--da],oa[da]=null;for(;t===fe;)fe=xl[--_l],xl[_l]=null,ql=xl[--_l],xl[_l]=null,Hl=xl[--_l],xl[_l]=null}function Zs(t,l){xl[_l++]=Hl,xl[_l++]=ql,xl[_l++]=fe,Hl=l.id,ql=l.overflow,fe=t}var Qt=null,St=null,ut=!1,se=null,Ol=!1,Lc=Error(f(519));function re(t){var l=Error(f(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw Ia(Al(l,t)),Lc}function Ls(t){var l=t.stateNode,e=t.type,a=t.memoizedProps;switch(l[Xt]=t,l[el]=a,e){case"dialog":tt("cancel",l),tt("close",l);break;case"iframe":case"object":case"embed":tt("load",l);break;case"video":case"audio":for(e=0;e<pu.length;e++)tt(pu[e],l);break;case"source":tt("error",l);break;case"img":case"image":case"link":tt("error",l),tt("load",l);break;case"details":tt("toggle",l);break;case"input":tt("invalid",l),es(l,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":tt("invalid",l);break;case"textarea":tt("invalid",l),us(l,a.value,a.defaultValue,a.children)}e=a.children,typeof e!="string"&&typeof e!="number"&&typeof e!="bigint"||l.textContent===""+e||a.suppressHydrationWarning===!0||id(l.textContent,e)?(a.popover!=null&&(tt("beforetoggle",l),tt("toggle",l)),a.onScroll!=null&&tt("scroll",l),a.onScrollEnd!=null&&tt("scrollend",l),a.onClick!=null&&(l.onclick=Xl),l=!0):l=!1,l||re(t,!0)}function Vs(t){for(Qt=t.return;Qt;)switch(Qt.tag){case 5:case 31:case 13:Ol=!1;return;case 27:case 3:Ol=!0;return;default:Qt=Qt.return}}function ma(t){if(t!==Qt)return!1;if(!ut)return Vs(t),ut=!0,!1;var l=t.tag,e;if((e=l!==3&&l!==27)&&((e=l===5)&&(e=t.type,e=!(e!=="form"&&e!=="button")||ff(t.type,t.memoizedProps)),e=!e),e&&St&&re(t),Vs(t),l===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(f(317));St=yd(t)}else if(l===31){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(f(317));St=yd(t)}else l===27?(l=St,Ae(t.type)?(t=mf,mf=null,St=t):St=l):St=Qt?Nl(t.stateNode.nextSibling):null;return!0}function Ye(){St=Qt=null,ut=!1}function Vc(){var t=se;return t!==null&&(il===null?il=t:il.push.apply(il,t),se=null),t}function Ia(t){se===null?se=[t]:se.push(t)}var Kc=m(null),Ge=null,Vl=null;function oe(t,l,e){U(Kc,l._currentValue),l._currentValue=e}function Kl(t){t._currentValue=Kc.current,_(Kc)}function Jc(t,l,e){for(;t!==null;){var a=t.alternate;if((t.childLanes&l)!==l?(t.childLanes|=l,a!==null&&(a.childLanes|=l)):a!==null&&(a.childLanes&l)!==l&&(a.childLanes|=l),t===e)break;t=t.return}}function wc(t,l,e,a){var u=t.child;for(u!==null&&(u.return=t);u!==null;){var n=u.dependencies;if(n!==null){var c=u.child;n=n.firstContext;t:for(;n!==null;){var i=n;n=u;for(var s=0;s<l.length;s++)if(i.context===l[s]){n.lanes|=e,i=n.alternate,i!==null&&(i.lanes|=e),Jc(n.return,e,t),a||(c=null);break t}n=i.next}}else if(u.tag===18){if(c=u.return,c===null)throw Error(f(341));c.lanes|=e,n=c.alternate,n!==null&&(n.lanes|=e),Jc(c,e,t),c=null}else c=u.child;if(c!==null)c.return=u;else for(c=u;c!==null;){if(c===t){c=null;break}if(u=c.sibling,u!==null){u.return=c.return,c=u;break}c=c.return}u=c}}function ha(t,l,e,a){t=null;for(var u=l,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var c=u.alternate;if(c===null)throw Error(f(387));if(c=c.memoizedProps,c!==null){var i=u.type;ml(u.pendingProps.value,c.value)||(t!==null?t.push(i):t=[i])}}else if(u===st.current){if(c=u.alternate,c===null)throw Error(f(387));c.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(t!==null?t.push(xu):t=[xu])}u=u.return}t!==null&&wc(l,t,e,a),l.flags|=262144}function ln(t){for(t=t.firstContext;t!==null;){if(!ml(t.context._currentValue,t.memoizedValue))return!0;t=t.next}return!1}function Xe(t){Ge=t,Vl=null,t=t.dependencies,t!==null&&(t.firstContext=null)}function Zt(t){return Ks(Ge,t)}function en(t,l){return Ge===null&&Xe(t),Ks(t,l)}function Ks(t,l){var e=l._currentValue;if(l={context:l,memoizedValue:e,next:null},Vl===null){if(t===null)throw Error(f(308));Vl=l,t.dependencies={lanes:0,firstContext:l},t.flags|=524288}else Vl=Vl.next=l;return e}var _0=typeof AbortController<"u"?AbortController:function(){var t=[],l=this.signal={aborted:!1,addEventListener:function(e,a){t.push(a)}};this.abort=function(){l.aborted=!0,t.forEach(function(e){return e()})}},O0=o.unstable_scheduleCallback,C0=o.unstable_NormalPriority,Mt={$$typeof:xt,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function kc(){return{controller:new _0,data:new Map,refCount:0}}function Pa(t){t.refCount--,t.refCount===0&&O0(C0,function(){t.controller.abort()})}var tu=null,Wc=0,va=0,ya=null;function N0(t,l){if(tu===null){var e=tu=[];Wc=0,va=Ii(),ya={status:"pending",value:void 0,then:function(a){e.push(a)}}}return Wc++,l.then(Js,Js),l}function Js(){if(--Wc===0&&tu!==null){ya!==null&&(ya.status="fulfilled");var t=tu;tu=null,va=0,ya=null;for(var l=0;l<t.length;l++)(0,t[l])()}}function j0(t,l){var e=[],a={status:"pending",value:null,reason:null,then:function(u){e.push(u)}};return t.then(function(){a.status="fulfilled",a.value=l;for(var u=0;u<e.length;u++)(0,e[u])(l)},function(u){for(a.status="rejected",a.reason=u,u=0;u<e.length;u++)(0,e[u])(void 0)}),a}var ws=p.S;p.S=function(t,l){Mo=rl(),typeof l=="object"&&l!==null&&typeof l.then=="function"&&N0(t,l),ws!==null&&ws(t,l)};var Qe=m(null);function $c(){var t=Qe.current;return t!==null?t:yt.pooledCache}function an(t,l){l===null?U(Qe,Qe.current):U(Qe,l.pool)}function ks(){var t=$c();return t===null?null:{parent:Mt._currentValue,pool:t}}var ga=Error(f(460)),Fc=Error(f(474)),un=Error(f(542)),nn={then:function(){}};function Ws(t){return t=t.status,t==="fulfilled"||t==="rejected"}function $s(t,l,e){switch(e=t[e],e===void 0?t.push(l):e!==l&&(l.then(Xl,Xl),l=e),l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Is(t),t;default:if(typeof l.status=="string")l.then(Xl,Xl);else{if(t=yt,t!==null&&100<t.shellSuspendCounter)throw Error(f(482));t=l,t.status="pending",t.then(function(a){if(l.status==="pending"){var u=l;u.status="fulfilled",u.value=a}},function(a){if(l.status==="pending"){var u=l;u.status="rejected",u.reason=a}})}switch(l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Is(t),t}throw Le=l,ga}}function Ze(t){try{var l=t._init;return l(t._payload)}catch(e){throw e!==null&&typeof e=="object"&&typeof e.then=="function"?(Le=e,ga):e}}var Le=null;function Fs(){if(Le===null)throw Error(f(459));var t=Le;return Le=null,t}function Is(t){if(t===ga||t===un)throw Error(f(483))}var Sa=null,lu=0;function cn(t){var l=lu;return lu+=1,Sa===null&&(Sa=[]),$s(Sa,t,l)}function eu(t,l){l=l.props.ref,t.ref=l!==void 0?l:null}function fn(t,l){throw l.$$typeof===Q?Error(f(525)):(t=Object.prototype.toString.call(l),Error(f(31,t==="[object Object]"?"object with keys {"+Object.keys(l).join(", ")+"}":t)))}function Ps(t){function l(h,d){if(t){var y=h.deletions;y===null?(h.deletions=[d],h.flags|=16):y.push(d)}}function e(h,d){if(!t)return null;for(;d!==null;)l(h,d),d=d.sibling;return null}function a(h){for(var d=new Map;h!==null;)h.key!==null?d.set(h.key,h):d.set(h.index,h),h=h.sibling;return d}function u(h,d){return h=Zl(h,d),h.index=0,h.sibling=null,h}function n(h,d,y){return h.index=y,t?(y=h.alternate,y!==null?(y=y.index,y<d?(h.flags|=67108866,d):y):(h.flags|=67108866,d)):(h.flags|=1048576,d)}function c(h){return t&&h.alternate===null&&(h.flags|=67108866),h}function i(h,d,y,A){return d===null||d.tag!==6?(d=Gc(y,h.mode,A),d.return=h,d):(d=u(d,y),d.return=h,d)}function s(h,d,y,A){var X=y.type;return X===ft?z(h,d,y.props.children,A,y.key):d!==null&&(d.elementType===X||typeof X=="object"&&X!==null&&X.$$typeof===Bt&&Ze(X)===d.type)?(d=u(d,y.props),eu(d,y),d.return=h,d):(d=Pu(y.type,y.key,y.props,null,h.mode,A),eu(d,y),d.return=h,d)}function g(h,d,y,A){return d===null||d.tag!==4||d.stateNode.containerInfo!==y.containerInfo||d.stateNode.implementation!==y.implementation?(d=Xc(y,h.mode,A),d.return=h,d):(d=u(d,y.children||[]),d.return=h,d)}function z(h,d,y,A,X){return d===null||d.tag!==7?(d=Be(y,h.mode,A,X),d.return=h,d):(d=u(d,y),d.return=h,d)}function O(h,d,y){if(typeof d=="string"&&d!==""||typeof d=="number"||typeof d=="bigint")return d=Gc(""+d,h.mode,y),d.return=h,d;if(typeof d=="object"&&d!==null){switch(d.$$typeof){case w:return y=Pu(d.type,d.key,d.props,null,h.mode,y),eu(y,d),y.return=h,y;case dt:return d=Xc(d,h.mode,y),d.return=h,d;case Bt:return d=Ze(d),O(h,d,y)}if(K(d)||_t(d))return d=Be(d,h.mode,y,null),d.return=h,d;if(typeof d.then=="function")return O(h,cn(d),y);if(d.$$typeof===xt)return O(h,en(h,d),y);fn(h,d)}return null}function S(h,d,y,A){var X=d!==null?d.key:null;if(typeof y=="string"&&y!==""||typeof y=="number"||typeof y=="bigint")return X!==null?null:i(h,d,""+y,A);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case w:return y.key===X?s(h,d,y,A):null;case dt:return y.key===X?g(h,d,y,A):null;case Bt:return y=Ze(y),S(h,d,y,A)}if(K(y)||_t(y))return X!==null?null:z(h,d,y,A,null);if(typeof y.then=="function")return S(h,d,cn(y),A);if(y.$$typeof===xt)return S(h,d,en(h,y),A);fn(h,y)}return null}function E(h,d,y,A,X){if(typeof A=="string"&&A!==""||typeof A=="number"||typeof A=="bigint")return h=h.get(y)||null,i(d,h,""+A,X);if(typeof A=="object"&&A!==null){switch(A.$$typeof){case w:return h=h.get(A.key===null?y:A.key)||null,s(d,h,A,X);case dt:return h=h.get(A.key===null?y:A.key)||null,g(d,h,A,X);case Bt:return A=Ze(A),E(h,d,y,A,X)}if(K(A)||_t(A))return h=h.get(y)||null,z(d,h,A,X,null);if(typeof A.then=="function")return E(h,d,y,cn(A),X);if(A.$$typeof===xt)return E(h,d,y,en(d,A),X);fn(d,A)}return null}function q(h,d,y,A){for(var X=null,nt=null,Y=d,k=d=0,et=null;Y!==null&&k<y.length;k++){Y.index>k?(et=Y,Y=null):et=Y.sibling;var ct=S(h,Y,y[k],A);if(ct===null){Y===null&&(Y=et);break}t&&Y&&ct.alternate===null&&l(h,Y),d=n(ct,d,k),nt===null?X=ct:nt.sibling=ct,nt=ct,Y=et}if(k===y.length)return e(h,Y),ut&&Ll(h,k),X;if(Y===null){for(;k<y.length;k++)Y=O(h,y[k],A),Y!==null&&(d=n(Y,d,k),nt===null?X=Y:nt.sibling=Y,nt=Y);return ut&&Ll(h,k),X}for(Y=a(Y);k<y.length;k++)et=E(Y,h,k,y[k],A),et!==null&&(t&&et.alternate!==null&&Y.delete(et.key===null?k:et.key),d=n(et,d,k),nt===null?X=et:nt.sibling=et,nt=et);return t&&Y.forEach(function(Ne){return l(h,Ne)}),ut&&Ll(h,k),X}function Z(h,d,y,A){if(y==null)throw Error(f(151));for(var X=null,nt=null,Y=d,k=d=0,et=null,ct=y.next();Y!==null&&!ct.done;k++,ct=y.next()){Y.index>k?(et=Y,Y=null):et=Y.sibling;var Ne=S(h,Y,ct.value,A);if(Ne===null){Y===null&&(Y=et);break}t&&Y&&Ne.alternate===null&&l(h,Y),d=n(Ne,d,k),nt===null?X=Ne:nt.sibling=Ne,nt=Ne,Y=et}if(ct.done)return e(h,Y),ut&&Ll(h,k),X;if(Y===null){for(;!ct.done;k++,ct=y.next())ct=O(h,ct.value,A),ct!==null&&(d=n(ct,d,k),nt===null?X=ct:nt.sibling=ct,nt=ct);return ut&&Ll(h,k),X}for(Y=a(Y);!ct.done;k++,ct=y.next())ct=E(Y,h,k,ct.value,A),ct!==null&&(t&&ct.alternate!==null&&Y.delete(ct.key===null?k:ct.key),d=n(ct,d,k),nt===null?X=ct:nt.sibling=ct,nt=ct);return t&&Y.forEach(function(Qh){return l(h,Qh)}),ut&&Ll(h,k),X}function vt(h,d,y,A){if(typeof y=="object"&&y!==null&&y.type===ft&&y.key===null&&(y=y.props.children),typeof y=="object"&&y!==null){switch(y.$$typeof){case w:t:{for(var X=y.key;d!==null;){if(d.key===X){if(X=y.type,X===ft){if(d.tag===7){e(h,d.sibling),A=u(d,y.props.children),A.return=h,h=A;break t}}else if(d.elementType===X||typeof X=="object"&&X!==null&&X.$$typeof===Bt&&Ze(X)===d.type){e(h,d.sibling),A=u(d,y.props),eu(A,y),A.return=h,h=A;break t}e(h,d);break}else l(h,d);d=d.sibling}y.type===ft?(A=Be(y.props.children,h.mode,A,y.key),A.return=h,h=A):(A=Pu(y.type,y.key,y.props,null,h.mode,A),eu(A,y),A.return=h,h=A)}return c(h);case dt:t:{for(X=y.key;d!==null;){if(d.key===X)if(d.tag===4&&d.stateNode.containerInfo===y.containerInfo&&d.stateNode.implementation===y.implementation){e(h,d.sibling),A=u(d,y.children||[]),A.return=h,h=A;break t}else{e(h,d);break}else l(h,d);d=d.sibling}A=Xc(y,h.mode,A),A.return=h,h=A}return c(h);case Bt:return y=Ze(y),vt(h,d,y,A)}if(K(y))return q(h,d,y,A);if(_t(y)){if(X=_t(y),typeof X!="function")throw Error(f(150));return y=X.call(y),Z(h,d,y,A)}if(typeof y.then=="function")return vt(h,d,cn(y),A);if(y.$$typeof===xt)return vt(h,d,en(h,y),A);fn(h,y)}return typeof y=="string"&&y!==""||typeof y=="number"||typeof y=="bigint"?(y=""+y,d!==null&&d.tag===6?(e(h,d.sibling),A=u(d,y),A.return=h,h=A):(e(h,d),A=Gc(y,h.mode,A),A.return=h,h=A),c(h)):e(h,d)}return function(h,d,y,A){try{lu=0;var X=vt(h,d,y,A);return Sa=null,X}catch(Y){if(Y===ga||Y===un)throw Y;var nt=hl(29,Y,null,h.mode);return nt.lanes=A,nt.return=h,nt}finally{}}}var Ve=Ps(!0),tr=Ps(!1),de=!1;function Ic(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Pc(t,l){t=t.updateQueue,l.updateQueue===t&&(l.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,callbacks:null})}function me(t){return{lane:t,tag:0,payload:null,callback:null,next:null}}function he(t,l,e){var a=t.updateQueue;if(a===null)return null;if(a=a.shared,(it&2)!==0){var u=a.pending;return u===null?l.next=l:(l.next=u.next,u.next=l),a.pending=l,l=Iu(t),Bs(t,null,e),l}return Fu(t,a,l,e),Iu(t)}function au(t,l,e){if(l=l.updateQueue,l!==null&&(l=l.shared,(e&4194048)!==0)){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,Kf(t,e)}}function ti(t,l){var e=t.updateQueue,a=t.alternate;if(a!==null&&(a=a.updateQueue,e===a)){var u=null,n=null;if(e=e.firstBaseUpdate,e!==null){do{var c={lane:e.lane,tag:e.tag,payload:e.payload,callback:null,next:null};n===null?u=n=c:n=n.next=c,e=e.next}while(e!==null);n===null?u=n=l:n=n.next=l}else u=n=l;e={baseState:a.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},t.updateQueue=e;return}t=e.lastBaseUpdate,t===null?e.firstBaseUpdate=l:t.next=l,e.lastBaseUpdate=l}var li=!1;function uu(){if(li){var t=ya;if(t!==null)throw t}}function nu(t,l,e,a){li=!1;var u=t.updateQueue;de=!1;var n=u.firstBaseUpdate,c=u.lastBaseUpdate,i=u.shared.pending;if(i!==null){u.shared.pending=null;var s=i,g=s.next;s.next=null,c===null?n=g:c.next=g,c=s;var z=t.alternate;z!==null&&(z=z.updateQueue,i=z.lastBaseUpdate,i!==c&&(i===null?z.firstBaseUpdate=g:i.next=g,z.lastBaseUpdate=s))}if(n!==null){var O=u.baseState;c=0,z=g=s=null,i=n;do{var S=i.lane&-536870913,E=S!==i.lane;if(E?(lt&S)===S:(a&S)===S){S!==0&&S===va&&(li=!0),z!==null&&(z=z.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});t:{var q=t,Z=i;S=l;var vt=e;switch(Z.tag){case 1:if(q=Z.payload,typeof q=="function"){O=q.call(vt,O,S);break t}O=q;break t;case 3:q.flags=q.flags&-65537|128;case 0:if(q=Z.payload,S=typeof q=="function"?q.call(vt,O,S):q,S==null)break t;O=H({},O,S);break t;case 2:de=!0}}S=i.callback,S!==null&&(t.flags|=64,E&&(t.flags|=8192),E=u.callbacks,E===null?u.callbacks=[S]:E.push(S))}else E={lane:S,tag:i.tag,payload:i.payload,callback:i.callback,next:null},z===null?(g=z=E,s=O):z=z.next=E,c|=S;if(i=i.next,i===null){if(i=u.shared.pending,i===null)break;E=i,i=E.next,E.next=null,u.lastBaseUpdate=E,u.shared.pending=null}}while(!0);z===null&&(s=O),u.baseState=s,u.firstBaseUpdate=g,u.lastBaseUpdate=z,n===null&&(u.shared.lanes=0),be|=c,t.lanes=c,t.memoizedState=O}}function lr(t,l){if(typeof t!="function")throw Error(f(191,t));t.call(l)}function er(t,l){var e=t.callbacks;if(e!==null)for(t.callbacks=null,t=0;t<e.length;t++)lr(e[t],l)}var ba=m(null),sn=m(0);function ar(t,l){t=te,U(sn,t),U(ba,l),te=t|l.baseLanes}function ei(){U(sn,te),U(ba,ba.current)}function ai(){te=sn.current,_(ba),_(sn)}var vl=m(null),Cl=null;function ve(t){var l=t.alternate;U(Ct,Ct.current&1),U(vl,t),Cl===null&&(l===null||ba.current!==null||l.memoizedState!==null)&&(Cl=t)}function ui(t){U(Ct,Ct.current),U(vl,t),Cl===null&&(Cl=t)}function ur(t){t.tag===22?(U(Ct,Ct.current),U(vl,t),Cl===null&&(Cl=t)):ye()}function ye(){U(Ct,Ct.current),U(vl,vl.current)}function yl(t){_(vl),Cl===t&&(Cl=null),_(Ct)}var Ct=m(0);function rn(t){for(var l=t;l!==null;){if(l.tag===13){var e=l.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||of(e)||df(e)))return l}else if(l.tag===19&&(l.memoizedProps.revealOrder==="forwards"||l.memoizedProps.revealOrder==="backwards"||l.memoizedProps.revealOrder==="unstable_legacy-backwards"||l.memoizedProps.revealOrder==="together")){if((l.flags&128)!==0)return l}else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return null;l=l.return}l.sibling.return=l.return,l=l.sibling}return null}var Jl=0,J=null,mt=null,Ut=null,on=!1,pa=!1,Ke=!1,dn=0,cu=0,Ea=null,M0=0;function Tt(){throw Error(f(321))}function ni(t,l){if(l===null)return!1;for(var e=0;e<l.length&&e<t.length;e++)if(!ml(t[e],l[e]))return!1;return!0}function ci(t,l,e,a,u,n){return Jl=n,J=l,l.memoizedState=null,l.updateQueue=null,l.lanes=0,p.H=t===null||t.memoizedState===null?Qr:Ei,Ke=!1,n=e(a,u),Ke=!1,pa&&(n=cr(l,e,a,u)),nr(t),n}function nr(t){p.H=su;var l=mt!==null&&mt.next!==null;if(Jl=0,Ut=mt=J=null,on=!1,cu=0,Ea=null,l)throw Error(f(300));t===null||Dt||(t=t.dependencies,t!==null&&ln(t)&&(Dt=!0))}function cr(t,l,e,a){J=t;var u=0;do{if(pa&&(Ea=null),cu=0,pa=!1,25<=u)throw Error(f(301));if(u+=1,Ut=mt=null,t.updateQueue!=null){var n=t.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}p.H=Zr,n=l(e,a)}while(pa);return n}function U0(){var t=p.H,l=t.useState()[0];return l=typeof l.then=="function"?iu(l):l,t=t.useState()[0],(mt!==null?mt.memoizedState:null)!==t&&(J.flags|=1024),l}function ii(){var t=dn!==0;return dn=0,t}function fi(t,l,e){l.updateQueue=t.updateQueue,l.flags&=-2053,t.lanes&=~e}function si(t){if(on){for(t=t.memoizedState;t!==null;){var l=t.queue;l!==null&&(l.pending=null),t=t.next}on=!1}Jl=0,Ut=mt=J=null,pa=!1,cu=dn=0,Ea=null}function $t(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ut===null?J.memoizedState=Ut=t:Ut=Ut.next=t,Ut}function Nt(){if(mt===null){var t=J.alternate;t=t!==null?t.memoizedState:null}else t=mt.next;var l=Ut===null?J.memoizedState:Ut.next;if(l!==null)Ut=l,mt=t;else{if(t===null)throw J.alternate===null?Error(f(467)):Error(f(310));mt=t,t={memoizedState:mt.memoizedState,baseState:mt.baseState,baseQueue:mt.baseQueue,queue:mt.queue,next:null},Ut===null?J.memoizedState=Ut=t:Ut=Ut.next=t}return Ut}function mn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function iu(t){var l=cu;return cu+=1,Ea===null&&(Ea=[]),t=$s(Ea,t,l),l=J,(Ut===null?l.memoizedState:Ut.next)===null&&(l=l.alternate,p.H=l===null||l.memoizedState===null?Qr:Ei),t}function hn(t){if(t!==null&&typeof t=="object"){if(typeof t.then=="function")return iu(t);if(t.$$typeof===xt)return Zt(t)}throw Error(f(438,String(t)))}function ri(t){var l=null,e=J.updateQueue;if(e!==null&&(l=e.memoCache),l==null){var a=J.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(l={data:a.data.map(function(u){return u.slice()}),index:0})))}if(l==null&&(l={data:[],index:0}),e===null&&(e=mn(),J.updateQueue=e),e.memoCache=l,e=l.data[l.index],e===void 0)for(e=l.data[l.index]=Array(t),a=0;a<t;a++)e[a]=Rl;return l.index++,e}function wl(t,l){return typeof l=="function"?l(t):l}function vn(t){var l=Nt();return oi(l,mt,t)}function oi(t,l,e){var a=t.queue;if(a===null)throw Error(f(311));a.lastRenderedReducer=e;var u=t.baseQueue,n=a.pending;if(n!==null){if(u!==null){var c=u.next;u.next=n.next,n.next=c}l.baseQueue=u=n,a.pending=null}if(n=t.baseState,u===null)t.memoizedState=n;else{l=u.next;var i=c=null,s=null,g=l,z=!1;do{var O=g.lane&-536870913;if(O!==g.lane?(lt&O)===O:(Jl&O)===O){var S=g.revertLane;if(S===0)s!==null&&(s=s.next={lane:0,revertLane:0,gesture:null,action:g.action,hasEagerState:g.hasEagerState,eagerState:g.eagerState,next:null}),O===va&&(z=!0);else if((Jl&S)===S){g=g.next,S===va&&(z=!0);continue}else O={lane:0,revertLane:g.revertLane,gesture:null,action:g.action,hasEagerState:g.hasEagerState,eagerState:g.eagerState,next:null},s===null?(i=s=O,c=n):s=s.next=O,J.lanes|=S,be|=S;O=g.action,Ke&&e(n,O),n=g.hasEagerState?g.eagerState:e(n,O)}else S={lane:O,revertLane:g.revertLane,gesture:g.gesture,action:g.action,hasEagerState:g.hasEagerState,eagerState:g.eagerState,next:null},s===null?(i=s=S,c=n):s=s.next=S,J.lanes|=O,be|=O;g=g.next}while(g!==null&&g!==l);if(s===null?c=n:s.next=i,!ml(n,t.memoizedState)&&(Dt=!0,z&&(e=ya,e!==null)))throw e;t.memoizedState=n,t.baseState=c,t.baseQueue=s,a.lastRenderedState=n}return u===null&&(a.lanes=0),[t.memoizedState,a.dispatch]}function di(t){var l=Nt(),e=l.queue;if(e===null)throw Error(f(311));e.lastRenderedReducer=t;var a=e.dispatch,u=e.pending,n=l.memoizedState;if(u!==null){e.pending=null;var c=u=u.next;do n=t(n,c.action),c=c.next;while(c!==u);ml(n,l.memoizedState)||(Dt=!0),l.memoizedState=n,l.baseQueue===null&&(l.baseState=n),e.lastRenderedState=n}return[n,a]}function ir(t,l,e){var a=J,u=Nt(),n=ut;if(n){if(e===void 0)throw Error(f(407));e=e()}else e=l();var c=!ml((mt||u).memoizedState,e);if(c&&(u.memoizedState=e,Dt=!0),u=u.queue,vi(rr.bind(null,a,u,t),[t]),u.getSnapshot!==l||c||Ut!==null&&Ut.memoizedState.tag&1){if(a.flags|=2048,Ta(9,{destroy:void 0},sr.bind(null,a,u,e,l),null),yt===null)throw Error(f(349));n||(Jl&127)!==0||fr(a,l,e)}return e}function fr(t,l,e){t.flags|=16384,t={getSnapshot:l,value:e},l=J.updateQueue,l===null?(l=mn(),J.updateQueue=l,l.stores=[t]):(e=l.stores,e===null?l.stores=[t]:e.push(t))}function sr(t,l,e,a){l.value=e,l.getSnapshot=a,or(l)&&dr(t)}function rr(t,l,e){return e(function(){or(l)&&dr(t)})}function or(t){var l=t.getSnapshot;t=t.value;try{var e=l();return!ml(t,e)}catch{return!0}}function dr(t){var l=qe(t,2);l!==null&&fl(l,t,2)}function mi(t){var l=$t();if(typeof t=="function"){var e=t;if(t=e(),Ke){ne(!0);try{e()}finally{ne(!1)}}}return l.memoizedState=l.baseState=t,l.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:wl,lastRenderedState:t},l}function mr(t,l,e,a){return t.baseState=e,oi(t,mt,typeof a=="function"?a:wl)}function D0(t,l,e,a,u){if(Sn(t))throw Error(f(485));if(t=l.action,t!==null){var n={payload:u,action:t,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(c){n.listeners.push(c)}};p.T!==null?e(!0):n.isTransition=!1,a(n),e=l.pending,e===null?(n.next=l.pending=n,hr(l,n)):(n.next=e.next,l.pending=e.next=n)}}function hr(t,l){var e=l.action,a=l.payload,u=t.state;if(l.isTransition){var n=p.T,c={};p.T=c;try{var i=e(u,a),s=p.S;s!==null&&s(c,i),vr(t,l,i)}catch(g){hi(t,l,g)}finally{n!==null&&c.types!==null&&(n.types=c.types),p.T=n}}else try{n=e(u,a),vr(t,l,n)}catch(g){hi(t,l,g)}}function vr(t,l,e){e!==null&&typeof e=="object"&&typeof e.then=="function"?e.then(function(a){yr(t,l,a)},function(a){return hi(t,l,a)}):yr(t,l,e)}function yr(t,l,e){l.status="fulfilled",l.value=e,gr(l),t.state=e,l=t.pending,l!==null&&(e=l.next,e===l?t.pending=null:(e=e.next,l.next=e,hr(t,e)))}function hi(t,l,e){var a=t.pending;if(t.pending=null,a!==null){a=a.next;do l.status="rejected",l.reason=e,gr(l),l=l.next;while(l!==a)}t.action=null}function gr(t){t=t.listeners;for(var l=0;l<t.length;l++)(0,t[l])()}function Sr(t,l){return l}function br(t,l){if(ut){var e=yt.formState;if(e!==null){t:{var a=J;if(ut){if(St){l:{for(var u=St,n=Ol;u.nodeType!==8;){if(!n){u=null;break l}if(u=Nl(u.nextSibling),u===null){u=null;break l}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){St=Nl(u.nextSibling),a=u.data==="F!";break t}}re(a)}a=!1}a&&(l=e[0])}}return e=$t(),e.memoizedState=e.baseState=l,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Sr,lastRenderedState:l},e.queue=a,e=Yr.bind(null,J,a),a.dispatch=e,a=mi(!1),n=pi.bind(null,J,!1,a.queue),a=$t(),u={state:l,dispatch:null,action:t,pending:null},a.queue=u,e=D0.bind(null,J,u,n,e),u.dispatch=e,a.memoizedState=t,[l,e,!1]}function pr(t){var l=Nt();return Er(l,mt,t)}function Er(t,l,e){if(l=oi(t,l,Sr)[0],t=vn(wl)[0],typeof l=="object"&&l!==null&&typeof l.then=="function")try{var a=iu(l)}catch(c){throw c===ga?un:c}else a=l;l=Nt();var u=l.queue,n=u.dispatch;return e!==l.memoizedState&&(J.flags|=2048,Ta(9,{destroy:void 0},R0.bind(null,u,e),null)),[a,n,t]}function R0(t,l){t.action=l}function Tr(t){var l=Nt(),e=mt;if(e!==null)return Er(l,e,t);Nt(),l=l.memoizedState,e=Nt();var a=e.queue.dispatch;return e.memoizedState=t,[l,a,!1]}function Ta(t,l,e,a){return t={tag:t,create:e,deps:a,inst:l,next:null},l=J.updateQueue,l===null&&(l=mn(),J.updateQueue=l),e=l.lastEffect,e===null?l.lastEffect=t.next=t:(a=e.next,e.next=t,t.next=a,l.lastEffect=t),t}function zr(){return Nt().memoizedState}function yn(t,l,e,a){var u=$t();J.flags|=t,u.memoizedState=Ta(1|l,{destroy:void 0},e,a===void 0?null:a)}function gn(t,l,e,a){var u=Nt();a=a===void 0?null:a;var n=u.memoizedState.inst;mt!==null&&a!==null&&ni(a,mt.memoizedState.deps)?u.memoizedState=Ta(l,n,e,a):(J.flags|=t,u.memoizedState=Ta(1|l,n,e,a))}function Ar(t,l){yn(8390656,8,t,l)}function vi(t,l){gn(2048,8,t,l)}function H0(t){J.flags|=4;var l=J.updateQueue;if(l===null)l=mn(),J.updateQueue=l,l.events=[t];else{var e=l.events;e===null?l.events=[t]:e.push(t)}}function xr(t){var l=Nt().memoizedState;return H0({ref:l,nextImpl:t}),function(){if((it&2)!==0)throw Error(f(440));return l.impl.apply(void 0,arguments)}}function _r(t,l){return gn(4,2,t,l)}function Or(t,l){return gn(4,4,t,l)}function Cr(t,l){if(typeof l=="function"){t=t();var e=l(t);return function(){typeof e=="function"?e():l(null)}}if(l!=null)return t=t(),l.current=t,function(){l.current=null}}function Nr(t,l,e){e=e!=null?e.concat([t]):null,gn(4,4,Cr.bind(null,l,t),e)}function yi(){}function jr(t,l){var e=Nt();l=l===void 0?null:l;var a=e.memoizedState;return l!==null&&ni(l,a[1])?a[0]:(e.memoizedState=[t,l],t)}function Mr(t,l){var e=Nt();l=l===void 0?null:l;var a=e.memoizedState;if(l!==null&&ni(l,a[1]))return a[0];if(a=t(),Ke){ne(!0);try{t()}finally{ne(!1)}}return e.memoizedState=[a,l],a}function gi(t,l,e){return e===void 0||(Jl&1073741824)!==0&&(lt&261930)===0?t.memoizedState=l:(t.memoizedState=e,t=Do(),J.lanes|=t,be|=t,e)}function Ur(t,l,e,a){return ml(e,l)?e:ba.current!==null?(t=gi(t,e,a),ml(t,l)||(Dt=!0),t):(Jl&42)===0||(Jl&1073741824)!==0&&(lt&261930)===0?(Dt=!0,t.memoizedState=e):(t=Do(),J.lanes|=t,be|=t,l)}function Dr(t,l,e,a,u){var n=j.p;j.p=n!==0&&8>n?n:8;var c=p.T,i={};p.T=i,pi(t,!1,l,e);try{var s=u(),g=p.S;if(g!==null&&g(i,s),s!==null&&typeof s=="object"&&typeof s.then=="function"){var z=j0(s,a);fu(t,l,z,bl(t))}else fu(t,l,a,bl(t))}catch(O){fu(t,l,{then:function(){},status:"rejected",reason:O},bl())}finally{j.p=n,c!==null&&i.types!==null&&(c.types=i.types),p.T=c}}function q0(){}function Si(t,l,e,a){if(t.tag!==5)throw Error(f(476));var u=Rr(t).queue;Dr(t,u,l,D,e===null?q0:function(){return Hr(t),e(a)})}function Rr(t){var l=t.memoizedState;if(l!==null)return l;l={memoizedState:D,baseState:D,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:wl,lastRenderedState:D},next:null};var e={};return l.next={memoizedState:e,baseState:e,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:wl,lastRenderedState:e},next:null},t.memoizedState=l,t=t.alternate,t!==null&&(t.memoizedState=l),l}function Hr(t){var l=Rr(t);l.next===null&&(l=t.alternate.memoizedState),fu(t,l.next.queue,{},bl())}function bi(){return Zt(xu)}function qr(){return Nt().memoizedState}function Br(){return Nt().memoizedState}function B0(t){for(var l=t.return;l!==null;){switch(l.tag){case 24:case 3:var e=bl();t=me(e);var a=he(l,t,e);a!==null&&(fl(a,l,e),au(a,l,e)),l={cache:kc()},t.payload=l;return}l=l.return}}function Y0(t,l,e){var a=bl();e={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},Sn(t)?Gr(l,e):(e=Bc(t,l,e,a),e!==null&&(fl(e,t,a),Xr(e,l,a)))}function Yr(t,l,e){var a=bl();fu(t,l,e,a)}function fu(t,l,e,a){var u={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null};if(Sn(t))Gr(l,u);else{var n=t.alternate;if(t.lanes===0&&(n===null||n.lanes===0)&&(n=l.lastRenderedReducer,n!==null))try{var c=l.lastRenderedState,i=n(c,e);if(u.hasEagerState=!0,u.eagerState=i,ml(i,c))return Fu(t,l,u,0),yt===null&&$u(),!1}catch{}finally{}if(e=Bc(t,l,u,a),e!==null)return fl(e,t,a),Xr(e,l,a),!0}return!1}function pi(t,l,e,a){if(a={lane:2,revertLane:Ii(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},Sn(t)){if(l)throw Error(f(479))}else l=Bc(t,e,a,2),l!==null&&fl(l,t,2)}function Sn(t){var l=t.alternate;return t===J||l!==null&&l===J}function Gr(t,l){pa=on=!0;var e=t.pending;e===null?l.next=l:(l.next=e.next,e.next=l),t.pending=l}function Xr(t,l,e){if((e&4194048)!==0){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,Kf(t,e)}}var su={readContext:Zt,use:hn,useCallback:Tt,useContext:Tt,useEffect:Tt,useImperativeHandle:Tt,useLayoutEffect:Tt,useInsertionEffect:Tt,useMemo:Tt,useReducer:Tt,useRef:Tt,useState:Tt,useDebugValue:Tt,useDeferredValue:Tt,useTransition:Tt,useSyncExternalStore:Tt,useId:Tt,useHostTransitionStatus:Tt,useFormState:Tt,useActionState:Tt,useOptimistic:Tt,useMemoCache:Tt,useCacheRefresh:Tt};su.useEffectEvent=Tt;var Qr={readContext:Zt,use:hn,useCallback:function(t,l){return $t().memoizedState=[t,l===void 0?null:l],t},useContext:Zt,useEffect:Ar,useImperativeHandle:function(t,l,e){e=e!=null?e.concat([t]):null,yn(4194308,4,Cr.bind(null,l,t),e)},useLayoutEffect:function(t,l){return yn(4194308,4,t,l)},useInsertionEffect:function(t,l){yn(4,2,t,l)},useMemo:function(t,l){var e=$t();l=l===void 0?null:l;var a=t();if(Ke){ne(!0);try{t()}finally{ne(!1)}}return e.memoizedState=[a,l],a},useReducer:function(t,l,e){var a=$t();if(e!==void 0){var u=e(l);if(Ke){ne(!0);try{e(l)}finally{ne(!1)}}}else u=l;return a.memoizedState=a.baseState=u,t={pending:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:u},a.queue=t,t=t.dispatch=Y0.bind(null,J,t),[a.memoizedState,t]},useRef:function(t){var l=$t();return t={current:t},l.memoizedState=t},useState:function(t){t=mi(t);var l=t.queue,e=Yr.bind(null,J,l);return l.dispatch=e,[t.memoizedState,e]},useDebugValue:yi,useDeferredValue:function(t,l){var e=$t();return gi(e,t,l)},useTransition:function(){var t=mi(!1);return t=Dr.bind(null,J,t.queue,!0,!1),$t().memoizedState=t,[!1,t]},useSyncExternalStore:function(t,l,e){var a=J,u=$t();if(ut){if(e===void 0)throw Error(f(407));e=e()}else{if(e=l(),yt===null)throw Error(f(349));(lt&127)!==0||fr(a,l,e)}u.memoizedState=e;var n={value:e,getSnapshot:l};return u.queue=n,Ar(rr.bind(null,a,n,t),[t]),a.flags|=2048,Ta(9,{destroy:void 0},sr.bind(null,a,n,e,l),null),e},useId:function(){var t=$t(),l=yt.identifierPrefix;if(ut){var e=ql,a=Hl;e=(a&~(1<<32-dl(a)-1)).toString(32)+e,l="_"+l+"R_"+e,e=dn++,0<e&&(l+="H"+e.toString(32)),l+="_"}else e=M0++,l="_"+l+"r_"+e.toString(32)+"_";return t.memoizedState=l},useHostTransitionStatus:bi,useFormState:br,useActionState:br,useOptimistic:function(t){var l=$t();l.memoizedState=l.baseState=t;var e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return l.queue=e,l=pi.bind(null,J,!0,e),e.dispatch=l,[t,l]},useMemoCache:ri,useCacheRefresh:function(){return $t().memoizedState=B0.bind(null,J)},useEffectEvent:function(t){var l=$t(),e={impl:t};return l.memoizedState=e,function(){if((it&2)!==0)throw Error(f(440));return e.impl.apply(void 0,arguments)}}},Ei={readContext:Zt,use:hn,useCallback:jr,useContext:Zt,useEffect:vi,useImperativeHandle:Nr,useInsertionEffect:_r,useLayoutEffect:Or,useMemo:Mr,useReducer:vn,useRef:zr,useState:function(){return vn(wl)},useDebugValue:yi,useDeferredValue:function(t,l){var e=Nt();return Ur(e,mt.memoizedState,t,l)},useTransition:function(){var t=vn(wl)[0],l=Nt().memoizedState;return[typeof t=="boolean"?t:iu(t),l]},useSyncExternalStore:ir,useId:qr,useHostTransitionStatus:bi,useFormState:pr,useActionState:pr,useOptimistic:function(t,l){var e=Nt();return mr(e,mt,t,l)},useMemoCache:ri,useCacheRefresh:Br};Ei.useEffectEvent=xr;var Zr={readContext:Zt,use:hn,useCallback:jr,useContext:Zt,useEffect:vi,useImperativeHandle:Nr,useInsertionEffect:_r,useLayoutEffect:Or,useMemo:Mr,useReducer:di,useRef:zr,useState:function(){return di(wl)},useDebugValue:yi,useDeferredValue:function(t,l){var e=Nt();return mt===null?gi(e,t,l):Ur(e,mt.memoizedState,t,l)},useTransition:function(){var t=di(wl)[0],l=Nt().memoizedState;return[typeof t=="boolean"?t:iu(t),l]},useSyncExternalStore:ir,useId:qr,useHostTransitionStatus:bi,useFormState:Tr,useActionState:Tr,useOptimistic:function(t,l){var e=Nt();return mt!==null?mr(e,mt,t,l):(e.baseState=t,[t,e.queue.dispatch])},useMemoCache:ri,useCacheRefresh:Br};Zr.useEffectEvent=xr;function Ti(t,l,e,a){l=t.memoizedState,e=e(a,l),e=e==null?l:H({},l,e),t.memoizedState=e,t.lanes===0&&(t.updateQueue.baseState=e)}var zi={enqueueSetState:function(t,l,e){t=t._reactInternals;var a=bl(),u=me(a);u.payload=l,e!=null&&(u.callback=e),l=he(t,u,a),l!==null&&(fl(l,t,a),au(l,t,a))},enqueueReplaceState:function(t,l,e){t=t._reactInternals;var a=bl(),u=me(a);u.tag=1,u.payload=l,e!=null&&(u.callback=e),l=he(t,u,a),l!==null&&(fl(l,t,a),au(l,t,a))},enqueueForceUpdate:function(t,l){t=t._reactInternals;var e=bl(),a=me(e);a.tag=2,l!=null&&(a.callback=l),l=he(t,a,e),l!==null&&(fl(l,t,e),au(l,t,e))}};function Lr(t,l,e,a,u,n,c){return t=t.stateNode,typeof t.shouldComponentUpdate=="function"?t.shouldComponentUpdate(a,n,c):l.prototype&&l.prototype.isPureReactComponent?!Wa(e,a)||!Wa(u,n):!0}function Vr(t,l,e,a){t=l.state,typeof l.componentWillReceiveProps=="function"&&l.componentWillReceiveProps(e,a),typeof l.UNSAFE_componentWillReceiveProps=="function"&&l.UNSAFE_componentWillReceiveProps(e,a),l.state!==t&&zi.enqueueReplaceState(l,l.state,null)}function Je(t,l){var e=l;if("ref"in l){e={};for(var a in l)a!=="ref"&&(e[a]=l[a])}if(t=t.defaultProps){e===l&&(e=H({},e));for(var u in t)e[u]===void 0&&(e[u]=t[u])}return e}function Kr(t){Wu(t)}function Jr(t){console.error(t)}function wr(t){Wu(t)}function bn(t,l){try{var e=t.onUncaughtError;e(l.value,{componentStack:l.stack})}catch(a){setTimeout(function(){throw a})}}function kr(t,l,e){try{var a=t.onCaughtError;a(e.value,{componentStack:e.stack,errorBoundary:l.tag===1?l.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function Ai(t,l,e){return e=me(e),e.tag=3,e.payload={element:null},e.callback=function(){bn(t,l)},e}function Wr(t){return t=me(t),t.tag=3,t}function $r(t,l,e,a){var u=e.type.getDerivedStateFromError;if(typeof u=="function"){var n=a.value;t.payload=function(){return u(n)},t.callback=function(){kr(l,e,a)}}var c=e.stateNode;c!==null&&typeof c.componentDidCatch=="function"&&(t.callback=function(){kr(l,e,a),typeof u!="function"&&(pe===null?pe=new Set([this]):pe.add(this));var i=a.stack;this.componentDidCatch(a.value,{componentStack:i!==null?i:""})})}function G0(t,l,e,a,u){if(e.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(l=e.alternate,l!==null&&ha(l,e,u,!0),e=vl.current,e!==null){switch(e.tag){case 31:case 13:return Cl===null?Mn():e.alternate===null&&zt===0&&(zt=3),e.flags&=-257,e.flags|=65536,e.lanes=u,a===nn?e.flags|=16384:(l=e.updateQueue,l===null?e.updateQueue=new Set([a]):l.add(a),Wi(t,a,u)),!1;case 22:return e.flags|=65536,a===nn?e.flags|=16384:(l=e.updateQueue,l===null?(l={transitions:null,markerInstances:null,retryQueue:new Set([a])},e.updateQueue=l):(e=l.retryQueue,e===null?l.retryQueue=new Set([a]):e.add(a)),Wi(t,a,u)),!1}throw Error(f(435,e.tag))}return Wi(t,a,u),Mn(),!1}if(ut)return l=vl.current,l!==null?((l.flags&65536)===0&&(l.flags|=256),l.flags|=65536,l.lanes=u,a!==Lc&&(t=Error(f(422),{cause:a}),Ia(Al(t,e)))):(a!==Lc&&(l=Error(f(423),{cause:a}),Ia(Al(l,e))),t=t.current.alternate,t.flags|=65536,u&=-u,t.lanes|=u,a=Al(a,e),u=Ai(t.stateNode,a,u),ti(t,u),zt!==4&&(zt=2)),!1;var n=Error(f(520),{cause:a});if(n=Al(n,e),gu===null?gu=[n]:gu.push(n),zt!==4&&(zt=2),l===null)return!0;a=Al(a,e),e=l;do{switch(e.tag){case 3:return e.flags|=65536,t=u&-u,e.lanes|=t,t=Ai(e.stateNode,a,t),ti(e,t),!1;case 1:if(l=e.type,n=e.stateNode,(e.flags&128)===0&&(typeof l.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(pe===null||!pe.has(n))))return e.flags|=65536,u&=-u,e.lanes|=u,u=Wr(u),$r(u,t,e,a),ti(e,u),!1}e=e.return}while(e!==null);return!1}var xi=Error(f(461)),Dt=!1;function Lt(t,l,e,a){l.child=t===null?tr(l,null,e,a):Ve(l,t.child,e,a)}function Fr(t,l,e,a,u){e=e.render;var n=l.ref;if("ref"in a){var c={};for(var i in a)i!=="ref"&&(c[i]=a[i])}else c=a;return Xe(l),a=ci(t,l,e,c,n,u),i=ii(),t!==null&&!Dt?(fi(t,l,u),kl(t,l,u)):(ut&&i&&Qc(l),l.flags|=1,Lt(t,l,a,u),l.child)}function Ir(t,l,e,a,u){if(t===null){var n=e.type;return typeof n=="function"&&!Yc(n)&&n.defaultProps===void 0&&e.compare===null?(l.tag=15,l.type=n,Pr(t,l,n,a,u)):(t=Pu(e.type,null,a,l,l.mode,u),t.ref=l.ref,t.return=l,l.child=t)}if(n=t.child,!Di(t,u)){var c=n.memoizedProps;if(e=e.compare,e=e!==null?e:Wa,e(c,a)&&t.ref===l.ref)return kl(t,l,u)}return l.flags|=1,t=Zl(n,a),t.ref=l.ref,t.return=l,l.child=t}function Pr(t,l,e,a,u){if(t!==null){var n=t.memoizedProps;if(Wa(n,a)&&t.ref===l.ref)if(Dt=!1,l.pendingProps=a=n,Di(t,u))(t.flags&131072)!==0&&(Dt=!0);else return l.lanes=t.lanes,kl(t,l,u)}return _i(t,l,e,a,u)}function to(t,l,e,a){var u=a.children,n=t!==null?t.memoizedState:null;if(t===null&&l.stateNode===null&&(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((l.flags&128)!==0){if(n=n!==null?n.baseLanes|e:e,t!==null){for(a=l.child=t.child,u=0;a!==null;)u=u|a.lanes|a.childLanes,a=a.sibling;a=u&~n}else a=0,l.child=null;return lo(t,l,n,e,a)}if((e&536870912)!==0)l.memoizedState={baseLanes:0,cachePool:null},t!==null&&an(l,n!==null?n.cachePool:null),n!==null?ar(l,n):ei(),ur(l);else return a=l.lanes=536870912,lo(t,l,n!==null?n.baseLanes|e:e,e,a)}else n!==null?(an(l,n.cachePool),ar(l,n),ye(),l.memoizedState=null):(t!==null&&an(l,null),ei(),ye());return Lt(t,l,u,e),l.child}function ru(t,l){return t!==null&&t.tag===22||l.stateNode!==null||(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),l.sibling}function lo(t,l,e,a,u){var n=$c();return n=n===null?null:{parent:Mt._currentValue,pool:n},l.memoizedState={baseLanes:e,cachePool:n},t!==null&&an(l,null),ei(),ur(l),t!==null&&ha(t,l,a,!0),l.childLanes=u,null}function pn(t,l){return l=Tn({mode:l.mode,children:l.children},t.mode),l.ref=t.ref,t.child=l,l.return=t,l}function eo(t,l,e){return Ve(l,t.child,null,e),t=pn(l,l.pendingProps),t.flags|=2,yl(l),l.memoizedState=null,t}function X0(t,l,e){var a=l.pendingProps,u=(l.flags&128)!==0;if(l.flags&=-129,t===null){if(ut){if(a.mode==="hidden")return t=pn(l,a),l.lanes=536870912,ru(null,t);if(ui(l),(t=St)?(t=vd(t,Ol),t=t!==null&&t.data==="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:fe!==null?{id:Hl,overflow:ql}:null,retryLane:536870912,hydrationErrors:null},e=Gs(t),e.return=l,l.child=e,Qt=l,St=null)):t=null,t===null)throw re(l);return l.lanes=536870912,null}return pn(l,a)}var n=t.memoizedState;if(n!==null){var c=n.dehydrated;if(ui(l),u)if(l.flags&256)l.flags&=-257,l=eo(t,l,e);else if(l.memoizedState!==null)l.child=t.child,l.flags|=128,l=null;else throw Error(f(558));else if(Dt||ha(t,l,e,!1),u=(e&t.childLanes)!==0,Dt||u){if(a=yt,a!==null&&(c=Jf(a,e),c!==0&&c!==n.retryLane))throw n.retryLane=c,qe(t,c),fl(a,t,c),xi;Mn(),l=eo(t,l,e)}else t=n.treeContext,St=Nl(c.nextSibling),Qt=l,ut=!0,se=null,Ol=!1,t!==null&&Zs(l,t),l=pn(l,a),l.flags|=4096;return l}return t=Zl(t.child,{mode:a.mode,children:a.children}),t.ref=l.ref,l.child=t,t.return=l,t}function En(t,l){var e=l.ref;if(e===null)t!==null&&t.ref!==null&&(l.flags|=4194816);else{if(typeof e!="function"&&typeof e!="object")throw Error(f(284));(t===null||t.ref!==e)&&(l.flags|=4194816)}}function _i(t,l,e,a,u){return Xe(l),e=ci(t,l,e,a,void 0,u),a=ii(),t!==null&&!Dt?(fi(t,l,u),kl(t,l,u)):(ut&&a&&Qc(l),l.flags|=1,Lt(t,l,e,u),l.child)}function ao(t,l,e,a,u,n){return Xe(l),l.updateQueue=null,e=cr(l,a,e,u),nr(t),a=ii(),t!==null&&!Dt?(fi(t,l,n),kl(t,l,n)):(ut&&a&&Qc(l),l.flags|=1,Lt(t,l,e,n),l.child)}function uo(t,l,e,a,u){if(Xe(l),l.stateNode===null){var n=ra,c=e.contextType;typeof c=="object"&&c!==null&&(n=Zt(c)),n=new e(a,n),l.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=zi,l.stateNode=n,n._reactInternals=l,n=l.stateNode,n.props=a,n.state=l.memoizedState,n.refs={},Ic(l),c=e.contextType,n.context=typeof c=="object"&&c!==null?Zt(c):ra,n.state=l.memoizedState,c=e.getDerivedStateFromProps,typeof c=="function"&&(Ti(l,e,c,a),n.state=l.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(c=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),c!==n.state&&zi.enqueueReplaceState(n,n.state,null),nu(l,a,n,u),uu(),n.state=l.memoizedState),typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!0}else if(t===null){n=l.stateNode;var i=l.memoizedProps,s=Je(e,i);n.props=s;var g=n.context,z=e.contextType;c=ra,typeof z=="object"&&z!==null&&(c=Zt(z));var O=e.getDerivedStateFromProps;z=typeof O=="function"||typeof n.getSnapshotBeforeUpdate=="function",i=l.pendingProps!==i,z||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i||g!==c)&&Vr(l,n,a,c),de=!1;var S=l.memoizedState;n.state=S,nu(l,a,n,u),uu(),g=l.memoizedState,i||S!==g||de?(typeof O=="function"&&(Ti(l,e,O,a),g=l.memoizedState),(s=de||Lr(l,e,s,a,S,g,c))?(z||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(l.flags|=4194308)):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),l.memoizedProps=a,l.memoizedState=g),n.props=a,n.state=g,n.context=c,a=s):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!1)}else{n=l.stateNode,Pc(t,l),c=l.memoizedProps,z=Je(e,c),n.props=z,O=l.pendingProps,S=n.context,g=e.contextType,s=ra,typeof g=="object"&&g!==null&&(s=Zt(g)),i=e.getDerivedStateFromProps,(g=typeof i=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c!==O||S!==s)&&Vr(l,n,a,s),de=!1,S=l.memoizedState,n.state=S,nu(l,a,n,u),uu();var E=l.memoizedState;c!==O||S!==E||de||t!==null&&t.dependencies!==null&&ln(t.dependencies)?(typeof i=="function"&&(Ti(l,e,i,a),E=l.memoizedState),(z=de||Lr(l,e,z,a,S,E,s)||t!==null&&t.dependencies!==null&&ln(t.dependencies))?(g||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,E,s),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,E,s)),typeof n.componentDidUpdate=="function"&&(l.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(l.flags|=1024)):(typeof n.componentDidUpdate!="function"||c===t.memoizedProps&&S===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===t.memoizedProps&&S===t.memoizedState||(l.flags|=1024),l.memoizedProps=a,l.memoizedState=E),n.props=a,n.state=E,n.context=s,a=z):(typeof n.componentDidUpdate!="function"||c===t.memoizedProps&&S===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===t.memoizedProps&&S===t.memoizedState||(l.flags|=1024),a=!1)}return n=a,En(t,l),a=(l.flags&128)!==0,n||a?(n=l.stateNode,e=a&&typeof e.getDerivedStateFromError!="function"?null:n.render(),l.flags|=1,t!==null&&a?(l.child=Ve(l,t.child,null,u),l.child=Ve(l,null,e,u)):Lt(t,l,e,u),l.memoizedState=n.state,t=l.child):t=kl(t,l,u),t}function no(t,l,e,a){return Ye(),l.flags|=256,Lt(t,l,e,a),l.child}var Oi={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Ci(t){return{baseLanes:t,cachePool:ks()}}function Ni(t,l,e){return t=t!==null?t.childLanes&~e:0,l&&(t|=Sl),t}function co(t,l,e){var a=l.pendingProps,u=!1,n=(l.flags&128)!==0,c;if((c=n)||(c=t!==null&&t.memoizedState===null?!1:(Ct.current&2)!==0),c&&(u=!0,l.flags&=-129),c=(l.flags&32)!==0,l.flags&=-33,t===null){if(ut){if(u?ve(l):ye(),(t=St)?(t=vd(t,Ol),t=t!==null&&t.data!=="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:fe!==null?{id:Hl,overflow:ql}:null,retryLane:536870912,hydrationErrors:null},e=Gs(t),e.return=l,l.child=e,Qt=l,St=null)):t=null,t===null)throw re(l);return df(t)?l.lanes=32:l.lanes=536870912,null}var i=a.children;return a=a.fallback,u?(ye(),u=l.mode,i=Tn({mode:"hidden",children:i},u),a=Be(a,u,e,null),i.return=l,a.return=l,i.sibling=a,l.child=i,a=l.child,a.memoizedState=Ci(e),a.childLanes=Ni(t,c,e),l.memoizedState=Oi,ru(null,a)):(ve(l),ji(l,i))}var s=t.memoizedState;if(s!==null&&(i=s.dehydrated,i!==null)){if(n)l.flags&256?(ve(l),l.flags&=-257,l=Mi(t,l,e)):l.memoizedState!==null?(ye(),l.child=t.child,l.flags|=128,l=null):(ye(),i=a.fallback,u=l.mode,a=Tn({mode:"visible",children:a.children},u),i=Be(i,u,e,null),i.flags|=2,a.return=l,i.return=l,a.sibling=i,l.child=a,Ve(l,t.child,null,e),a=l.child,a.memoizedState=Ci(e),a.childLanes=Ni(t,c,e),l.memoizedState=Oi,l=ru(null,a));else if(ve(l),df(i)){if(c=i.nextSibling&&i.nextSibling.dataset,c)var g=c.dgst;c=g,a=Error(f(419)),a.stack="",a.digest=c,Ia({value:a,source:null,stack:null}),l=Mi(t,l,e)}else if(Dt||ha(t,l,e,!1),c=(e&t.childLanes)!==0,Dt||c){if(c=yt,c!==null&&(a=Jf(c,e),a!==0&&a!==s.retryLane))throw s.retryLane=a,qe(t,a),fl(c,t,a),xi;of(i)||Mn(),l=Mi(t,l,e)}else of(i)?(l.flags|=192,l.child=t.child,l=null):(t=s.treeContext,St=Nl(i.nextSibling),Qt=l,ut=!0,se=null,Ol=!1,t!==null&&Zs(l,t),l=ji(l,a.children),l.flags|=4096);return l}return u?(ye(),i=a.fallback,u=l.mode,s=t.child,g=s.sibling,a=Zl(s,{mode:"hidden",children:a.children}),a.subtreeFlags=s.subtreeFlags&65011712,g!==null?i=Zl(g,i):(i=Be(i,u,e,null),i.flags|=2),i.return=l,a.return=l,a.sibling=i,l.child=a,ru(null,a),a=l.child,i=t.child.memoizedState,i===null?i=Ci(e):(u=i.cachePool,u!==null?(s=Mt._currentValue,u=u.parent!==s?{parent:s,pool:s}:u):u=ks(),i={baseLanes:i.baseLanes|e,cachePool:u}),a.memoizedState=i,a.childLanes=Ni(t,c,e),l.memoizedState=Oi,ru(t.child,a)):(ve(l),e=t.child,t=e.sibling,e=Zl(e,{mode:"visible",children:a.children}),e.return=l,e.sibling=null,t!==null&&(c=l.deletions,c===null?(l.deletions=[t],l.flags|=16):c.push(t)),l.child=e,l.memoizedState=null,e)}function ji(t,l){return l=Tn({mode:"visible",children:l},t.mode),l.return=t,t.child=l}function Tn(t,l){return t=hl(22,t,null,l),t.lanes=0,t}function Mi(t,l,e){return Ve(l,t.child,null,e),t=ji(l,l.pendingProps.children),t.flags|=2,l.memoizedState=null,t}function io(t,l,e){t.lanes|=l;var a=t.alternate;a!==null&&(a.lanes|=l),Jc(t.return,l,e)}function Ui(t,l,e,a,u,n){var c=t.memoizedState;c===null?t.memoizedState={isBackwards:l,rendering:null,renderingStartTime:0,last:a,tail:e,tailMode:u,treeForkCount:n}:(c.isBackwards=l,c.rendering=null,c.renderingStartTime=0,c.last=a,c.tail=e,c.tailMode=u,c.treeForkCount=n)}function fo(t,l,e){var a=l.pendingProps,u=a.revealOrder,n=a.tail;a=a.children;var c=Ct.current,i=(c&2)!==0;if(i?(c=c&1|2,l.flags|=128):c&=1,U(Ct,c),Lt(t,l,a,e),a=ut?Fa:0,!i&&t!==null&&(t.flags&128)!==0)t:for(t=l.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&io(t,e,l);else if(t.tag===19)io(t,e,l);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break t;for(;t.sibling===null;){if(t.return===null||t.return===l)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}switch(u){case"forwards":for(e=l.child,u=null;e!==null;)t=e.alternate,t!==null&&rn(t)===null&&(u=e),e=e.sibling;e=u,e===null?(u=l.child,l.child=null):(u=e.sibling,e.sibling=null),Ui(l,!1,u,e,n,a);break;case"backwards":case"unstable_legacy-backwards":for(e=null,u=l.child,l.child=null;u!==null;){if(t=u.alternate,t!==null&&rn(t)===null){l.child=u;break}t=u.sibling,u.sibling=e,e=u,u=t}Ui(l,!0,e,null,n,a);break;case"together":Ui(l,!1,null,null,void 0,a);break;default:l.memoizedState=null}return l.child}function kl(t,l,e){if(t!==null&&(l.dependencies=t.dependencies),be|=l.lanes,(e&l.childLanes)===0)if(t!==null){if(ha(t,l,e,!1),(e&l.childLanes)===0)return null}else return null;if(t!==null&&l.child!==t.child)throw Error(f(153));if(l.child!==null){for(t=l.child,e=Zl(t,t.pendingProps),l.child=e,e.return=l;t.sibling!==null;)t=t.sibling,e=e.sibling=Zl(t,t.pendingProps),e.return=l;e.sibling=null}return l.child}function Di(t,l){return(t.lanes&l)!==0?!0:(t=t.dependencies,!!(t!==null&&ln(t)))}function Q0(t,l,e){switch(l.tag){case 3:Wt(l,l.stateNode.containerInfo),oe(l,Mt,t.memoizedState.cache),Ye();break;case 27:case 5:qa(l);break;case 4:Wt(l,l.stateNode.containerInfo);break;case 10:oe(l,l.type,l.memoizedProps.value);break;case 31:if(l.memoizedState!==null)return l.flags|=128,ui(l),null;break;case 13:var a=l.memoizedState;if(a!==null)return a.dehydrated!==null?(ve(l),l.flags|=128,null):(e&l.child.childLanes)!==0?co(t,l,e):(ve(l),t=kl(t,l,e),t!==null?t.sibling:null);ve(l);break;case 19:var u=(t.flags&128)!==0;if(a=(e&l.childLanes)!==0,a||(ha(t,l,e,!1),a=(e&l.childLanes)!==0),u){if(a)return fo(t,l,e);l.flags|=128}if(u=l.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),U(Ct,Ct.current),a)break;return null;case 22:return l.lanes=0,to(t,l,e,l.pendingProps);case 24:oe(l,Mt,t.memoizedState.cache)}return kl(t,l,e)}function so(t,l,e){if(t!==null)if(t.memoizedProps!==l.pendingProps)Dt=!0;else{if(!Di(t,e)&&(l.flags&128)===0)return Dt=!1,Q0(t,l,e);Dt=(t.flags&131072)!==0}else Dt=!1,ut&&(l.flags&1048576)!==0&&Qs(l,Fa,l.index);switch(l.lanes=0,l.tag){case 16:t:{var a=l.pendingProps;if(t=Ze(l.elementType),l.type=t,typeof t=="function")Yc(t)?(a=Je(t,a),l.tag=1,l=uo(null,l,t,a,e)):(l.tag=0,l=_i(null,l,t,a,e));else{if(t!=null){var u=t.$$typeof;if(u===Jt){l.tag=11,l=Fr(null,l,t,a,e);break t}else if(u===$){l.tag=14,l=Ir(null,l,t,a,e);break t}}throw l=jt(t)||t,Error(f(306,l,""))}}return l;case 0:return _i(t,l,l.type,l.pendingProps,e);case 1:return a=l.type,u=Je(a,l.pendingProps),uo(t,l,a,u,e);case 3:t:{if(Wt(l,l.stateNode.containerInfo),t===null)throw Error(f(387));a=l.pendingProps;var n=l.memoizedState;u=n.element,Pc(t,l),nu(l,a,null,e);var c=l.memoizedState;if(a=c.cache,oe(l,Mt,a),a!==n.cache&&wc(l,[Mt],e,!0),uu(),a=c.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:c.cache},l.updateQueue.baseState=n,l.memoizedState=n,l.flags&256){l=no(t,l,a,e);break t}else if(a!==u){u=Al(Error(f(424)),l),Ia(u),l=no(t,l,a,e);break t}else{switch(t=l.stateNode.containerInfo,t.nodeType){case 9:t=t.body;break;default:t=t.nodeName==="HTML"?t.ownerDocument.body:t}for(St=Nl(t.firstChild),Qt=l,ut=!0,se=null,Ol=!0,e=tr(l,null,a,e),l.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling}else{if(Ye(),a===u){l=kl(t,l,e);break t}Lt(t,l,a,e)}l=l.child}return l;case 26:return En(t,l),t===null?(e=Ed(l.type,null,l.pendingProps,null))?l.memoizedState=e:ut||(e=l.type,t=l.pendingProps,a=Yn(W.current).createElement(e),a[Xt]=l,a[el]=t,Vt(a,e,t),Yt(a),l.stateNode=a):l.memoizedState=Ed(l.type,t.memoizedProps,l.pendingProps,t.memoizedState),null;case 27:return qa(l),t===null&&ut&&(a=l.stateNode=Sd(l.type,l.pendingProps,W.current),Qt=l,Ol=!0,u=St,Ae(l.type)?(mf=u,St=Nl(a.firstChild)):St=u),Lt(t,l,l.pendingProps.children,e),En(t,l),t===null&&(l.flags|=4194304),l.child;case 5:return t===null&&ut&&((u=a=St)&&(a=gh(a,l.type,l.pendingProps,Ol),a!==null?(l.stateNode=a,Qt=l,St=Nl(a.firstChild),Ol=!1,u=!0):u=!1),u||re(l)),qa(l),u=l.type,n=l.pendingProps,c=t!==null?t.memoizedProps:null,a=n.children,ff(u,n)?a=null:c!==null&&ff(u,c)&&(l.flags|=32),l.memoizedState!==null&&(u=ci(t,l,U0,null,null,e),xu._currentValue=u),En(t,l),Lt(t,l,a,e),l.child;case 6:return t===null&&ut&&((t=e=St)&&(e=Sh(e,l.pendingProps,Ol),e!==null?(l.stateNode=e,Qt=l,St=null,t=!0):t=!1),t||re(l)),null;case 13:return co(t,l,e);case 4:return Wt(l,l.stateNode.containerInfo),a=l.pendingProps,t===null?l.child=Ve(l,null,a,e):Lt(t,l,a,e),l.child;case 11:return Fr(t,l,l.type,l.pendingProps,e);case 7:return Lt(t,l,l.pendingProps,e),l.child;case 8:return Lt(t,l,l.pendingProps.children,e),l.child;case 12:return Lt(t,l,l.pendingProps.children,e),l.child;case 10:return a=l.pendingProps,oe(l,l.type,a.value),Lt(t,l,a.children,e),l.child;case 9:return u=l.type._context,a=l.pendingProps.children,Xe(l),u=Zt(u),a=a(u),l.flags|=1,Lt(t,l,a,e),l.child;case 14:return Ir(t,l,l.type,l.pendingProps,e);case 15:return Pr(t,l,l.type,l.pendingProps,e);case 19:return fo(t,l,e);case 31:return X0(t,l,e);case 22:return to(t,l,e,l.pendingProps);case 24:return Xe(l),a=Zt(Mt),t===null?(u=$c(),u===null&&(u=yt,n=kc(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=e),u=n),l.memoizedState={parent:a,cache:u},Ic(l),oe(l,Mt,u)):((t.lanes&e)!==0&&(Pc(t,l),nu(l,null,null,e),uu()),u=t.memoizedState,n=l.memoizedState,u.parent!==a?(u={parent:a,cache:a},l.memoizedState=u,l.lanes===0&&(l.memoizedState=l.updateQueue.baseState=u),oe(l,Mt,a)):(a=n.cache,oe(l,Mt,a),a!==u.cache&&wc(l,[Mt],e,!0))),Lt(t,l,l.pendingProps.children,e),l.child;case 29:throw l.pendingProps}throw Error(f(156,l.tag))}function Wl(t){t.flags|=4}function Ri(t,l,e,a,u){if((l=(t.mode&32)!==0)&&(l=!1),l){if(t.flags|=16777216,(u&335544128)===u)if(t.stateNode.complete)t.flags|=8192;else if(Bo())t.flags|=8192;else throw Le=nn,Fc}else t.flags&=-16777217}function ro(t,l){if(l.type!=="stylesheet"||(l.state.loading&4)!==0)t.flags&=-16777217;else if(t.flags|=16777216,!_d(l))if(Bo())t.flags|=8192;else throw Le=nn,Fc}function zn(t,l){l!==null&&(t.flags|=4),t.flags&16384&&(l=t.tag!==22?Lf():536870912,t.lanes|=l,_a|=l)}function ou(t,l){if(!ut)switch(t.tailMode){case"hidden":l=t.tail;for(var e=null;l!==null;)l.alternate!==null&&(e=l),l=l.sibling;e===null?t.tail=null:e.sibling=null;break;case"collapsed":e=t.tail;for(var a=null;e!==null;)e.alternate!==null&&(a=e),e=e.sibling;a===null?l||t.tail===null?t.tail=null:t.tail.sibling=null:a.sibling=null}}function bt(t){var l=t.alternate!==null&&t.alternate.child===t.child,e=0,a=0;if(l)for(var u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags&65011712,a|=u.flags&65011712,u.return=t,u=u.sibling;else for(u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags,a|=u.flags,u.return=t,u=u.sibling;return t.subtreeFlags|=a,t.childLanes=e,l}function Z0(t,l,e){var a=l.pendingProps;switch(Zc(l),l.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return bt(l),null;case 1:return bt(l),null;case 3:return e=l.stateNode,a=null,t!==null&&(a=t.memoizedState.cache),l.memoizedState.cache!==a&&(l.flags|=2048),Kl(Mt),Ot(),e.pendingContext&&(e.context=e.pendingContext,e.pendingContext=null),(t===null||t.child===null)&&(ma(l)?Wl(l):t===null||t.memoizedState.isDehydrated&&(l.flags&256)===0||(l.flags|=1024,Vc())),bt(l),null;case 26:var u=l.type,n=l.memoizedState;return t===null?(Wl(l),n!==null?(bt(l),ro(l,n)):(bt(l),Ri(l,u,null,a,e))):n?n!==t.memoizedState?(Wl(l),bt(l),ro(l,n)):(bt(l),l.flags&=-16777217):(t=t.memoizedProps,t!==a&&Wl(l),bt(l),Ri(l,u,t,a,e)),null;case 27:if(Du(l),e=W.current,u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&Wl(l);else{if(!a){if(l.stateNode===null)throw Error(f(166));return bt(l),null}t=M.current,ma(l)?Ls(l):(t=Sd(u,a,e),l.stateNode=t,Wl(l))}return bt(l),null;case 5:if(Du(l),u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&Wl(l);else{if(!a){if(l.stateNode===null)throw Error(f(166));return bt(l),null}if(n=M.current,ma(l))Ls(l);else{var c=Yn(W.current);switch(n){case 1:n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=c.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?c.createElement("select",{is:a.is}):c.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?c.createElement(u,{is:a.is}):c.createElement(u)}}n[Xt]=l,n[el]=a;t:for(c=l.child;c!==null;){if(c.tag===5||c.tag===6)n.appendChild(c.stateNode);else if(c.tag!==4&&c.tag!==27&&c.child!==null){c.child.return=c,c=c.child;continue}if(c===l)break t;for(;c.sibling===null;){if(c.return===null||c.return===l)break t;c=c.return}c.sibling.return=c.return,c=c.sibling}l.stateNode=n;t:switch(Vt(n,u,a),u){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break t;case"img":a=!0;break t;default:a=!1}a&&Wl(l)}}return bt(l),Ri(l,l.type,t===null?null:t.memoizedProps,l.pendingProps,e),null;case 6:if(t&&l.stateNode!=null)t.memoizedProps!==a&&Wl(l);else{if(typeof a!="string"&&l.stateNode===null)throw Error(f(166));if(t=W.current,ma(l)){if(t=l.stateNode,e=l.memoizedProps,a=null,u=Qt,u!==null)switch(u.tag){case 27:case 5:a=u.memoizedProps}t[Xt]=l,t=!!(t.nodeValue===e||a!==null&&a.suppressHydrationWarning===!0||id(t.nodeValue,e)),t||re(l,!0)}else t=Yn(t).createTextNode(a),t[Xt]=l,l.stateNode=t}return bt(l),null;case 31:if(e=l.memoizedState,t===null||t.memoizedState!==null){if(a=ma(l),e!==null){if(t===null){if(!a)throw Error(f(318));if(t=l.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(f(557));t[Xt]=l}else Ye(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;bt(l),t=!1}else e=Vc(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=e),t=!0;if(!t)return l.flags&256?(yl(l),l):(yl(l),null);if((l.flags&128)!==0)throw Error(f(558))}return bt(l),null;case 13:if(a=l.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(u=ma(l),a!==null&&a.dehydrated!==null){if(t===null){if(!u)throw Error(f(318));if(u=l.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(f(317));u[Xt]=l}else Ye(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;bt(l),u=!1}else u=Vc(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=u),u=!0;if(!u)return l.flags&256?(yl(l),l):(yl(l),null)}return yl(l),(l.flags&128)!==0?(l.lanes=e,l):(e=a!==null,t=t!==null&&t.memoizedState!==null,e&&(a=l.child,u=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(u=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==u&&(a.flags|=2048)),e!==t&&e&&(l.child.flags|=8192),zn(l,l.updateQueue),bt(l),null);case 4:return Ot(),t===null&&ef(l.stateNode.containerInfo),bt(l),null;case 10:return Kl(l.type),bt(l),null;case 19:if(_(Ct),a=l.memoizedState,a===null)return bt(l),null;if(u=(l.flags&128)!==0,n=a.rendering,n===null)if(u)ou(a,!1);else{if(zt!==0||t!==null&&(t.flags&128)!==0)for(t=l.child;t!==null;){if(n=rn(t),n!==null){for(l.flags|=128,ou(a,!1),t=n.updateQueue,l.updateQueue=t,zn(l,t),l.subtreeFlags=0,t=e,e=l.child;e!==null;)Ys(e,t),e=e.sibling;return U(Ct,Ct.current&1|2),ut&&Ll(l,a.treeForkCount),l.child}t=t.sibling}a.tail!==null&&rl()>Cn&&(l.flags|=128,u=!0,ou(a,!1),l.lanes=4194304)}else{if(!u)if(t=rn(n),t!==null){if(l.flags|=128,u=!0,t=t.updateQueue,l.updateQueue=t,zn(l,t),ou(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!ut)return bt(l),null}else 2*rl()-a.renderingStartTime>Cn&&e!==536870912&&(l.flags|=128,u=!0,ou(a,!1),l.lanes=4194304);a.isBackwards?(n.sibling=l.child,l.child=n):(t=a.last,t!==null?t.sibling=n:l.child=n,a.last=n)}return a.tail!==null?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=rl(),t.sibling=null,e=Ct.current,U(Ct,u?e&1|2:e&1),ut&&Ll(l,a.treeForkCount),t):(bt(l),null);case 22:case 23:return yl(l),ai(),a=l.memoizedState!==null,t!==null?t.memoizedState!==null!==a&&(l.flags|=8192):a&&(l.flags|=8192),a?(e&536870912)!==0&&(l.flags&128)===0&&(bt(l),l.subtreeFlags&6&&(l.flags|=8192)):bt(l),e=l.updateQueue,e!==null&&zn(l,e.retryQueue),e=null,t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),a=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),a!==e&&(l.flags|=2048),t!==null&&_(Qe),null;case 24:return e=null,t!==null&&(e=t.memoizedState.cache),l.memoizedState.cache!==e&&(l.flags|=2048),Kl(Mt),bt(l),null;case 25:return null;case 30:return null}throw Error(f(156,l.tag))}function L0(t,l){switch(Zc(l),l.tag){case 1:return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 3:return Kl(Mt),Ot(),t=l.flags,(t&65536)!==0&&(t&128)===0?(l.flags=t&-65537|128,l):null;case 26:case 27:case 5:return Du(l),null;case 31:if(l.memoizedState!==null){if(yl(l),l.alternate===null)throw Error(f(340));Ye()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 13:if(yl(l),t=l.memoizedState,t!==null&&t.dehydrated!==null){if(l.alternate===null)throw Error(f(340));Ye()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 19:return _(Ct),null;case 4:return Ot(),null;case 10:return Kl(l.type),null;case 22:case 23:return yl(l),ai(),t!==null&&_(Qe),t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 24:return Kl(Mt),null;case 25:return null;default:return null}}function oo(t,l){switch(Zc(l),l.tag){case 3:Kl(Mt),Ot();break;case 26:case 27:case 5:Du(l);break;case 4:Ot();break;case 31:l.memoizedState!==null&&yl(l);break;case 13:yl(l);break;case 19:_(Ct);break;case 10:Kl(l.type);break;case 22:case 23:yl(l),ai(),t!==null&&_(Qe);break;case 24:Kl(Mt)}}function du(t,l){try{var e=l.updateQueue,a=e!==null?e.lastEffect:null;if(a!==null){var u=a.next;e=u;do{if((e.tag&t)===t){a=void 0;var n=e.create,c=e.inst;a=n(),c.destroy=a}e=e.next}while(e!==u)}}catch(i){ot(l,l.return,i)}}function ge(t,l,e){try{var a=l.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var n=u.next;a=n;do{if((a.tag&t)===t){var c=a.inst,i=c.destroy;if(i!==void 0){c.destroy=void 0,u=l;var s=e,g=i;try{g()}catch(z){ot(u,s,z)}}}a=a.next}while(a!==n)}}catch(z){ot(l,l.return,z)}}function mo(t){var l=t.updateQueue;if(l!==null){var e=t.stateNode;try{er(l,e)}catch(a){ot(t,t.return,a)}}}function ho(t,l,e){e.props=Je(t.type,t.memoizedProps),e.state=t.memoizedState;try{e.componentWillUnmount()}catch(a){ot(t,l,a)}}function mu(t,l){try{var e=t.ref;if(e!==null){switch(t.tag){case 26:case 27:case 5:var a=t.stateNode;break;case 30:a=t.stateNode;break;default:a=t.stateNode}typeof e=="function"?t.refCleanup=e(a):e.current=a}}catch(u){ot(t,l,u)}}function Bl(t,l){var e=t.ref,a=t.refCleanup;if(e!==null)if(typeof a=="function")try{a()}catch(u){ot(t,l,u)}finally{t.refCleanup=null,t=t.alternate,t!=null&&(t.refCleanup=null)}else if(typeof e=="function")try{e(null)}catch(u){ot(t,l,u)}else e.current=null}function vo(t){var l=t.type,e=t.memoizedProps,a=t.stateNode;try{t:switch(l){case"button":case"input":case"select":case"textarea":e.autoFocus&&a.focus();break t;case"img":e.src?a.src=e.src:e.srcSet&&(a.srcset=e.srcSet)}}catch(u){ot(t,t.return,u)}}function Hi(t,l,e){try{var a=t.stateNode;oh(a,t.type,e,l),a[el]=l}catch(u){ot(t,t.return,u)}}function yo(t){return t.tag===5||t.tag===3||t.tag===26||t.tag===27&&Ae(t.type)||t.tag===4}function qi(t){t:for(;;){for(;t.sibling===null;){if(t.return===null||yo(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.tag===27&&Ae(t.type)||t.flags&2||t.child===null||t.tag===4)continue t;t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function Bi(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e).insertBefore(t,l):(l=e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,l.appendChild(t),e=e._reactRootContainer,e!=null||l.onclick!==null||(l.onclick=Xl));else if(a!==4&&(a===27&&Ae(t.type)&&(e=t.stateNode,l=null),t=t.child,t!==null))for(Bi(t,l,e),t=t.sibling;t!==null;)Bi(t,l,e),t=t.sibling}function An(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?e.insertBefore(t,l):e.appendChild(t);else if(a!==4&&(a===27&&Ae(t.type)&&(e=t.stateNode),t=t.child,t!==null))for(An(t,l,e),t=t.sibling;t!==null;)An(t,l,e),t=t.sibling}function go(t){var l=t.stateNode,e=t.memoizedProps;try{for(var a=t.type,u=l.attributes;u.length;)l.removeAttributeNode(u[0]);Vt(l,a,e),l[Xt]=t,l[el]=e}catch(n){ot(t,t.return,n)}}var $l=!1,Rt=!1,Yi=!1,So=typeof WeakSet=="function"?WeakSet:Set,Gt=null;function V0(t,l){if(t=t.containerInfo,nf=Kn,t=Ns(t),Mc(t)){if("selectionStart"in t)var e={start:t.selectionStart,end:t.selectionEnd};else t:{e=(e=t.ownerDocument)&&e.defaultView||window;var a=e.getSelection&&e.getSelection();if(a&&a.rangeCount!==0){e=a.anchorNode;var u=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{e.nodeType,n.nodeType}catch{e=null;break t}var c=0,i=-1,s=-1,g=0,z=0,O=t,S=null;l:for(;;){for(var E;O!==e||u!==0&&O.nodeType!==3||(i=c+u),O!==n||a!==0&&O.nodeType!==3||(s=c+a),O.nodeType===3&&(c+=O.nodeValue.length),(E=O.firstChild)!==null;)S=O,O=E;for(;;){if(O===t)break l;if(S===e&&++g===u&&(i=c),S===n&&++z===a&&(s=c),(E=O.nextSibling)!==null)break;O=S,S=O.parentNode}O=E}e=i===-1||s===-1?null:{start:i,end:s}}else e=null}e=e||{start:0,end:0}}else e=null;for(cf={focusedElem:t,selectionRange:e},Kn=!1,Gt=l;Gt!==null;)if(l=Gt,t=l.child,(l.subtreeFlags&1028)!==0&&t!==null)t.return=l,Gt=t;else for(;Gt!==null;){switch(l=Gt,n=l.alternate,t=l.flags,l.tag){case 0:if((t&4)!==0&&(t=l.updateQueue,t=t!==null?t.events:null,t!==null))for(e=0;e<t.length;e++)u=t[e],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((t&1024)!==0&&n!==null){t=void 0,e=l,u=n.memoizedProps,n=n.memoizedState,a=e.stateNode;try{var q=Je(e.type,u);t=a.getSnapshotBeforeUpdate(q,n),a.__reactInternalSnapshotBeforeUpdate=t}catch(Z){ot(e,e.return,Z)}}break;case 3:if((t&1024)!==0){if(t=l.stateNode.containerInfo,e=t.nodeType,e===9)rf(t);else if(e===1)switch(t.nodeName){case"HEAD":case"HTML":case"BODY":rf(t);break;default:t.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((t&1024)!==0)throw Error(f(163))}if(t=l.sibling,t!==null){t.return=l.return,Gt=t;break}Gt=l.return}}function bo(t,l,e){var a=e.flags;switch(e.tag){case 0:case 11:case 15:Il(t,e),a&4&&du(5,e);break;case 1:if(Il(t,e),a&4)if(t=e.stateNode,l===null)try{t.componentDidMount()}catch(c){ot(e,e.return,c)}else{var u=Je(e.type,l.memoizedProps);l=l.memoizedState;try{t.componentDidUpdate(u,l,t.__reactInternalSnapshotBeforeUpdate)}catch(c){ot(e,e.return,c)}}a&64&&mo(e),a&512&&mu(e,e.return);break;case 3:if(Il(t,e),a&64&&(t=e.updateQueue,t!==null)){if(l=null,e.child!==null)switch(e.child.tag){case 27:case 5:l=e.child.stateNode;break;case 1:l=e.child.stateNode}try{er(t,l)}catch(c){ot(e,e.return,c)}}break;case 27:l===null&&a&4&&go(e);case 26:case 5:Il(t,e),l===null&&a&4&&vo(e),a&512&&mu(e,e.return);break;case 12:Il(t,e);break;case 31:Il(t,e),a&4&&To(t,e);break;case 13:Il(t,e),a&4&&zo(t,e),a&64&&(t=e.memoizedState,t!==null&&(t=t.dehydrated,t!==null&&(e=P0.bind(null,e),bh(t,e))));break;case 22:if(a=e.memoizedState!==null||$l,!a){l=l!==null&&l.memoizedState!==null||Rt,u=$l;var n=Rt;$l=a,(Rt=l)&&!n?Pl(t,e,(e.subtreeFlags&8772)!==0):Il(t,e),$l=u,Rt=n}break;case 30:break;default:Il(t,e)}}function po(t){var l=t.alternate;l!==null&&(t.alternate=null,po(l)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(l=t.stateNode,l!==null&&hc(l)),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}var pt=null,ul=!1;function Fl(t,l,e){for(e=e.child;e!==null;)Eo(t,l,e),e=e.sibling}function Eo(t,l,e){if(ol&&typeof ol.onCommitFiberUnmount=="function")try{ol.onCommitFiberUnmount(Ba,e)}catch{}switch(e.tag){case 26:Rt||Bl(e,l),Fl(t,l,e),e.memoizedState?e.memoizedState.count--:e.stateNode&&(e=e.stateNode,e.parentNode.removeChild(e));break;case 27:Rt||Bl(e,l);var a=pt,u=ul;Ae(e.type)&&(pt=e.stateNode,ul=!1),Fl(t,l,e),Tu(e.stateNode),pt=a,ul=u;break;case 5:Rt||Bl(e,l);case 6:if(a=pt,u=ul,pt=null,Fl(t,l,e),pt=a,ul=u,pt!==null)if(ul)try{(pt.nodeType===9?pt.body:pt.nodeName==="HTML"?pt.ownerDocument.body:pt).removeChild(e.stateNode)}catch(n){ot(e,l,n)}else try{pt.removeChild(e.stateNode)}catch(n){ot(e,l,n)}break;case 18:pt!==null&&(ul?(t=pt,md(t.nodeType===9?t.body:t.nodeName==="HTML"?t.ownerDocument.body:t,e.stateNode),Ra(t)):md(pt,e.stateNode));break;case 4:a=pt,u=ul,pt=e.stateNode.containerInfo,ul=!0,Fl(t,l,e),pt=a,ul=u;break;case 0:case 11:case 14:case 15:ge(2,e,l),Rt||ge(4,e,l),Fl(t,l,e);break;case 1:Rt||(Bl(e,l),a=e.stateNode,typeof a.componentWillUnmount=="function"&&ho(e,l,a)),Fl(t,l,e);break;case 21:Fl(t,l,e);break;case 22:Rt=(a=Rt)||e.memoizedState!==null,Fl(t,l,e),Rt=a;break;default:Fl(t,l,e)}}function To(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null))){t=t.dehydrated;try{Ra(t)}catch(e){ot(l,l.return,e)}}}function zo(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null&&(t=t.dehydrated,t!==null))))try{Ra(t)}catch(e){ot(l,l.return,e)}}function K0(t){switch(t.tag){case 31:case 13:case 19:var l=t.stateNode;return l===null&&(l=t.stateNode=new So),l;case 22:return t=t.stateNode,l=t._retryCache,l===null&&(l=t._retryCache=new So),l;default:throw Error(f(435,t.tag))}}function xn(t,l){var e=K0(t);l.forEach(function(a){if(!e.has(a)){e.add(a);var u=th.bind(null,t,a);a.then(u,u)}})}function nl(t,l){var e=l.deletions;if(e!==null)for(var a=0;a<e.length;a++){var u=e[a],n=t,c=l,i=c;t:for(;i!==null;){switch(i.tag){case 27:if(Ae(i.type)){pt=i.stateNode,ul=!1;break t}break;case 5:pt=i.stateNode,ul=!1;break t;case 3:case 4:pt=i.stateNode.containerInfo,ul=!0;break t}i=i.return}if(pt===null)throw Error(f(160));Eo(n,c,u),pt=null,ul=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(l.subtreeFlags&13886)for(l=l.child;l!==null;)Ao(l,t),l=l.sibling}var Ul=null;function Ao(t,l){var e=t.alternate,a=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:nl(l,t),cl(t),a&4&&(ge(3,t,t.return),du(3,t),ge(5,t,t.return));break;case 1:nl(l,t),cl(t),a&512&&(Rt||e===null||Bl(e,e.return)),a&64&&$l&&(t=t.updateQueue,t!==null&&(a=t.callbacks,a!==null&&(e=t.shared.hiddenCallbacks,t.shared.hiddenCallbacks=e===null?a:e.concat(a))));break;case 26:var u=Ul;if(nl(l,t),cl(t),a&512&&(Rt||e===null||Bl(e,e.return)),a&4){var n=e!==null?e.memoizedState:null;if(a=t.memoizedState,e===null)if(a===null)if(t.stateNode===null){t:{a=t.type,e=t.memoizedProps,u=u.ownerDocument||u;l:switch(a){case"title":n=u.getElementsByTagName("title")[0],(!n||n[Xa]||n[Xt]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(a),u.head.insertBefore(n,u.querySelector("head > title"))),Vt(n,a,e),n[Xt]=t,Yt(n),a=n;break t;case"link":var c=Ad("link","href",u).get(a+(e.href||""));if(c){for(var i=0;i<c.length;i++)if(n=c[i],n.getAttribute("href")===(e.href==null||e.href===""?null:e.href)&&n.getAttribute("rel")===(e.rel==null?null:e.rel)&&n.getAttribute("title")===(e.title==null?null:e.title)&&n.getAttribute("crossorigin")===(e.crossOrigin==null?null:e.crossOrigin)){c.splice(i,1);break l}}n=u.createElement(a),Vt(n,a,e),u.head.appendChild(n);break;case"meta":if(c=Ad("meta","content",u).get(a+(e.content||""))){for(i=0;i<c.length;i++)if(n=c[i],n.getAttribute("content")===(e.content==null?null:""+e.content)&&n.getAttribute("name")===(e.name==null?null:e.name)&&n.getAttribute("property")===(e.property==null?null:e.property)&&n.getAttribute("http-equiv")===(e.httpEquiv==null?null:e.httpEquiv)&&n.getAttribute("charset")===(e.charSet==null?null:e.charSet)){c.splice(i,1);break l}}n=u.createElement(a),Vt(n,a,e),u.head.appendChild(n);break;default:throw Error(f(468,a))}n[Xt]=t,Yt(n),a=n}t.stateNode=a}else xd(u,t.type,t.stateNode);else t.stateNode=zd(u,a,t.memoizedProps);else n!==a?(n===null?e.stateNode!==null&&(e=e.stateNode,e.parentNode.removeChild(e)):n.count--,a===null?xd(u,t.type,t.stateNode):zd(u,a,t.memoizedProps)):a===null&&t.stateNode!==null&&Hi(t,t.memoizedProps,e.memoizedProps)}break;case 27:nl(l,t),cl(t),a&512&&(Rt||e===null||Bl(e,e.return)),e!==null&&a&4&&Hi(t,t.memoizedProps,e.memoizedProps);break;case 5:if(nl(l,t),cl(t),a&512&&(Rt||e===null||Bl(e,e.return)),t.flags&32){u=t.stateNode;try{aa(u,"")}catch(q){ot(t,t.return,q)}}a&4&&t.stateNode!=null&&(u=t.memoizedProps,Hi(t,u,e!==null?e.memoizedProps:u)),a&1024&&(Yi=!0);break;case 6:if(nl(l,t),cl(t),a&4){if(t.stateNode===null)throw Error(f(162));a=t.memoizedProps,e=t.stateNode;try{e.nodeValue=a}catch(q){ot(t,t.return,q)}}break;case 3:if(Qn=null,u=Ul,Ul=Gn(l.containerInfo),nl(l,t),Ul=u,cl(t),a&4&&e!==null&&e.memoizedState.isDehydrated)try{Ra(l.containerInfo)}catch(q){ot(t,t.return,q)}Yi&&(Yi=!1,xo(t));break;case 4:a=Ul,Ul=Gn(t.stateNode.containerInfo),nl(l,t),cl(t),Ul=a;break;case 12:nl(l,t),cl(t);break;case 31:nl(l,t),cl(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,xn(t,a)));break;case 13:nl(l,t),cl(t),t.child.flags&8192&&t.memoizedState!==null!=(e!==null&&e.memoizedState!==null)&&(On=rl()),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,xn(t,a)));break;case 22:u=t.memoizedState!==null;var s=e!==null&&e.memoizedState!==null,g=$l,z=Rt;if($l=g||u,Rt=z||s,nl(l,t),Rt=z,$l=g,cl(t),a&8192)t:for(l=t.stateNode,l._visibility=u?l._visibility&-2:l._visibility|1,u&&(e===null||s||$l||Rt||we(t)),e=null,l=t;;){if(l.tag===5||l.tag===26){if(e===null){s=e=l;try{if(n=s.stateNode,u)c=n.style,typeof c.setProperty=="function"?c.setProperty("display","none","important"):c.display="none";else{i=s.stateNode;var O=s.memoizedProps.style,S=O!=null&&O.hasOwnProperty("display")?O.display:null;i.style.display=S==null||typeof S=="boolean"?"":(""+S).trim()}}catch(q){ot(s,s.return,q)}}}else if(l.tag===6){if(e===null){s=l;try{s.stateNode.nodeValue=u?"":s.memoizedProps}catch(q){ot(s,s.return,q)}}}else if(l.tag===18){if(e===null){s=l;try{var E=s.stateNode;u?hd(E,!0):hd(s.stateNode,!1)}catch(q){ot(s,s.return,q)}}}else if((l.tag!==22&&l.tag!==23||l.memoizedState===null||l===t)&&l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break t;for(;l.sibling===null;){if(l.return===null||l.return===t)break t;e===l&&(e=null),l=l.return}e===l&&(e=null),l.sibling.return=l.return,l=l.sibling}a&4&&(a=t.updateQueue,a!==null&&(e=a.retryQueue,e!==null&&(a.retryQueue=null,xn(t,e))));break;case 19:nl(l,t),cl(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,xn(t,a)));break;case 30:break;case 21:break;default:nl(l,t),cl(t)}}function cl(t){var l=t.flags;if(l&2){try{for(var e,a=t.return;a!==null;){if(yo(a)){e=a;break}a=a.return}if(e==null)throw Error(f(160));switch(e.tag){case 27:var u=e.stateNode,n=qi(t);An(t,n,u);break;case 5:var c=e.stateNode;e.flags&32&&(aa(c,""),e.flags&=-33);var i=qi(t);An(t,i,c);break;case 3:case 4:var s=e.stateNode.containerInfo,g=qi(t);Bi(t,g,s);break;default:throw Error(f(161))}}catch(z){ot(t,t.return,z)}t.flags&=-3}l&4096&&(t.flags&=-4097)}function xo(t){if(t.subtreeFlags&1024)for(t=t.child;t!==null;){var l=t;xo(l),l.tag===5&&l.flags&1024&&l.stateNode.reset(),t=t.sibling}}function Il(t,l){if(l.subtreeFlags&8772)for(l=l.child;l!==null;)bo(t,l.alternate,l),l=l.sibling}function we(t){for(t=t.child;t!==null;){var l=t;switch(l.tag){case 0:case 11:case 14:case 15:ge(4,l,l.return),we(l);break;case 1:Bl(l,l.return);var e=l.stateNode;typeof e.componentWillUnmount=="function"&&ho(l,l.return,e),we(l);break;case 27:Tu(l.stateNode);case 26:case 5:Bl(l,l.return),we(l);break;case 22:l.memoizedState===null&&we(l);break;case 30:we(l);break;default:we(l)}t=t.sibling}}function Pl(t,l,e){for(e=e&&(l.subtreeFlags&8772)!==0,l=l.child;l!==null;){var a=l.alternate,u=t,n=l,c=n.flags;switch(n.tag){case 0:case 11:case 15:Pl(u,n,e),du(4,n);break;case 1:if(Pl(u,n,e),a=n,u=a.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(g){ot(a,a.return,g)}if(a=n,u=a.updateQueue,u!==null){var i=a.stateNode;try{var s=u.shared.hiddenCallbacks;if(s!==null)for(u.shared.hiddenCallbacks=null,u=0;u<s.length;u++)lr(s[u],i)}catch(g){ot(a,a.return,g)}}e&&c&64&&mo(n),mu(n,n.return);break;case 27:go(n);case 26:case 5:Pl(u,n,e),e&&a===null&&c&4&&vo(n),mu(n,n.return);break;case 12:Pl(u,n,e);break;case 31:Pl(u,n,e),e&&c&4&&To(u,n);break;case 13:Pl(u,n,e),e&&c&4&&zo(u,n);break;case 22:n.memoizedState===null&&Pl(u,n,e),mu(n,n.return);break;case 30:break;default:Pl(u,n,e)}l=l.sibling}}function Gi(t,l){var e=null;t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),t=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(t=l.memoizedState.cachePool.pool),t!==e&&(t!=null&&t.refCount++,e!=null&&Pa(e))}function Xi(t,l){t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&Pa(t))}function Dl(t,l,e,a){if(l.subtreeFlags&10256)for(l=l.child;l!==null;)_o(t,l,e,a),l=l.sibling}function _o(t,l,e,a){var u=l.flags;switch(l.tag){case 0:case 11:case 15:Dl(t,l,e,a),u&2048&&du(9,l);break;case 1:Dl(t,l,e,a);break;case 3:Dl(t,l,e,a),u&2048&&(t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&Pa(t)));break;case 12:if(u&2048){Dl(t,l,e,a),t=l.stateNode;try{var n=l.memoizedProps,c=n.id,i=n.onPostCommit;typeof i=="function"&&i(c,l.alternate===null?"mount":"update",t.passiveEffectDuration,-0)}catch(s){ot(l,l.return,s)}}else Dl(t,l,e,a);break;case 31:Dl(t,l,e,a);break;case 13:Dl(t,l,e,a);break;case 23:break;case 22:n=l.stateNode,c=l.alternate,l.memoizedState!==null?n._visibility&2?Dl(t,l,e,a):hu(t,l):n._visibility&2?Dl(t,l,e,a):(n._visibility|=2,za(t,l,e,a,(l.subtreeFlags&10256)!==0||!1)),u&2048&&Gi(c,l);break;case 24:Dl(t,l,e,a),u&2048&&Xi(l.alternate,l);break;default:Dl(t,l,e,a)}}function za(t,l,e,a,u){for(u=u&&((l.subtreeFlags&10256)!==0||!1),l=l.child;l!==null;){var n=t,c=l,i=e,s=a,g=c.flags;switch(c.tag){case 0:case 11:case 15:za(n,c,i,s,u),du(8,c);break;case 23:break;case 22:var z=c.stateNode;c.memoizedState!==null?z._visibility&2?za(n,c,i,s,u):hu(n,c):(z._visibility|=2,za(n,c,i,s,u)),u&&g&2048&&Gi(c.alternate,c);break;case 24:za(n,c,i,s,u),u&&g&2048&&Xi(c.alternate,c);break;default:za(n,c,i,s,u)}l=l.sibling}}function hu(t,l){if(l.subtreeFlags&10256)for(l=l.child;l!==null;){var e=t,a=l,u=a.flags;switch(a.tag){case 22:hu(e,a),u&2048&&Gi(a.alternate,a);break;case 24:hu(e,a),u&2048&&Xi(a.alternate,a);break;default:hu(e,a)}l=l.sibling}}var vu=8192;function Aa(t,l,e){if(t.subtreeFlags&vu)for(t=t.child;t!==null;)Oo(t,l,e),t=t.sibling}function Oo(t,l,e){switch(t.tag){case 26:Aa(t,l,e),t.flags&vu&&t.memoizedState!==null&&Mh(e,Ul,t.memoizedState,t.memoizedProps);break;case 5:Aa(t,l,e);break;case 3:case 4:var a=Ul;Ul=Gn(t.stateNode.containerInfo),Aa(t,l,e),Ul=a;break;case 22:t.memoizedState===null&&(a=t.alternate,a!==null&&a.memoizedState!==null?(a=vu,vu=16777216,Aa(t,l,e),vu=a):Aa(t,l,e));break;default:Aa(t,l,e)}}function Co(t){var l=t.alternate;if(l!==null&&(t=l.child,t!==null)){l.child=null;do l=t.sibling,t.sibling=null,t=l;while(t!==null)}}function yu(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Gt=a,jo(a,t)}Co(t)}if(t.subtreeFlags&10256)for(t=t.child;t!==null;)No(t),t=t.sibling}function No(t){switch(t.tag){case 0:case 11:case 15:yu(t),t.flags&2048&&ge(9,t,t.return);break;case 3:yu(t);break;case 12:yu(t);break;case 22:var l=t.stateNode;t.memoizedState!==null&&l._visibility&2&&(t.return===null||t.return.tag!==13)?(l._visibility&=-3,_n(t)):yu(t);break;default:yu(t)}}function _n(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Gt=a,jo(a,t)}Co(t)}for(t=t.child;t!==null;){switch(l=t,l.tag){case 0:case 11:case 15:ge(8,l,l.return),_n(l);break;case 22:e=l.stateNode,e._visibility&2&&(e._visibility&=-3,_n(l));break;default:_n(l)}t=t.sibling}}function jo(t,l){for(;Gt!==null;){var e=Gt;switch(e.tag){case 0:case 11:case 15:ge(8,e,l);break;case 23:case 22:if(e.memoizedState!==null&&e.memoizedState.cachePool!==null){var a=e.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:Pa(e.memoizedState.cache)}if(a=e.child,a!==null)a.return=e,Gt=a;else t:for(e=t;Gt!==null;){a=Gt;var u=a.sibling,n=a.return;if(po(a),a===e){Gt=null;break t}if(u!==null){u.return=n,Gt=u;break t}Gt=n}}}var J0={getCacheForType:function(t){var l=Zt(Mt),e=l.data.get(t);return e===void 0&&(e=t(),l.data.set(t,e)),e},cacheSignal:function(){return Zt(Mt).controller.signal}},w0=typeof WeakMap=="function"?WeakMap:Map,it=0,yt=null,P=null,lt=0,rt=0,gl=null,Se=!1,xa=!1,Qi=!1,te=0,zt=0,be=0,ke=0,Zi=0,Sl=0,_a=0,gu=null,il=null,Li=!1,On=0,Mo=0,Cn=1/0,Nn=null,pe=null,Ht=0,Ee=null,Oa=null,le=0,Vi=0,Ki=null,Uo=null,Su=0,Ji=null;function bl(){return(it&2)!==0&&lt!==0?lt&-lt:p.T!==null?Ii():wf()}function Do(){if(Sl===0)if((lt&536870912)===0||ut){var t=qu;qu<<=1,(qu&3932160)===0&&(qu=262144),Sl=t}else Sl=536870912;return t=vl.current,t!==null&&(t.flags|=32),Sl}function fl(t,l,e){(t===yt&&(rt===2||rt===9)||t.cancelPendingCommit!==null)&&(Ca(t,0),Te(t,lt,Sl,!1)),Ga(t,e),((it&2)===0||t!==yt)&&(t===yt&&((it&2)===0&&(ke|=e),zt===4&&Te(t,lt,Sl,!1)),Yl(t))}function Ro(t,l,e){if((it&6)!==0)throw Error(f(327));var a=!e&&(l&127)===0&&(l&t.expiredLanes)===0||Ya(t,l),u=a?$0(t,l):ki(t,l,!0),n=a;do{if(u===0){xa&&!a&&Te(t,l,0,!1);break}else{if(e=t.current.alternate,n&&!k0(e)){u=ki(t,l,!1),n=!1;continue}if(u===2){if(n=l,t.errorRecoveryDisabledLanes&n)var c=0;else c=t.pendingLanes&-536870913,c=c!==0?c:c&536870912?536870912:0;if(c!==0){l=c;t:{var i=t;u=gu;var s=i.current.memoizedState.isDehydrated;if(s&&(Ca(i,c).flags|=256),c=ki(i,c,!1),c!==2){if(Qi&&!s){i.errorRecoveryDisabledLanes|=n,ke|=n,u=4;break t}n=il,il=u,n!==null&&(il===null?il=n:il.push.apply(il,n))}u=c}if(n=!1,u!==2)continue}}if(u===1){Ca(t,0),Te(t,l,0,!0);break}t:{switch(a=t,n=u,n){case 0:case 1:throw Error(f(345));case 4:if((l&4194048)!==l)break;case 6:Te(a,l,Sl,!Se);break t;case 2:il=null;break;case 3:case 5:break;default:throw Error(f(329))}if((l&62914560)===l&&(u=On+300-rl(),10<u)){if(Te(a,l,Sl,!Se),Yu(a,0,!0)!==0)break t;le=l,a.timeoutHandle=od(Ho.bind(null,a,e,il,Nn,Li,l,Sl,ke,_a,Se,n,"Throttled",-0,0),u);break t}Ho(a,e,il,Nn,Li,l,Sl,ke,_a,Se,n,null,-0,0)}}break}while(!0);Yl(t)}function Ho(t,l,e,a,u,n,c,i,s,g,z,O,S,E){if(t.timeoutHandle=-1,O=l.subtreeFlags,O&8192||(O&16785408)===16785408){O={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Xl},Oo(l,n,O);var q=(n&62914560)===n?On-rl():(n&4194048)===n?Mo-rl():0;if(q=Uh(O,q),q!==null){le=n,t.cancelPendingCommit=q(Lo.bind(null,t,l,n,e,a,u,c,i,s,z,O,null,S,E)),Te(t,n,c,!g);return}}Lo(t,l,n,e,a,u,c,i,s)}function k0(t){for(var l=t;;){var e=l.tag;if((e===0||e===11||e===15)&&l.flags&16384&&(e=l.updateQueue,e!==null&&(e=e.stores,e!==null)))for(var a=0;a<e.length;a++){var u=e[a],n=u.getSnapshot;u=u.value;try{if(!ml(n(),u))return!1}catch{return!1}}if(e=l.child,l.subtreeFlags&16384&&e!==null)e.return=l,l=e;else{if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return!0;l=l.return}l.sibling.return=l.return,l=l.sibling}}return!0}function Te(t,l,e,a){l&=~Zi,l&=~ke,t.suspendedLanes|=l,t.pingedLanes&=~l,a&&(t.warmLanes|=l),a=t.expirationTimes;for(var u=l;0<u;){var n=31-dl(u),c=1<<n;a[n]=-1,u&=~c}e!==0&&Vf(t,e,l)}function jn(){return(it&6)===0?(bu(0),!1):!0}function wi(){if(P!==null){if(rt===0)var t=P.return;else t=P,Vl=Ge=null,si(t),Sa=null,lu=0,t=P;for(;t!==null;)oo(t.alternate,t),t=t.return;P=null}}function Ca(t,l){var e=t.timeoutHandle;e!==-1&&(t.timeoutHandle=-1,hh(e)),e=t.cancelPendingCommit,e!==null&&(t.cancelPendingCommit=null,e()),le=0,wi(),yt=t,P=e=Zl(t.current,null),lt=l,rt=0,gl=null,Se=!1,xa=Ya(t,l),Qi=!1,_a=Sl=Zi=ke=be=zt=0,il=gu=null,Li=!1,(l&8)!==0&&(l|=l&32);var a=t.entangledLanes;if(a!==0)for(t=t.entanglements,a&=l;0<a;){var u=31-dl(a),n=1<<u;l|=t[u],a&=~n}return te=l,$u(),e}function qo(t,l){J=null,p.H=su,l===ga||l===un?(l=Fs(),rt=3):l===Fc?(l=Fs(),rt=4):rt=l===xi?8:l!==null&&typeof l=="object"&&typeof l.then=="function"?6:1,gl=l,P===null&&(zt=1,bn(t,Al(l,t.current)))}function Bo(){var t=vl.current;return t===null?!0:(lt&4194048)===lt?Cl===null:(lt&62914560)===lt||(lt&536870912)!==0?t===Cl:!1}function Yo(){var t=p.H;return p.H=su,t===null?su:t}function Go(){var t=p.A;return p.A=J0,t}function Mn(){zt=4,Se||(lt&4194048)!==lt&&vl.current!==null||(xa=!0),(be&134217727)===0&&(ke&134217727)===0||yt===null||Te(yt,lt,Sl,!1)}function ki(t,l,e){var a=it;it|=2;var u=Yo(),n=Go();(yt!==t||lt!==l)&&(Nn=null,Ca(t,l)),l=!1;var c=zt;t:do try{if(rt!==0&&P!==null){var i=P,s=gl;switch(rt){case 8:wi(),c=6;break t;case 3:case 2:case 9:case 6:vl.current===null&&(l=!0);var g=rt;if(rt=0,gl=null,Na(t,i,s,g),e&&xa){c=0;break t}break;default:g=rt,rt=0,gl=null,Na(t,i,s,g)}}W0(),c=zt;break}catch(z){qo(t,z)}while(!0);return l&&t.shellSuspendCounter++,Vl=Ge=null,it=a,p.H=u,p.A=n,P===null&&(yt=null,lt=0,$u()),c}function W0(){for(;P!==null;)Xo(P)}function $0(t,l){var e=it;it|=2;var a=Yo(),u=Go();yt!==t||lt!==l?(Nn=null,Cn=rl()+500,Ca(t,l)):xa=Ya(t,l);t:do try{if(rt!==0&&P!==null){l=P;var n=gl;l:switch(rt){case 1:rt=0,gl=null,Na(t,l,n,1);break;case 2:case 9:if(Ws(n)){rt=0,gl=null,Qo(l);break}l=function(){rt!==2&&rt!==9||yt!==t||(rt=7),Yl(t)},n.then(l,l);break t;case 3:rt=7;break t;case 4:rt=5;break t;case 7:Ws(n)?(rt=0,gl=null,Qo(l)):(rt=0,gl=null,Na(t,l,n,7));break;case 5:var c=null;switch(P.tag){case 26:c=P.memoizedState;case 5:case 27:var i=P;if(c?_d(c):i.stateNode.complete){rt=0,gl=null;var s=i.sibling;if(s!==null)P=s;else{var g=i.return;g!==null?(P=g,Un(g)):P=null}break l}}rt=0,gl=null,Na(t,l,n,5);break;case 6:rt=0,gl=null,Na(t,l,n,6);break;case 8:wi(),zt=6;break t;default:throw Error(f(462))}}F0();break}catch(z){qo(t,z)}while(!0);return Vl=Ge=null,p.H=a,p.A=u,it=e,P!==null?0:(yt=null,lt=0,$u(),zt)}function F0(){for(;P!==null&&!pm();)Xo(P)}function Xo(t){var l=so(t.alternate,t,te);t.memoizedProps=t.pendingProps,l===null?Un(t):P=l}function Qo(t){var l=t,e=l.alternate;switch(l.tag){case 15:case 0:l=ao(e,l,l.pendingProps,l.type,void 0,lt);break;case 11:l=ao(e,l,l.pendingProps,l.type.render,l.ref,lt);break;case 5:si(l);default:oo(e,l),l=P=Ys(l,te),l=so(e,l,te)}t.memoizedProps=t.pendingProps,l===null?Un(t):P=l}function Na(t,l,e,a){Vl=Ge=null,si(l),Sa=null,lu=0;var u=l.return;try{if(G0(t,u,l,e,lt)){zt=1,bn(t,Al(e,t.current)),P=null;return}}catch(n){if(u!==null)throw P=u,n;zt=1,bn(t,Al(e,t.current)),P=null;return}l.flags&32768?(ut||a===1?t=!0:xa||(lt&536870912)!==0?t=!1:(Se=t=!0,(a===2||a===9||a===3||a===6)&&(a=vl.current,a!==null&&a.tag===13&&(a.flags|=16384))),Zo(l,t)):Un(l)}function Un(t){var l=t;do{if((l.flags&32768)!==0){Zo(l,Se);return}t=l.return;var e=Z0(l.alternate,l,te);if(e!==null){P=e;return}if(l=l.sibling,l!==null){P=l;return}P=l=t}while(l!==null);zt===0&&(zt=5)}function Zo(t,l){do{var e=L0(t.alternate,t);if(e!==null){e.flags&=32767,P=e;return}if(e=t.return,e!==null&&(e.flags|=32768,e.subtreeFlags=0,e.deletions=null),!l&&(t=t.sibling,t!==null)){P=t;return}P=t=e}while(t!==null);zt=6,P=null}function Lo(t,l,e,a,u,n,c,i,s){t.cancelPendingCommit=null;do Dn();while(Ht!==0);if((it&6)!==0)throw Error(f(327));if(l!==null){if(l===t.current)throw Error(f(177));if(n=l.lanes|l.childLanes,n|=qc,jm(t,e,n,c,i,s),t===yt&&(P=yt=null,lt=0),Oa=l,Ee=t,le=e,Vi=n,Ki=u,Uo=a,(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?(t.callbackNode=null,t.callbackPriority=0,lh(Ru,function(){return ko(),null})):(t.callbackNode=null,t.callbackPriority=0),a=(l.flags&13878)!==0,(l.subtreeFlags&13878)!==0||a){a=p.T,p.T=null,u=j.p,j.p=2,c=it,it|=4;try{V0(t,l,e)}finally{it=c,j.p=u,p.T=a}}Ht=1,Vo(),Ko(),Jo()}}function Vo(){if(Ht===1){Ht=0;var t=Ee,l=Oa,e=(l.flags&13878)!==0;if((l.subtreeFlags&13878)!==0||e){e=p.T,p.T=null;var a=j.p;j.p=2;var u=it;it|=4;try{Ao(l,t);var n=cf,c=Ns(t.containerInfo),i=n.focusedElem,s=n.selectionRange;if(c!==i&&i&&i.ownerDocument&&Cs(i.ownerDocument.documentElement,i)){if(s!==null&&Mc(i)){var g=s.start,z=s.end;if(z===void 0&&(z=g),"selectionStart"in i)i.selectionStart=g,i.selectionEnd=Math.min(z,i.value.length);else{var O=i.ownerDocument||document,S=O&&O.defaultView||window;if(S.getSelection){var E=S.getSelection(),q=i.textContent.length,Z=Math.min(s.start,q),vt=s.end===void 0?Z:Math.min(s.end,q);!E.extend&&Z>vt&&(c=vt,vt=Z,Z=c);var h=Os(i,Z),d=Os(i,vt);if(h&&d&&(E.rangeCount!==1||E.anchorNode!==h.node||E.anchorOffset!==h.offset||E.focusNode!==d.node||E.focusOffset!==d.offset)){var y=O.createRange();y.setStart(h.node,h.offset),E.removeAllRanges(),Z>vt?(E.addRange(y),E.extend(d.node,d.offset)):(y.setEnd(d.node,d.offset),E.addRange(y))}}}}for(O=[],E=i;E=E.parentNode;)E.nodeType===1&&O.push({element:E,left:E.scrollLeft,top:E.scrollTop});for(typeof i.focus=="function"&&i.focus(),i=0;i<O.length;i++){var A=O[i];A.element.scrollLeft=A.left,A.element.scrollTop=A.top}}Kn=!!nf,cf=nf=null}finally{it=u,j.p=a,p.T=e}}t.current=l,Ht=2}}function Ko(){if(Ht===2){Ht=0;var t=Ee,l=Oa,e=(l.flags&8772)!==0;if((l.subtreeFlags&8772)!==0||e){e=p.T,p.T=null;var a=j.p;j.p=2;var u=it;it|=4;try{bo(t,l.alternate,l)}finally{it=u,j.p=a,p.T=e}}Ht=3}}function Jo(){if(Ht===4||Ht===3){Ht=0,Em();var t=Ee,l=Oa,e=le,a=Uo;(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?Ht=5:(Ht=0,Oa=Ee=null,wo(t,t.pendingLanes));var u=t.pendingLanes;if(u===0&&(pe=null),dc(e),l=l.stateNode,ol&&typeof ol.onCommitFiberRoot=="function")try{ol.onCommitFiberRoot(Ba,l,void 0,(l.current.flags&128)===128)}catch{}if(a!==null){l=p.T,u=j.p,j.p=2,p.T=null;try{for(var n=t.onRecoverableError,c=0;c<a.length;c++){var i=a[c];n(i.value,{componentStack:i.stack})}}finally{p.T=l,j.p=u}}(le&3)!==0&&Dn(),Yl(t),u=t.pendingLanes,(e&261930)!==0&&(u&42)!==0?t===Ji?Su++:(Su=0,Ji=t):Su=0,bu(0)}}function wo(t,l){(t.pooledCacheLanes&=l)===0&&(l=t.pooledCache,l!=null&&(t.pooledCache=null,Pa(l)))}function Dn(){return Vo(),Ko(),Jo(),ko()}function ko(){if(Ht!==5)return!1;var t=Ee,l=Vi;Vi=0;var e=dc(le),a=p.T,u=j.p;try{j.p=32>e?32:e,p.T=null,e=Ki,Ki=null;var n=Ee,c=le;if(Ht=0,Oa=Ee=null,le=0,(it&6)!==0)throw Error(f(331));var i=it;if(it|=4,No(n.current),_o(n,n.current,c,e),it=i,bu(0,!1),ol&&typeof ol.onPostCommitFiberRoot=="function")try{ol.onPostCommitFiberRoot(Ba,n)}catch{}return!0}finally{j.p=u,p.T=a,wo(t,l)}}function Wo(t,l,e){l=Al(e,l),l=Ai(t.stateNode,l,2),t=he(t,l,2),t!==null&&(Ga(t,2),Yl(t))}function ot(t,l,e){if(t.tag===3)Wo(t,t,e);else for(;l!==null;){if(l.tag===3){Wo(l,t,e);break}else if(l.tag===1){var a=l.stateNode;if(typeof l.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(pe===null||!pe.has(a))){t=Al(e,t),e=Wr(2),a=he(l,e,2),a!==null&&($r(e,a,l,t),Ga(a,2),Yl(a));break}}l=l.return}}function Wi(t,l,e){var a=t.pingCache;if(a===null){a=t.pingCache=new w0;var u=new Set;a.set(l,u)}else u=a.get(l),u===void 0&&(u=new Set,a.set(l,u));u.has(e)||(Qi=!0,u.add(e),t=I0.bind(null,t,l,e),l.then(t,t))}function I0(t,l,e){var a=t.pingCache;a!==null&&a.delete(l),t.pingedLanes|=t.suspendedLanes&e,t.warmLanes&=~e,yt===t&&(lt&e)===e&&(zt===4||zt===3&&(lt&62914560)===lt&&300>rl()-On?(it&2)===0&&Ca(t,0):Zi|=e,_a===lt&&(_a=0)),Yl(t)}function $o(t,l){l===0&&(l=Lf()),t=qe(t,l),t!==null&&(Ga(t,l),Yl(t))}function P0(t){var l=t.memoizedState,e=0;l!==null&&(e=l.retryLane),$o(t,e)}function th(t,l){var e=0;switch(t.tag){case 31:case 13:var a=t.stateNode,u=t.memoizedState;u!==null&&(e=u.retryLane);break;case 19:a=t.stateNode;break;case 22:a=t.stateNode._retryCache;break;default:throw Error(f(314))}a!==null&&a.delete(l),$o(t,e)}function lh(t,l){return fc(t,l)}var Rn=null,ja=null,$i=!1,Hn=!1,Fi=!1,ze=0;function Yl(t){t!==ja&&t.next===null&&(ja===null?Rn=ja=t:ja=ja.next=t),Hn=!0,$i||($i=!0,ah())}function bu(t,l){if(!Fi&&Hn){Fi=!0;do for(var e=!1,a=Rn;a!==null;){if(t!==0){var u=a.pendingLanes;if(u===0)var n=0;else{var c=a.suspendedLanes,i=a.pingedLanes;n=(1<<31-dl(42|t)+1)-1,n&=u&~(c&~i),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(e=!0,td(a,n))}else n=lt,n=Yu(a,a===yt?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||Ya(a,n)||(e=!0,td(a,n));a=a.next}while(e);Fi=!1}}function eh(){Fo()}function Fo(){Hn=$i=!1;var t=0;ze!==0&&mh()&&(t=ze);for(var l=rl(),e=null,a=Rn;a!==null;){var u=a.next,n=Io(a,l);n===0?(a.next=null,e===null?Rn=u:e.next=u,u===null&&(ja=e)):(e=a,(t!==0||(n&3)!==0)&&(Hn=!0)),a=u}Ht!==0&&Ht!==5||bu(t),ze!==0&&(ze=0)}function Io(t,l){for(var e=t.suspendedLanes,a=t.pingedLanes,u=t.expirationTimes,n=t.pendingLanes&-62914561;0<n;){var c=31-dl(n),i=1<<c,s=u[c];s===-1?((i&e)===0||(i&a)!==0)&&(u[c]=Nm(i,l)):s<=l&&(t.expiredLanes|=i),n&=~i}if(l=yt,e=lt,e=Yu(t,t===l?e:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a=t.callbackNode,e===0||t===l&&(rt===2||rt===9)||t.cancelPendingCommit!==null)return a!==null&&a!==null&&sc(a),t.callbackNode=null,t.callbackPriority=0;if((e&3)===0||Ya(t,e)){if(l=e&-e,l===t.callbackPriority)return l;switch(a!==null&&sc(a),dc(e)){case 2:case 8:e=Qf;break;case 32:e=Ru;break;case 268435456:e=Zf;break;default:e=Ru}return a=Po.bind(null,t),e=fc(e,a),t.callbackPriority=l,t.callbackNode=e,l}return a!==null&&a!==null&&sc(a),t.callbackPriority=2,t.callbackNode=null,2}function Po(t,l){if(Ht!==0&&Ht!==5)return t.callbackNode=null,t.callbackPriority=0,null;var e=t.callbackNode;if(Dn()&&t.callbackNode!==e)return null;var a=lt;return a=Yu(t,t===yt?a:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a===0?null:(Ro(t,a,l),Io(t,rl()),t.callbackNode!=null&&t.callbackNode===e?Po.bind(null,t):null)}function td(t,l){if(Dn())return null;Ro(t,l,!0)}function ah(){vh(function(){(it&6)!==0?fc(Xf,eh):Fo()})}function Ii(){if(ze===0){var t=va;t===0&&(t=Hu,Hu<<=1,(Hu&261888)===0&&(Hu=256)),ze=t}return ze}function ld(t){return t==null||typeof t=="symbol"||typeof t=="boolean"?null:typeof t=="function"?t:Zu(""+t)}function ed(t,l){var e=l.ownerDocument.createElement("input");return e.name=l.name,e.value=l.value,t.id&&e.setAttribute("form",t.id),l.parentNode.insertBefore(e,l),t=new FormData(t),e.parentNode.removeChild(e),t}function uh(t,l,e,a,u){if(l==="submit"&&e&&e.stateNode===u){var n=ld((u[el]||null).action),c=a.submitter;c&&(l=(l=c[el]||null)?ld(l.formAction):c.getAttribute("formAction"),l!==null&&(n=l,c=null));var i=new Ju("action","action",null,a,u);t.push({event:i,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(ze!==0){var s=c?ed(u,c):new FormData(u);Si(e,{pending:!0,data:s,method:u.method,action:n},null,s)}}else typeof n=="function"&&(i.preventDefault(),s=c?ed(u,c):new FormData(u),Si(e,{pending:!0,data:s,method:u.method,action:n},n,s))},currentTarget:u}]})}}for(var Pi=0;Pi<Hc.length;Pi++){var tf=Hc[Pi],nh=tf.toLowerCase(),ch=tf[0].toUpperCase()+tf.slice(1);Ml(nh,"on"+ch)}Ml(Us,"onAnimationEnd"),Ml(Ds,"onAnimationIteration"),Ml(Rs,"onAnimationStart"),Ml("dblclick","onDoubleClick"),Ml("focusin","onFocus"),Ml("focusout","onBlur"),Ml(T0,"onTransitionRun"),Ml(z0,"onTransitionStart"),Ml(A0,"onTransitionCancel"),Ml(Hs,"onTransitionEnd"),la("onMouseEnter",["mouseout","mouseover"]),la("onMouseLeave",["mouseout","mouseover"]),la("onPointerEnter",["pointerout","pointerover"]),la("onPointerLeave",["pointerout","pointerover"]),Ue("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ue("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ue("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ue("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ue("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ue("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var pu="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),ih=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(pu));function ad(t,l){l=(l&4)!==0;for(var e=0;e<t.length;e++){var a=t[e],u=a.event;a=a.listeners;t:{var n=void 0;if(l)for(var c=a.length-1;0<=c;c--){var i=a[c],s=i.instance,g=i.currentTarget;if(i=i.listener,s!==n&&u.isPropagationStopped())break t;n=i,u.currentTarget=g;try{n(u)}catch(z){Wu(z)}u.currentTarget=null,n=s}else for(c=0;c<a.length;c++){if(i=a[c],s=i.instance,g=i.currentTarget,i=i.listener,s!==n&&u.isPropagationStopped())break t;n=i,u.currentTarget=g;try{n(u)}catch(z){Wu(z)}u.currentTarget=null,n=s}}}}function tt(t,l){var e=l[mc];e===void 0&&(e=l[mc]=new Set);var a=t+"__bubble";e.has(a)||(ud(l,t,2,!1),e.add(a))}function lf(t,l,e){var a=0;l&&(a|=4),ud(e,t,a,l)}var qn="_reactListening"+Math.random().toString(36).slice(2);function ef(t){if(!t[qn]){t[qn]=!0,$f.forEach(function(e){e!=="selectionchange"&&(ih.has(e)||lf(e,!1,t),lf(e,!0,t))});var l=t.nodeType===9?t:t.ownerDocument;l===null||l[qn]||(l[qn]=!0,lf("selectionchange",!1,l))}}function ud(t,l,e,a){switch(Dd(l)){case 2:var u=Hh;break;case 8:u=qh;break;default:u=Sf}e=u.bind(null,l,e,t),u=void 0,!Tc||l!=="touchstart"&&l!=="touchmove"&&l!=="wheel"||(u=!0),a?u!==void 0?t.addEventListener(l,e,{capture:!0,passive:u}):t.addEventListener(l,e,!0):u!==void 0?t.addEventListener(l,e,{passive:u}):t.addEventListener(l,e,!1)}function af(t,l,e,a,u){var n=a;if((l&1)===0&&(l&2)===0&&a!==null)t:for(;;){if(a===null)return;var c=a.tag;if(c===3||c===4){var i=a.stateNode.containerInfo;if(i===u)break;if(c===4)for(c=a.return;c!==null;){var s=c.tag;if((s===3||s===4)&&c.stateNode.containerInfo===u)return;c=c.return}for(;i!==null;){if(c=Ie(i),c===null)return;if(s=c.tag,s===5||s===6||s===26||s===27){a=n=c;continue t}i=i.parentNode}}a=a.return}fs(function(){var g=n,z=pc(e),O=[];t:{var S=qs.get(t);if(S!==void 0){var E=Ju,q=t;switch(t){case"keypress":if(Vu(e)===0)break t;case"keydown":case"keyup":E=t0;break;case"focusin":q="focus",E=_c;break;case"focusout":q="blur",E=_c;break;case"beforeblur":case"afterblur":E=_c;break;case"click":if(e.button===2)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":E=os;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":E=Zm;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":E=a0;break;case Us:case Ds:case Rs:E=Km;break;case Hs:E=n0;break;case"scroll":case"scrollend":E=Xm;break;case"wheel":E=i0;break;case"copy":case"cut":case"paste":E=wm;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":E=ms;break;case"toggle":case"beforetoggle":E=s0}var Z=(l&4)!==0,vt=!Z&&(t==="scroll"||t==="scrollend"),h=Z?S!==null?S+"Capture":null:S;Z=[];for(var d=g,y;d!==null;){var A=d;if(y=A.stateNode,A=A.tag,A!==5&&A!==26&&A!==27||y===null||h===null||(A=Za(d,h),A!=null&&Z.push(Eu(d,A,y))),vt)break;d=d.return}0<Z.length&&(S=new E(S,q,null,e,z),O.push({event:S,listeners:Z}))}}if((l&7)===0){t:{if(S=t==="mouseover"||t==="pointerover",E=t==="mouseout"||t==="pointerout",S&&e!==bc&&(q=e.relatedTarget||e.fromElement)&&(Ie(q)||q[Fe]))break t;if((E||S)&&(S=z.window===z?z:(S=z.ownerDocument)?S.defaultView||S.parentWindow:window,E?(q=e.relatedTarget||e.toElement,E=g,q=q?Ie(q):null,q!==null&&(vt=C(q),Z=q.tag,q!==vt||Z!==5&&Z!==27&&Z!==6)&&(q=null)):(E=null,q=g),E!==q)){if(Z=os,A="onMouseLeave",h="onMouseEnter",d="mouse",(t==="pointerout"||t==="pointerover")&&(Z=ms,A="onPointerLeave",h="onPointerEnter",d="pointer"),vt=E==null?S:Qa(E),y=q==null?S:Qa(q),S=new Z(A,d+"leave",E,e,z),S.target=vt,S.relatedTarget=y,A=null,Ie(z)===g&&(Z=new Z(h,d+"enter",q,e,z),Z.target=y,Z.relatedTarget=vt,A=Z),vt=A,E&&q)l:{for(Z=fh,h=E,d=q,y=0,A=h;A;A=Z(A))y++;A=0;for(var X=d;X;X=Z(X))A++;for(;0<y-A;)h=Z(h),y--;for(;0<A-y;)d=Z(d),A--;for(;y--;){if(h===d||d!==null&&h===d.alternate){Z=h;break l}h=Z(h),d=Z(d)}Z=null}else Z=null;E!==null&&nd(O,S,E,Z,!1),q!==null&&vt!==null&&nd(O,vt,q,Z,!0)}}t:{if(S=g?Qa(g):window,E=S.nodeName&&S.nodeName.toLowerCase(),E==="select"||E==="input"&&S.type==="file")var nt=Es;else if(bs(S))if(Ts)nt=b0;else{nt=g0;var Y=y0}else E=S.nodeName,!E||E.toLowerCase()!=="input"||S.type!=="checkbox"&&S.type!=="radio"?g&&Sc(g.elementType)&&(nt=Es):nt=S0;if(nt&&(nt=nt(t,g))){ps(O,nt,e,z);break t}Y&&Y(t,S,g),t==="focusout"&&g&&S.type==="number"&&g.memoizedProps.value!=null&&gc(S,"number",S.value)}switch(Y=g?Qa(g):window,t){case"focusin":(bs(Y)||Y.contentEditable==="true")&&(ia=Y,Uc=g,$a=null);break;case"focusout":$a=Uc=ia=null;break;case"mousedown":Dc=!0;break;case"contextmenu":case"mouseup":case"dragend":Dc=!1,js(O,e,z);break;case"selectionchange":if(E0)break;case"keydown":case"keyup":js(O,e,z)}var k;if(Cc)t:{switch(t){case"compositionstart":var et="onCompositionStart";break t;case"compositionend":et="onCompositionEnd";break t;case"compositionupdate":et="onCompositionUpdate";break t}et=void 0}else ca?gs(t,e)&&(et="onCompositionEnd"):t==="keydown"&&e.keyCode===229&&(et="onCompositionStart");et&&(hs&&e.locale!=="ko"&&(ca||et!=="onCompositionStart"?et==="onCompositionEnd"&&ca&&(k=ss()):(ie=z,zc="value"in ie?ie.value:ie.textContent,ca=!0)),Y=Bn(g,et),0<Y.length&&(et=new ds(et,t,null,e,z),O.push({event:et,listeners:Y}),k?et.data=k:(k=Ss(e),k!==null&&(et.data=k)))),(k=o0?d0(t,e):m0(t,e))&&(et=Bn(g,"onBeforeInput"),0<et.length&&(Y=new ds("onBeforeInput","beforeinput",null,e,z),O.push({event:Y,listeners:et}),Y.data=k)),uh(O,t,g,e,z)}ad(O,l)})}function Eu(t,l,e){return{instance:t,listener:l,currentTarget:e}}function Bn(t,l){for(var e=l+"Capture",a=[];t!==null;){var u=t,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=Za(t,e),u!=null&&a.unshift(Eu(t,u,n)),u=Za(t,l),u!=null&&a.push(Eu(t,u,n))),t.tag===3)return a;t=t.return}return[]}function fh(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5&&t.tag!==27);return t||null}function nd(t,l,e,a,u){for(var n=l._reactName,c=[];e!==null&&e!==a;){var i=e,s=i.alternate,g=i.stateNode;if(i=i.tag,s!==null&&s===a)break;i!==5&&i!==26&&i!==27||g===null||(s=g,u?(g=Za(e,n),g!=null&&c.unshift(Eu(e,g,s))):u||(g=Za(e,n),g!=null&&c.push(Eu(e,g,s)))),e=e.return}c.length!==0&&t.push({event:l,listeners:c})}var sh=/\r\n?/g,rh=/\u0000|\uFFFD/g;function cd(t){return(typeof t=="string"?t:""+t).replace(sh,`
-`).replace(rh,"")}function id(t,l){return l=cd(l),cd(t)===l}function ht(t,l,e,a,u,n){switch(e){case"children":typeof a=="string"?l==="body"||l==="textarea"&&a===""||aa(t,a):(typeof a=="number"||typeof a=="bigint")&&l!=="body"&&aa(t,""+a);break;case"className":Xu(t,"class",a);break;case"tabIndex":Xu(t,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Xu(t,e,a);break;case"style":cs(t,a,n);break;case"data":if(l!=="object"){Xu(t,"data",a);break}case"src":case"href":if(a===""&&(l!=="a"||e!=="href")){t.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Zu(""+a),t.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){t.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(e==="formAction"?(l!=="input"&&ht(t,l,"name",u.name,u,null),ht(t,l,"formEncType",u.formEncType,u,null),ht(t,l,"formMethod",u.formMethod,u,null),ht(t,l,"formTarget",u.formTarget,u,null)):(ht(t,l,"encType",u.encType,u,null),ht(t,l,"method",u.method,u,null),ht(t,l,"target",u.target,u,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Zu(""+a),t.setAttribute(e,a);break;case"onClick":a!=null&&(t.onclick=Xl);break;case"onScroll":a!=null&&tt("scroll",t);break;case"onScrollEnd":a!=null&&tt("scrollend",t);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(f(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(f(60));t.innerHTML=e}}break;case"multiple":t.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":t.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){t.removeAttribute("xlink:href");break}e=Zu(""+a),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""+a):t.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""):t.removeAttribute(e);break;case"capture":case"download":a===!0?t.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,a):t.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?t.setAttribute(e,a):t.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?t.removeAttribute(e):t.setAttribute(e,a);break;case"popover":tt("beforetoggle",t),tt("toggle",t),Gu(t,"popover",a);break;case"xlinkActuate":Gl(t,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Gl(t,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Gl(t,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Gl(t,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Gl(t,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Gl(t,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Gl(t,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Gl(t,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Gl(t,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Gu(t,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=Ym.get(e)||e,Gu(t,e,a))}}function uf(t,l,e,a,u,n){switch(e){case"style":cs(t,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(f(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(f(60));t.innerHTML=e}}break;case"children":typeof a=="string"?aa(t,a):(typeof a=="number"||typeof a=="bigint")&&aa(t,""+a);break;case"onScroll":a!=null&&tt("scroll",t);break;case"onScrollEnd":a!=null&&tt("scrollend",t);break;case"onClick":a!=null&&(t.onclick=Xl);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Ff.hasOwnProperty(e))t:{if(e[0]==="o"&&e[1]==="n"&&(u=e.endsWith("Capture"),l=e.slice(2,u?e.length-7:void 0),n=t[el]||null,n=n!=null?n[e]:null,typeof n=="function"&&t.removeEventListener(l,n,u),typeof a=="function")){typeof n!="function"&&n!==null&&(e in t?t[e]=null:t.hasAttribute(e)&&t.removeAttribute(e)),t.addEventListener(l,a,u);break t}e in t?t[e]=a:a===!0?t.setAttribute(e,""):Gu(t,e,a)}}}function Vt(t,l,e){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":tt("error",t),tt("load",t);var a=!1,u=!1,n;for(n in e)if(e.hasOwnProperty(n)){var c=e[n];if(c!=null)switch(n){case"src":a=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(f(137,l));default:ht(t,l,n,c,e,null)}}u&&ht(t,l,"srcSet",e.srcSet,e,null),a&&ht(t,l,"src",e.src,e,null);return;case"input":tt("invalid",t);var i=n=c=u=null,s=null,g=null;for(a in e)if(e.hasOwnProperty(a)){var z=e[a];if(z!=null)switch(a){case"name":u=z;break;case"type":c=z;break;case"checked":s=z;break;case"defaultChecked":g=z;break;case"value":n=z;break;case"defaultValue":i=z;break;case"children":case"dangerouslySetInnerHTML":if(z!=null)throw Error(f(137,l));break;default:ht(t,l,a,z,e,null)}}es(t,n,i,s,g,c,u,!1);return;case"select":tt("invalid",t),a=c=n=null;for(u in e)if(e.hasOwnProperty(u)&&(i=e[u],i!=null))switch(u){case"value":n=i;break;case"defaultValue":c=i;break;case"multiple":a=i;default:ht(t,l,u,i,e,null)}l=n,e=c,t.multiple=!!a,l!=null?ea(t,!!a,l,!1):e!=null&&ea(t,!!a,e,!0);return;case"textarea":tt("invalid",t),n=u=a=null;for(c in e)if(e.hasOwnProperty(c)&&(i=e[c],i!=null))switch(c){case"value":a=i;break;case"defaultValue":u=i;break;case"children":n=i;break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(f(91));break;default:ht(t,l,c,i,e,null)}us(t,a,u,n);return;case"option":for(s in e)if(e.hasOwnProperty(s)&&(a=e[s],a!=null))switch(s){case"selected":t.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:ht(t,l,s,a,e,null)}return;case"dialog":tt("beforetoggle",t),tt("toggle",t),tt("cancel",t),tt("close",t);break;case"iframe":case"object":tt("load",t);break;case"video":case"audio":for(a=0;a<pu.length;a++)tt(pu[a],t);break;case"image":tt("error",t),tt("load",t);break;case"details":tt("toggle",t);break;case"embed":case"source":case"link":tt("error",t),tt("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(g in e)if(e.hasOwnProperty(g)&&(a=e[g],a!=null))switch(g){case"children":case"dangerouslySetInnerHTML":throw Error(f(137,l));default:ht(t,l,g,a,e,null)}return;default:if(Sc(l)){for(z in e)e.hasOwnProperty(z)&&(a=e[z],a!==void 0&&uf(t,l,z,a,e,void 0));return}}for(i in e)e.hasOwnProperty(i)&&(a=e[i],a!=null&&ht(t,l,i,a,e,null))}function oh(t,l,e,a){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,c=null,i=null,s=null,g=null,z=null;for(E in e){var O=e[E];if(e.hasOwnProperty(E)&&O!=null)switch(E){case"checked":break;case"value":break;case"defaultValue":s=O;default:a.hasOwnProperty(E)||ht(t,l,E,null,a,O)}}for(var S in a){var E=a[S];if(O=e[S],a.hasOwnProperty(S)&&(E!=null||O!=null))switch(S){case"type":n=E;break;case"name":u=E;break;case"checked":g=E;break;case"defaultChecked":z=E;break;case"value":c=E;break;case"defaultValue":i=E;break;case"children":case"dangerouslySetInnerHTML":if(E!=null)throw Error(f(137,l));break;default:E!==O&&ht(t,l,S,E,a,O)}}yc(t,c,i,s,g,z,n,u);return;case"select":E=c=i=S=null;for(n in e)if(s=e[n],e.hasOwnProperty(n)&&s!=null)switch(n){case"value":break;case"multiple":E=s;default:a.hasOwnProperty(n)||ht(t,l,n,null,a,s)}for(u in a)if(n=a[u],s=e[u],a.hasOwnProperty(u)&&(n!=null||s!=null))switch(u){case"value":S=n;break;case"defaultValue":i=n;break;case"multiple":c=n;default:n!==s&&ht(t,l,u,n,a,s)}l=i,e=c,a=E,S!=null?ea(t,!!e,S,!1):!!a!=!!e&&(l!=null?ea(t,!!e,l,!0):ea(t,!!e,e?[]:"",!1));return;case"textarea":E=S=null;for(i in e)if(u=e[i],e.hasOwnProperty(i)&&u!=null&&!a.hasOwnProperty(i))switch(i){case"value":break;case"children":break;default:ht(t,l,i,null,a,u)}for(c in a)if(u=a[c],n=e[c],a.hasOwnProperty(c)&&(u!=null||n!=null))switch(c){case"value":S=u;break;case"defaultValue":E=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(f(91));break;default:u!==n&&ht(t,l,c,u,a,n)}as(t,S,E);return;case"option":for(var q in e)if(S=e[q],e.hasOwnProperty(q)&&S!=null&&!a.hasOwnProperty(q))switch(q){case"selected":t.selected=!1;break;default:ht(t,l,q,null,a,S)}for(s in a)if(S=a[s],E=e[s],a.hasOwnProperty(s)&&S!==E&&(S!=null||E!=null))switch(s){case"selected":t.selected=S&&typeof S!="function"&&typeof S!="symbol";break;default:ht(t,l,s,S,a,E)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var Z in e)S=e[Z],e.hasOwnProperty(Z)&&S!=null&&!a.hasOwnProperty(Z)&&ht(t,l,Z,null,a,S);for(g in a)if(S=a[g],E=e[g],a.hasOwnProperty(g)&&S!==E&&(S!=null||E!=null))switch(g){case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(f(137,l));break;default:ht(t,l,g,S,a,E)}return;default:if(Sc(l)){for(var vt in e)S=e[vt],e.hasOwnProperty(vt)&&S!==void 0&&!a.hasOwnProperty(vt)&&uf(t,l,vt,void 0,a,S);for(z in a)S=a[z],E=e[z],!a.hasOwnProperty(z)||S===E||S===void 0&&E===void 0||uf(t,l,z,S,a,E);return}}for(var h in e)S=e[h],e.hasOwnProperty(h)&&S!=null&&!a.hasOwnProperty(h)&&ht(t,l,h,null,a,S);for(O in a)S=a[O],E=e[O],!a.hasOwnProperty(O)||S===E||S==null&&E==null||ht(t,l,O,S,a,E)}function fd(t){switch(t){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function dh(){if(typeof performance.getEntriesByType=="function"){for(var t=0,l=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var u=e[a],n=u.transferSize,c=u.initiatorType,i=u.duration;if(n&&i&&fd(c)){for(c=0,i=u.responseEnd,a+=1;a<e.length;a++){var s=e[a],g=s.startTime;if(g>i)break;var z=s.transferSize,O=s.initiatorType;z&&fd(O)&&(s=s.responseEnd,c+=z*(s<i?1:(i-g)/(s-g)))}if(--a,l+=8*(n+c)/(u.duration/1e3),t++,10<t)break}}if(0<t)return l/t/1e6}return navigator.connection&&(t=navigator.connection.downlink,typeof t=="number")?t:5}var nf=null,cf=null;function Yn(t){return t.nodeType===9?t:t.ownerDocument}function sd(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function rd(t,l){if(t===0)switch(l){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&l==="foreignObject"?0:t}function ff(t,l){return t==="textarea"||t==="noscript"||typeof l.children=="string"||typeof l.children=="number"||typeof l.children=="bigint"||typeof l.dangerouslySetInnerHTML=="object"&&l.dangerouslySetInnerHTML!==null&&l.dangerouslySetInnerHTML.__html!=null}var sf=null;function mh(){var t=window.event;return t&&t.type==="popstate"?t===sf?!1:(sf=t,!0):(sf=null,!1)}var od=typeof setTimeout=="function"?setTimeout:void 0,hh=typeof clearTimeout=="function"?clearTimeout:void 0,dd=typeof Promise=="function"?Promise:void 0,vh=typeof queueMicrotask=="function"?queueMicrotask:typeof dd<"u"?function(t){return dd.resolve(null).then(t).catch(yh)}:od;function yh(t){setTimeout(function(){throw t})}function Ae(t){return t==="head"}function md(t,l){var e=l,a=0;do{var u=e.nextSibling;if(t.removeChild(e),u&&u.nodeType===8)if(e=u.data,e==="/$"||e==="/&"){if(a===0){t.removeChild(u),Ra(l);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Tu(t.ownerDocument.documentElement);else if(e==="head"){e=t.ownerDocument.head,Tu(e);for(var n=e.firstChild;n;){var c=n.nextSibling,i=n.nodeName;n[Xa]||i==="SCRIPT"||i==="STYLE"||i==="LINK"&&n.rel.toLowerCase()==="stylesheet"||e.removeChild(n),n=c}}else e==="body"&&Tu(t.ownerDocument.body);e=u}while(e);Ra(l)}function hd(t,l){var e=t;t=0;do{var a=e.nextSibling;if(e.nodeType===1?l?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(l?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(t===0)break;t--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||t++;e=a}while(e)}function rf(t){var l=t.firstChild;for(l&&l.nodeType===10&&(l=l.nextSibling);l;){var e=l;switch(l=l.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":rf(e),hc(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}t.removeChild(e)}}function gh(t,l,e,a){for(;t.nodeType===1;){var u=e;if(t.nodeName.toLowerCase()!==l.toLowerCase()){if(!a&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(a){if(!t[Xa])switch(l){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(n=t.getAttribute("rel"),n==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(n!==u.rel||t.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||t.getAttribute("title")!==(u.title==null?null:u.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(n=t.getAttribute("src"),(n!==(u.src==null?null:u.src)||t.getAttribute("type")!==(u.type==null?null:u.type)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(l==="input"&&t.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&t.getAttribute("name")===n)return t}else return t;if(t=Nl(t.nextSibling),t===null)break}return null}function Sh(t,l,e){if(l==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!e||(t=Nl(t.nextSibling),t===null))return null;return t}function vd(t,l){for(;t.nodeType!==8;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!l||(t=Nl(t.nextSibling),t===null))return null;return t}function of(t){return t.data==="$?"||t.data==="$~"}function df(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState!=="loading"}function bh(t,l){var e=t.ownerDocument;if(t.data==="$~")t._reactRetry=l;else if(t.data!=="$?"||e.readyState!=="loading")l();else{var a=function(){l(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),t._reactRetry=a}}function Nl(t){for(;t!=null;t=t.nextSibling){var l=t.nodeType;if(l===1||l===3)break;if(l===8){if(l=t.data,l==="$"||l==="$!"||l==="$?"||l==="$~"||l==="&"||l==="F!"||l==="F")break;if(l==="/$"||l==="/&")return null}}return t}var mf=null;function yd(t){t=t.nextSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="/$"||e==="/&"){if(l===0)return Nl(t.nextSibling);l--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||l++}t=t.nextSibling}return null}function gd(t){t=t.previousSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(l===0)return t;l--}else e!=="/$"&&e!=="/&"||l++}t=t.previousSibling}return null}function Sd(t,l,e){switch(l=Yn(e),t){case"html":if(t=l.documentElement,!t)throw Error(f(452));return t;case"head":if(t=l.head,!t)throw Error(f(453));return t;case"body":if(t=l.body,!t)throw Error(f(454));return t;default:throw Error(f(451))}}function Tu(t){for(var l=t.attributes;l.length;)t.removeAttributeNode(l[0]);hc(t)}var jl=new Map,bd=new Set;function Gn(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var ee=j.d;j.d={f:ph,r:Eh,D:Th,C:zh,L:Ah,m:xh,X:Oh,S:_h,M:Ch};function ph(){var t=ee.f(),l=jn();return t||l}function Eh(t){var l=Pe(t);l!==null&&l.tag===5&&l.type==="form"?Hr(l):ee.r(t)}var Ma=typeof document>"u"?null:document;function pd(t,l,e){var a=Ma;if(a&&typeof l=="string"&&l){var u=Tl(l);u='link[rel="'+t+'"][href="'+u+'"]',typeof e=="string"&&(u+='[crossorigin="'+e+'"]'),bd.has(u)||(bd.add(u),t={rel:t,crossOrigin:e,href:l},a.querySelector(u)===null&&(l=a.createElement("link"),Vt(l,"link",t),Yt(l),a.head.appendChild(l)))}}function Th(t){ee.D(t),pd("dns-prefetch",t,null)}function zh(t,l){ee.C(t,l),pd("preconnect",t,l)}function Ah(t,l,e){ee.L(t,l,e);var a=Ma;if(a&&t&&l){var u='link[rel="preload"][as="'+Tl(l)+'"]';l==="image"&&e&&e.imageSrcSet?(u+='[imagesrcset="'+Tl(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(u+='[imagesizes="'+Tl(e.imageSizes)+'"]')):u+='[href="'+Tl(t)+'"]';var n=u;switch(l){case"style":n=Ua(t);break;case"script":n=Da(t)}jl.has(n)||(t=H({rel:"preload",href:l==="image"&&e&&e.imageSrcSet?void 0:t,as:l},e),jl.set(n,t),a.querySelector(u)!==null||l==="style"&&a.querySelector(zu(n))||l==="script"&&a.querySelector(Au(n))||(l=a.createElement("link"),Vt(l,"link",t),Yt(l),a.head.appendChild(l)))}}function xh(t,l){ee.m(t,l);var e=Ma;if(e&&t){var a=l&&typeof l.as=="string"?l.as:"script",u='link[rel="modulepreload"][as="'+Tl(a)+'"][href="'+Tl(t)+'"]',n=u;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Da(t)}if(!jl.has(n)&&(t=H({rel:"modulepreload",href:t},l),jl.set(n,t),e.querySelector(u)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(Au(n)))return}a=e.createElement("link"),Vt(a,"link",t),Yt(a),e.head.appendChild(a)}}}function _h(t,l,e){ee.S(t,l,e);var a=Ma;if(a&&t){var u=ta(a).hoistableStyles,n=Ua(t);l=l||"default";var c=u.get(n);if(!c){var i={loading:0,preload:null};if(c=a.querySelector(zu(n)))i.loading=5;else{t=H({rel:"stylesheet",href:t,"data-precedence":l},e),(e=jl.get(n))&&hf(t,e);var s=c=a.createElement("link");Yt(s),Vt(s,"link",t),s._p=new Promise(function(g,z){s.onload=g,s.onerror=z}),s.addEventListener("load",function(){i.loading|=1}),s.addEventListener("error",function(){i.loading|=2}),i.loading|=4,Xn(c,l,a)}c={type:"stylesheet",instance:c,count:1,state:i},u.set(n,c)}}}function Oh(t,l){ee.X(t,l);var e=Ma;if(e&&t){var a=ta(e).hoistableScripts,u=Da(t),n=a.get(u);n||(n=e.querySelector(Au(u)),n||(t=H({src:t,async:!0},l),(l=jl.get(u))&&vf(t,l),n=e.createElement("script"),Yt(n),Vt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function Ch(t,l){ee.M(t,l);var e=Ma;if(e&&t){var a=ta(e).hoistableScripts,u=Da(t),n=a.get(u);n||(n=e.querySelector(Au(u)),n||(t=H({src:t,async:!0,type:"module"},l),(l=jl.get(u))&&vf(t,l),n=e.createElement("script"),Yt(n),Vt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function Ed(t,l,e,a){var u=(u=W.current)?Gn(u):null;if(!u)throw Error(f(446));switch(t){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(l=Ua(e.href),e=ta(u).hoistableStyles,a=e.get(l),a||(a={type:"style",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){t=Ua(e.href);var n=ta(u).hoistableStyles,c=n.get(t);if(c||(u=u.ownerDocument||u,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(t,c),(n=u.querySelector(zu(t)))&&!n._p&&(c.instance=n,c.state.loading=5),jl.has(t)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},jl.set(t,e),n||Nh(u,t,e,c.state))),l&&a===null)throw Error(f(528,""));return c}if(l&&a!==null)throw Error(f(529,""));return null;case"script":return l=e.async,e=e.src,typeof e=="string"&&l&&typeof l!="function"&&typeof l!="symbol"?(l=Da(e),e=ta(u).hoistableScripts,a=e.get(l),a||(a={type:"script",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(f(444,t))}}function Ua(t){return'href="'+Tl(t)+'"'}function zu(t){return'link[rel="stylesheet"]['+t+"]"}function Td(t){return H({},t,{"data-precedence":t.precedence,precedence:null})}function Nh(t,l,e,a){t.querySelector('link[rel="preload"][as="style"]['+l+"]")?a.loading=1:(l=t.createElement("link"),a.preload=l,l.addEventListener("load",function(){return a.loading|=1}),l.addEventListener("error",function(){return a.loading|=2}),Vt(l,"link",e),Yt(l),t.head.appendChild(l))}function Da(t){return'[src="'+Tl(t)+'"]'}function Au(t){return"script[async]"+t}function zd(t,l,e){if(l.count++,l.instance===null)switch(l.type){case"style":var a=t.querySelector('style[data-href~="'+Tl(e.href)+'"]');if(a)return l.instance=a,Yt(a),a;var u=H({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(t.ownerDocument||t).createElement("style"),Yt(a),Vt(a,"style",u),Xn(a,e.precedence,t),l.instance=a;case"stylesheet":u=Ua(e.href);var n=t.querySelector(zu(u));if(n)return l.state.loading|=4,l.instance=n,Yt(n),n;a=Td(e),(u=jl.get(u))&&hf(a,u),n=(t.ownerDocument||t).createElement("link"),Yt(n);var c=n;return c._p=new Promise(function(i,s){c.onload=i,c.onerror=s}),Vt(n,"link",a),l.state.loading|=4,Xn(n,e.precedence,t),l.instance=n;case"script":return n=Da(e.src),(u=t.querySelector(Au(n)))?(l.instance=u,Yt(u),u):(a=e,(u=jl.get(n))&&(a=H({},e),vf(a,u)),t=t.ownerDocument||t,u=t.createElement("script"),Yt(u),Vt(u,"link",a),t.head.appendChild(u),l.instance=u);case"void":return null;default:throw Error(f(443,l.type))}else l.type==="stylesheet"&&(l.state.loading&4)===0&&(a=l.instance,l.state.loading|=4,Xn(a,e.precedence,t));return l.instance}function Xn(t,l,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=a.length?a[a.length-1]:null,n=u,c=0;c<a.length;c++){var i=a[c];if(i.dataset.precedence===l)n=i;else if(n!==u)break}n?n.parentNode.insertBefore(t,n.nextSibling):(l=e.nodeType===9?e.head:e,l.insertBefore(t,l.firstChild))}function hf(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.title==null&&(t.title=l.title)}function vf(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.integrity==null&&(t.integrity=l.integrity)}var Qn=null;function Ad(t,l,e){if(Qn===null){var a=new Map,u=Qn=new Map;u.set(e,a)}else u=Qn,a=u.get(e),a||(a=new Map,u.set(e,a));if(a.has(t))return a;for(a.set(t,null),e=e.getElementsByTagName(t),u=0;u<e.length;u++){var n=e[u];if(!(n[Xa]||n[Xt]||t==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(l)||"";c=t+c;var i=a.get(c);i?i.push(n):a.set(c,[n])}}return a}function xd(t,l,e){t=t.ownerDocument||t,t.head.insertBefore(e,l==="title"?t.querySelector("head > title"):null)}function jh(t,l,e){if(e===1||l.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof l.precedence!="string"||typeof l.href!="string"||l.href==="")break;return!0;case"link":if(typeof l.rel!="string"||typeof l.href!="string"||l.href===""||l.onLoad||l.onError)break;switch(l.rel){case"stylesheet":return t=l.disabled,typeof l.precedence=="string"&&t==null;default:return!0}case"script":if(l.async&&typeof l.async!="function"&&typeof l.async!="symbol"&&!l.onLoad&&!l.onError&&l.src&&typeof l.src=="string")return!0}return!1}function _d(t){return!(t.type==="stylesheet"&&(t.state.loading&3)===0)}function Mh(t,l,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var u=Ua(a.href),n=l.querySelector(zu(u));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(t.count++,t=Zn.bind(t),l.then(t,t)),e.state.loading|=4,e.instance=n,Yt(n);return}n=l.ownerDocument||l,a=Td(a),(u=jl.get(u))&&hf(a,u),n=n.createElement("link"),Yt(n);var c=n;c._p=new Promise(function(i,s){c.onload=i,c.onerror=s}),Vt(n,"link",a),e.instance=n}t.stylesheets===null&&(t.stylesheets=new Map),t.stylesheets.set(e,l),(l=e.state.preload)&&(e.state.loading&3)===0&&(t.count++,e=Zn.bind(t),l.addEventListener("load",e),l.addEventListener("error",e))}}var yf=0;function Uh(t,l){return t.stylesheets&&t.count===0&&Vn(t,t.stylesheets),0<t.count||0<t.imgCount?function(e){var a=setTimeout(function(){if(t.stylesheets&&Vn(t,t.stylesheets),t.unsuspend){var n=t.unsuspend;t.unsuspend=null,n()}},6e4+l);0<t.imgBytes&&yf===0&&(yf=62500*dh());var u=setTimeout(function(){if(t.waitingForImages=!1,t.count===0&&(t.stylesheets&&Vn(t,t.stylesheets),t.unsuspend)){var n=t.unsuspend;t.unsuspend=null,n()}},(t.imgBytes>yf?50:800)+l);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(a),clearTimeout(u)}}:null}function Zn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Vn(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var Ln=null;function Vn(t,l){t.stylesheets=null,t.unsuspend!==null&&(t.count++,Ln=new Map,l.forEach(Dh,t),Ln=null,Zn.call(t))}function Dh(t,l){if(!(l.state.loading&4)){var e=Ln.get(t);if(e)var a=e.get(null);else{e=new Map,Ln.set(t,e);for(var u=t.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var c=u[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(e.set(c.dataset.precedence,c),a=c)}a&&e.set(null,a)}u=l.instance,c=u.getAttribute("data-precedence"),n=e.get(c)||a,n===a&&e.set(null,u),e.set(c,u),this.count++,a=Zn.bind(this),u.addEventListener("load",a),u.addEventListener("error",a),n?n.parentNode.insertBefore(u,n.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(u,t.firstChild)),l.state.loading|=4}}var xu={$$typeof:xt,Provider:null,Consumer:null,_currentValue:D,_currentValue2:D,_threadCount:0};function Rh(t,l,e,a,u,n,c,i,s){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=rc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=rc(0),this.hiddenUpdates=rc(null),this.identifierPrefix=a,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=s,this.incompleteTransitions=new Map}function Od(t,l,e,a,u,n,c,i,s,g,z,O){return t=new Rh(t,l,e,c,s,g,z,O,i),l=1,n===!0&&(l|=24),n=hl(3,null,null,l),t.current=n,n.stateNode=t,l=kc(),l.refCount++,t.pooledCache=l,l.refCount++,n.memoizedState={element:a,isDehydrated:e,cache:l},Ic(n),t}function Cd(t){return t?(t=ra,t):ra}function Nd(t,l,e,a,u,n){u=Cd(u),a.context===null?a.context=u:a.pendingContext=u,a=me(l),a.payload={element:e},n=n===void 0?null:n,n!==null&&(a.callback=n),e=he(t,a,l),e!==null&&(fl(e,t,l),au(e,t,l))}function jd(t,l){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var e=t.retryLane;t.retryLane=e!==0&&e<l?e:l}}function gf(t,l){jd(t,l),(t=t.alternate)&&jd(t,l)}function Md(t){if(t.tag===13||t.tag===31){var l=qe(t,67108864);l!==null&&fl(l,t,67108864),gf(t,67108864)}}function Ud(t){if(t.tag===13||t.tag===31){var l=bl();l=oc(l);var e=qe(t,l);e!==null&&fl(e,t,l),gf(t,l)}}var Kn=!0;function Hh(t,l,e,a){var u=p.T;p.T=null;var n=j.p;try{j.p=2,Sf(t,l,e,a)}finally{j.p=n,p.T=u}}function qh(t,l,e,a){var u=p.T;p.T=null;var n=j.p;try{j.p=8,Sf(t,l,e,a)}finally{j.p=n,p.T=u}}function Sf(t,l,e,a){if(Kn){var u=bf(a);if(u===null)af(t,l,a,Jn,e),Rd(t,a);else if(Yh(u,t,l,e,a))a.stopPropagation();else if(Rd(t,a),l&4&&-1<Bh.indexOf(t)){for(;u!==null;){var n=Pe(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=Me(n.pendingLanes);if(c!==0){var i=n;for(i.pendingLanes|=2,i.entangledLanes|=2;c;){var s=1<<31-dl(c);i.entanglements[1]|=s,c&=~s}Yl(n),(it&6)===0&&(Cn=rl()+500,bu(0))}}break;case 31:case 13:i=qe(n,2),i!==null&&fl(i,n,2),jn(),gf(n,2)}if(n=bf(a),n===null&&af(t,l,a,Jn,e),n===u)break;u=n}u!==null&&a.stopPropagation()}else af(t,l,a,null,e)}}function bf(t){return t=pc(t),pf(t)}var Jn=null;function pf(t){if(Jn=null,t=Ie(t),t!==null){var l=C(t);if(l===null)t=null;else{var e=l.tag;if(e===13){if(t=R(l),t!==null)return t;t=null}else if(e===31){if(t=B(l),t!==null)return t;t=null}else if(e===3){if(l.stateNode.current.memoizedState.isDehydrated)return l.tag===3?l.stateNode.containerInfo:null;t=null}else l!==t&&(t=null)}}return Jn=t,null}function Dd(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Tm()){case Xf:return 2;case Qf:return 8;case Ru:case zm:return 32;case Zf:return 268435456;default:return 32}default:return 32}}var Ef=!1,xe=null,_e=null,Oe=null,_u=new Map,Ou=new Map,Ce=[],Bh="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Rd(t,l){switch(t){case"focusin":case"focusout":xe=null;break;case"dragenter":case"dragleave":_e=null;break;case"mouseover":case"mouseout":Oe=null;break;case"pointerover":case"pointerout":_u.delete(l.pointerId);break;case"gotpointercapture":case"lostpointercapture":Ou.delete(l.pointerId)}}function Cu(t,l,e,a,u,n){return t===null||t.nativeEvent!==n?(t={blockedOn:l,domEventName:e,eventSystemFlags:a,nativeEvent:n,targetContainers:[u]},l!==null&&(l=Pe(l),l!==null&&Md(l)),t):(t.eventSystemFlags|=a,l=t.targetContainers,u!==null&&l.indexOf(u)===-1&&l.push(u),t)}function Yh(t,l,e,a,u){switch(l){case"focusin":return xe=Cu(xe,t,l,e,a,u),!0;case"dragenter":return _e=Cu(_e,t,l,e,a,u),!0;case"mouseover":return Oe=Cu(Oe,t,l,e,a,u),!0;case"pointerover":var n=u.pointerId;return _u.set(n,Cu(_u.get(n)||null,t,l,e,a,u)),!0;case"gotpointercapture":return n=u.pointerId,Ou.set(n,Cu(Ou.get(n)||null,t,l,e,a,u)),!0}return!1}function Hd(t){var l=Ie(t.target);if(l!==null){var e=C(l);if(e!==null){if(l=e.tag,l===13){if(l=R(e),l!==null){t.blockedOn=l,kf(t.priority,function(){Ud(e)});return}}else if(l===31){if(l=B(e),l!==null){t.blockedOn=l,kf(t.priority,function(){Ud(e)});return}}else if(l===3&&e.stateNode.current.memoizedState.isDehydrated){t.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}t.blockedOn=null}function wn(t){if(t.blockedOn!==null)return!1;for(var l=t.targetContainers;0<l.length;){var e=bf(t.nativeEvent);if(e===null){e=t.nativeEvent;var a=new e.constructor(e.type,e);bc=a,e.target.dispatchEvent(a),bc=null}else return l=Pe(e),l!==null&&Md(l),t.blockedOn=e,!1;l.shift()}return!0}function qd(t,l,e){wn(t)&&e.delete(l)}function Gh(){Ef=!1,xe!==null&&wn(xe)&&(xe=null),_e!==null&&wn(_e)&&(_e=null),Oe!==null&&wn(Oe)&&(Oe=null),_u.forEach(qd),Ou.forEach(qd)}function kn(t,l){t.blockedOn===l&&(t.blockedOn=null,Ef||(Ef=!0,o.unstable_scheduleCallback(o.unstable_NormalPriority,Gh)))}var Wn=null;function Bd(t){Wn!==t&&(Wn=t,o.unstable_scheduleCallback(o.unstable_NormalPriority,function(){Wn===t&&(Wn=null);for(var l=0;l<t.length;l+=3){var e=t[l],a=t[l+1],u=t[l+2];if(typeof a!="function"){if(pf(a||e)===null)continue;break}var n=Pe(e);n!==null&&(t.splice(l,3),l-=3,Si(n,{pending:!0,data:u,method:e.method,action:a},a,u))}}))}function Ra(t){function l(s){return kn(s,t)}xe!==null&&kn(xe,t),_e!==null&&kn(_e,t),Oe!==null&&kn(Oe,t),_u.forEach(l),Ou.forEach(l);for(var e=0;e<Ce.length;e++){var a=Ce[e];a.blockedOn===t&&(a.blockedOn=null)}for(;0<Ce.length&&(e=Ce[0],e.blockedOn===null);)Hd(e),e.blockedOn===null&&Ce.shift();if(e=(t.ownerDocument||t).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var u=e[a],n=e[a+1],c=u[el]||null;if(typeof n=="function")c||Bd(e);else if(c){var i=null;if(n&&n.hasAttribute("formAction")){if(u=n,c=n[el]||null)i=c.formAction;else if(pf(u)!==null)continue}else i=c.action;typeof i=="function"?e[a+1]=i:(e.splice(a,3),a-=3),Bd(e)}}}function Yd(){function t(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(c){return u=c})},focusReset:"manual",scroll:"manual"})}function l(){u!==null&&(u(),u=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,u=null;return navigation.addEventListener("navigate",t),navigation.addEventListener("navigatesuccess",l),navigation.addEventListener("navigateerror",l),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",t),navigation.removeEventListener("navigatesuccess",l),navigation.removeEventListener("navigateerror",l),u!==null&&(u(),u=null)}}}function Tf(t){this._internalRoot=t}$n.prototype.render=Tf.prototype.render=function(t){var l=this._internalRoot;if(l===null)throw Error(f(409));var e=l.current,a=bl();Nd(e,a,t,l,null,null)},$n.prototype.unmount=Tf.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var l=t.containerInfo;Nd(t.current,2,null,t,null,null),jn(),l[Fe]=null}};function $n(t){this._internalRoot=t}$n.prototype.unstable_scheduleHydration=function(t){if(t){var l=wf();t={blockedOn:null,target:t,priority:l};for(var e=0;e<Ce.length&&l!==0&&l<Ce[e].priority;e++);Ce.splice(e,0,t),e===0&&Hd(t)}};var Gd=r.version;if(Gd!=="19.2.0")throw Error(f(527,Gd,"19.2.0"));j.findDOMNode=function(t){var l=t._reactInternals;if(l===void 0)throw typeof t.render=="function"?Error(f(188)):(t=Object.keys(t).join(","),Error(f(268,t)));return t=T(l),t=t!==null?G(t):null,t=t===null?null:t.stateNode,t};var Xh={bundleType:0,version:"19.2.0",rendererPackageName:"react-dom",currentDispatcherRef:p,reconcilerVersion:"19.2.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Fn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Fn.isDisabled&&Fn.supportsFiber)try{Ba=Fn.inject(Xh),ol=Fn}catch{}}return ju.createRoot=function(t,l){if(!N(t))throw Error(f(299));var e=!1,a="",u=Kr,n=Jr,c=wr;return l!=null&&(l.unstable_strictMode===!0&&(e=!0),l.identifierPrefix!==void 0&&(a=l.identifierPrefix),l.onUncaughtError!==void 0&&(u=l.onUncaughtError),l.onCaughtError!==void 0&&(n=l.onCaughtError),l.onRecoverableError!==void 0&&(c=l.onRecoverableError)),l=Od(t,1,!1,null,null,e,a,null,u,n,c,Yd),t[Fe]=l.current,ef(t),new Tf(l)},ju.hydrateRoot=function(t,l,e){if(!N(t))throw Error(f(299));var a=!1,u="",n=Kr,c=Jr,i=wr,s=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(u=e.identifierPrefix),e.onUncaughtError!==void 0&&(n=e.onUncaughtError),e.onCaughtError!==void 0&&(c=e.onCaughtError),e.onRecoverableError!==void 0&&(i=e.onRecoverableError),e.formState!==void 0&&(s=e.formState)),l=Od(t,1,!0,l,e??null,a,u,s,n,c,i,Yd),l.context=Cd(null),e=l.current,a=bl(),a=oc(a),u=me(a),u.callback=null,he(e,u,a),e=a,l.current.lanes=e,Ga(l,e),Yl(l),t[Fe]=l.current,ef(t),new $n(l)},ju.version="19.2.0",ju}var Wd;function $h(){if(Wd)return xf.exports;Wd=1;function o(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(o)}catch(r){console.error(r)}}return o(),xf.exports=Wh(),xf.exports}var Fh=$h();const Ih=Rf(Fh),Nf="/api/tickets",In={async getConcerts(){const o=await fetch(`${Nf}/concerts/`);if(!o.ok)throw new Error("Failed to fetch concerts");return o.json()},async getTicketTypes(o){const r=await fetch(`${Nf}/concert/tickettypes?concert_id=${o}`);if(!r.ok)throw new Error("Failed to fetch ticket types");return r.json()},async createCheckoutSession(o,r){const v=await fetch(`${Nf}/create-checkout-session/`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({concert_id:o,line_items:r})});if(!v.ok){const f=await v.json();throw new Error(f.detail||"Failed to create checkout session")}return v.json()}};const Ph=o=>o.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),tv=o=>o.replace(/^([A-Z])|[\s-_]+(\w)/g,(r,v,f)=>f?f.toUpperCase():v.toLowerCase()),$d=o=>{const r=tv(o);return r.charAt(0).toUpperCase()+r.slice(1)},fm=(...o)=>o.filter((r,v,f)=>!!r&&r.trim()!==""&&f.indexOf(r)===v).join(" ").trim(),lv=o=>{for(const r in o)if(r.startsWith("aria-")||r==="role"||r==="title")return!0};var ev={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const av=At.forwardRef(({color:o="currentColor",size:r=24,strokeWidth:v=2,absoluteStrokeWidth:f,className:N="",children:C,iconNode:R,...B},x)=>At.createElement("svg",{ref:x,...ev,width:r,height:r,stroke:o,strokeWidth:f?Number(v)*24/Number(r):v,className:fm("lucide",N),...!C&&!lv(B)&&{"aria-hidden":"true"},...B},[...R.map(([T,G])=>At.createElement(T,G)),...Array.isArray(C)?C:[C]]));const $e=(o,r)=>{const v=At.forwardRef(({className:f,...N},C)=>At.createElement(av,{ref:C,iconNode:r,className:fm(`lucide-${Ph($d(o))}`,`lucide-${o}`,f),...N}));return v.displayName=$d(o),v};const uv=[["path",{d:"M8 2v4",key:"1cmpym"}],["path",{d:"M16 2v4",key:"4m81vk"}],["rect",{width:"18",height:"18",x:"3",y:"4",rx:"2",key:"1hopcy"}],["path",{d:"M3 10h18",key:"8toen8"}]],nv=$e("calendar",uv);const cv=[["path",{d:"M20 6 9 17l-5-5",key:"1gmf2c"}]],qf=$e("check",cv);const iv=[["path",{d:"M12 6v6l4 2",key:"mmk7yg"}],["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}]],fv=$e("clock",iv);const sv=[["path",{d:"M12 15V3",key:"m9g1x1"}],["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["path",{d:"m7 10 5 5 5-5",key:"brsn70"}]],rv=$e("download",sv);const ov=[["path",{d:"M21 12a9 9 0 1 1-6.219-8.56",key:"13zald"}]],dv=$e("loader-circle",ov);const mv=[["path",{d:"m22 7-8.991 5.727a2 2 0 0 1-2.009 0L2 7",key:"132q7q"}],["rect",{x:"2",y:"4",width:"20",height:"16",rx:"2",key:"izxlao"}]],hv=$e("mail",mv);const vv=[["path",{d:"M20 10c0 4.993-5.539 10.193-7.399 11.799a1 1 0 0 1-1.202 0C9.539 20.193 4 14.993 4 10a8 8 0 0 1 16 0",key:"1r0f0z"}],["circle",{cx:"12",cy:"10",r:"3",key:"ilqhr7"}]],yv=$e("map-pin",vv),gv=({currentStep:o})=>{const r=[{number:1,label:"Select Concert"},{number:2,label:"Choose Tickets"},{number:3,label:"Checkout"}];return b.jsx("div",{className:"flex justify-center mb-12",children:b.jsx("div",{className:"flex items-center space-x-4",children:r.map((v,f)=>b.jsxs(at.Fragment,{children:[b.jsxs("div",{className:`flex items-center ${o>=v.number?"text-[#008888]":"text-gray-400"}`,children:[b.jsx("div",{className:`w-10 h-10 rounded-full flex items-center justify-center font-semibold ${o>=v.number?"bg-[#008888] text-white":"bg-gray-300"}`,children:o>v.number?b.jsx(qf,{className:"w-6 h-6"}):v.number}),b.jsx("span",{className:"ml-2 font-semibold hidden sm:inline",children:v.label})]}),f<r.length-1&&b.jsx("div",{className:"w-16 h-px bg-gray-300"})]},v.number))})})},ae=({children:o,className:r=""})=>b.jsx("div",{className:`bg-white rounded-lg shadow-lg ${r}`,children:o}),ec=({children:o})=>b.jsx("div",{className:"p-6 border-b border-gray-200",children:o}),ac=({children:o,className:r=""})=>b.jsx("h2",{className:`font-bold ${r}`,children:o}),ue=({children:o,className:r=""})=>b.jsx("div",{className:`p-6 ${r}`,children:o}),We=({children:o,onClick:r,disabled:v,variant:f="default",className:N="",type:C="button"})=>{const R="px-4 py-2 rounded-md font-semibold transition-all disabled:opacity-50 disabled:cursor-not-allowed",B={default:"bg-[#008888] text-white hover:bg-[#006666]",outline:"border-2 border-gray-300 text-gray-700 hover:bg-gray-50"};return b.jsx("button",{type:C,onClick:r,disabled:v,className:`${R} ${B[f]} ${N}`,children:o})},Sv=({concerts:o,selectedConcert:r,onSelectConcert:v,onContinue:f,loading:N})=>N?b.jsx(ae,{children:b.jsxs(ue,{className:"p-12 text-center",children:[b.jsx("div",{className:"inline-block animate-spin rounded-full h-12 w-12 border-4 border-[#008888] border-t-transparent mb-4"}),b.jsx("p",{className:"text-gray-600",children:"Loading concerts..."})]})}):b.jsxs(ae,{children:[b.jsx(ec,{children:b.jsx(ac,{className:"text-2xl",children:"Select a Concert"})}),b.jsxs(ue,{className:"space-y-4",children:[o.map(C=>b.jsxs("div",{onClick:()=>v(C.id),className:`p-6 border-2 rounded-lg cursor-pointer transition-all ${r===C.id?"border-[#008888] bg-[#008888]/5":"border-gray-200 hover:border-[#008888]/50"}`,children:[b.jsx("h3",{className:"text-xl font-bold text-gray-900 mb-3",children:C.concert_name}),b.jsxs("div",{className:"space-y-2 text-gray-600",children:[b.jsxs("p",{className:"flex items-center",children:[b.jsx(nv,{className:"w-4 h-4 mr-2 text-[#008888]"}),C.concert_date]}),b.jsxs("p",{className:"flex items-center",children:[b.jsx(fv,{className:"w-4 h-4 mr-2 text-[#008888]"}),C.concert_time]}),b.jsxs("p",{className:"flex items-center",children:[b.jsx(yv,{className:"w-4 h-4 mr-2 text-[#008888]"}),C.concert_location]}),C.conductor&&b.jsxs("p",{className:"flex items-center",children:[b.jsx("span",{className:"w-4 h-4 mr-2 text-[#008888]",children:"♪"}),"Conductor: ",C.conductor]})]})]},C.id)),b.jsx(We,{onClick:f,disabled:!r,className:"w-full",children:"Continue to Ticket Selection"})]})]}),bv=({ticketTypes:o,ticketQuantities:r,onQuantityChange:v,onBack:f,onContinue:N,loading:C,validating:R})=>{const B=()=>Object.values(r).reduce((x,T)=>x+T,0);return C?b.jsx(ae,{children:b.jsxs(ue,{className:"p-12 text-center",children:[b.jsx("div",{className:"inline-block animate-spin rounded-full h-12 w-12 border-4 border-[#008888] border-t-transparent mb-4"}),b.jsx("p",{className:"text-gray-600",children:"Loading ticket types..."})]})}):b.jsxs(ae,{children:[b.jsx(ec,{children:b.jsx(ac,{className:"text-2xl",children:"Choose Your Tickets"})}),b.jsxs(ue,{className:"space-y-4",children:[o.map(x=>b.jsx("div",{className:x.display_ticket?"p-6 border-2 rounded-lg border-gray-200":"p-6 border-2 rounded-lg border-red-200 hidden",children:b.jsxs("div",{className:"flex justify-between items-start mb-3",children:[b.jsxs("div",{className:"flex-1",children:[b.jsx("h3",{className:"text-xl font-bold text-gray-900",children:x.ticket_label}),b.jsx("p",{className:"text-gray-600 text-sm mt-1",children:x.description}),x.features&&x.features.length>0&&b.jsx("ul",{className:"space-y-1 text-sm text-gray-600 mt-3",children:x.features.map((T,G)=>b.jsxs("li",{className:"flex items-center",children:[b.jsx(qf,{className:"w-4 h-4 mr-2 text-[#008888] flex-shrink-0"}),T]},G))}),Number(x.qty_available)<20&&b.jsx("p",{className:"text-sm text-red-500 mt-2",children:"Few tickets available!"})]}),b.jsxs("div",{className:"text-right ml-6",children:[b.jsxs("div",{className:"text-2xl font-bold text-[#008888] mb-4",children:["£",Number(x.price).toFixed(2)]}),b.jsxs("div",{className:"flex items-center gap-3",children:[b.jsx("button",{onClick:()=>v(x.id,-1),disabled:r[x.id]===0,className:"w-10 h-10 rounded-full bg-gray-200 hover:bg-gray-300 disabled:opacity-30 disabled:cursor-not-allowed flex items-center justify-center font-bold text-gray-700 transition-colors",children:"−"}),b.jsx("span",{className:"text-2xl font-bold text-gray-900 w-12 text-center",children:r[x.id]||0}),b.jsx("button",{onClick:()=>v(x.id,1),disabled:r[x.id]>=x.qty_available,className:"w-10 h-10 rounded-full bg-[#008888] hover:bg-[#006666] disabled:opacity-30 disabled:cursor-not-allowed flex items-center justify-center font-bold text-white transition-colors",children:"+"})]})]})]})},x.id)),b.jsxs("div",{className:"flex gap-4 pt-4",children:[b.jsx(We,{onClick:f,variant:"outline",className:"flex-1",children:"Back"}),b.jsx(We,{onClick:N,disabled:B()===0||R,className:"flex-1",children:R?"Validating...":"Continue to Checkout"})]})]})]})};var jf={exports:{}},Mf,Fd;function pv(){if(Fd)return Mf;Fd=1;var o="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED";return Mf=o,Mf}var Uf,Id;function Ev(){if(Id)return Uf;Id=1;var o=pv();function r(){}function v(){}return v.resetWarningCache=r,Uf=function(){function f(R,B,x,T,G,H){if(H!==o){var Q=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw Q.name="Invariant Violation",Q}}f.isRequired=f;function N(){return f}var C={array:f,bigint:f,bool:f,func:f,number:f,object:f,string:f,symbol:f,any:f,arrayOf:N,element:f,elementType:f,instanceOf:N,node:f,objectOf:N,oneOf:N,oneOfType:N,shape:N,exact:N,checkPropTypes:v,resetWarningCache:r};return C.PropTypes=C,C},Uf}var Pd;function Tv(){return Pd||(Pd=1,jf.exports=Ev()()),jf.exports}var zv=Tv();const gt=Rf(zv);function tm(o,r){var v=Object.keys(o);if(Object.getOwnPropertySymbols){var f=Object.getOwnPropertySymbols(o);r&&(f=f.filter(function(N){return Object.getOwnPropertyDescriptor(o,N).enumerable})),v.push.apply(v,f)}return v}function lm(o){for(var r=1;r<arguments.length;r++){var v=arguments[r]!=null?arguments[r]:{};r%2?tm(Object(v),!0).forEach(function(f){sm(o,f,v[f])}):Object.getOwnPropertyDescriptors?Object.defineProperties(o,Object.getOwnPropertyDescriptors(v)):tm(Object(v)).forEach(function(f){Object.defineProperty(o,f,Object.getOwnPropertyDescriptor(v,f))})}return o}function lc(o){"@babel/helpers - typeof";return typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?lc=function(r){return typeof r}:lc=function(r){return r&&typeof Symbol=="function"&&r.constructor===Symbol&&r!==Symbol.prototype?"symbol":typeof r},lc(o)}function sm(o,r,v){return r in o?Object.defineProperty(o,r,{value:v,enumerable:!0,configurable:!0,writable:!0}):o[r]=v,o}function Av(o,r){if(o==null)return{};var v={},f=Object.keys(o),N,C;for(C=0;C<f.length;C++)N=f[C],!(r.indexOf(N)>=0)&&(v[N]=o[N]);return v}function xv(o,r){if(o==null)return{};var v=Av(o,r),f,N;if(Object.getOwnPropertySymbols){var C=Object.getOwnPropertySymbols(o);for(N=0;N<C.length;N++)f=C[N],!(r.indexOf(f)>=0)&&Object.prototype.propertyIsEnumerable.call(o,f)&&(v[f]=o[f])}return v}function rm(o,r){return _v(o)||Ov(o,r)||Cv(o,r)||Nv()}function _v(o){if(Array.isArray(o))return o}function Ov(o,r){var v=o&&(typeof Symbol<"u"&&o[Symbol.iterator]||o["@@iterator"]);if(v!=null){var f=[],N=!0,C=!1,R,B;try{for(v=v.call(o);!(N=(R=v.next()).done)&&(f.push(R.value),!(r&&f.length===r));N=!0);}catch(x){C=!0,B=x}finally{try{!N&&v.return!=null&&v.return()}finally{if(C)throw B}}return f}}function Cv(o,r){if(o){if(typeof o=="string")return em(o,r);var v=Object.prototype.toString.call(o).slice(8,-1);if(v==="Object"&&o.constructor&&(v=o.constructor.name),v==="Map"||v==="Set")return Array.from(o);if(v==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(v))return em(o,r)}}function em(o,r){(r==null||r>o.length)&&(r=o.length);for(var v=0,f=new Array(r);v<r;v++)f[v]=o[v];return f}function Nv(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var Ft=function(r,v,f){var N=!!f,C=at.useRef(f);at.useEffect(function(){C.current=f},[f]),at.useEffect(function(){if(!N||!r)return function(){};var R=function(){C.current&&C.current.apply(C,arguments)};return r.on(v,R),function(){r.off(v,R)}},[N,v,r,C])},Df=function(r){var v=at.useRef(r);return at.useEffect(function(){v.current=r},[r]),v.current},Ha=function(r){return r!==null&&lc(r)==="object"},jv=function(r){return Ha(r)&&typeof r.then=="function"},Mv=function(r){return Ha(r)&&typeof r.elements=="function"&&typeof r.createToken=="function"&&typeof r.createPaymentMethod=="function"&&typeof r.confirmCardPayment=="function"},am="[object Object]",Uv=function o(r,v){if(!Ha(r)||!Ha(v))return r===v;var f=Array.isArray(r),N=Array.isArray(v);if(f!==N)return!1;var C=Object.prototype.toString.call(r)===am,R=Object.prototype.toString.call(v)===am;if(C!==R)return!1;if(!C&&!f)return r===v;var B=Object.keys(r),x=Object.keys(v);if(B.length!==x.length)return!1;for(var T={},G=0;G<B.length;G+=1)T[B[G]]=!0;for(var H=0;H<x.length;H+=1)T[x[H]]=!0;var Q=Object.keys(T);if(Q.length!==B.length)return!1;var w=r,dt=v,ft=function(Et){return o(w[Et],dt[Et])};return Q.every(ft)},Dv=function(r,v,f){return Ha(r)?Object.keys(r).reduce(function(N,C){var R=!Ha(v)||!Uv(r[C],v[C]);return f.includes(C)?(R&&console.warn("Unsupported prop change: options.".concat(C," is not a mutable property.")),N):R?lm(lm({},N||{}),{},sm({},C,r[C])):N},null):null},om="Invalid prop `stripe` supplied to `Elements`. We recommend using the `loadStripe` utility from `@stripe/stripe-js`. See https://stripe.com/docs/stripe-js/react#elements-props-stripe for details.",um=function(r){var v=arguments.length>1&&arguments[1]!==void 0?arguments[1]:om;if(r===null||Mv(r))return r;throw new Error(v)},Rv=function(r){var v=arguments.length>1&&arguments[1]!==void 0?arguments[1]:om;if(jv(r))return{tag:"async",stripePromise:Promise.resolve(r).then(function(N){return um(N,v)})};var f=um(r,v);return f===null?{tag:"empty"}:{tag:"sync",stripe:f}},Hv=function(r){!r||!r._registerWrapper||!r.registerAppInfo||(r._registerWrapper({name:"react-stripe-js",version:"5.4.1"}),r.registerAppInfo({name:"react-stripe-js",version:"5.4.1",url:"https://stripe.com/docs/stripe-js/react"}))},dm=at.createContext(null);dm.displayName="ElementsContext";var qv=function(r,v){if(!r)throw new Error("Could not find Elements context; You need to wrap the part of your app that ".concat(v," in an <Elements> provider."));return r};gt.any,gt.object;gt.func.isRequired;var mm=at.createContext(null);mm.displayName="CheckoutContext";gt.any,gt.shape({clientSecret:gt.oneOfType([gt.string,gt.instanceOf(Promise)]).isRequired,elementsOptions:gt.object}).isRequired;var nm=function(r){var v=at.useContext(mm),f=at.useContext(dm);if(v){if(f)throw new Error("You cannot wrap the part of your app that ".concat(r," in both <CheckoutProvider> and <Elements> providers."));return v}else return qv(f,r)},Bv=["mode"],Yv=function(r){return r.charAt(0).toUpperCase()+r.slice(1)},sl=function(r,v){var f="".concat(Yv(r),"Element"),N=function(x){var T=x.id,G=x.className,H=x.options,Q=H===void 0?{}:H,w=x.onBlur,dt=x.onFocus,ft=x.onReady,Kt=x.onChange,Et=x.onEscape,pl=x.onClick,xt=x.onLoadError,Jt=x.onLoaderStart,kt=x.onNetworksChange,qt=x.onConfirm,$=x.onCancel,Bt=x.onShippingAddressChange,Pt=x.onShippingRateChange,Rl=x.onSavedPaymentMethodRemove,tl=x.onSavedPaymentMethodUpdate,_t=nm("mounts <".concat(f,">")),ll="elements"in _t?_t.elements:null,jt="checkoutState"in _t?_t.checkoutState:null,K=jt?.type==="success"||jt?.type==="loading"?jt.sdk:null,p=at.useState(null),j=rm(p,2),D=j[0],I=j[1],F=at.useRef(null),m=at.useRef(null);Ft(D,"blur",w),Ft(D,"focus",dt),Ft(D,"escape",Et),Ft(D,"click",pl),Ft(D,"loaderror",xt),Ft(D,"loaderstart",Jt),Ft(D,"networkschange",kt),Ft(D,"confirm",qt),Ft(D,"cancel",$),Ft(D,"shippingaddresschange",Bt),Ft(D,"shippingratechange",Pt),Ft(D,"savedpaymentmethodremove",Rl),Ft(D,"savedpaymentmethodupdate",tl),Ft(D,"change",Kt);var _;ft&&(r==="expressCheckout"?_=ft:_=function(){ft(D)}),Ft(D,"ready",_),at.useLayoutEffect(function(){if(F.current===null&&m.current!==null&&(ll||K)){var M=null;if(K)switch(r){case"paymentForm":M=K.createPaymentFormElement();break;case"payment":M=K.createPaymentElement(Q);break;case"address":if("mode"in Q){var L=Q.mode,W=xv(Q,Bv);if(L==="shipping")M=K.createShippingAddressElement(W);else if(L==="billing")M=K.createBillingAddressElement(W);else throw new Error("Invalid options.mode. mode must be 'billing' or 'shipping'.")}else throw new Error("You must supply options.mode. mode must be 'billing' or 'shipping'.");break;case"expressCheckout":M=K.createExpressCheckoutElement(Q);break;case"currencySelector":M=K.createCurrencySelectorElement();break;case"taxId":M=K.createTaxIdElement(Q);break;default:throw new Error("Invalid Element type ".concat(f,". You must use either the <PaymentElement />, <AddressElement options={{mode: 'shipping'}} />, <AddressElement options={{mode: 'billing'}} />, or <ExpressCheckoutElement />."))}else ll&&(M=ll.create(r,Q));F.current=M,I(M),M&&M.mount(m.current)}},[ll,K,Q]);var U=Df(Q);return at.useEffect(function(){if(F.current){var M=Dv(Q,U,["paymentRequest"]);M&&"update"in F.current&&F.current.update(M)}},[Q,U]),at.useLayoutEffect(function(){return function(){if(F.current&&typeof F.current.destroy=="function")try{F.current.destroy(),F.current=null}catch{}}},[]),at.createElement("div",{id:T,className:G,ref:m})},C=function(x){nm("mounts <".concat(f,">"));var T=x.id,G=x.className;return at.createElement("div",{id:T,className:G})},R=v?C:N;return R.propTypes={id:gt.string,className:gt.string,onChange:gt.func,onBlur:gt.func,onFocus:gt.func,onReady:gt.func,onEscape:gt.func,onClick:gt.func,onLoadError:gt.func,onLoaderStart:gt.func,onNetworksChange:gt.func,onConfirm:gt.func,onCancel:gt.func,onShippingAddressChange:gt.func,onShippingRateChange:gt.func,onSavedPaymentMethodRemove:gt.func,onSavedPaymentMethodUpdate:gt.func,options:gt.object},R.displayName=f,R.__elementType=r,R},It=typeof window>"u",Bf=at.createContext(null);Bf.displayName="EmbeddedCheckoutProviderContext";var hm=function(){var r=at.useContext(Bf);if(!r)throw new Error("<EmbeddedCheckout> must be used within <EmbeddedCheckoutProvider>");return r},Gv="Invalid prop `stripe` supplied to `EmbeddedCheckoutProvider`. We recommend using the `loadStripe` utility from `@stripe/stripe-js`. See https://stripe.com/docs/stripe-js/react#elements-props-stripe for details.",Xv=function(r){var v=r.stripe,f=r.options,N=r.children,C=at.useMemo(function(){return Rv(v,Gv)},[v]),R=at.useRef(null),B=at.useRef(null),x=at.useState({embeddedCheckout:null}),T=rm(x,2),G=T[0],H=T[1];at.useEffect(function(){if(!(B.current||R.current)){var dt=function(Kt){B.current||R.current||(B.current=Kt,R.current=B.current.initEmbeddedCheckout(f).then(function(Et){H({embeddedCheckout:Et})}))};C.tag==="async"&&!B.current&&(f.clientSecret||f.fetchClientSecret)?C.stripePromise.then(function(ft){ft&&dt(ft)}):C.tag==="sync"&&!B.current&&(f.clientSecret||f.fetchClientSecret)&&dt(C.stripe)}},[C,f,G,B]),at.useEffect(function(){return function(){G.embeddedCheckout?(R.current=null,G.embeddedCheckout.destroy()):R.current&&R.current.then(function(){R.current=null,G.embeddedCheckout&&G.embeddedCheckout.destroy()})}},[G.embeddedCheckout]),at.useEffect(function(){Hv(B)},[B]);var Q=Df(v);at.useEffect(function(){Q!==null&&Q!==v&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the `stripe` prop after setting it.")},[Q,v]);var w=Df(f);return at.useEffect(function(){if(w!=null){if(f==null){console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot unset options after setting them.");return}f.clientSecret===void 0&&f.fetchClientSecret===void 0&&console.warn("Invalid props passed to EmbeddedCheckoutProvider: You must provide one of either `options.fetchClientSecret` or `options.clientSecret`."),w.clientSecret!=null&&f.clientSecret!==w.clientSecret&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the client secret after setting it. Unmount and create a new instance of EmbeddedCheckoutProvider instead."),w.fetchClientSecret!=null&&f.fetchClientSecret!==w.fetchClientSecret&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change fetchClientSecret after setting it. Unmount and create a new instance of EmbeddedCheckoutProvider instead."),w.onComplete!=null&&f.onComplete!==w.onComplete&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the onComplete option after setting it."),w.onShippingDetailsChange!=null&&f.onShippingDetailsChange!==w.onShippingDetailsChange&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the onShippingDetailsChange option after setting it."),w.onLineItemsChange!=null&&f.onLineItemsChange!==w.onLineItemsChange&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the onLineItemsChange option after setting it.")}},[w,f]),at.createElement(Bf.Provider,{value:G},N)},Qv=function(r){var v=r.id,f=r.className,N=hm(),C=N.embeddedCheckout,R=at.useRef(!1),B=at.useRef(null);return at.useLayoutEffect(function(){return!R.current&&C&&B.current!==null&&(C.mount(B.current),R.current=!0),function(){if(R.current&&C)try{C.unmount(),R.current=!1}catch{}}},[C]),at.createElement("div",{ref:B,id:v,className:f})},Zv=function(r){var v=r.id,f=r.className;return hm(),at.createElement("div",{id:v,className:f})},Lv=It?Zv:Qv;sl("auBankAccount",It);sl("card",It);sl("cardNumber",It);sl("cardExpiry",It);sl("cardCvc",It);sl("iban",It);sl("payment",It);sl("expressCheckout",It);sl("paymentRequestButton",It);sl("linkAuthentication",It);sl("address",It);sl("shippingAddress",It);sl("paymentMethodMessaging",It);sl("taxId",It);var vm="clover",Vv=function(r){return r===3?"v3":r},ym="https://js.stripe.com",Kv="".concat(ym,"/").concat(vm,"/stripe.js"),Jv=/^https:\/\/js\.stripe\.com\/v3\/?(\?.*)?$/,wv=/^https:\/\/js\.stripe\.com\/(v3|[a-z]+)\/stripe\.js(\?.*)?$/;var kv=function(r){return Jv.test(r)||wv.test(r)},Wv=function(){for(var r=document.querySelectorAll('script[src^="'.concat(ym,'"]')),v=0;v<r.length;v++){var f=r[v];if(kv(f.src))return f}return null},cm=function(r){var v="",f=document.createElement("script");f.src="".concat(Kv).concat(v);var N=document.head||document.body;if(!N)throw new Error("Expected document.body not to be null. Stripe.js requires a <body> element.");return N.appendChild(f),f},$v=function(r,v){!r||!r._registerWrapper||r._registerWrapper({name:"stripe-js",version:"8.5.3",startTime:v})},Mu=null,Pn=null,tc=null,Fv=function(r){return function(v){r(new Error("Failed to load Stripe.js",{cause:v}))}},Iv=function(r,v){return function(){window.Stripe?r(window.Stripe):v(new Error("Stripe.js not available"))}},Pv=function(r){return Mu!==null?Mu:(Mu=new Promise(function(v,f){if(typeof window>"u"||typeof document>"u"){v(null);return}if(window.Stripe){v(window.Stripe);return}try{var N=Wv();if(!(N&&r)){if(!N)N=cm(r);else if(N&&tc!==null&&Pn!==null){var C;N.removeEventListener("load",tc),N.removeEventListener("error",Pn),(C=N.parentNode)===null||C===void 0||C.removeChild(N),N=cm(r)}}tc=Iv(v,f),Pn=Fv(f),N.addEventListener("load",tc),N.addEventListener("error",Pn)}catch(R){f(R);return}}),Mu.catch(function(v){return Mu=null,Promise.reject(v)}))},ty=function(r,v,f){if(r===null)return null;var N=v[0],C=N.match(/^pk_test/),R=Vv(r.version),B=vm;C&&R!==B&&console.warn("Stripe.js@".concat(R," was loaded on the page, but @stripe/stripe-js@").concat("8.5.3"," expected Stripe.js@").concat(B,". This may result in unexpected behavior. For more information, see https://docs.stripe.com/sdks/stripejs-versioning"));var x=r.apply(void 0,v);return $v(x,f),x},Uu,gm=!1,Sm=function(){return Uu||(Uu=Pv(null).catch(function(r){return Uu=null,Promise.reject(r)}),Uu)};Promise.resolve().then(function(){return Sm()}).catch(function(o){gm||console.warn(o)});var ly=function(){for(var r=arguments.length,v=new Array(r),f=0;f<r;f++)v[f]=arguments[f];gm=!0;var N=Date.now();return Sm().then(function(C){return ty(C,v,N)})};const ey=ly("pk_test_YOUR_PUBLISHABLE_KEY"),ay=({clientSecret:o,sessionId:r,onBack:v,onComplete:f,concertName:N})=>{const[C,R]=At.useState("checkout"),[B,x]=At.useState(null),[T,G]=At.useState(0),H=async()=>{try{const dt=await(await fetch(`/api/tickets/order-status/?session_id=${r}`)).json();return dt.status==="confirmed"?(x(dt),R("complete"),!0):dt.status==="failed"?(R("error"),!0):!1}catch(w){return console.error("Error polling order status:",w),!1}};At.useEffect(()=>{if(C!=="confirming")return;const w=setInterval(async()=>{G(ft=>ft+1),await H()&&clearInterval(w),T>=30&&(clearInterval(w),R("error"))},1e3);return H(),()=>clearInterval(w)},[C,T,r]);const Q={clientSecret:o,onComplete:()=>{R("confirming"),G(0)}};return C==="error"?b.jsx(ae,{children:b.jsx(ue,{className:"p-12 text-center",children:b.jsxs("div",{className:"mb-4",children:[b.jsx("div",{className:"inline-flex items-center justify-center w-16 h-16 bg-red-100 rounded-full mb-4",children:b.jsx("svg",{className:"w-8 h-8 text-red-600",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:b.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M6 18L18 6M6 6l12 12"})})}),b.jsx("h3",{className:"text-2xl font-bold text-gray-900 mb-2",children:"Order Confirmation Issue"}),b.jsxs("p",{className:"text-gray-600 mb-6",children:["We're having trouble confirming your order. Your payment may have been processed. Please check your email or contact support with session ID:",b.jsxs("span",{className:"font-mono text-sm block mt-2",children:[r.substring(0,20),"..."]})]}),b.jsx(We,{onClick:v,children:"Back to Tickets"})]})})}):C==="confirming"?b.jsx(ae,{children:b.jsx(ue,{className:"p-12 text-center",children:b.jsxs("div",{className:"mb-4",children:[b.jsx(dv,{className:"w-16 h-16 text-[#008888] animate-spin mx-auto mb-4"}),b.jsx("h3",{className:"text-2xl font-bold text-gray-900 mb-2",children:"Confirming Your Order"}),b.jsx("p",{className:"text-gray-600",children:"Payment successful! We're finalizing your ticket reservation..."}),b.jsx("p",{className:"text-sm text-gray-500 mt-4",children:"This usually takes just a few seconds"})]})})}):C==="complete"&&B?b.jsx(ae,{children:b.jsxs(ue,{className:"p-12",children:[b.jsxs("div",{className:"text-center mb-8",children:[b.jsx("div",{className:"inline-flex items-center justify-center w-20 h-20 bg-green-100 rounded-full mb-4",children:b.jsx(qf,{className:"w-12 h-12 text-green-600"})}),b.jsx("h3",{className:"text-3xl font-bold text-gray-900 mb-2",children:"Order Confirmed!"}),b.jsx("p",{className:"text-lg text-gray-600",children:"Your tickets have been reserved"})]}),b.jsxs("div",{className:"bg-gray-50 rounded-lg p-6 mb-6",children:[b.jsx("h4",{className:"font-semibold text-gray-900 mb-3 text-lg",children:"Order Details"}),b.jsxs("div",{className:"space-y-2 text-gray-700",children:[b.jsxs("div",{className:"flex justify-between",children:[b.jsx("span",{children:"Event:"}),b.jsx("span",{className:"font-medium",children:B.concert_name})]}),b.jsxs("div",{className:"flex justify-between",children:[b.jsx("span",{children:"Order ID:"}),b.jsxs("span",{className:"font-mono text-sm",children:["#",B.order_id]})]}),B.total_amount&&b.jsxs("div",{className:"flex justify-between",children:[b.jsx("span",{children:"Total:"}),b.jsxs("span",{className:"font-medium",children:[B.currency==="GBP"?"£":B.currency,B.total_amount]})]})]})]}),b.jsx("div",{className:"bg-blue-50 border border-blue-200 rounded-lg p-4 mb-6",children:b.jsxs("div",{className:"flex items-start",children:[b.jsx(hv,{className:"w-5 h-5 text-blue-600 mt-0.5 mr-3 flex-shrink-0"}),b.jsxs("div",{children:[b.jsx("p",{className:"text-sm text-blue-900",children:b.jsx("strong",{children:"Confirmation email sent to:"})}),b.jsx("p",{className:"text-sm text-blue-800 mt-1",children:B.customer_email}),b.jsx("p",{className:"text-xs text-blue-700 mt-2",children:"Your tickets and receipt have been emailed. Please check your inbox and spam folder."})]})]})}),b.jsxs("div",{className:"space-y-3",children:[b.jsx(We,{onClick:f,className:"w-full",children:"Book More Tickets"}),b.jsxs(We,{onClick:()=>window.print(),variant:"outline",className:"w-full",children:[b.jsx(rv,{className:"w-4 h-4 mr-2"}),"Print Confirmation"]})]})]})}):b.jsxs(ae,{children:[b.jsx(ec,{children:b.jsx(ac,{className:"text-2xl",children:"Complete Your Purchase"})}),b.jsxs(ue,{children:[b.jsx("div",{className:"mb-4",children:b.jsx(We,{onClick:v,variant:"outline",className:"mb-4",children:"← Back to Tickets"})}),b.jsx("div",{id:"checkout",children:b.jsx(Xv,{stripe:ey,options:Q,children:b.jsx(Lv,{})})})]})]})},uy=({concert:o,ticketTypes:r,ticketQuantities:v})=>{const f=()=>Object.values(v).reduce((C,R)=>C+R,0),N=()=>r.reduce((C,R)=>C+R.price*(v[R.id]||0),0);return b.jsxs(ae,{className:"sticky top-24",children:[b.jsx(ec,{children:b.jsx(ac,{children:"Order Summary"})}),b.jsxs(ue,{className:"space-y-4",children:[o&&b.jsxs("div",{children:[b.jsx("h4",{className:"font-semibold text-gray-900 mb-2",children:"Concert"}),b.jsx("p",{className:"text-sm text-gray-600",children:o.concert_name}),b.jsx("p",{className:"text-sm text-gray-600",children:o.concert_date})]}),f()>0&&b.jsxs("div",{children:[b.jsx("h4",{className:"font-semibold text-gray-900 mb-2",children:"Tickets"}),r.map(C=>v[C.id]>0&&b.jsxs("div",{className:"flex justify-between text-sm text-gray-600 mb-1",children:[b.jsxs("span",{children:[C.ticket_label," × ",v[C.id]]}),b.jsxs("span",{children:["£",(C.price*v[C.id]).toFixed(2)]})]},C.id)),b.jsxs("div",{className:"text-sm text-gray-600 mt-2 pt-2 border-t",children:["Total Tickets: ",f()]})]}),b.jsxs("div",{className:"border-t pt-4",children:[b.jsxs("div",{className:"flex justify-between items-center mb-2",children:[b.jsx("span",{className:"text-gray-600",children:"Subtotal"}),b.jsxs("span",{className:"font-semibold",children:["£",N().toFixed(2)]})]}),b.jsxs("div",{className:"flex justify-between items-center text-lg font-bold pt-2 border-t",children:[b.jsx("span",{children:"Total"}),b.jsxs("span",{className:"text-[#008888]",children:["£",(N()*1.1).toFixed(2)]})]})]})]})]})};function ny(){const[o,r]=At.useState(1),[v,f]=At.useState([]),[N,C]=At.useState(null),[R,B]=At.useState([]),[x,T]=At.useState({}),[G,H]=At.useState(null),[Q,w]=At.useState(null),[dt,ft]=At.useState(!0),[Kt,Et]=At.useState(!1),[pl,xt]=At.useState(!1),[Jt,kt]=At.useState(!1);At.useEffect(()=>{qt()},[]);const qt=async()=>{ft(!0);try{const K=await In.getConcerts();f(K)}catch(K){console.error("Error fetching concerts:",K),alert("Failed to load concerts. Please try again.")}finally{ft(!1)}},$=async K=>{Et(!0);try{const p=await In.getTicketTypes(K);B(p);const j={};p.forEach(D=>{j[D.id]=0}),T(j)}catch(p){console.error("Error fetching ticket types:",p),alert("Failed to load ticket types. Please try again.")}finally{Et(!1)}},Bt=async()=>{if(!N)return!1;xt(!0);try{const K=await In.getTicketTypes(N);for(const p of K){const j=x[p.id]||0;if(j>p.qty_available)return alert(`Sorry, only ${p.qty_available} ${p.ticket_label} tickets are now available. Please adjust your selection.`),B(K),T(D=>({...D,[p.id]:Math.min(j,p.qty_available)})),!1}return!0}catch(K){return console.error("Error validating availability:",K),alert("Failed to validate ticket availability. Please try again."),!1}finally{xt(!1)}},Pt=K=>{C(K),$(K)},Rl=()=>{N&&r(2)},tl=(K,p)=>{T(j=>{const D=Math.max(0,(j[K]||0)+p),I=R.find(m=>m.id===K),F=I?I.qty_available:0;return{...j,[K]:Math.min(D,F)}})},_t=async()=>{if(await Bt()){kt(!0);try{const p=Object.entries(x).filter(([D,I])=>I>0).map(([D,I])=>({ticket_type_id:parseInt(D),quantity:I})),j=await In.createCheckoutSession(N,p);H(j.client_secret),w(j.session_id),r(3)}catch(p){console.error("Error creating checkout session:",p),alert("Failed to create checkout session. Please try again.")}finally{kt(!1)}}},ll=()=>{r(1),C(null),B([]),T({}),H(null),w(null)},jt=v.find(K=>K.id===N)||null;return b.jsxs("div",{className:"max-w-6xl mx-auto",children:[b.jsx(gv,{currentStep:o}),b.jsxs("div",{className:"grid lg:grid-cols-3 gap-8",children:[b.jsxs("div",{className:"lg:col-span-2",children:[o===1&&b.jsx(Sv,{concerts:v,selectedConcert:N,onSelectConcert:Pt,onContinue:Rl,loading:dt}),o===2&&b.jsx(bv,{ticketTypes:R,ticketQuantities:x,onQuantityChange:tl,onBack:()=>r(1),onContinue:_t,loading:Kt,validating:pl||Jt}),o===3&&G&&Q&&b.jsx(ay,{clientSecret:G,sessionId:Q,onBack:()=>{r(2),H(null),w(null)},onComplete:ll,concertName:jt?.concert_name||""})]}),b.jsx("div",{className:"lg:col-span-1",children:b.jsx(uy,{concert:jt,ticketTypes:R,ticketQuantities:x})})]})]})}const im=document.getElementById("ticketing-root");im&&Ih.createRoot(im).render(b.jsx(at.StrictMode,{children:b.jsx(ny,{})}));
+`).replace(rh,"")}function id(t,l){return l=cd(l),cd(t)===l}function ht(t,l,e,a,u,n){switch(e){case"children":typeof a=="string"?l==="body"||l==="textarea"&&a===""||aa(t,a):(typeof a=="number"||typeof a=="bigint")&&l!=="body"&&aa(t,""+a);break;case"className":Xu(t,"class",a);break;case"tabIndex":Xu(t,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Xu(t,e,a);break;case"style":cs(t,a,n);break;case"data":if(l!=="object"){Xu(t,"data",a);break}case"src":case"href":if(a===""&&(l!=="a"||e!=="href")){t.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Zu(""+a),t.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){t.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(e==="formAction"?(l!=="input"&&ht(t,l,"name",u.name,u,null),ht(t,l,"formEncType",u.formEncType,u,null),ht(t,l,"formMethod",u.formMethod,u,null),ht(t,l,"formTarget",u.formTarget,u,null)):(ht(t,l,"encType",u.encType,u,null),ht(t,l,"method",u.method,u,null),ht(t,l,"target",u.target,u,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Zu(""+a),t.setAttribute(e,a);break;case"onClick":a!=null&&(t.onclick=Xl);break;case"onScroll":a!=null&&tt("scroll",t);break;case"onScrollEnd":a!=null&&tt("scrollend",t);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(f(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(f(60));t.innerHTML=e}}break;case"multiple":t.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":t.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){t.removeAttribute("xlink:href");break}e=Zu(""+a),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""+a):t.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""):t.removeAttribute(e);break;case"capture":case"download":a===!0?t.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,a):t.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?t.setAttribute(e,a):t.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?t.removeAttribute(e):t.setAttribute(e,a);break;case"popover":tt("beforetoggle",t),tt("toggle",t),Gu(t,"popover",a);break;case"xlinkActuate":Gl(t,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Gl(t,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Gl(t,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Gl(t,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Gl(t,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Gl(t,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Gl(t,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Gl(t,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Gl(t,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Gu(t,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=Ym.get(e)||e,Gu(t,e,a))}}function uf(t,l,e,a,u,n){switch(e){case"style":cs(t,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(f(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(f(60));t.innerHTML=e}}break;case"children":typeof a=="string"?aa(t,a):(typeof a=="number"||typeof a=="bigint")&&aa(t,""+a);break;case"onScroll":a!=null&&tt("scroll",t);break;case"onScrollEnd":a!=null&&tt("scrollend",t);break;case"onClick":a!=null&&(t.onclick=Xl);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Ff.hasOwnProperty(e))t:{if(e[0]==="o"&&e[1]==="n"&&(u=e.endsWith("Capture"),l=e.slice(2,u?e.length-7:void 0),n=t[el]||null,n=n!=null?n[e]:null,typeof n=="function"&&t.removeEventListener(l,n,u),typeof a=="function")){typeof n!="function"&&n!==null&&(e in t?t[e]=null:t.hasAttribute(e)&&t.removeAttribute(e)),t.addEventListener(l,a,u);break t}e in t?t[e]=a:a===!0?t.setAttribute(e,""):Gu(t,e,a)}}}function Vt(t,l,e){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":tt("error",t),tt("load",t);var a=!1,u=!1,n;for(n in e)if(e.hasOwnProperty(n)){var c=e[n];if(c!=null)switch(n){case"src":a=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(f(137,l));default:ht(t,l,n,c,e,null)}}u&&ht(t,l,"srcSet",e.srcSet,e,null),a&&ht(t,l,"src",e.src,e,null);return;case"input":tt("invalid",t);var i=n=c=u=null,s=null,g=null;for(a in e)if(e.hasOwnProperty(a)){var z=e[a];if(z!=null)switch(a){case"name":u=z;break;case"type":c=z;break;case"checked":s=z;break;case"defaultChecked":g=z;break;case"value":n=z;break;case"defaultValue":i=z;break;case"children":case"dangerouslySetInnerHTML":if(z!=null)throw Error(f(137,l));break;default:ht(t,l,a,z,e,null)}}es(t,n,i,s,g,c,u,!1);return;case"select":tt("invalid",t),a=c=n=null;for(u in e)if(e.hasOwnProperty(u)&&(i=e[u],i!=null))switch(u){case"value":n=i;break;case"defaultValue":c=i;break;case"multiple":a=i;default:ht(t,l,u,i,e,null)}l=n,e=c,t.multiple=!!a,l!=null?ea(t,!!a,l,!1):e!=null&&ea(t,!!a,e,!0);return;case"textarea":tt("invalid",t),n=u=a=null;for(c in e)if(e.hasOwnProperty(c)&&(i=e[c],i!=null))switch(c){case"value":a=i;break;case"defaultValue":u=i;break;case"children":n=i;break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(f(91));break;default:ht(t,l,c,i,e,null)}us(t,a,u,n);return;case"option":for(s in e)if(e.hasOwnProperty(s)&&(a=e[s],a!=null))switch(s){case"selected":t.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:ht(t,l,s,a,e,null)}return;case"dialog":tt("beforetoggle",t),tt("toggle",t),tt("cancel",t),tt("close",t);break;case"iframe":case"object":tt("load",t);break;case"video":case"audio":for(a=0;a<pu.length;a++)tt(pu[a],t);break;case"image":tt("error",t),tt("load",t);break;case"details":tt("toggle",t);break;case"embed":case"source":case"link":tt("error",t),tt("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(g in e)if(e.hasOwnProperty(g)&&(a=e[g],a!=null))switch(g){case"children":case"dangerouslySetInnerHTML":throw Error(f(137,l));default:ht(t,l,g,a,e,null)}return;default:if(Sc(l)){for(z in e)e.hasOwnProperty(z)&&(a=e[z],a!==void 0&&uf(t,l,z,a,e,void 0));return}}for(i in e)e.hasOwnProperty(i)&&(a=e[i],a!=null&&ht(t,l,i,a,e,null))}function oh(t,l,e,a){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,c=null,i=null,s=null,g=null,z=null;for(E in e){var O=e[E];if(e.hasOwnProperty(E)&&O!=null)switch(E){case"checked":break;case"value":break;case"defaultValue":s=O;default:a.hasOwnProperty(E)||ht(t,l,E,null,a,O)}}for(var S in a){var E=a[S];if(O=e[S],a.hasOwnProperty(S)&&(E!=null||O!=null))switch(S){case"type":n=E;break;case"name":u=E;break;case"checked":g=E;break;case"defaultChecked":z=E;break;case"value":c=E;break;case"defaultValue":i=E;break;case"children":case"dangerouslySetInnerHTML":if(E!=null)throw Error(f(137,l));break;default:E!==O&&ht(t,l,S,E,a,O)}}yc(t,c,i,s,g,z,n,u);return;case"select":E=c=i=S=null;for(n in e)if(s=e[n],e.hasOwnProperty(n)&&s!=null)switch(n){case"value":break;case"multiple":E=s;default:a.hasOwnProperty(n)||ht(t,l,n,null,a,s)}for(u in a)if(n=a[u],s=e[u],a.hasOwnProperty(u)&&(n!=null||s!=null))switch(u){case"value":S=n;break;case"defaultValue":i=n;break;case"multiple":c=n;default:n!==s&&ht(t,l,u,n,a,s)}l=i,e=c,a=E,S!=null?ea(t,!!e,S,!1):!!a!=!!e&&(l!=null?ea(t,!!e,l,!0):ea(t,!!e,e?[]:"",!1));return;case"textarea":E=S=null;for(i in e)if(u=e[i],e.hasOwnProperty(i)&&u!=null&&!a.hasOwnProperty(i))switch(i){case"value":break;case"children":break;default:ht(t,l,i,null,a,u)}for(c in a)if(u=a[c],n=e[c],a.hasOwnProperty(c)&&(u!=null||n!=null))switch(c){case"value":S=u;break;case"defaultValue":E=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(f(91));break;default:u!==n&&ht(t,l,c,u,a,n)}as(t,S,E);return;case"option":for(var q in e)if(S=e[q],e.hasOwnProperty(q)&&S!=null&&!a.hasOwnProperty(q))switch(q){case"selected":t.selected=!1;break;default:ht(t,l,q,null,a,S)}for(s in a)if(S=a[s],E=e[s],a.hasOwnProperty(s)&&S!==E&&(S!=null||E!=null))switch(s){case"selected":t.selected=S&&typeof S!="function"&&typeof S!="symbol";break;default:ht(t,l,s,S,a,E)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var Z in e)S=e[Z],e.hasOwnProperty(Z)&&S!=null&&!a.hasOwnProperty(Z)&&ht(t,l,Z,null,a,S);for(g in a)if(S=a[g],E=e[g],a.hasOwnProperty(g)&&S!==E&&(S!=null||E!=null))switch(g){case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(f(137,l));break;default:ht(t,l,g,S,a,E)}return;default:if(Sc(l)){for(var vt in e)S=e[vt],e.hasOwnProperty(vt)&&S!==void 0&&!a.hasOwnProperty(vt)&&uf(t,l,vt,void 0,a,S);for(z in a)S=a[z],E=e[z],!a.hasOwnProperty(z)||S===E||S===void 0&&E===void 0||uf(t,l,z,S,a,E);return}}for(var h in e)S=e[h],e.hasOwnProperty(h)&&S!=null&&!a.hasOwnProperty(h)&&ht(t,l,h,null,a,S);for(O in a)S=a[O],E=e[O],!a.hasOwnProperty(O)||S===E||S==null&&E==null||ht(t,l,O,S,a,E)}function fd(t){switch(t){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function dh(){if(typeof performance.getEntriesByType=="function"){for(var t=0,l=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var u=e[a],n=u.transferSize,c=u.initiatorType,i=u.duration;if(n&&i&&fd(c)){for(c=0,i=u.responseEnd,a+=1;a<e.length;a++){var s=e[a],g=s.startTime;if(g>i)break;var z=s.transferSize,O=s.initiatorType;z&&fd(O)&&(s=s.responseEnd,c+=z*(s<i?1:(i-g)/(s-g)))}if(--a,l+=8*(n+c)/(u.duration/1e3),t++,10<t)break}}if(0<t)return l/t/1e6}return navigator.connection&&(t=navigator.connection.downlink,typeof t=="number")?t:5}var nf=null,cf=null;function Yn(t){return t.nodeType===9?t:t.ownerDocument}function sd(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function rd(t,l){if(t===0)switch(l){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&l==="foreignObject"?0:t}function ff(t,l){return t==="textarea"||t==="noscript"||typeof l.children=="string"||typeof l.children=="number"||typeof l.children=="bigint"||typeof l.dangerouslySetInnerHTML=="object"&&l.dangerouslySetInnerHTML!==null&&l.dangerouslySetInnerHTML.__html!=null}var sf=null;function mh(){var t=window.event;return t&&t.type==="popstate"?t===sf?!1:(sf=t,!0):(sf=null,!1)}var od=typeof setTimeout=="function"?setTimeout:void 0,hh=typeof clearTimeout=="function"?clearTimeout:void 0,dd=typeof Promise=="function"?Promise:void 0,vh=typeof queueMicrotask=="function"?queueMicrotask:typeof dd<"u"?function(t){return dd.resolve(null).then(t).catch(yh)}:od;function yh(t){setTimeout(function(){throw t})}function Ae(t){return t==="head"}function md(t,l){var e=l,a=0;do{var u=e.nextSibling;if(t.removeChild(e),u&&u.nodeType===8)if(e=u.data,e==="/$"||e==="/&"){if(a===0){t.removeChild(u),Ra(l);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Tu(t.ownerDocument.documentElement);else if(e==="head"){e=t.ownerDocument.head,Tu(e);for(var n=e.firstChild;n;){var c=n.nextSibling,i=n.nodeName;n[Xa]||i==="SCRIPT"||i==="STYLE"||i==="LINK"&&n.rel.toLowerCase()==="stylesheet"||e.removeChild(n),n=c}}else e==="body"&&Tu(t.ownerDocument.body);e=u}while(e);Ra(l)}function hd(t,l){var e=t;t=0;do{var a=e.nextSibling;if(e.nodeType===1?l?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(l?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(t===0)break;t--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||t++;e=a}while(e)}function rf(t){var l=t.firstChild;for(l&&l.nodeType===10&&(l=l.nextSibling);l;){var e=l;switch(l=l.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":rf(e),hc(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}t.removeChild(e)}}function gh(t,l,e,a){for(;t.nodeType===1;){var u=e;if(t.nodeName.toLowerCase()!==l.toLowerCase()){if(!a&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(a){if(!t[Xa])switch(l){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(n=t.getAttribute("rel"),n==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(n!==u.rel||t.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||t.getAttribute("title")!==(u.title==null?null:u.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(n=t.getAttribute("src"),(n!==(u.src==null?null:u.src)||t.getAttribute("type")!==(u.type==null?null:u.type)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(l==="input"&&t.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&t.getAttribute("name")===n)return t}else return t;if(t=Nl(t.nextSibling),t===null)break}return null}function Sh(t,l,e){if(l==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!e||(t=Nl(t.nextSibling),t===null))return null;return t}function vd(t,l){for(;t.nodeType!==8;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!l||(t=Nl(t.nextSibling),t===null))return null;return t}function of(t){return t.data==="$?"||t.data==="$~"}function df(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState!=="loading"}function bh(t,l){var e=t.ownerDocument;if(t.data==="$~")t._reactRetry=l;else if(t.data!=="$?"||e.readyState!=="loading")l();else{var a=function(){l(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),t._reactRetry=a}}function Nl(t){for(;t!=null;t=t.nextSibling){var l=t.nodeType;if(l===1||l===3)break;if(l===8){if(l=t.data,l==="$"||l==="$!"||l==="$?"||l==="$~"||l==="&"||l==="F!"||l==="F")break;if(l==="/$"||l==="/&")return null}}return t}var mf=null;function yd(t){t=t.nextSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="/$"||e==="/&"){if(l===0)return Nl(t.nextSibling);l--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||l++}t=t.nextSibling}return null}function gd(t){t=t.previousSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(l===0)return t;l--}else e!=="/$"&&e!=="/&"||l++}t=t.previousSibling}return null}function Sd(t,l,e){switch(l=Yn(e),t){case"html":if(t=l.documentElement,!t)throw Error(f(452));return t;case"head":if(t=l.head,!t)throw Error(f(453));return t;case"body":if(t=l.body,!t)throw Error(f(454));return t;default:throw Error(f(451))}}function Tu(t){for(var l=t.attributes;l.length;)t.removeAttributeNode(l[0]);hc(t)}var jl=new Map,bd=new Set;function Gn(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var ee=j.d;j.d={f:ph,r:Eh,D:Th,C:zh,L:Ah,m:xh,X:Oh,S:_h,M:Ch};function ph(){var t=ee.f(),l=jn();return t||l}function Eh(t){var l=Pe(t);l!==null&&l.tag===5&&l.type==="form"?Hr(l):ee.r(t)}var Ma=typeof document>"u"?null:document;function pd(t,l,e){var a=Ma;if(a&&typeof l=="string"&&l){var u=Tl(l);u='link[rel="'+t+'"][href="'+u+'"]',typeof e=="string"&&(u+='[crossorigin="'+e+'"]'),bd.has(u)||(bd.add(u),t={rel:t,crossOrigin:e,href:l},a.querySelector(u)===null&&(l=a.createElement("link"),Vt(l,"link",t),Yt(l),a.head.appendChild(l)))}}function Th(t){ee.D(t),pd("dns-prefetch",t,null)}function zh(t,l){ee.C(t,l),pd("preconnect",t,l)}function Ah(t,l,e){ee.L(t,l,e);var a=Ma;if(a&&t&&l){var u='link[rel="preload"][as="'+Tl(l)+'"]';l==="image"&&e&&e.imageSrcSet?(u+='[imagesrcset="'+Tl(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(u+='[imagesizes="'+Tl(e.imageSizes)+'"]')):u+='[href="'+Tl(t)+'"]';var n=u;switch(l){case"style":n=Ua(t);break;case"script":n=Da(t)}jl.has(n)||(t=H({rel:"preload",href:l==="image"&&e&&e.imageSrcSet?void 0:t,as:l},e),jl.set(n,t),a.querySelector(u)!==null||l==="style"&&a.querySelector(zu(n))||l==="script"&&a.querySelector(Au(n))||(l=a.createElement("link"),Vt(l,"link",t),Yt(l),a.head.appendChild(l)))}}function xh(t,l){ee.m(t,l);var e=Ma;if(e&&t){var a=l&&typeof l.as=="string"?l.as:"script",u='link[rel="modulepreload"][as="'+Tl(a)+'"][href="'+Tl(t)+'"]',n=u;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Da(t)}if(!jl.has(n)&&(t=H({rel:"modulepreload",href:t},l),jl.set(n,t),e.querySelector(u)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(Au(n)))return}a=e.createElement("link"),Vt(a,"link",t),Yt(a),e.head.appendChild(a)}}}function _h(t,l,e){ee.S(t,l,e);var a=Ma;if(a&&t){var u=ta(a).hoistableStyles,n=Ua(t);l=l||"default";var c=u.get(n);if(!c){var i={loading:0,preload:null};if(c=a.querySelector(zu(n)))i.loading=5;else{t=H({rel:"stylesheet",href:t,"data-precedence":l},e),(e=jl.get(n))&&hf(t,e);var s=c=a.createElement("link");Yt(s),Vt(s,"link",t),s._p=new Promise(function(g,z){s.onload=g,s.onerror=z}),s.addEventListener("load",function(){i.loading|=1}),s.addEventListener("error",function(){i.loading|=2}),i.loading|=4,Xn(c,l,a)}c={type:"stylesheet",instance:c,count:1,state:i},u.set(n,c)}}}function Oh(t,l){ee.X(t,l);var e=Ma;if(e&&t){var a=ta(e).hoistableScripts,u=Da(t),n=a.get(u);n||(n=e.querySelector(Au(u)),n||(t=H({src:t,async:!0},l),(l=jl.get(u))&&vf(t,l),n=e.createElement("script"),Yt(n),Vt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function Ch(t,l){ee.M(t,l);var e=Ma;if(e&&t){var a=ta(e).hoistableScripts,u=Da(t),n=a.get(u);n||(n=e.querySelector(Au(u)),n||(t=H({src:t,async:!0,type:"module"},l),(l=jl.get(u))&&vf(t,l),n=e.createElement("script"),Yt(n),Vt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function Ed(t,l,e,a){var u=(u=W.current)?Gn(u):null;if(!u)throw Error(f(446));switch(t){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(l=Ua(e.href),e=ta(u).hoistableStyles,a=e.get(l),a||(a={type:"style",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){t=Ua(e.href);var n=ta(u).hoistableStyles,c=n.get(t);if(c||(u=u.ownerDocument||u,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(t,c),(n=u.querySelector(zu(t)))&&!n._p&&(c.instance=n,c.state.loading=5),jl.has(t)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},jl.set(t,e),n||Nh(u,t,e,c.state))),l&&a===null)throw Error(f(528,""));return c}if(l&&a!==null)throw Error(f(529,""));return null;case"script":return l=e.async,e=e.src,typeof e=="string"&&l&&typeof l!="function"&&typeof l!="symbol"?(l=Da(e),e=ta(u).hoistableScripts,a=e.get(l),a||(a={type:"script",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(f(444,t))}}function Ua(t){return'href="'+Tl(t)+'"'}function zu(t){return'link[rel="stylesheet"]['+t+"]"}function Td(t){return H({},t,{"data-precedence":t.precedence,precedence:null})}function Nh(t,l,e,a){t.querySelector('link[rel="preload"][as="style"]['+l+"]")?a.loading=1:(l=t.createElement("link"),a.preload=l,l.addEventListener("load",function(){return a.loading|=1}),l.addEventListener("error",function(){return a.loading|=2}),Vt(l,"link",e),Yt(l),t.head.appendChild(l))}function Da(t){return'[src="'+Tl(t)+'"]'}function Au(t){return"script[async]"+t}function zd(t,l,e){if(l.count++,l.instance===null)switch(l.type){case"style":var a=t.querySelector('style[data-href~="'+Tl(e.href)+'"]');if(a)return l.instance=a,Yt(a),a;var u=H({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(t.ownerDocument||t).createElement("style"),Yt(a),Vt(a,"style",u),Xn(a,e.precedence,t),l.instance=a;case"stylesheet":u=Ua(e.href);var n=t.querySelector(zu(u));if(n)return l.state.loading|=4,l.instance=n,Yt(n),n;a=Td(e),(u=jl.get(u))&&hf(a,u),n=(t.ownerDocument||t).createElement("link"),Yt(n);var c=n;return c._p=new Promise(function(i,s){c.onload=i,c.onerror=s}),Vt(n,"link",a),l.state.loading|=4,Xn(n,e.precedence,t),l.instance=n;case"script":return n=Da(e.src),(u=t.querySelector(Au(n)))?(l.instance=u,Yt(u),u):(a=e,(u=jl.get(n))&&(a=H({},e),vf(a,u)),t=t.ownerDocument||t,u=t.createElement("script"),Yt(u),Vt(u,"link",a),t.head.appendChild(u),l.instance=u);case"void":return null;default:throw Error(f(443,l.type))}else l.type==="stylesheet"&&(l.state.loading&4)===0&&(a=l.instance,l.state.loading|=4,Xn(a,e.precedence,t));return l.instance}function Xn(t,l,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=a.length?a[a.length-1]:null,n=u,c=0;c<a.length;c++){var i=a[c];if(i.dataset.precedence===l)n=i;else if(n!==u)break}n?n.parentNode.insertBefore(t,n.nextSibling):(l=e.nodeType===9?e.head:e,l.insertBefore(t,l.firstChild))}function hf(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.title==null&&(t.title=l.title)}function vf(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.integrity==null&&(t.integrity=l.integrity)}var Qn=null;function Ad(t,l,e){if(Qn===null){var a=new Map,u=Qn=new Map;u.set(e,a)}else u=Qn,a=u.get(e),a||(a=new Map,u.set(e,a));if(a.has(t))return a;for(a.set(t,null),e=e.getElementsByTagName(t),u=0;u<e.length;u++){var n=e[u];if(!(n[Xa]||n[Xt]||t==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(l)||"";c=t+c;var i=a.get(c);i?i.push(n):a.set(c,[n])}}return a}function xd(t,l,e){t=t.ownerDocument||t,t.head.insertBefore(e,l==="title"?t.querySelector("head > title"):null)}function jh(t,l,e){if(e===1||l.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof l.precedence!="string"||typeof l.href!="string"||l.href==="")break;return!0;case"link":if(typeof l.rel!="string"||typeof l.href!="string"||l.href===""||l.onLoad||l.onError)break;switch(l.rel){case"stylesheet":return t=l.disabled,typeof l.precedence=="string"&&t==null;default:return!0}case"script":if(l.async&&typeof l.async!="function"&&typeof l.async!="symbol"&&!l.onLoad&&!l.onError&&l.src&&typeof l.src=="string")return!0}return!1}function _d(t){return!(t.type==="stylesheet"&&(t.state.loading&3)===0)}function Mh(t,l,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var u=Ua(a.href),n=l.querySelector(zu(u));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(t.count++,t=Zn.bind(t),l.then(t,t)),e.state.loading|=4,e.instance=n,Yt(n);return}n=l.ownerDocument||l,a=Td(a),(u=jl.get(u))&&hf(a,u),n=n.createElement("link"),Yt(n);var c=n;c._p=new Promise(function(i,s){c.onload=i,c.onerror=s}),Vt(n,"link",a),e.instance=n}t.stylesheets===null&&(t.stylesheets=new Map),t.stylesheets.set(e,l),(l=e.state.preload)&&(e.state.loading&3)===0&&(t.count++,e=Zn.bind(t),l.addEventListener("load",e),l.addEventListener("error",e))}}var yf=0;function Uh(t,l){return t.stylesheets&&t.count===0&&Vn(t,t.stylesheets),0<t.count||0<t.imgCount?function(e){var a=setTimeout(function(){if(t.stylesheets&&Vn(t,t.stylesheets),t.unsuspend){var n=t.unsuspend;t.unsuspend=null,n()}},6e4+l);0<t.imgBytes&&yf===0&&(yf=62500*dh());var u=setTimeout(function(){if(t.waitingForImages=!1,t.count===0&&(t.stylesheets&&Vn(t,t.stylesheets),t.unsuspend)){var n=t.unsuspend;t.unsuspend=null,n()}},(t.imgBytes>yf?50:800)+l);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(a),clearTimeout(u)}}:null}function Zn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Vn(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var Ln=null;function Vn(t,l){t.stylesheets=null,t.unsuspend!==null&&(t.count++,Ln=new Map,l.forEach(Dh,t),Ln=null,Zn.call(t))}function Dh(t,l){if(!(l.state.loading&4)){var e=Ln.get(t);if(e)var a=e.get(null);else{e=new Map,Ln.set(t,e);for(var u=t.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var c=u[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(e.set(c.dataset.precedence,c),a=c)}a&&e.set(null,a)}u=l.instance,c=u.getAttribute("data-precedence"),n=e.get(c)||a,n===a&&e.set(null,u),e.set(c,u),this.count++,a=Zn.bind(this),u.addEventListener("load",a),u.addEventListener("error",a),n?n.parentNode.insertBefore(u,n.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(u,t.firstChild)),l.state.loading|=4}}var xu={$$typeof:xt,Provider:null,Consumer:null,_currentValue:D,_currentValue2:D,_threadCount:0};function Rh(t,l,e,a,u,n,c,i,s){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=rc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=rc(0),this.hiddenUpdates=rc(null),this.identifierPrefix=a,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=s,this.incompleteTransitions=new Map}function Od(t,l,e,a,u,n,c,i,s,g,z,O){return t=new Rh(t,l,e,c,s,g,z,O,i),l=1,n===!0&&(l|=24),n=hl(3,null,null,l),t.current=n,n.stateNode=t,l=kc(),l.refCount++,t.pooledCache=l,l.refCount++,n.memoizedState={element:a,isDehydrated:e,cache:l},Ic(n),t}function Cd(t){return t?(t=ra,t):ra}function Nd(t,l,e,a,u,n){u=Cd(u),a.context===null?a.context=u:a.pendingContext=u,a=me(l),a.payload={element:e},n=n===void 0?null:n,n!==null&&(a.callback=n),e=he(t,a,l),e!==null&&(fl(e,t,l),au(e,t,l))}function jd(t,l){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var e=t.retryLane;t.retryLane=e!==0&&e<l?e:l}}function gf(t,l){jd(t,l),(t=t.alternate)&&jd(t,l)}function Md(t){if(t.tag===13||t.tag===31){var l=qe(t,67108864);l!==null&&fl(l,t,67108864),gf(t,67108864)}}function Ud(t){if(t.tag===13||t.tag===31){var l=bl();l=oc(l);var e=qe(t,l);e!==null&&fl(e,t,l),gf(t,l)}}var Kn=!0;function Hh(t,l,e,a){var u=p.T;p.T=null;var n=j.p;try{j.p=2,Sf(t,l,e,a)}finally{j.p=n,p.T=u}}function qh(t,l,e,a){var u=p.T;p.T=null;var n=j.p;try{j.p=8,Sf(t,l,e,a)}finally{j.p=n,p.T=u}}function Sf(t,l,e,a){if(Kn){var u=bf(a);if(u===null)af(t,l,a,Jn,e),Rd(t,a);else if(Yh(u,t,l,e,a))a.stopPropagation();else if(Rd(t,a),l&4&&-1<Bh.indexOf(t)){for(;u!==null;){var n=Pe(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=Me(n.pendingLanes);if(c!==0){var i=n;for(i.pendingLanes|=2,i.entangledLanes|=2;c;){var s=1<<31-dl(c);i.entanglements[1]|=s,c&=~s}Yl(n),(it&6)===0&&(Cn=rl()+500,bu(0))}}break;case 31:case 13:i=qe(n,2),i!==null&&fl(i,n,2),jn(),gf(n,2)}if(n=bf(a),n===null&&af(t,l,a,Jn,e),n===u)break;u=n}u!==null&&a.stopPropagation()}else af(t,l,a,null,e)}}function bf(t){return t=pc(t),pf(t)}var Jn=null;function pf(t){if(Jn=null,t=Ie(t),t!==null){var l=C(t);if(l===null)t=null;else{var e=l.tag;if(e===13){if(t=R(l),t!==null)return t;t=null}else if(e===31){if(t=B(l),t!==null)return t;t=null}else if(e===3){if(l.stateNode.current.memoizedState.isDehydrated)return l.tag===3?l.stateNode.containerInfo:null;t=null}else l!==t&&(t=null)}}return Jn=t,null}function Dd(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Tm()){case Xf:return 2;case Qf:return 8;case Ru:case zm:return 32;case Zf:return 268435456;default:return 32}default:return 32}}var Ef=!1,xe=null,_e=null,Oe=null,_u=new Map,Ou=new Map,Ce=[],Bh="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Rd(t,l){switch(t){case"focusin":case"focusout":xe=null;break;case"dragenter":case"dragleave":_e=null;break;case"mouseover":case"mouseout":Oe=null;break;case"pointerover":case"pointerout":_u.delete(l.pointerId);break;case"gotpointercapture":case"lostpointercapture":Ou.delete(l.pointerId)}}function Cu(t,l,e,a,u,n){return t===null||t.nativeEvent!==n?(t={blockedOn:l,domEventName:e,eventSystemFlags:a,nativeEvent:n,targetContainers:[u]},l!==null&&(l=Pe(l),l!==null&&Md(l)),t):(t.eventSystemFlags|=a,l=t.targetContainers,u!==null&&l.indexOf(u)===-1&&l.push(u),t)}function Yh(t,l,e,a,u){switch(l){case"focusin":return xe=Cu(xe,t,l,e,a,u),!0;case"dragenter":return _e=Cu(_e,t,l,e,a,u),!0;case"mouseover":return Oe=Cu(Oe,t,l,e,a,u),!0;case"pointerover":var n=u.pointerId;return _u.set(n,Cu(_u.get(n)||null,t,l,e,a,u)),!0;case"gotpointercapture":return n=u.pointerId,Ou.set(n,Cu(Ou.get(n)||null,t,l,e,a,u)),!0}return!1}function Hd(t){var l=Ie(t.target);if(l!==null){var e=C(l);if(e!==null){if(l=e.tag,l===13){if(l=R(e),l!==null){t.blockedOn=l,kf(t.priority,function(){Ud(e)});return}}else if(l===31){if(l=B(e),l!==null){t.blockedOn=l,kf(t.priority,function(){Ud(e)});return}}else if(l===3&&e.stateNode.current.memoizedState.isDehydrated){t.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}t.blockedOn=null}function wn(t){if(t.blockedOn!==null)return!1;for(var l=t.targetContainers;0<l.length;){var e=bf(t.nativeEvent);if(e===null){e=t.nativeEvent;var a=new e.constructor(e.type,e);bc=a,e.target.dispatchEvent(a),bc=null}else return l=Pe(e),l!==null&&Md(l),t.blockedOn=e,!1;l.shift()}return!0}function qd(t,l,e){wn(t)&&e.delete(l)}function Gh(){Ef=!1,xe!==null&&wn(xe)&&(xe=null),_e!==null&&wn(_e)&&(_e=null),Oe!==null&&wn(Oe)&&(Oe=null),_u.forEach(qd),Ou.forEach(qd)}function kn(t,l){t.blockedOn===l&&(t.blockedOn=null,Ef||(Ef=!0,o.unstable_scheduleCallback(o.unstable_NormalPriority,Gh)))}var Wn=null;function Bd(t){Wn!==t&&(Wn=t,o.unstable_scheduleCallback(o.unstable_NormalPriority,function(){Wn===t&&(Wn=null);for(var l=0;l<t.length;l+=3){var e=t[l],a=t[l+1],u=t[l+2];if(typeof a!="function"){if(pf(a||e)===null)continue;break}var n=Pe(e);n!==null&&(t.splice(l,3),l-=3,Si(n,{pending:!0,data:u,method:e.method,action:a},a,u))}}))}function Ra(t){function l(s){return kn(s,t)}xe!==null&&kn(xe,t),_e!==null&&kn(_e,t),Oe!==null&&kn(Oe,t),_u.forEach(l),Ou.forEach(l);for(var e=0;e<Ce.length;e++){var a=Ce[e];a.blockedOn===t&&(a.blockedOn=null)}for(;0<Ce.length&&(e=Ce[0],e.blockedOn===null);)Hd(e),e.blockedOn===null&&Ce.shift();if(e=(t.ownerDocument||t).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var u=e[a],n=e[a+1],c=u[el]||null;if(typeof n=="function")c||Bd(e);else if(c){var i=null;if(n&&n.hasAttribute("formAction")){if(u=n,c=n[el]||null)i=c.formAction;else if(pf(u)!==null)continue}else i=c.action;typeof i=="function"?e[a+1]=i:(e.splice(a,3),a-=3),Bd(e)}}}function Yd(){function t(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(c){return u=c})},focusReset:"manual",scroll:"manual"})}function l(){u!==null&&(u(),u=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,u=null;return navigation.addEventListener("navigate",t),navigation.addEventListener("navigatesuccess",l),navigation.addEventListener("navigateerror",l),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",t),navigation.removeEventListener("navigatesuccess",l),navigation.removeEventListener("navigateerror",l),u!==null&&(u(),u=null)}}}function Tf(t){this._internalRoot=t}$n.prototype.render=Tf.prototype.render=function(t){var l=this._internalRoot;if(l===null)throw Error(f(409));var e=l.current,a=bl();Nd(e,a,t,l,null,null)},$n.prototype.unmount=Tf.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var l=t.containerInfo;Nd(t.current,2,null,t,null,null),jn(),l[Fe]=null}};function $n(t){this._internalRoot=t}$n.prototype.unstable_scheduleHydration=function(t){if(t){var l=wf();t={blockedOn:null,target:t,priority:l};for(var e=0;e<Ce.length&&l!==0&&l<Ce[e].priority;e++);Ce.splice(e,0,t),e===0&&Hd(t)}};var Gd=r.version;if(Gd!=="19.2.0")throw Error(f(527,Gd,"19.2.0"));j.findDOMNode=function(t){var l=t._reactInternals;if(l===void 0)throw typeof t.render=="function"?Error(f(188)):(t=Object.keys(t).join(","),Error(f(268,t)));return t=T(l),t=t!==null?G(t):null,t=t===null?null:t.stateNode,t};var Xh={bundleType:0,version:"19.2.0",rendererPackageName:"react-dom",currentDispatcherRef:p,reconcilerVersion:"19.2.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Fn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Fn.isDisabled&&Fn.supportsFiber)try{Ba=Fn.inject(Xh),ol=Fn}catch{}}return ju.createRoot=function(t,l){if(!N(t))throw Error(f(299));var e=!1,a="",u=Kr,n=Jr,c=wr;return l!=null&&(l.unstable_strictMode===!0&&(e=!0),l.identifierPrefix!==void 0&&(a=l.identifierPrefix),l.onUncaughtError!==void 0&&(u=l.onUncaughtError),l.onCaughtError!==void 0&&(n=l.onCaughtError),l.onRecoverableError!==void 0&&(c=l.onRecoverableError)),l=Od(t,1,!1,null,null,e,a,null,u,n,c,Yd),t[Fe]=l.current,ef(t),new Tf(l)},ju.hydrateRoot=function(t,l,e){if(!N(t))throw Error(f(299));var a=!1,u="",n=Kr,c=Jr,i=wr,s=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(u=e.identifierPrefix),e.onUncaughtError!==void 0&&(n=e.onUncaughtError),e.onCaughtError!==void 0&&(c=e.onCaughtError),e.onRecoverableError!==void 0&&(i=e.onRecoverableError),e.formState!==void 0&&(s=e.formState)),l=Od(t,1,!0,l,e??null,a,u,s,n,c,i,Yd),l.context=Cd(null),e=l.current,a=bl(),a=oc(a),u=me(a),u.callback=null,he(e,u,a),e=a,l.current.lanes=e,Ga(l,e),Yl(l),t[Fe]=l.current,ef(t),new $n(l)},ju.version="19.2.0",ju}var Wd;function $h(){if(Wd)return xf.exports;Wd=1;function o(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(o)}catch(r){console.error(r)}}return o(),xf.exports=Wh(),xf.exports}var Fh=$h();const Ih=Rf(Fh),Nf="/api/tickets",In={async getConcerts(){const o=await fetch(`${Nf}/concerts/`);if(!o.ok)throw new Error("Failed to fetch concerts");return o.json()},async getTicketTypes(o){const r=await fetch(`${Nf}/concert/tickettypes?concert_id=${o}`);if(!r.ok)throw new Error("Failed to fetch ticket types");return r.json()},async getQueueStatus(){const o=await fetch(`${Nf}/queue/`,{credentials:"same-origin"});if(!o.ok)throw new Error("Failed to fetch queue status");return o.json()},async createCheckoutSession(o,r){const v=await fetch(`${Nf}/create-checkout-session/`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({concert_id:o,line_items:r})});if(!v.ok){const f=await v.json();if(v.status===429&&f.queue)throw new Tw(f.detail,f.queue);throw new Error(f.detail||"Failed to create checkout session")}return v.json()}};class Tw extends Error{queue;constructor(o,r){super(o),this.queue=r}}function Ty(){const o=document.getElementById("ticketing-queue");try{return o&&JSON.parse(o.textContent||"null")||{admitted:!0}}catch{return{admitted:!0}}}let Tq;function Tg(){if(Tq===void 0){const o=document.getElementById("ticketing-catalogue");try{Tq=o?JSON.parse(o.textContent||"null"):null}catch{Tq=null}}return Tq??null}const Ph=o=>o.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),tv=o=>o.replace(/^([A-Z])|[\s-_]+(\w)/g,(r,v,f)=>f?f.toUpperCase():v.toLowerCase()),$d=o=>{const r=tv(o);return r.charAt(0).toUpperCase()+r.slice(1)},fm=(...o)=>o.filter((r,v,f)=>!!r&&r.trim()!==""&&f.indexOf(r)===v).join(" ").trim(),lv=o=>{for(const r in o)if(r.startsWith("aria-")||r==="role"||r==="title")return!0};var ev={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const av=At.forwardRef(({color:o="currentColor",size:r=24,strokeWidth:v=2,absoluteStrokeWidth:f,className:N="",children:C,iconNode:R,...B},x)=>At.createElement("svg",{ref:x,...ev,width:r,height:r,stroke:o,strokeWidth:f?Number(v)*24/Number(r):v,className:fm("lucide",N),...!C&&!lv(B)&&{"aria-hidden":"true"},...B},[...R.map(([T,G])=>At.createElement(T,G)),...Array.isArray(C)?C:[C]]));const $e=(o,r)=>{const v=At.forwardRef(({className:f,...N},C)=>At.createElement(av,{ref:C,iconNode:r,className:fm(`lucide-${Ph($d(o))}`,`lucide-${o}`,f),...N}));return v.displayName=$d(o),v};const uv=[["path",{d:"M8 2v4",key:"1cmpym"}],["path",{d:"M16 2v4",key:"4m81vk"}],["rect",{width:"18",height:"18",x:"3",y:"4",rx:"2",key:"1hopcy"}],["path",{d:"M3 10h18",key:"8toen8"}]],nv=$e("calendar",uv);const cv=[["path",{d:"M20 6 9 17l-5-5",key:"1gmf2c"}]],qf=$e("check",cv);const iv=[["path",{d:"M12 6v6l4 2",key:"mmk7yg"}],["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}]],fv=$e("clock",iv);const sv=[["path",{d:"M12 15V3",key:"m9g1x1"}],["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["path",{d:"m7 10 5 5 5-5",key:"brsn70"}]],rv=$e("download",sv);const ov=[["path",{d:"M21 12a9 9 0 1 1-6.219-8.56",key:"13zald"}]],dv=$e("loader-circle",ov);const mv=[["path",{d:"m22 7-8.991 5.727a2 2 0 0 1-2.009 0L2 7",key:"132q7q"}],["rect",{x:"2",y:"4",width:"20",height:"16",rx:"2",key:"izxlao"}]],hv=$e("mail",mv);const vv=[["path",{d:"M20 10c0 4.993-5.539 10.193-7.399 11.799a1 1 0 0 1-1.202 0C9.539 20.193 4 14.993 4 10a8 8 0 0 1 16 0",key:"1r0f0z"}],["circle",{cx:"12",cy:"10",r:"3",key:"ilqhr7"}]],yv=$e("map-pin",vv),gv=({currentStep:o})=>{const r=[{number:1,label:"Select Concert"},{number:2,label:"Choose Tickets"},{number:3,label:"Checkout"}];return b.jsx("div",{className:"flex justify-center mb-12",children:b.jsx("div",{className:"flex items-center space-x-4",children:r.map((v,f)=>b.jsxs(at.Fragment,{children:[b.jsxs("div",{className:`flex items-center ${o>=v.number?"text-[#008888]":"text-gray-400"}`,children:[b.jsx("div",{className:`w-10 h-10 rounded-full flex items-center justify-center font-semibold ${o>=v.number?"bg-[#008888] text-white":"bg-gray-300"}`,children:o>v.number?b.jsx(qf,{className:"w-6 h-6"}):v.number}),b.jsx("span",{className:"ml-2 font-semibold hidden sm:inline",children:v.label})]}),f<r.length-1&&b.jsx("div",{className:"w-16 h-px bg-gray-300"})]},v.number))})})},ae=({children:o,className:r=""})=>b.jsx("div",{className:`bg-white rounded-lg shadow-lg ${r}`,children:o}),ec=({children:o})=>b.jsx("div",{className:"p-6 border-b border-gray-200",children:o}),ac=({children:o,className:r=""})=>b.jsx("h2",{className:`font-bold ${r}`,children:o}),ue=({children:o,className:r=""})=>b.jsx("div",{className:`p-6 ${r}`,children:o}),We=({children:o,onClick:r,disabled:v,variant:f="default",className:N="",type:C="button"})=>{const R="px-4 py-2 rounded-md font-semibold transition-all disabled:opacity-50 disabled:cursor-not-allowed",B={default:"bg-[#008888] text-white hover:bg-[#006666]",outline:"border-2 border-gray-300 text-gray-700 hover:bg-gray-50"};return b.jsx("button",{type:C,onClick:r,disabled:v,className:`${R} ${B[f]} ${N}`,children:o})},Sv=({concerts:o,selectedConcert:r,onSelectConcert:v,onContinue:f,loading:N})=>N?b.jsx(ae,{children:b.jsxs(ue,{className:"p-12 text-center",children:[b.jsx("div",{className:"inline-block animate-spin rounded-full h-12 w-12 border-4 border-[#008888] border-t-transparent mb-4"}),b.jsx("p",{className:"text-gray-600",children:"Loading concerts..."})]})}):b.jsxs(ae,{children:[b.jsx(ec,{children:b.jsx(ac,{className:"text-2xl",children:"Select a Concert"})}),b.jsxs(ue,{className:"space-y-4",children:[o.map(C=>b.jsxs("div",{onClick:()=>v(C.id),className:`p-6 border-2 rounded-lg cursor-pointer transition-all ${r===C.id?"border-[#008888] bg-[#008888]/5":"border-gray-200 hover:border-[#008888]/50"}`,children:[b.jsx("h3",{className:"text-xl font-bold text-gray-900 mb-3",children:C.concert_name}),b.jsxs("div",{className:"space-y-2 text-gray-600",children:[b.jsxs("p",{className:"flex items-center",children:[b.jsx(nv,{className:"w-4 h-4 mr-2 text-[#008888]"}),C.concert_date]}),b.jsxs("p",{className:"flex items-center",children:[b.jsx(fv,{className:"w-4 h-4 mr-2 text-[#008888]"}),C.concert_time]}),b.jsxs("p",{className:"flex items-center",children:[b.jsx(yv,{className:"w-4 h-4 mr-2 text-[#008888]"}),C.concert_location]}),C.conductor&&b.jsxs("p",{className:"flex items-center",children:[b.jsx("span",{className:"w-4 h-4 mr-2 text-[#008888]",children:"♪"}),"Conductor: ",C.conductor]})]})]},C.id)),b.jsx(We,{onClick:f,disabled:!r,className:"w-full",children:"Continue to Ticket Selection"})]})]}),bv=({ticketTypes:o,ticketQuantities:r,onQuantityChange:v,onBack:f,onContinue:N,loading:C,validating:R})=>{const B=()=>Object.values(r).reduce((x,T)=>x+T,0);return C?b.jsx(ae,{children:b.jsxs(ue,{className:"p-12 text-center",children:[b.jsx("div",{className:"inline-block animate-spin rounded-full h-12 w-12 border-4 border-[#008888] border-t-transparent mb-4"}),b.jsx("p",{className:"text-gray-600",children:"Loading ticket types..."})]})}):b.jsxs(ae,{children:[b.jsx(ec,{children:b.jsx(ac,{className:"text-2xl",children:"Choose Your Tickets"})}),b.jsxs(ue,{className:"space-y-4",children:[o.map(x=>b.jsx("div",{className:x.display_ticket?"p-6 border-2 rounded-lg border-gray-200":"p-6 border-2 rounded-lg border-red-200 hidden",children:b.jsxs("div",{className:"flex justify-between items-start mb-3",children:[b.jsxs("div",{className:"flex-1",children:[b.jsx("h3",{className:"text-xl font-bold text-gray-900",children:x.ticket_label}),b.jsx("p",{className:"text-gray-600 text-sm mt-1",children:x.description}),x.features&&x.features.length>0&&b.jsx("ul",{className:"space-y-1 text-sm text-gray-600 mt-3",children:x.features.map((T,G)=>b.jsxs("li",{className:"flex items-center",children:[b.jsx(qf,{className:"w-4 h-4 mr-2 text-[#008888] flex-shrink-0"}),T]},G))}),Number(x.qty_available)<20&&b.jsx("p",{className:"text-sm text-red-500 mt-2",children:"Few tickets available!"})]}),b.jsxs("div",{className:"text-right ml-6",children:[b.jsxs("div",{className:"text-2xl font-bold text-[#008888] mb-4",children:["£",Number(x.price).toFixed(2)]}),b.jsxs("div",{className:"flex items-center gap-3",children:[b.jsx("button",{onClick:()=>v(x.id,-1),disabled:r[x.id]===0,className:"w-10 h-10 rounded-full bg-gray-200 hover:bg-gray-300 disabled:opacity-30 disabled:cursor-not-allowed flex items-center justify-center font-bold text-gray-700 transition-colors",children:"−"}),b.jsx("span",{className:"text-2xl font-bold text-gray-900 w-12 text-center",children:r[x.id]||0}),b.jsx("button",{onClick:()=>v(x.id,1),disabled:r[x.id]>=x.qty_available,className:"w-10 h-10 rounded-full bg-[#008888] hover:bg-[#006666] disabled:opacity-30 disabled:cursor-not-allowed flex items-center justify-center font-bold text-white transition-colors",children:"+"})]})]})]})},x.id)),b.jsxs("div",{className:"flex gap-4 pt-4",children:[b.jsx(We,{onClick:f,variant:"outline",className:"flex-1",children:"Back"}),b.jsx(We,{onClick:N,disabled:B()===0||R,className:"flex-1",children:R?"Validating...":"Continue to Checkout"})]})]})]})};var jf={exports:{}},Mf,Fd;function pv(){if(Fd)return Mf;Fd=1;var o="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED";return Mf=o,Mf}var Uf,Id;function Ev(){if(Id)return Uf;Id=1;var o=pv();function r(){}function v(){}return v.resetWarningCache=r,Uf=function(){function f(R,B,x,T,G,H){if(H!==o){var Q=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw Q.name="Invariant Violation",Q}}f.isRequired=f;function N(){return f}var C={array:f,bigint:f,bool:f,func:f,number:f,object:f,string:f,symbol:f,any:f,arrayOf:N,element:f,elementType:f,instanceOf:N,node:f,objectOf:N,oneOf:N,oneOfType:N,shape:N,exact:N,checkPropTypes:v,resetWarningCache:r};return C.PropTypes=C,C},Uf}var Pd;function Tv(){return Pd||(Pd=1,jf.exports=Ev()()),jf.exports}var zv=Tv();const gt=Rf(zv);function tm(o,r){var v=Object.keys(o);if(Object.getOwnPropertySymbols){var f=Object.getOwnPropertySymbols(o);r&&(f=f.filter(function(N){return Object.getOwnPropertyDescriptor(o,N).enumerable})),v.push.apply(v,f)}return v}function lm(o){for(var r=1;r<arguments.length;r++){var v=arguments[r]!=null?arguments[r]:{};r%2?tm(Object(v),!0).forEach(function(f){sm(o,f,v[f])}):Object.getOwnPropertyDescriptors?Object.defineProperties(o,Object.getOwnPropertyDescriptors(v)):tm(Object(v)).forEach(function(f){Object.defineProperty(o,f,Object.getOwnPropertyDescriptor(v,f))})}return o}function lc(o){"@babel/helpers - typeof";return typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?lc=function(r){return typeof r}:lc=function(r){return r&&typeof Symbol=="function"&&r.constructor===Symbol&&r!==Symbol.prototype?"symbol":typeof r},lc(o)}function sm(o,r,v){return r in o?Object.defineProperty(o,r,{value:v,enumerable:!0,configurable:!0,writable:!0}):o[r]=v,o}function Av(o,r){if(o==null)return{};var v={},f=Object.keys(o),N,C;for(C=0;C<f.length;C++)N=f[C],!(r.indexOf(N)>=0)&&(v[N]=o[N]);return v}function xv(o,r){if(o==null)return{};var v=Av(o,r),f,N;if(Object.getOwnPropertySymbols){var C=Object.getOwnPropertySymbols(o);for(N=0;N<C.length;N++)f=C[N],!(r.indexOf(f)>=0)&&Object.prototype.propertyIsEnumerable.call(o,f)&&(v[f]=o[f])}return v}function rm(o,r){return _v(o)||Ov(o,r)||Cv(o,r)||Nv()}function _v(o){if(Array.isArray(o))return o}function Ov(o,r){var v=o&&(typeof Symbol<"u"&&o[Symbol.iterator]||o["@@iterator"]);if(v!=null){var f=[],N=!0,C=!1,R,B;try{for(v=v.call(o);!(N=(R=v.next()).done)&&(f.push(R.value),!(r&&f.length===r));N=!0);}catch(x){C=!0,B=x}finally{try{!N&&v.return!=null&&v.return()}finally{if(C)throw B}}return f}}function Cv(o,r){if(o){if(typeof o=="string")return em(o,r);var v=Object.prototype.toString.call(o).slice(8,-1);if(v==="Object"&&o.constructor&&(v=o.constructor.name),v==="Map"||v==="Set")return Array.from(o);if(v==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(v))return em(o,r)}}function em(o,r){(r==null||r>o.length)&&(r=o.length);for(var v=0,f=new Array(r);v<r;v++)f[v]=o[v];return f}function Nv(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
+In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var Ft=function(r,v,f){var N=!!f,C=at.useRef(f);at.useEffect(function(){C.current=f},[f]),at.useEffect(function(){if(!N||!r)return function(){};var R=function(){C.current&&C.current.apply(C,arguments)};return r.on(v,R),function(){r.off(v,R)}},[N,v,r,C])},Df=function(r){var v=at.useRef(r);return at.useEffect(function(){v.current=r},[r]),v.current},Ha=function(r){return r!==null&&lc(r)==="object"},jv=function(r){return Ha(r)&&typeof r.then=="function"},Mv=function(r){return Ha(r)&&typeof r.elements=="function"&&typeof r.createToken=="function"&&typeof r.createPaymentMethod=="function"&&typeof r.confirmCardPayment=="function"},am="[object Object]",Uv=function o(r,v){if(!Ha(r)||!Ha(v))return r===v;var f=Array.isArray(r),N=Array.isArray(v);if(f!==N)return!1;var C=Object.prototype.toString.call(r)===am,R=Object.prototype.toString.call(v)===am;if(C!==R)return!1;if(!C&&!f)return r===v;var B=Object.keys(r),x=Object.keys(v);if(B.length!==x.length)return!1;for(var T={},G=0;G<B.length;G+=1)T[B[G]]=!0;for(var H=0;H<x.length;H+=1)T[x[H]]=!0;var Q=Object.keys(T);if(Q.length!==B.length)return!1;var w=r,dt=v,ft=function(Et){return o(w[Et],dt[Et])};return Q.every(ft)},Dv=function(r,v,f){return Ha(r)?Object.keys(r).reduce(function(N,C){var R=!Ha(v)||!Uv(r[C],v[C]);return f.includes(C)?(R&&console.warn("Unsupported prop change: options.".concat(C," is not a mutable property.")),N):R?lm(lm({},N||{}),{},sm({},C,r[C])):N},null):null},om="Invalid prop `stripe` supplied to `Elements`. We recommend using the `loadStripe` utility from `@stripe/stripe-js`. See https://stripe.com/docs/stripe-js/react#elements-props-stripe for details.",um=function(r){var v=arguments.length>1&&arguments[1]!==void 0?arguments[1]:om;if(r===null||Mv(r))return r;throw new Error(v)},Rv=function(r){var v=arguments.length>1&&arguments[1]!==void 0?arguments[1]:om;if(jv(r))return{tag:"async",stripePromise:Promise.resolve(r).then(function(N){return um(N,v)})};var f=um(r,v);return f===null?{tag:"empty"}:{tag:"sync",stripe:f}},Hv=function(r){!r||!r._registerWrapper||!r.registerAppInfo||(r._registerWrapper({name:"react-stripe-js",version:"5.4.1"}),r.registerAppInfo({name:"react-stripe-js",version:"5.4.1",url:"https://stripe.com/docs/stripe-js/react"}))},dm=at.createContext(null);dm.displayName="ElementsContext";var qv=function(r,v){if(!r)throw new Error("Could not find Elements context; You need to wrap the part of your app that ".concat(v," in an <Elements> provider."));return r};gt.any,gt.object;gt.func.isRequired;var mm=at.createContext(null);mm.displayName="CheckoutContext";gt.any,gt.shape({clientSecret:gt.oneOfType([gt.string,gt.instanceOf(Promise)]).isRequired,elementsOptions:gt.object}).isRequired;var nm=function(r){var v=at.useContext(mm),f=at.useContext(dm);if(v){if(f)throw new Error("You cannot wrap the part of your app that ".concat(r," in both <CheckoutProvider> and <Elements> providers."));return v}else return qv(f,r)},Bv=["mode"],Yv=function(r){return r.charAt(0).toUpperCase()+r.slice(1)},sl=function(r,v){var f="".concat(Yv(r),"Element"),N=function(x){var T=x.id,G=x.className,H=x.options,Q=H===void 0?{}:H,w=x.onBlur,dt=x.onFocus,ft=x.onReady,Kt=x.onChange,Et=x.onEscape,pl=x.onClick,xt=x.onLoadError,Jt=x.onLoaderStart,kt=x.onNetworksChange,qt=x.onConfirm,$=x.onCancel,Bt=x.onShippingAddressChange,Pt=x.onShippingRateChange,Rl=x.onSavedPaymentMethodRemove,tl=x.onSavedPaymentMethodUpdate,_t=nm("mounts <".concat(f,">")),ll="elements"in _t?_t.elements:null,jt="checkoutState"in _t?_t.checkoutState:null,K=jt?.type==="success"||jt?.type==="loading"?jt.sdk:null,p=at.useState(null),j=rm(p,2),D=j[0],I=j[1],F=at.useRef(null),m=at.useRef(null);Ft(D,"blur",w),Ft(D,"focus",dt),Ft(D,"escape",Et),Ft(D,"click",pl),Ft(D,"loaderror",xt),Ft(D,"loaderstart",Jt),Ft(D,"networkschange",kt),Ft(D,"confirm",qt),Ft(D,"cancel",$),Ft(D,"shippingaddresschange",Bt),Ft(D,"shippingratechange",Pt),Ft(D,"savedpaymentmethodremove",Rl),Ft(D,"savedpaymentmethodupdate",tl),Ft(D,"change",Kt);var _;ft&&(r==="expressCheckout"?_=ft:_=function(){ft(D)}),Ft(D,"ready",_),at.useLayoutEffect(function(){if(F.current===null&&m.current!==null&&(ll||K)){var M=null;if(K)switch(r){case"paymentForm":M=K.createPaymentFormElement();break;case"payment":M=K.createPaymentElement(Q);break;case"address":if("mode"in Q){var L=Q.mode,W=xv(Q,Bv);if(L==="shipping")M=K.createShippingAddressElement(W);else if(L==="billing")M=K.createBillingAddressElement(W);else throw new Error("Invalid options.mode. mode must be 'billing' or 'shipping'.")}else throw new Error("You must supply options.mode. mode must be 'billing' or 'shipping'.");break;case"expressCheckout":M=K.createExpressCheckoutElement(Q);break;case"currencySelector":M=K.createCurrencySelectorElement();break;case"taxId":M=K.createTaxIdElement(Q);break;default:throw new Error("Invalid Element type ".concat(f,". You must use either the <PaymentElement />, <AddressElement options={{mode: 'shipping'}} />, <AddressElement options={{mode: 'billing'}} />, or <ExpressCheckoutElement />."))}else ll&&(M=ll.create(r,Q));F.current=M,I(M),M&&M.mount(m.current)}},[ll,K,Q]);var U=Df(Q);return at.useEffect(function(){if(F.current){var M=Dv(Q,U,["paymentRequest"]);M&&"update"in F.current&&F.current.update(M)}},[Q,U]),at.useLayoutEffect(function(){return function(){if(F.current&&typeof F.current.destroy=="function")try{F.current.destroy(),F.current=null}catch{}}},[]),at.createElement("div",{id:T,className:G,ref:m})},C=function(x){nm("mounts <".concat(f,">"));var T=x.id,G=x.className;return at.createElement("div",{id:T,className:G})},R=v?C:N;return R.propTypes={id:gt.string,className:gt.string,onChange:gt.func,onBlur:gt.func,onFocus:gt.func,onReady:gt.func,onEscape:gt.func,onClick:gt.func,onLoadError:gt.func,onLoaderStart:gt.func,onNetworksChange:gt.func,onConfirm:gt.func,onCancel:gt.func,onShippingAddressChange:gt.func,onShippingRateChange:gt.func,onSavedPaymentMethodRemove:gt.func,onSavedPaymentMethodUpdate:gt.func,options:gt.object},R.displayName=f,R.__elementType=r,R},It=typeof window>"u",Bf=at.createContext(null);Bf.displayName="EmbeddedCheckoutProviderContext";var hm=function(){var r=at.useContext(Bf);if(!r)throw new Error("<EmbeddedCheckout> must be used within <EmbeddedCheckoutProvider>");return r},Gv="Invalid prop `stripe` supplied to `EmbeddedCheckoutProvider`. We recommend using the `loadStripe` utility from `@stripe/stripe-js`. See https://stripe.com/docs/stripe-js/react#elements-props-stripe for details.",Xv=function(r){var v=r.stripe,f=r.options,N=r.children,C=at.useMemo(function(){return Rv(v,Gv)},[v]),R=at.useRef(null),B=at.useRef(null),x=at.useState({embeddedCheckout:null}),T=rm(x,2),G=T[0],H=T[1];at.useEffect(function(){if(!(B.current||R.current)){var dt=function(Kt){B.current||R.current||(B.current=Kt,R.current=B.current.initEmbeddedCheckout(f).then(function(Et){H({embeddedCheckout:Et})}))};C.tag==="async"&&!B.current&&(f.clientSecret||f.fetchClientSecret)?C.stripePromise.then(function(ft){ft&&dt(ft)}):C.tag==="sync"&&!B.current&&(f.clientSecret||f.fetchClientSecret)&&dt(C.stripe)}},[C,f,G,B]),at.useEffect(function(){return function(){G.embeddedCheckout?(R.current=null,G.embeddedCheckout.destroy()):R.current&&R.current.then(function(){R.current=null,G.embeddedCheckout&&G.embeddedCheckout.destroy()})}},[G.embeddedCheckout]),at.useEffect(function(){Hv(B)},[B]);var Q=Df(v);at.useEffect(function(){Q!==null&&Q!==v&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the `stripe` prop after setting it.")},[Q,v]);var w=Df(f);return at.useEffect(function(){if(w!=null){if(f==null){console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot unset options after setting them.");return}f.clientSecret===void 0&&f.fetchClientSecret===void 0&&console.warn("Invalid props passed to EmbeddedCheckoutProvider: You must provide one of either `options.fetchClientSecret` or `options.clientSecret`."),w.clientSecret!=null&&f.clientSecret!==w.clientSecret&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the client secret after setting it. Unmount and create a new instance of EmbeddedCheckoutProvider instead."),w.fetchClientSecret!=null&&f.fetchClientSecret!==w.fetchClientSecret&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change fetchClientSecret after setting it. Unmount and create a new instance of EmbeddedCheckoutProvider instead."),w.onComplete!=null&&f.onComplete!==w.onComplete&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the onComplete option after setting it."),w.onShippingDetailsChange!=null&&f.onShippingDetailsChange!==w.onShippingDetailsChange&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the onShippingDetailsChange option after setting it."),w.onLineItemsChange!=null&&f.onLineItemsChange!==w.onLineItemsChange&&console.warn("Unsupported prop change on EmbeddedCheckoutProvider: You cannot change the onLineItemsChange option after setting it.")}},[w,f]),at.createElement(Bf.Provider,{value:G},N)},Qv=function(r){var v=r.id,f=r.className,N=hm(),C=N.embeddedCheckout,R=at.useRef(!1),B=at.useRef(null);return at.useLayoutEffect(function(){return!R.current&&C&&B.current!==null&&(C.mount(B.current),R.current=!0),function(){if(R.current&&C)try{C.unmount(),R.current=!1}catch{}}},[C]),at.createElement("div",{ref:B,id:v,className:f})},Zv=function(r){var v=r.id,f=r.className;return hm(),at.createElement("div",{id:v,className:f})},Lv=It?Zv:Qv;sl("auBankAccount",It);sl("card",It);sl("cardNumber",It);sl("cardExpiry",It);sl("cardCvc",It);sl("iban",It);sl("payment",It);sl("expressCheckout",It);sl("paymentRequestButton",It);sl("linkAuthentication",It);sl("address",It);sl("shippingAddress",It);sl("paymentMethodMessaging",It);sl("taxId",It);var vm="clover",Vv=function(r){return r===3?"v3":r},ym="https://js.stripe.com",Kv="".concat(ym,"/").concat(vm,"/stripe.js"),Jv=/^https:\/\/js\.stripe\.com\/v3\/?(\?.*)?$/,wv=/^https:\/\/js\.stripe\.com\/(v3|[a-z]+)\/stripe\.js(\?.*)?$/;var kv=function(r){return Jv.test(r)||wv.test(r)},Wv=function(){for(var r=document.querySelectorAll('script[src^="'.concat(ym,'"]')),v=0;v<r.length;v++){var f=r[v];if(kv(f.src))return f}return null},cm=function(r){var v="",f=document.createElement("script");f.src="".concat(Kv).concat(v);var N=document.head||document.body;if(!N)throw new Error("Expected document.body not to be null. Stripe.js requires a <body> element.");return N.appendChild(f),f},$v=function(r,v){!r||!r._registerWrapper||r._registerWrapper({name:"stripe-js",version:"8.5.3",startTime:v})},Mu=null,Pn=null,tc=null,Fv=function(r){return function(v){r(new Error("Failed to load Stripe.js",{cause:v}))}},Iv=function(r,v){return function(){window.Stripe?r(window.Stripe):v(new Error("Stripe.js not available"))}},Pv=function(r){return Mu!==null?Mu:(Mu=new Promise(function(v,f){if(typeof window>"u"||typeof document>"u"){v(null);return}if(window.Stripe){v(window.Stripe);return}try{var N=Wv();if(!(N&&r)){if(!N)N=cm(r);else if(N&&tc!==null&&Pn!==null){var C;N.removeEventListener("load",tc),N.removeEventListener("error",Pn),(C=N.parentNode)===null||C===void 0||C.removeChild(N),N=cm(r)}}tc=Iv(v,f),Pn=Fv(f),N.addEventListener("load",tc),N.addEventListener("error",Pn)}catch(R){f(R);return}}),Mu.catch(function(v){return Mu=null,Promise.reject(v)}))},ty=function(r,v,f){if(r===null)return null;var N=v[0],C=N.match(/^pk_test/),R=Vv(r.version),B=vm;C&&R!==B&&console.warn("Stripe.js@".concat(R," was loaded on the page, but @stripe/stripe-js@").concat("8.5.3"," expected Stripe.js@").concat(B,". This may result in unexpected behavior. For more information, see https://docs.stripe.com/sdks/stripejs-versioning"));var x=r.apply(void 0,v);return $v(x,f),x},Uu,gm=!1,Sm=function(){return Uu||(Uu=Pv(null).catch(function(r){return Uu=null,Promise.reject(r)}),Uu)};Promise.resolve().then(function(){return Sm()}).catch(function(o){gm||console.warn(o)});var ly=function(){for(var r=arguments.length,v=new Array(r),f=0;f<r;f++)v[f]=arguments[f];gm=!0;var N=Date.now();return Sm().then(function(C){return ty(C,v,N)})};const ey=ly("pk_test_YOUR_PUBLISHABLE_KEY"),ay=({clientSecret:o,sessionId:r,onBack:v,onComplete:f,concertName:N})=>{const[C,R]=At.useState("checkout"),[B,x]=At.useState(null),[T,G]=At.useState(0),H=async()=>{try{const dt=await(await fetch(`/api/tickets/order-status/?session_id=${r}`)).json();return dt.status==="confirmed"?(x(dt),R("complete"),!0):dt.status==="failed"?(R("error"),!0):!1}catch(w){return console.error("Error polling order status:",w),!1}};At.useEffect(()=>{if(C!=="confirming")return;const w=setInterval(async()=>{G(ft=>ft+1),await H()&&clearInterval(w),T>=30&&(clearInterval(w),R("error"))},1e3);return H(),()=>clearInterval(w)},[C,T,r]);const Q={clientSecret:o,onComplete:()=>{R("confirming"),G(0)}};return C==="error"?b.jsx(ae,{children:b.jsx(ue,{className:"p-12 text-center",children:b.jsxs("div",{className:"mb-4",children:[b.jsx("div",{className:"inline-flex items-center justify-center w-16 h-16 bg-red-100 rounded-full mb-4",children:b.jsx("svg",{className:"w-8 h-8 text-red-600",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:b.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M6 18L18 6M6 6l12 12"})})}),b.jsx("h3",{className:"text-2xl font-bold text-gray-900 mb-2",children:"Order Confirmation Issue"}),b.jsxs("p",{className:"text-gray-600 mb-6",children:["We're having trouble confirming your order. Your payment may have been processed. Please check your email or contact support with session ID:",b.jsxs("span",{className:"font-mono text-sm block mt-2",children:[r.substring(0,20),"..."]})]}),b.jsx(We,{onClick:v,children:"Back to Tickets"})]})})}):C==="confirming"?b.jsx(ae,{children:b.jsx(ue,{className:"p-12 text-center",children:b.jsxs("div",{className:"mb-4",children:[b.jsx(dv,{className:"w-16 h-16 text-[#008888] animate-spin mx-auto mb-4"}),b.jsx("h3",{className:"text-2xl font-bold text-gray-900 mb-2",children:"Confirming Your Order"}),b.jsx("p",{className:"text-gray-600",children:"Payment successful! We're finalizing your ticket reservation..."}),b.jsx("p",{className:"text-sm text-gray-500 mt-4",children:"This usually takes just a few seconds"})]})})}):C==="complete"&&B?b.jsx(ae,{children:b.jsxs(ue,{className:"p-12",children:[b.jsxs("div",{className:"text-center mb-8",children:[b.jsx("div",{className:"inline-flex items-center justify-center w-20 h-20 bg-green-100 rounded-full mb-4",children:b.jsx(qf,{className:"w-12 h-12 text-green-600"})}),b.jsx("h3",{className:"text-3xl font-bold text-gray-900 mb-2",children:"Order Confirmed!"}),b.jsx("p",{className:"text-lg text-gray-600",children:"Your tickets have been reserved"})]}),b.jsxs("div",{className:"bg-gray-50 rounded-lg p-6 mb-6",children:[b.jsx("h4",{className:"font-semibold text-gray-900 mb-3 text-lg",children:"Order Details"}),b.jsxs("div",{className:"space-y-2 text-gray-700",children:[b.jsxs("div",{className:"flex justify-between",children:[b.jsx("span",{children:"Event:"}),b.jsx("span",{className:"font-medium",children:B.concert_name})]}),b.jsxs("div",{className:"flex justify-between",children:[b.jsx("span",{children:"Order ID:"}),b.jsxs("span",{className:"font-mono text-sm",children:["#",B.order_id]})]}),B.total_amount&&b.jsxs("div",{className:"flex justify-between",children:[b.jsx("span",{children:"Total:"}),b.jsxs("span",{className:"font-medium",children:[B.currency==="GBP"?"£":B.currency,B.total_amount]})]})]})]}),b.jsx("div",{className:"bg-blue-50 border border-blue-200 rounded-lg p-4 mb-6",children:b.jsxs("div",{className:"flex items-start",children:[b.jsx(hv,{className:"w-5 h-5 text-blue-600 mt-0.5 mr-3 flex-shrink-0"}),b.jsxs("div",{children:[b.jsx("p",{className:"text-sm text-blue-900",children:b.jsx("strong",{children:"Confirmation email sent to:"})}),b.jsx("p",{className:"text-sm text-blue-800 mt-1",children:B.customer_email}),b.jsx("p",{className:"text-xs text-blue-700 mt-2",children:"Your tickets and receipt have been emailed. Please check your inbox and spam folder."})]})]})}),b.jsxs("div",{className:"space-y-3",children:[b.jsx(We,{onClick:f,className:"w-full",children:"Book More Tickets"}),b.jsxs(We,{onClick:()=>window.print(),variant:"outline",className:"w-full",children:[b.jsx(rv,{className:"w-4 h-4 mr-2"}),"Print Confirmation"]})]})]})}):b.jsxs(ae,{children:[b.jsx(ec,{children:b.jsx(ac,{className:"text-2xl",children:"Complete Your Purchase"})}),b.jsxs(ue,{children:[b.jsx("div",{className:"mb-4",children:b.jsx(We,{onClick:v,variant:"outline",className:"mb-4",children:"← Back to Tickets"})}),b.jsx("div",{id:"checkout",children:b.jsx(Xv,{stripe:ey,options:Q,children:b.jsx(Lv,{})})})]})]})},uy=({concert:o,ticketTypes:r,ticketQuantities:v})=>{const f=()=>Object.values(v).reduce((C,R)=>C+R,0),N=()=>r.reduce((C,R)=>C+R.price*(v[R.id]||0),0);return b.jsxs(ae,{className:"sticky top-24",children:[b.jsx(ec,{children:b.jsx(ac,{children:"Order Summary"})}),b.jsxs(ue,{className:"space-y-4",children:[o&&b.jsxs("div",{children:[b.jsx("h4",{className:"font-semibold text-gray-900 mb-2",children:"Concert"}),b.jsx("p",{className:"text-sm text-gray-600",children:o.concert_name}),b.jsx("p",{className:"text-sm text-gray-600",children:o.concert_date})]}),f()>0&&b.jsxs("div",{children:[b.jsx("h4",{className:"font-semibold text-gray-900 mb-2",children:"Tickets"}),r.map(C=>v[C.id]>0&&b.jsxs("div",{className:"flex justify-between text-sm text-gray-600 mb-1",children:[b.jsxs("span",{children:[C.ticket_label," × ",v[C.id]]}),b.jsxs("span",{children:["£",(C.price*v[C.id]).toFixed(2)]})]},C.id)),b.jsxs("div",{className:"text-sm text-gray-600 mt-2 pt-2 border-t",children:["Total Tickets: ",f()]})]}),b.jsxs("div",{className:"border-t pt-4",children:[b.jsxs("div",{className:"flex justify-between items-center mb-2",children:[b.jsx("span",{className:"text-gray-600",children:"Subtotal"}),b.jsxs("span",{className:"font-semibold",children:["£",N().toFixed(2)]})]}),b.jsxs("div",{className:"flex justify-between items-center text-lg font-bold pt-2 border-t",children:[b.jsx("span",{children:"Total"}),b.jsxs("span",{className:"text-[#008888]",children:["£",(N()*1.1).toFixed(2)]})]})]})]})]})};function ny(){const[o,r]=At.useState(1),Tz=Tg(),[v,f]=At.useState(Tz?.concerts??[]),[N,C]=At.useState(null),[R,B]=At.useState([]),[x,T]=At.useState({}),[G,H]=At.useState(null),[Q,w]=At.useState(null),[dt,ft]=At.useState(!Tz),[Kt,Et]=At.useState(!1),[pl,xt]=At.useState(!1),[Jt,kt]=At.useState(!1),[Tj,Tx]=At.useState(Ty);At.useEffect(()=>{Tz||qt()},[]),At.useEffect(()=>{if(Tj.admitted)return;if(Tj.queued===!1){window.location.reload();return}const K=window.setTimeout(async()=>{try{Tx(await In.getQueueStatus())}catch(p){console.error("Error checking queue status:",p),Tx(j=>({...j}))}},(Tj.retry_after||5)*1e3);return()=>window.clearTimeout(K)},[Tj]);const qt=async()=>{ft(!0);try{const K=await In.getConcerts();f(K)}catch(K){console.error("Error fetching concerts:",K),alert("Failed to load concerts. Please try again.")}finally{ft(!1)}},Tk=K=>{B(K);const p={};K.forEach(j=>{p[j.id]=0}),T(p)},$=async K=>{const p=Tz?.ticket_types[String(K)];if(p){Tk(p);return}Et(!0);try{Tk(await In.getTicketTypes(K))}catch(p){console.error("Error fetching ticket types:",p),alert("Failed to load ticket types. Please try again.")}finally{Et(!1)}},Bt=async()=>{if(!N)return!1;xt(!0);try{const K=await In.getTicketTypes(N);for(const p of K){const j=x[p.id]||0;if(j>p.qty_available)return alert(`Sorry, only ${p.qty_available} ${p.ticket_label} tickets are now available. Please adjust your selection.`),B(K),T(D=>({...D,[p.id]:Math.min(j,p.qty_available)})),!1}return!0}catch(K){return console.error("Error validating availability:",K),alert("Failed to validate ticket availability. Please try again."),!1}finally{xt(!1)}},Pt=K=>{C(K),$(K)},Rl=()=>{N&&r(2)},tl=(K,p)=>{T(j=>{const D=Math.max(0,(j[K]||0)+p),I=R.find(m=>m.id===K),F=I?I.qty_available:0;return{...j,[K]:Math.min(D,F)}})},_t=async()=>{if(!Tj.admitted){alert("You're still in the queue for tickets. Checkout will open as soon as it's your turn.");return}if(await Bt()){kt(!0);try{const p=Object.entries(x).filter(([D,I])=>I>0).map(([D,I])=>({ticket_type_id:parseInt(D),quantity:I})),j=await In.createCheckoutSession(N,p);H(j.client_secret),w(j.session_id),r(3)}catch(p){if(p instanceof Tw){Tx(p.queue);return}console.error("Error creating checkout session:",p),alert("Failed to create checkout session. Please try again.")}finally{kt(!1)}}},ll=()=>{r(1),C(null),B([]),T({}),H(null),w(null)},jt=v.find(K=>K.id===N)||null;return b.jsxs("div",{className:"max-w-6xl mx-auto",children:[!Tj.admitted&&b.jsxs("div",{className:"mb-8 rounded-lg border border-[#008888] bg-white p-6 text-center shadow",children:[b.jsx("p",{className:"text-lg font-semibold text-gray-900",children:"You're in the queue"}),b.jsxs("p",{className:"text-gray-600",children:[Tj.ahead?`${Tj.ahead} ${Tj.ahead===1?"person is":"people are"} ahead of you. `:"","You can choose your tickets now; checkout opens when it's your turn. Please keep this page open."]})]}),b.jsx(gv,{currentStep:o}),b.jsxs("div",{className:"grid lg:grid-cols-3 gap-8",children:[b.jsxs("div",{className:"lg:col-span-2",children:[o===1&&b.jsx(Sv,{concerts:v,selectedConcert:N,onSelectConcert:Pt,onContinue:Rl,loading:dt}),o===2&&b.jsx(bv,{ticketTypes:R,ticketQuantities:x,onQuantityChange:tl,onBack:()=>r(1),onContinue:_t,loading:Kt,validating:pl||Jt}),o===3&&G&&Q&&b.jsx(ay,{clientSecret:G,sessionId:Q,onBack:()=>{r(2),H(null),w(null)},onComplete:ll,concertName:jt?.concert_name||""})]}),b.jsx("div",{className:"lg:col-span-1",children:b.jsx(uy,{concert:jt,ticketTypes:R,ticketQuantities:x})})]})]})}const im=document.getElementById("ticketing-root");im&&Ih.createRoot(im).render(b.jsx(at.StrictMode,{children:b.jsx(ny,{})}));
@@ -0,0 +1,236 @@
+"""
+Catching up on Stripe events we missed.
+
+While we're down, or failing, webhooks are lost until Stripe's retry
+schedule resends them, sometimes hours later. ``catch_up()`` lists the
+events we handle from the Events API since a stored checkpoint and runs
+each through handle_webhook() on a small pool of threads, so running
+``manage.py catch_up_stripe_events`` every few minutes gets buyers their
+tickets soon after an outage.
+
+Every handled event, webhook or caught up, is recorded as a StripeEvent and
+both paths skip events already recorded. An order is only confirmed once,
+so an event arriving by webhook while the catch-up handles it is harmless.
+
+Events are handled oldest first, and never two for the same payment at a
+time (a refund can't overtake its checkout); if one fails, that payment's
+later events wait too. The checkpoint only moves past events that were
+handled, so failed events are retried next run; each run also lists a few
+minutes before the checkpoint, as Stripe's created times aren't strictly
+in delivery order.
+
+Failed attempts are counted on the event's StripeEvent. After
+STRIPE_EVENT_MAX_ATTEMPTS runs have failed to handle it, an event is given
+up on: logged as an error, skipped from then on, and the checkpoint moves
+past it, so one broken event can't hold back every later run.
+"""
+import logging
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import stripe
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from ticketing import metrics as ts_metrics
+from ticketing.models import StripeEvent, StripeEventCheckpoint
+from ticketing.webhook_handler import HANDLED_EVENT_TYPES, handle_webhook
+
+logger = logging.getLogger("ticketing.stripe_events")
+
+DEFAULT_CHECKPOINT = "stripe"
+FIRST_RUN_LOOKBACK = timedelta(days=1)
+OVERLAP = timedelta(minutes=5)
+PAGE_SIZE = 100
+CHECKPOINT_EVERY = 100
+# Stripe keeps events for 30 days; older records are no use for skipping.
+KEEP_PROCESSED = timedelta(days=35)
+
+CatchUpResult = namedtuple("CatchUpResult", ["listed", "handled", "skipped", "failed", "gave_up"])
+
+
+def _created(event):
+    return datetime.fromtimestamp(event["created"], tz=dt_timezone.utc)
+
+
+def _payment(event):
+    # Checkout sessions and charges for one payment share its payment intent.
+    obj = event["data"]["object"]
+    return obj.get("payment_intent") or obj.get("id")
+
+
+def list_events(since):
+    """
+    Events of the types we handle created since `since`, oldest first, as
+    plain dicts.
+    """
+    params = {"types": HANDLED_EVENT_TYPES, "created": {"gte": int(since.timestamp())}, "limit": PAGE_SIZE}
+    events = []
+    while True:
+        with ts_metrics.stripe_call("Event.list"):
+            page = stripe.Event.list(**params)
+        data = page["data"]
+        events += [event if isinstance(event, dict) else event.to_dict() for event in data]
+        if not page["has_more"] or not data:
+            break
+        params["starting_after"] = data[-1]["id"]
+    # Stripe lists newest first.
+    events.reverse()
+    return events
+
+
+def _processed(event_ids):
+    seen = set()
+    for start in range(0, len(event_ids), 1000):
+        seen.update(
+            StripeEvent.objects.filter(event_id__in=event_ids[start:start + 1000])
+            .exclude(status=StripeEvent.FAILED)
+            .values_list("event_id", flat=True)
+        )
+    return seen
+
+
+def pending_events(since=None, checkpoint=DEFAULT_CHECKPOINT):
+    """
+    (events listed, those not handled yet) since the checkpoint, or `since`.
+    """
+    if since is None:
+        row = StripeEventCheckpoint.objects.filter(name=checkpoint).first()
+        processed_through = row.processed_through if row else timezone.now() - FIRST_RUN_LOOKBACK
+        since = processed_through - OVERLAP
+    events = list_events(since)
+    seen = _processed([event["id"] for event in events])
+    return events, [event for event in events if event["id"] not in seen]
+
+
+def _handle(event):
+    """
+    Runs in a worker thread. Returns (handled, error detail).
+    """
+    try:
+        response = handle_webhook(event, source=StripeEvent.CATCH_UP)
+        return response.data.get("status") == "success", response.data.get("detail", "")
+    finally:
+        connections.close_all()
+
+
+def _record_failure(event, error):
+    """
+    Count a failed attempt at an event. True if that was the last attempt
+    and the event is now given up on.
+    """
+    row, _ = StripeEvent.objects.get_or_create(event_id=event["id"], defaults={
+        "event_type": event["type"], "created": _created(event),
+        "source": StripeEvent.CATCH_UP, "status": StripeEvent.FAILED,
+    })
+    attempts = row.attempts + 1
+    give_up = attempts >= settings.STRIPE_EVENT_MAX_ATTEMPTS
+    # Unless a webhook handled it meanwhile.
+    updated = StripeEvent.objects.filter(pk=row.pk, status=StripeEvent.FAILED).update(
+        attempts=attempts, last_error=str(error)[:2000],
+        status=StripeEvent.GAVE_UP if give_up else StripeEvent.FAILED,
+    )
+    if updated and give_up:
+        logger.error(
+            "Gave up on Stripe event",
+            extra={"event_id": event["id"], "event_type": event["type"], "attempts": attempts},
+        )
+    return bool(updated) and give_up
+
+
+def _advance(name, processed_through):
+    # Never move back, e.g. when backfilling an older range with `since`.
+    StripeEventCheckpoint.objects.filter(name=name, processed_through__lt=processed_through).update(
+        processed_through=processed_through, updated_at=timezone.now()
+    )
+
+
+def catch_up(since=None, workers=None, checkpoint=DEFAULT_CHECKPOINT, progress=None):
+    """
+    Handle the events created since the checkpoint (or `since`) that
+    haven't been handled yet, and move the checkpoint on. ``progress`` is
+    called with (handled, failed, remaining) as the run goes. Returns a
+    CatchUpResult.
+    """
+    workers = workers or settings.STRIPE_EVENT_WORKERS
+    listed_at = timezone.now()
+    StripeEventCheckpoint.objects.get_or_create(
+        name=checkpoint, defaults={"processed_through": listed_at - FIRST_RUN_LOOKBACK}
+    )
+    events, todo = pending_events(since, checkpoint)
+
+    ready = deque(range(len(todo)))
+    waiting = defaultdict(deque)  # payment -> events queued behind the one in flight
+    busy = set()
+    held_back = set()  # payments with a failed event: their later events wait for the next run
+    in_flight = {}
+    done = [False] * len(todo)
+    watermark = 0  # todo[:watermark] are all handled or given up on
+    handled = failed = gave_up = saved = 0
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stripe-events") as pool:
+        while ready or in_flight:
+            while ready and len(in_flight) < workers:
+                index = ready.popleft()
+                payment = _payment(todo[index])
+                if payment in held_back:
+                    failed += 1
+                    continue
+                if payment in busy:
+                    waiting[payment].append(index)
+                    continue
+                busy.add(payment)
+                in_flight[pool.submit(_handle, todo[index])] = index
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = in_flight.pop(future)
+                event = todo[index]
+                try:
+                    ok, error = future.result()
+                except Exception as e:
+                    logger.exception("Catch-up failed for event", extra={"event_id": event["id"]})
+                    ok, error = False, repr(e)
+                if ok:
+                    handled += 1
+                    done[index] = True
+                    ts_metrics.STRIPE_EVENTS_CAUGHT_UP.inc(event_type=event["type"])
+                else:
+                    failed += 1
+                    logger.warning("Stripe event not handled", extra={"event_id": event["id"], "event_type": event["type"]})
+                    if _record_failure(event, error):
+                        gave_up += 1
+                        done[index] = True
+                    # Its payment's later events wait for the next run either way.
+                    held_back.add(_payment(event))
+
+                payment = _payment(event)
+                busy.discard(payment)
+                queued = waiting.pop(payment, ())
+                if payment in held_back:
+                    failed += len(queued)
+                else:
+                    # Back to the front: they're older than anything still ready.
+                    ready.extendleft(reversed(queued))
+
+            while watermark < len(todo) and done[watermark]:
+                watermark += 1
+            if watermark and handled + failed - saved >= CHECKPOINT_EVERY:
+                saved = handled + failed
+                _advance(checkpoint, _created(todo[watermark - 1]))
+            if progress:
+                progress(handled, failed, len(todo) - handled - failed)
+
+    if watermark == len(todo):
+        _advance(checkpoint, listed_at)
+    elif watermark:
+        _advance(checkpoint, _created(todo[watermark - 1]))
+    StripeEvent.objects.filter(created__lt=listed_at - KEEP_PROCESSED).delete()
+
+    logger.info(
+        "Stripe event catch-up finished",
+        extra={"listed": len(events), "handled": handled, "failed": failed, "gave_up": gave_up},
+    )
+    return CatchUpResult(len(events), handled, len(events) - len(todo), failed, gave_up)
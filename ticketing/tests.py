@@ -1,3 +1,1022 @@
-from django.test import TestCase
+import atexit
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models import F
+from django.templatetags.static import static
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from ticketing import (
+    cart, catalogue, checkin, door_bundle, exports, inventory, metrics, outbox, refunds, render_worker, rendering, sales,
+    seating, stripe_events, waiting_room,
+)
+from ticketing.codes import make_ticket_code
+from ticketing.log import BackgroundHandler, CorrelationFilter, SamplingFilter, bind
+from ticketing.models import (
+    Concert, Order, OutboxEmail, SalesRollup, SeatMap, StripeEvent, StripeEventCheckpoint, Ticket, TicketEvent, TicketRemoval, TicketType, VersionConflict,
+    WaitingRoomState,
+    defer_quantity_recalculation,
+)
+from ticketing.webhook_handler import handle_webhook
+
+
+def make_concert(**kwargs):
+    return Concert.objects.create(**{
+        "concert_name": "Winter Concert",
+        "concert_date": date(2026, 12, 5),
+        "concert_time": time(19, 30),
+        "concert_location": "Main Hall",
+        "concert_description": "",
+        **kwargs,
+    })
+
+
+def make_ticket_type(concert, **kwargs):
+    return TicketType.objects.create(**{
+        "ticket_label": "Standard",
+        "for_concert": concert,
+        "qty_total": 100,
+        "price": 10,
+        "price_id": "price_standard",
+        **kwargs,
+    })
+
+
+def make_ticket(ticket_type, **kwargs):
+    return Ticket.objects.create(**{
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "ticket_type": ticket_type,
+        "for_concert": ticket_type.for_concert,
+        "transaction_ID": "cs_test",
+        **kwargs,
+    })
+
+
+def make_order(session_id, **kwargs):
+    return Order.objects.create(**{
+        "stripe_session_id": session_id,
+        "status": "confirmed",
+        "customer_email": "ada@example.com",
+        "total_amount": 10,
+        "payment_intent_id": f"pi_{session_id}",
+        **kwargs,
+    })
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        store = metrics._MemoryStore()
+        patcher = mock.patch("ticketing.metrics._get_store", return_value=store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_counter_and_histogram_output(self):
+        metrics.TICKETS_ISSUED.inc(3)
+        metrics.ORDERS_FAILED.inc(reason="payment_failed")
+        metrics.CHECKOUT_SESSION_SECONDS.observe(0.03, outcome="created")
+        metrics.CHECKOUT_SESSION_SECONDS.observe(20, outcome="created")
+
+        lines = metrics.render().splitlines()
+
+        for line in [
+            "# TYPE nk_tickets_issued counter",
+            "nk_tickets_issued_total 3",
+            'nk_orders_failed_total{reason="payment_failed"} 1',
+            "# TYPE nk_checkout_session_seconds histogram",
+            'nk_checkout_session_seconds_bucket{outcome="created",le="0.025"} 0',
+            'nk_checkout_session_seconds_bucket{outcome="created",le="0.05"} 1',
+            'nk_checkout_session_seconds_bucket{outcome="created",le="10.0"} 1',
+            'nk_checkout_session_seconds_bucket{outcome="created",le="+Inf"} 2',
+            'nk_checkout_session_seconds_sum{outcome="created"} 20.03',
+            'nk_checkout_session_seconds_count{outcome="created"} 2',
+        ]:
+            self.assertIn(line, lines)
+
+    def test_labels_must_match(self):
+        with self.assertRaises(ValueError):
+            metrics.ORDERS_FAILED.inc()
+
+    def test_worker_files_are_summed(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        key = metrics.TICKETS_ISSUED._key("_total", {})
+        metrics._MmapStore(os.path.join(directory, "metrics_1.db")).inc(key, 1)
+        metrics._MmapStore(os.path.join(directory, "metrics_2.db")).inc(key, 2)
+        # Reopened after a restart, a file keeps counting where it left off.
+        metrics._MmapStore(os.path.join(directory, "metrics_2.db")).inc(key, 4)
+
+        self.assertEqual(metrics._MmapStore.read_directory(directory), [(key, 7.0)])
+
+    def test_endpoint(self):
+        ticket_type = make_ticket_type(make_concert(), qty_total=10)
+        make_ticket(ticket_type)
+        make_order("cs_pending", status="pending")
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/plain; version=0.0.4; charset=utf-8")
+        body = response.content.decode()
+        self.assertIn("nk_orders_pending 1\n", body)
+        self.assertIn(
+            f'nk_cluster_tickets_available{{cluster="{ticket_type.pk}",concert="{ticket_type.for_concert_id}"}} 9\n', body,
+        )
+
+    def test_endpoint_is_for_allowed_ips_and_staff(self):
+        self.assertEqual(self.client.get("/metrics", REMOTE_ADDR="203.0.113.9").status_code, 403)
+
+        self.client.force_login(User.objects.create_user("staff", is_staff=True))
+        self.assertEqual(self.client.get("/metrics", REMOTE_ADDR="203.0.113.9").status_code, 200)
+
+
+class LoggingTests(SimpleTestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = BackgroundHandler(stream=self.stream)
+        self.handler.addFilter(CorrelationFilter())
+        self.logger = logging.getLogger("ticketing.tests.logging")
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+        self.logger.propagate = False
+        self.addCleanup(setattr, self.logger, "propagate", True)
+
+    def records(self):
+        # Stopping the listener flushes the queue.
+        listener = self.handler._listener
+        listener.stop()
+        atexit.unregister(listener.stop)
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_records_carry_bound_ids_and_extra_fields(self):
+        with bind(session_id="cs_test_1"):
+            with bind(order_id=7):
+                self.logger.warning("Order confirmed", extra={"total_amount": "20.00"})
+            self.logger.warning("Webhook received")
+        self.logger.warning("Unbound")
+
+        confirmed, received, unbound = self.records()
+        self.assertEqual(confirmed, {
+            "ts": confirmed["ts"], "level": "WARNING", "logger": "ticketing.tests.logging", "msg": "Order confirmed",
+            "order_id": 7, "session_id": "cs_test_1", "total_amount": "20.00",
+        })
+        self.assertEqual((received.get("order_id"), received["session_id"]), (None, "cs_test_1"))
+        self.assertNotIn("session_id", unbound)
+
+    def test_message_and_traceback_are_captured_when_logged(self):
+        items = ["first"]
+        self.logger.warning("Items: %s", items)
+        items.append("second")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.exception("Failed")
+
+        logged, failed = self.records()
+        self.assertEqual(logged["msg"], "Items: ['first']")
+        self.assertIn("ValueError: boom", failed["exc"])
+
+    def test_full_queue_drops_records_instead_of_blocking(self):
+        handler = BackgroundHandler(stream=io.StringIO(), maxsize=1)
+        with mock.patch.object(handler, "_ensure_listener"):
+            for n in range(3):
+                handler.handle(logging.makeLogRecord({"msg": f"record {n}", "levelno": logging.WARNING}))
+
+        self.assertEqual(handler.dropped, 2)
+
+    def test_debug_records_are_sampled(self):
+        sampling = SamplingFilter({"ticketing.webhook": 0.0})
+        record = lambda name, level: logging.makeLogRecord({"name": name, "levelno": level})
+
+        self.assertFalse(sampling.filter(record("ticketing.webhook.stripe", logging.DEBUG)))
+        self.assertTrue(sampling.filter(record("ticketing.webhook", logging.INFO)))
+        self.assertTrue(sampling.filter(record("ticketing.outbox", logging.DEBUG)))
+
+
+class CheckInTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        self.ticket = make_ticket(make_ticket_type(self.concert))
+        self.code = make_ticket_code(self.ticket.pk, self.concert.pk)
+
+    def test_naive_scan_time_is_taken_as_utc(self):
+        result = checkin.check_in([{"code": self.code, "scanned_at": "2020-10-19T10:00:00"}])[0]
+
+        self.assertEqual(result["result"], checkin.ADMITTED)
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.admitted_at, datetime(2020, 10, 19, 10, tzinfo=dt_timezone.utc))
+
+    def test_future_scan_time_is_clamped_to_now(self):
+        before = timezone.now()
+        checkin.check_in([{"code": self.code, "scanned_at": (before + timedelta(days=1)).isoformat()}])
+
+        self.ticket.refresh_from_db()
+        self.assertLess(self.ticket.admitted_at, before + timedelta(minutes=1))
+
+    def test_earliest_scan_of_a_batch_wins(self):
+        results = checkin.check_in([
+            {"code": self.code, "scanned_at": "2020-10-19T10:05:00Z"},
+            {"code": self.code, "scanned_at": "2020-10-19T10:00:00Z"},
+        ])
+
+        self.assertEqual([r["result"] for r in results], [checkin.ALREADY_ADMITTED, checkin.ADMITTED])
+
+    def test_wrong_concert_and_invalid_code(self):
+        other = make_concert(concert_name="Spring Concert")
+        results = checkin.check_in([{"code": self.code}, {"code": "nonsense"}], concert_id=other.pk)
+
+        self.assertEqual([r["result"] for r in results], [checkin.WRONG_CONCERT, checkin.INVALID_CODE])
+
+    def test_ticket_moved_to_another_concert_is_not_admitted_on_its_old_code(self):
+        other = make_concert(concert_name="Spring Concert")
+        Ticket.objects.filter(pk=self.ticket.pk).update(for_concert=other)
+
+        result = checkin.check_in([{"code": self.code}], concert_id=self.concert.pk)[0]
+
+        self.assertEqual(result["result"], checkin.WRONG_CONCERT)
+        self.ticket.refresh_from_db()
+        self.assertIsNone(self.ticket.admitted_at)
+
+    def test_malformed_scans_get_a_result_in_their_place(self):
+        results = checkin.check_in([
+            "not a scan",
+            {"code": 12345},
+            {"code": self.code, "scanned_at": 1603101600},
+            {"code": self.code, "scanned_at": "2020-13-45T99:00:00"},
+        ])
+
+        self.assertEqual(
+            [r["result"] for r in results],
+            [checkin.INVALID_CODE, checkin.INVALID_CODE, checkin.ADMITTED, checkin.ALREADY_ADMITTED],
+        )
+
+
+class CatalogueTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.concert = make_concert()
+        self.ticket_type = make_ticket_type(self.concert, qty_total=10, display_ticket=True)
+        make_ticket_type(make_concert(concert_name="Last Year", concert_date=date(2020, 12, 5)))
+
+    def test_snapshot_matches_the_api(self):
+        snapshot = catalogue.get_snapshot()
+
+        # Upcoming concerts only; the API lists past ones too.
+        upcoming = [c for c in self.client.get("/api/tickets/concerts/").json() if c["id"] == self.concert.pk]
+        self.assertEqual(snapshot["concerts"], upcoming)
+        self.assertEqual(
+            snapshot["ticket_types"],
+            {str(self.concert.pk): self.client.get(
+                "/api/tickets/concert/tickettypes", {"concert_id": self.concert.pk}
+            ).json()},
+        )
+
+    def test_snapshot_is_cached_until_something_changes(self):
+        catalogue.get_snapshot()
+        with self.assertNumQueries(0):
+            catalogue.get_snapshot()
+
+        make_ticket(self.ticket_type)  # a sale recalculates quantities
+        self.assertEqual(catalogue.get_snapshot()["ticket_types"][str(self.concert.pk)][0]["qty_available"], 9)
+
+        self.concert.concert_name = "Winter Gala"
+        self.concert.save()
+        self.assertEqual(catalogue.get_snapshot()["concerts"][0]["concert_name"], "Winter Gala")
+
+        with defer_quantity_recalculation():
+            self.ticket_type.delete()
+        self.assertEqual(catalogue.get_snapshot()["ticket_types"][str(self.concert.pk)], [])
+
+    @override_settings(
+        WAITING_ROOM_ENABLED=False,
+        STORAGES={
+            "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        },
+    )
+    def test_tickets_page_embeds_the_snapshot(self):
+        response = self.client.get("/tickets/")
+
+        self.assertContains(response, '<script id="ticketing-catalogue" type="application/json">')
+        self.assertContains(response, "Winter Concert")
+        self.assertNotContains(response, "Last Year")
+
+
+class CartTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        self.standard = make_ticket_type(self.concert, qty_total=5, display_ticket=True)
+        self.concession = make_ticket_type(
+            self.concert, ticket_label="Concession", price_id="price_concession", qty_total=5, display_ticket=True,
+        )
+
+    def test_valid_cart(self):
+        lines, errors = cart.validate_cart(self.concert.pk, [
+            {"ticket_type_id": self.standard.pk, "quantity": 2},
+            {"ticket_type_id": self.standard.pk, "quantity": 1},
+            {"ticket_type_id": self.concession.pk, "quantity": 0},
+        ])
+
+        self.assertEqual(errors, [])
+        self.assertEqual(lines, [cart.CartLine(self.standard, 3)])
+
+    def test_every_problem_is_reported(self):
+        hidden = make_ticket_type(self.concert, ticket_label="Hidden", display_ticket=False)
+        other = make_ticket_type(make_concert(concert_name="Spring Concert"), display_ticket=True)
+
+        _, errors = cart.validate_cart(self.concert.pk, [
+            {"ticket_type_id": "x", "quantity": 1},
+            {"ticket_type_id": 999999, "quantity": 1},
+            {"ticket_type_id": hidden.pk, "quantity": 1},
+            {"ticket_type_id": other.pk, "quantity": 1},
+            {"ticket_type_id": self.standard.pk, "quantity": 6},
+        ])
+
+        self.assertEqual([error["code"] for error in errors], [
+            cart.INVALID_ITEM, cart.UNKNOWN_TICKET_TYPE, cart.NOT_ON_SALE, cart.WRONG_CONCERT, cart.INSUFFICIENT,
+        ])
+
+    def test_linked_types_share_availability(self):
+        self.standard.linked_tickets.add(self.concession)
+        self.standard.refresh_from_db()
+        self.assertIsNotNone(self.standard.cluster_id)
+
+        _, errors = cart.validate_cart(self.concert.pk, [
+            {"ticket_type_id": self.standard.pk, "quantity": 3},
+            {"ticket_type_id": self.concession.pk, "quantity": 3},
+        ])
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]["code"], cart.INSUFFICIENT)
+        self.assertEqual(errors[0]["requested"], 6)
+
+    def test_idempotency_key(self):
+        lines = [cart.CartLine(self.standard, 2), cart.CartLine(self.concession, 1)]
+        key = cart.idempotency_key("client-a", self.concert.pk, lines)
+
+        self.assertEqual(key, cart.idempotency_key("client-a", str(self.concert.pk), lines[::-1]))
+        self.assertNotEqual(key, cart.idempotency_key("client-b", self.concert.pk, lines))
+        self.assertNotEqual(key, cart.idempotency_key("client-a", self.concert.pk, lines, "retry-2"))
+        self.assertNotEqual(key, cart.idempotency_key("client-a", self.concert.pk, lines, seats=["A1"]))
+
+
+class WaitingRoomTests(TestCase):
+    def test_database_store_meters_admission(self):
+        store = waiting_room.DatabaseQueueStore(rate=1, burst=2)
+        positions = [store.issue() for _ in range(4)]
+
+        self.assertEqual(positions, [1, 2, 3, 4])
+        self.assertEqual(store.served(), 2)
+        self.assertEqual(store.served(), 2)
+        # A second process sees the same queue.
+        self.assertEqual(waiting_room.DatabaseQueueStore(rate=1, burst=2).issue(), 5)
+
+        WaitingRoomState.objects.update(refilled_at=F("refilled_at") - 1)
+        self.assertEqual(store.served(), 3)
+
+    def test_local_store_meters_admission(self):
+        store = waiting_room.LocalQueueStore(rate=0, burst=2)
+        for _ in range(3):
+            store.issue()
+
+        self.assertEqual(store.served(), 2)
+
+
+@mock.patch("stripe.Refund.create", side_effect=lambda **kwargs: {"id": f"re_{kwargs['payment_intent']}"})
+class RefundTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        self.ticket_type = make_ticket_type(self.concert, display_ticket=True)
+
+    @mock.patch("stripe.checkout.Session.expire")
+    def test_refund_run_resumes_and_expires_open_checkouts(self, expire, refund):
+        confirmed = make_order("cs_confirmed")
+        interrupted = make_order("cs_interrupted", status="refunding")
+        open_checkout = make_order("cs_open", status="pending", concert=self.concert)
+        for order in (confirmed, interrupted):
+            make_ticket(self.ticket_type, transaction_ID=order.stripe_session_id)
+
+        result = refunds.refund_concert(self.concert, workers=2)
+
+        self.assertEqual(result, refunds.RefundResult(refunded=2, failed=0, expired=1))
+        expire.assert_called_once_with("cs_open")
+        self.assertEqual(
+            dict(Order.objects.values_list("stripe_session_id", "status")),
+            {"cs_confirmed": "refunded", "cs_interrupted": "refunded", "cs_open": "cancelled"},
+        )
+        self.assertFalse(Ticket.objects.filter(validity=True).exists())
+        self.assertFalse(TicketType.objects.get(pk=self.ticket_type.pk).display_ticket)
+        self.assertIsNotNone(Concert.objects.get(pk=self.concert.pk).cancelled_at)
+
+        # Running again finds nothing left to do.
+        self.assertEqual(refunds.refund_concert(self.concert), refunds.RefundResult(0, 0, 0))
+        self.assertEqual(refund.call_count, 2)
+
+    def test_checkout_completed_after_cancellation_is_refunded(self, refund):
+        Concert.objects.filter(pk=self.concert.pk).update(cancelled_at=timezone.now())
+        order = make_order("cs_late", status="pending", payment_intent_id="")
+        line_items = {"data": [{"price": {"id": self.ticket_type.price_id}, "quantity": 2}]}
+        event = {"type": "checkout.session.completed", "data": {"object": {
+            "id": "cs_late", "payment_intent": "pi_late", "customer_details": {"email": "ada@example.com"},
+        }}}
+
+        with mock.patch("stripe.checkout.Session.list_line_items", return_value=line_items):
+            response = handle_webhook(event)
+
+        self.assertEqual(response.data["status"], "success")
+        order.refresh_from_db()
+        self.assertEqual((order.status, order.refund_id, order.concert_id), ("refunded", "re_pi_late", self.concert.pk))
+        self.assertFalse(Ticket.objects.exists())
+
+
+class SeatingTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        self.ticket_type = make_ticket_type(self.concert, seated=True)
+        self.seat_map = SeatMap.objects.create(concert=self.concert, rows=[{"label": "A", "seats": 4}, {"label": "B", "seats": 6}])
+        self.layout = seating.Layout(self.seat_map.rows)
+
+    def test_layout(self):
+        self.assertEqual(self.layout.capacity, 10)
+        self.assertEqual((self.layout.label(0), self.layout.label(9)), ("A1", "B6"))
+        self.assertEqual(self.layout.seat(" b-2 "), 5)
+        with self.assertRaises(seating.SeatsUnavailable):
+            self.layout.seat("A5")
+
+    def test_best_available(self):
+        # Together, front-most row first, as central as possible.
+        self.assertEqual(self.layout.best_available(0, 2), [1, 2])
+        self.assertEqual(self.layout.best_available(0b1111, 3), [5, 6, 7])
+        # No row has room together: front-most free seats.
+        every_other = 0b0101010101
+        self.assertEqual(self.layout.best_available(every_other, 3), [1, 3, 5])
+        self.assertIsNone(self.layout.best_available(0b1111111110, 2))
+
+    def test_reserve_and_release(self):
+        hold = seating.reserve(self.concert.pk, 2, labels=["A1", "a2"])
+        self.assertEqual(hold.seats, [0, 1])
+        with self.assertRaisesMessage(seating.SeatsUnavailable, "Seat A2 is no longer available."):
+            seating.reserve(self.concert.pk, 1, labels=["A2"])
+        self.assertEqual(seating.reserve(self.concert.pk, 2).seats, [2, 3])
+
+        seating.release(hold)
+        self.seat_map.refresh_from_db()
+        self.assertEqual(seating.to_int(self.seat_map.held), 0b1100)
+
+    def test_confirm_sells_the_held_seats(self):
+        order = make_order("cs_seated")
+        hold = seating.reserve(self.concert.pk, 2)
+        hold.order = order
+        hold.save()
+        tickets = [make_ticket(self.ticket_type) for _ in range(2)]
+
+        seating.confirm(order, tickets)
+
+        self.seat_map.refresh_from_db()
+        self.assertEqual(sorted(Ticket.objects.values_list("seat", flat=True)), hold.seats)
+        self.assertEqual(seating.to_int(self.seat_map.sold), seating._mask(hold.seats))
+        self.assertEqual(seating.to_int(self.seat_map.held), 0)
+
+    def test_confirm_flags_tickets_it_cannot_seat(self):
+        # The order's hold was swept and the hall sold out meanwhile.
+        SeatMap.objects.filter(pk=self.seat_map.pk).update(sold=seating.to_bytes(0b1111111110, 10))
+        tickets = [make_ticket(self.ticket_type) for _ in range(2)]
+
+        with self.assertLogs("ticketing.seating", "WARNING"):
+            seating.confirm(make_order("cs_seated"), tickets)
+
+        self.assertFalse(Ticket.objects.filter(seat__isnull=False).exists())
+        self.assertEqual(TicketEvent.objects.filter(message__startswith="Issued without a seat").count(), 2)
+
+    def test_sync_keeps_a_seat_sold_while_it_ran(self):
+        make_ticket(self.ticket_type, seat=0)
+        Layout = seating.Layout
+
+        def sell_meanwhile(rows):
+            # Another checkout sells A2 after sync_sold has read the map.
+            if not Ticket.objects.filter(seat=1).exists():
+                make_ticket(self.ticket_type, seat=1)
+                SeatMap.objects.filter(pk=self.seat_map.pk).update(
+                    sold=seating.to_bytes(0b11, 10), version=F("version") + 1
+                )
+            return Layout(rows)
+
+        with mock.patch.object(seating, "Layout", side_effect=sell_meanwhile):
+            seating.sync_sold([self.concert.pk])
+
+        self.seat_map.refresh_from_db()
+        self.assertEqual(seating.to_int(self.seat_map.sold), 0b11)
+
+
+class DoorBundleTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        ticket_type = make_ticket_type(self.concert)
+        self.unchanged, self.invalidated, self.deleted, self.moved = [make_ticket(ticket_type) for _ in range(4)]
+        for ticket in (self.unchanged, self.invalidated, self.deleted, self.moved):
+            ticket.code_pk = ticket.pk  # deleting clears pk
+        Ticket.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+        Ticket.objects.filter(pk=self.unchanged.pk).update(updated_at=timezone.now() - timedelta(hours=2))
+
+    def hash(self, ticket):
+        return door_bundle.code_hash(make_ticket_code(ticket.code_pk, self.concert.pk))
+
+    def test_full_bundle(self):
+        Ticket.objects.filter(pk=self.invalidated.pk).update(validity=False)
+        Ticket.objects.filter(pk=self.unchanged.pk).update(admitted_at=timezone.now())
+
+        header, records = door_bundle.read_bundle(door_bundle.build_bundle(self.concert)[0])
+
+        self.assertEqual((header["kind"], header["count"]), (door_bundle.FULL, 4))
+        self.assertEqual(records[self.hash(self.unchanged)], door_bundle.STATE_ADMITTED)
+        self.assertEqual(records[self.hash(self.invalidated)], door_bundle.STATE_INVALID)
+        self.assertEqual(records[self.hash(self.deleted)], door_bundle.STATE_VALID)
+
+    def test_delta_reports_changed_and_removed_tickets(self):
+        _, since = door_bundle.build_bundle(self.concert)
+
+        Ticket.objects.filter(pk=self.invalidated.pk).update(validity=False, updated_at=timezone.now())
+        self.deleted.delete()
+        other = make_concert(concert_name="Spring Concert")
+        Ticket.objects.filter(pk=self.moved.pk).update(for_concert=other, updated_at=timezone.now())
+        TicketRemoval.log([(self.moved.pk, self.concert.pk)])
+
+        data, watermark = door_bundle.build_bundle(self.concert, since=since)
+        header, records = door_bundle.read_bundle(data)
+
+        self.assertEqual(header["kind"], door_bundle.DELTA)
+        self.assertGreater(watermark, since)
+        self.assertEqual(records, {
+            self.hash(self.invalidated): door_bundle.STATE_INVALID,
+            self.hash(self.deleted): door_bundle.STATE_INVALID,
+            self.hash(self.moved): door_bundle.STATE_INVALID,
+        })
+        # Nothing has changed since this delta.
+        self.assertEqual(door_bundle.read_bundle(door_bundle.build_bundle(self.concert, since=watermark)[0])[1], {
+            self.hash(self.invalidated): door_bundle.STATE_INVALID,
+            self.hash(self.deleted): door_bundle.STATE_INVALID,
+            self.hash(self.moved): door_bundle.STATE_INVALID,
+        })
+
+    def test_deleting_a_concert_with_tickets(self):
+        with defer_quantity_recalculation():
+            self.concert.delete()
+
+        self.assertFalse(Ticket.objects.exists())
+
+
+class SalesTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        self.ticket_type = make_ticket_type(self.concert, price=10)
+
+    def revenue(self):
+        return sum(SalesRollup.objects.values_list("revenue", flat=True))
+
+    def test_revenue_is_the_price_tickets_were_sold_at(self):
+        make_order("cs_paid", status="pending")
+        line_items = {"data": [{
+            "price": {"id": self.ticket_type.price_id}, "quantity": 2, "amount_total": 1920, "amount_tax": 320,
+        }]}
+        event = {"type": "checkout.session.completed", "data": {"object": {"id": "cs_paid", "payment_intent": "pi_paid"}}}
+        with mock.patch("stripe.checkout.Session.list_line_items", return_value=line_items):
+            handle_webhook(event)
+
+        self.assertEqual(set(Ticket.objects.values_list("price", flat=True)), {Decimal("8.00")})
+        self.assertEqual(self.revenue(), Decimal("16.00"))
+
+        # A later price change doesn't rewrite past sales.
+        TicketType.objects.filter(pk=self.ticket_type.pk).update(price=20)
+        sales.rebuild()
+        self.assertEqual(self.revenue(), Decimal("16.00"))
+        self.assertEqual(list(exports._sales(self.concert)[1])[0][-1], Decimal("16.00"))
+
+    def test_tickets_without_a_recorded_price_count_at_their_types_price(self):
+        make_order("cs_old", confirmed_at=timezone.now())
+        make_ticket(self.ticket_type, transaction_ID="cs_old")
+
+        sales.rebuild()
+
+        self.assertEqual(self.revenue(), Decimal("10.00"))
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.concert = make_concert()
+        self.ticket_type = make_ticket_type(self.concert, price=10)
+        self.order = make_order("cs_paid", customer_name="Ada Lovelace", total_amount=Decimal("20.00"))
+        self.tickets = [make_ticket(self.ticket_type, transaction_ID="cs_paid") for _ in range(2)]
+        Ticket.objects.filter(pk=self.tickets[1].pk).update(validity=False)
+        other = make_ticket_type(make_concert(concert_name="Spring Concert"))
+        make_order("cs_other")
+        make_ticket(other, transaction_ID="cs_other")
+
+    def export(self, kind, fmt):
+        return "".join(exports.iter_export(self.concert, kind, fmt))
+
+    def test_tickets_csv(self):
+        self.assertEqual(self.export("tickets", "csv").splitlines(), [
+            "id,name,email,ticket_type,validity,transaction_ID",
+            f"{self.tickets[0].pk},Ada Lovelace,ada@example.com,Standard,True,cs_paid",
+            f"{self.tickets[1].pk},Ada Lovelace,ada@example.com,Standard,False,cs_paid",
+        ])
+
+    def test_orders_jsonl(self):
+        rows = [json.loads(line) for line in self.export("orders", "jsonl").splitlines()]
+
+        self.assertEqual([row["stripe_session_id"] for row in rows], ["cs_paid"])
+        self.assertEqual((rows[0]["customer_name"], rows[0]["total_amount"]), ("Ada Lovelace", "20.00"))
+
+    def test_sales_csv(self):
+        (row,) = self.export("sales", "csv").splitlines()[1:]
+        *counts, revenue = row.split(",")
+
+        self.assertEqual(counts, [str(self.ticket_type.pk), "Standard", "10.00", "100", "1", "1"])
+        self.assertEqual(Decimal(revenue), Decimal("10.00"))
+
+    def test_rows_are_read_as_the_response_is_sent(self):
+        with self.assertNumQueries(0):
+            chunks = exports.iter_export(self.concert, "tickets", "csv")
+        with self.assertNumQueries(1):
+            self.assertEqual(len(list(chunks)), 3)
+
+    def test_admin_download(self):
+        self.client.force_login(User.objects.create_superuser("admin"))
+        url = f"/admin/ticketing/concert/{self.concert.pk}/export/tickets.jsonl"
+
+        response = self.client.get(url)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"], f'attachment; filename="concert-{self.concert.pk}-tickets.jsonl"'
+        )
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 2)
+        self.assertEqual(self.client.get(url.replace(".jsonl", ".xml")).status_code, 404)
+
+
+class RenderingTests(TestCase):
+    def setUp(self):
+        render_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, render_dir)
+        settings_override = override_settings(TICKET_RENDER_DIR=render_dir, TICKET_RENDER_WORKERS=1)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.order = make_order("cs_paid")
+        ticket_type = make_ticket_type(make_concert())
+        self.tickets = [make_ticket(ticket_type, transaction_ID="cs_paid") for _ in range(2)]
+
+    def test_render_once_and_reuse_pages(self):
+        pages, pdf_path = rendering._order_job(self.order)
+
+        self.assertEqual(render_worker.render_order_document(pages, pdf_path), pdf_path)
+        with open(pdf_path, "rb") as f:
+            self.assertEqual(f.read(5), b"%PDF-")
+        self.assertEqual(rendering.order_document_path(self.order), pdf_path)
+
+        with mock.patch("ticketing.render_worker.render_ticket_page") as render_page:
+            render_worker.render_order_document(pages, pdf_path)
+        render_page.assert_not_called()
+
+    def test_edits_produce_new_files(self):
+        pages, pdf_path = rendering._order_job(self.order)
+        render_worker.render_order_document(pages, pdf_path)
+
+        Ticket.objects.filter(pk=self.tickets[0].pk).update(name="Ada King")
+        new_pages, new_pdf_path = rendering._order_job(self.order)
+
+        self.assertNotEqual(new_pages[0][1], pages[0][1])
+        self.assertEqual(new_pages[1][1], pages[1][1])
+        self.assertNotEqual(new_pdf_path, pdf_path)
+        self.assertIsNone(rendering.order_document_path(self.order))
+
+    def test_order_render_is_submitted_after_commit(self):
+        pool = ThreadPoolExecutor(max_workers=1)
+        with mock.patch("ticketing.rendering.get_pool", return_value=pool):
+            with self.captureOnCommitCallbacks(execute=True):
+                rendering.submit_order_render(self.order)
+                self.assertIsNone(rendering.order_document_path(self.order))
+            pool.shutdown(wait=True)
+
+        self.assertIsNotNone(rendering.order_document_path(self.order))
+
+    def test_failures_are_logged(self):
+        future = Future()
+        future.set_exception(OSError("disk full"))
+
+        with self.assertLogs("ticketing.rendering", "ERROR"):
+            rendering._log_failure(self.order.pk)(future)
+
+    def test_render_orders_in_the_process_pool(self):
+        rendering._pool = None
+        self.addCleanup(setattr, rendering, "_pool", None)
+        self.addCleanup(lambda: rendering._pool and rendering._pool.shutdown(wait=True))
+        make_order("cs_empty")  # no tickets, nothing to render
+
+        results = dict(rendering.render_orders(Order.objects.all()))
+
+        self.assertEqual(list(results), [self.order.pk])
+        self.assertEqual(results[self.order.pk], rendering.order_document_path(self.order))
+        # Already rendered: not sent to the pool again.
+        with mock.patch("ticketing.rendering.get_pool") as get_pool:
+            self.assertEqual(dict(rendering.render_orders(Order.objects.all())), results)
+        get_pool.assert_not_called()
+
+
+class StaticFilesTests(SimpleTestCase):
+    def setUp(self):
+        static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, static_root)
+        # Just the ticketing bundle, through the configured storage.
+        settings_override = override_settings(
+            STATIC_ROOT=static_root,
+            STATICFILES_DIRS=[settings.BASE_DIR / "ticketing" / "static"],
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    def test_bundle_is_hashed_and_precompressed(self):
+        url = static("ticketing/assets/main.js")
+
+        self.assertRegex(url, r"^/static/ticketing/assets/main\.[0-9a-f]{12}\.js$")
+        name = url.removeprefix(settings.STATIC_URL)
+        for suffix in ("", ".gz", ".br"):
+            self.assertTrue(staticfiles_storage.exists(name + suffix), suffix)
+
+    def test_hashed_files_are_served_immutable_and_compressed(self):
+        response = self.client.get(static("ticketing/assets/main.js"), HTTP_ACCEPT_ENCODING="gzip, br")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(response["Content-Encoding"], "br")
+
+        unhashed = self.client.get("/static/ticketing/assets/main.js")
+        self.assertNotIn("immutable", unhashed.get("Cache-Control", ""))
+
+
+class TicketTypeVersionTests(TestCase):
+    def setUp(self):
+        self.ticket_type = make_ticket_type(make_concert(), qty_total=10)
+        self.ticket_type.refresh_from_db()
+        self.write_quantities = TicketType._write_quantities
+
+    def sell_behind_its_back(self):
+        # A sale whose own recalculation hasn't run yet, but which has moved the row.
+        Ticket.objects.bulk_create([Ticket(
+            name="Ada Lovelace", email="ada@example.com", transaction_ID="cs_test",
+            ticket_type=self.ticket_type, for_concert=self.ticket_type.for_concert,
+        )])
+        TicketType.objects.filter(pk=self.ticket_type.pk).update(version=F("version") + 1)
+
+    def test_every_write_bumps_the_version(self):
+        version = self.ticket_type.version
+
+        make_ticket(self.ticket_type)
+        self.ticket_type.refresh_from_db()
+        self.assertEqual(self.ticket_type.version, version + 1)
+
+        self.ticket_type.ticket_label = "Renamed"
+        self.ticket_type.save()
+        self.assertEqual(TicketType.objects.get(pk=self.ticket_type.pk).version, version + 2)
+
+    def test_recalculation_counts_again_after_a_conflict(self):
+        calls = []
+
+        def write_quantities(queryset, sold_count):
+            calls.append(sold_count)
+            if len(calls) == 1:
+                self.sell_behind_its_back()
+            return self.write_quantities(queryset, sold_count)
+
+        with mock.patch.object(TicketType, "_write_quantities", side_effect=write_quantities):
+            TicketType.recalculate_quantities_for_cluster(self.ticket_type)
+
+        self.assertEqual(calls, [0, 1])
+        self.ticket_type.refresh_from_db()
+        self.assertEqual((self.ticket_type.qty_sold, self.ticket_type.qty_available), (1, 9))
+
+    def test_freshest_count_wins_when_conflicts_persist(self):
+        calls = []
+
+        def write_quantities(queryset, sold_count):
+            calls.append(sold_count)
+            if len(calls) <= TicketType.RECALCULATE_ATTEMPTS:
+                self.sell_behind_its_back()
+            return self.write_quantities(queryset, sold_count)
+
+        with mock.patch.object(TicketType, "_write_quantities", side_effect=write_quantities), \
+                self.assertLogs("ticketing.models", "WARNING"):
+            TicketType.recalculate_quantities_for_cluster(self.ticket_type)
+
+        self.assertEqual(calls, [0, 1, 2, 3, 4, 5])
+        self.ticket_type.refresh_from_db()
+        self.assertEqual((self.ticket_type.qty_sold, self.ticket_type.qty_available), (5, 5))
+
+    def test_saving_a_stale_copy_raises_version_conflict(self):
+        stale = TicketType.objects.get(pk=self.ticket_type.pk)
+        self.ticket_type.ticket_label = "Renamed"
+        self.ticket_type.save()
+
+        stale.ticket_label = "Overwritten"
+        with self.assertRaises(VersionConflict):
+            stale.save()
+        self.assertEqual(TicketType.objects.get(pk=self.ticket_type.pk).ticket_label, "Renamed")
+
+    def test_save_leaves_the_counters_to_recalculation(self):
+        stale = TicketType.objects.get(pk=self.ticket_type.pk)
+        self.sell_behind_its_back()
+        TicketType.recalculate_quantities_for_cluster(self.ticket_type)
+        stale.refresh_from_db(fields=["version"])
+
+        stale.ticket_label = "Renamed"
+        stale.save()
+
+        self.ticket_type.refresh_from_db()
+        self.assertEqual((self.ticket_type.ticket_label, self.ticket_type.qty_sold), ("Renamed", 1))
+
+    def test_edit_digest_ignores_sales(self):
+        digest = self.ticket_type.edit_digest()
+
+        make_ticket(self.ticket_type)
+        self.assertEqual(TicketType.objects.get(pk=self.ticket_type.pk).edit_digest(), digest)
+
+        TicketType.objects.filter(pk=self.ticket_type.pk).update(ticket_label="Renamed")
+        self.assertNotEqual(TicketType.objects.get(pk=self.ticket_type.pk).edit_digest(), digest)
+
+
+class InventoryTests(TestCase):
+    def setUp(self):
+        concert = make_concert()
+        self.standard = make_ticket_type(concert, qty_total=10, price_id="price_linked")
+        self.concession = make_ticket_type(concert, qty_total=10, price_id="price_concession")
+        self.standard.linked_tickets.add(self.concession)
+        self.standard.refresh_from_db()
+        self.concession.refresh_from_db()
+        self.standalone = make_ticket_type(concert, qty_total=10)
+        # As left by a bulk insert: not linked to anything, no cluster_id.
+        TicketType.objects.filter(pk=self.standalone.pk).update(cluster_id=None)
+        self.standalone.refresh_from_db()
+        for ticket_type in (self.standalone, self.standalone, self.standard, self.concession):
+            make_ticket(ticket_type)
+
+    def drift(self):
+        return [drift for batch in inventory.find_drift(batch_size=1) for drift in batch]
+
+    def test_counters_kept_by_sales_are_not_drift(self):
+        self.assertIsNone(TicketType.objects.get(pk=self.standalone.pk).cluster_id)
+        self.assertEqual(self.drift(), [])
+
+    def test_drift_is_found_and_repaired(self):
+        TicketType.objects.filter(pk__in=[self.standalone.pk, self.concession.pk]).update(qty_sold=0, qty_available=10)
+
+        drifted = self.drift()
+
+        self.assertEqual(
+            {(drift.ticket_type_id, drift.expected_sold, drift.expected_available) for drift in drifted},
+            {(self.standalone.pk, 2, 8), (self.concession.pk, 2, 8)},
+        )
+        self.assertEqual(inventory.repair(drifted), 2)
+        self.assertEqual(self.drift(), [])
+
+
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.emails = [
+            OutboxEmail.objects.create(to_email=f"buyer{n}@example.com", subject=f"Tickets {n}", body="")
+            for n in range(3)
+        ]
+
+    def test_an_email_that_cannot_be_built_does_not_hold_up_the_rest(self):
+        build = outbox._build_message
+
+        def build_message(email, connection):
+            if email.pk == self.emails[0].pk:
+                raise OSError("attachment unreadable")
+            return build(email, connection)
+
+        with mock.patch("ticketing.outbox._build_message", side_effect=build_message):
+            self.assertEqual(outbox.drain(), (2, 1))
+
+        self.assertEqual(len(mail.outbox), 2)
+        broken = OutboxEmail.objects.get(pk=self.emails[0].pk)
+        self.assertEqual((broken.status, broken.attempts), (OutboxEmail.PENDING, 1))
+        self.assertIn("attachment unreadable", broken.last_error)
+
+    def test_rate_limit_waits_between_batches_with_no_connection_open(self):
+        clock = [0.0]
+        open_while_sleeping = []
+
+        class Connection(mail.get_connection().__class__):
+            opened = False
+
+            def open(self):
+                Connection.opened = True
+
+            def close(self):
+                Connection.opened = False
+
+        def sleep(seconds):
+            open_while_sleeping.append(Connection.opened)
+            clock[0] += seconds
+
+        with mock.patch("ticketing.outbox.get_connection", Connection), \
+                mock.patch("ticketing.outbox.time.monotonic", lambda: clock[0]), \
+                mock.patch("ticketing.outbox.time.sleep", side_effect=sleep):
+            self.assertEqual(outbox.drain(batch_size=10, rate_per_minute=2), (3, 0))
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(open_while_sleeping, [False])
+        self.assertEqual(clock[0], 60)
+
+
+class StripeEventCatchUpTests(TestCase):
+    def setUp(self):
+        start = int(timezone.now().timestamp()) - 600
+        self.events = [
+            {"id": f"evt_{n}", "type": "checkout.session.completed", "created": start + n,
+             "data": {"object": {"id": f"cs_{n}", "payment_intent": payment}}}
+            for n, payment in enumerate(["pi_a", "pi_b", "pi_b", "pi_c"])
+        ]
+        self.failing = {"evt_1"}
+        self.attempted = []
+        patch = mock.patch("ticketing.stripe_events.list_events", side_effect=lambda since: list(self.events))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def handle(self, event):
+        self.attempted.append(event["id"])
+        return event["id"] not in self.failing, "boom"
+
+    def catch_up(self):
+        self.attempted = []
+        with mock.patch("ticketing.stripe_events._handle", side_effect=self.handle):
+            result = stripe_events.catch_up(workers=2)
+        # Recorded as handle_webhook() would have, outside the worker threads.
+        for event in self.events:
+            if event["id"] in self.attempted and event["id"] not in self.failing:
+                StripeEvent.objects.update_or_create(event_id=event["id"], defaults={
+                    "event_type": event["type"], "created": stripe_events._created(event), "status": StripeEvent.HANDLED,
+                })
+        return result
+
+    def checkpoint(self):
+        return StripeEventCheckpoint.objects.get(name=stripe_events.DEFAULT_CHECKPOINT).processed_through
+
+    def test_checkpoint_stops_before_a_failed_event(self):
+        result = self.catch_up()
+
+        # evt_2 is for the same payment as evt_1, so it waits for the next run.
+        self.assertEqual(sorted(self.attempted), ["evt_0", "evt_1", "evt_3"])
+        self.assertEqual((result.handled, result.failed, result.gave_up), (2, 2, 0))
+        self.assertEqual(self.checkpoint(), stripe_events._created(self.events[0]))
+        failure = StripeEvent.objects.get(event_id="evt_1")
+        self.assertEqual((failure.status, failure.attempts, failure.last_error), (StripeEvent.FAILED, 1, "boom"))
+
+        self.failing.clear()
+        self.assertEqual(self.catch_up().handled, 2)
+        self.assertEqual(self.attempted, ["evt_1", "evt_2"])
+        self.assertGreater(self.checkpoint(), stripe_events._created(self.events[-1]))
+
+    @override_settings(STRIPE_EVENT_MAX_ATTEMPTS=2)
+    def test_event_that_keeps_failing_is_given_up_on(self):
+        self.catch_up()
+        with self.assertLogs("ticketing.stripe_events", "ERROR"):
+            result = self.catch_up()
+
+        self.assertEqual(result.gave_up, 1)
+        self.assertEqual(StripeEvent.objects.get(event_id="evt_1").status, StripeEvent.GAVE_UP)
+        # The checkpoint has moved through it; the event held back behind it goes next run.
+        self.assertEqual(self.checkpoint(), stripe_events._created(self.events[1]))
+
+        self.catch_up()
+        self.assertEqual(self.attempted, ["evt_2"])
+
+    def test_webhook_retries_failed_events_but_not_given_up_ones(self):
+        for event_id, status in [("evt_failed", StripeEvent.FAILED), ("evt_gave_up", StripeEvent.GAVE_UP)]:
+            StripeEvent.objects.create(event_id=event_id, event_type="charge.refunded", created=timezone.now(), status=status)
+
+        def deliver(event_id):
+            event = {"id": event_id, "type": "charge.refunded", "created": 0, "data": {"object": {"id": "ch_1"}}}
+            return handle_webhook(event).data
+
+        self.assertEqual(deliver("evt_failed"), {"status": "success"})
+        self.assertEqual(StripeEvent.objects.get(event_id="evt_failed").status, StripeEvent.HANDLED)
+        self.assertEqual(deliver("evt_gave_up")["detail"], "Already processed")
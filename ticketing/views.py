@@ -1,7 +1,36 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import render
 
+from ticketing import cart
+from ticketing import catalogue
+from ticketing import metrics as ts_metrics
+from ticketing import waiting_room
+
 def ticketing_page(request):
-    return render(request, "ticket_purchase.html")
+    # Takes a place in the waiting room, if the buyer doesn't have one yet.
+    token, queue = waiting_room.check(request, join=True)
+    response = render(request, "ticket_purchase.html", {
+        "catalogue": catalogue.get_snapshot(),
+        "queue": queue,
+    })
+    # Give the browser its checkout identity up front, so even its first
+    # checkout requests (e.g. a double click) share one idempotency key.
+    client, new = cart.client_id(request)
+    if new:
+        cart.set_client_cookie(response, client)
+    return waiting_room.set_cookie(response, token)
 
 def ticketing_success(request):
     return render(request, "ticket_purchase_complete.html")
+
+def metrics(request):
+    """
+    Prometheus scrape endpoint. Only reachable from METRICS_ALLOWED_IPS or by staff.
+    """
+    if request.META.get("REMOTE_ADDR") not in settings.METRICS_ALLOWED_IPS and not request.user.is_staff:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        ts_metrics.render(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,230 @@
+"""
+Virtual waiting room for on-sale launches.
+
+Visiting /tickets/ hands the buyer a queue position in a signed cookie. A
+token bucket (WAITING_ROOM_ADMIT_RATE per second, bursting to
+WAITING_ROOM_BURST) moves the "served" mark along the queue. Once a buyer's
+position is served, their cookie is re-signed with an admission that lasts
+WAITING_ROOM_ADMISSION_TTL seconds. Only admitted buyers may create checkout
+sessions. When the site is quiet the burst admits people immediately, so
+the queue is invisible.
+
+Only the ticket page joins buyers to the queue. The frontend polls the
+status endpoint, which only touches the cookie and the queue store (no
+session) and never hands out places, so polling can't push anyone back.
+
+The store is pluggable and must be shared by every worker, or positions
+mean nothing:
+- DatabaseQueueStore (the default) keeps it in one database row.
+- CacheQueueStore keeps it in the default cache, when that cache is shared
+  (e.g. Redis or memcached).
+- LocalQueueStore keeps it in process memory: a single process only.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils.module_loading import import_string
+
+from ticketing.models import WaitingRoomState
+
+COOKIE_NAME = "nk_queue"
+_SALT = "ticketing.waiting_room"
+
+
+class LocalQueueStore:
+    """
+    Queue state in this process' memory.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._issued = 0
+        self._served = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+
+    def issue(self):
+        with self._lock:
+            self._issued += 1
+            return self._issued
+
+    def served(self):
+        """
+        Spend the tokens accrued since the last call admitting the next
+        people in line, and return the highest admitted position.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            admit = min(int(self._tokens), self._issued - self._served)
+            self._served += admit
+            self._tokens -= admit
+            return self._served
+
+
+class CacheQueueStore:
+    """
+    Queue state in the default cache, shared by every process using it.
+
+    Positions come from an atomic cache.incr. Refilling the bucket is done by
+    whichever process holds a short cache.add lock; the others just read the
+    served mark, which is at most a moment behind.
+    """
+    KEY = "ticketing:waiting_room:"
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+
+    def issue(self):
+        cache.add(self.KEY + "issued", 0, timeout=None)
+        return cache.incr(self.KEY + "issued")
+
+    def served(self):
+        served = cache.get(self.KEY + "served", 0)
+        if not cache.add(self.KEY + "lock", 1, timeout=1):
+            return served
+        try:
+            now = time.time()
+            tokens, refilled_at = cache.get(self.KEY + "bucket", (float(self.burst), now))
+            tokens = min(self.burst, tokens + (now - refilled_at) * self.rate)
+            admit = min(int(tokens), cache.get(self.KEY + "issued", 0) - served)
+            if admit > 0:
+                served += admit
+                tokens -= admit
+                cache.set(self.KEY + "served", served, timeout=None)
+            cache.set(self.KEY + "bucket", (tokens, now), timeout=None)
+            return served
+        finally:
+            cache.delete(self.KEY + "lock")
+
+
+class DatabaseQueueStore:
+    """
+    Queue state in one WaitingRoomState row, shared by every process.
+
+    Positions come from an atomic increment. Admitting people writes the
+    bucket back with a conditional update on refilled_at, so concurrent
+    pollers can't spend the same tokens twice. While nobody can be admitted
+    the bucket is only written every REFILL_INTERVAL seconds, so most polls
+    are a single read.
+    """
+    REFILL_INTERVAL = 0.25
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+
+    def _create(self):
+        WaitingRoomState.objects.get_or_create(
+            pk=1, defaults={"tokens": float(self.burst), "refilled_at": time.time()}
+        )
+
+    def issue(self):
+        state = WaitingRoomState.objects.filter(pk=1)
+        with transaction.atomic():
+            if not state.update(issued=F("issued") + 1):
+                self._create()
+                state.update(issued=F("issued") + 1)
+            return state.values_list("issued", flat=True).get()
+
+    def served(self):
+        state = WaitingRoomState.objects.filter(pk=1)
+        row = state.values_list("issued", "served", "tokens", "refilled_at").first()
+        if row is None:
+            self._create()
+            return 0
+        issued, served, tokens, refilled_at = row
+        now = time.time()
+        tokens = min(self.burst, tokens + (now - refilled_at) * self.rate)
+        admit = max(0, min(int(tokens), issued - served))
+        if not admit and now - refilled_at < self.REFILL_INTERVAL:
+            return served
+
+        if state.filter(refilled_at=refilled_at).update(served=served + admit, tokens=tokens - admit, refilled_at=now):
+            return served + admit
+        return state.values_list("served", flat=True).get()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            store_class = import_string(settings.WAITING_ROOM_STORE)
+            _store = store_class(settings.WAITING_ROOM_ADMIT_RATE, settings.WAITING_ROOM_BURST)
+    return _store
+
+
+def read_token(request):
+    """
+    The buyer's {"position": n, "admitted_until": epoch seconds or None}, or None.
+    """
+    value = request.COOKIES.get(COOKIE_NAME)
+    if not value:
+        return None
+    try:
+        return signing.loads(value, salt=_SALT)
+    except signing.BadSignature:
+        return None
+
+
+def check(request, join=False):
+    """
+    Return (token, status) for the buyer, advancing the queue. With `join`
+    (the ticket page), a buyer without a place joins at the back; otherwise
+    they're told to join ({"admitted": false, "queued": false}). A buyer
+    whose admission expired is treated as having no place. The caller must
+    store the returned token with set_cookie().
+    """
+    if not settings.WAITING_ROOM_ENABLED:
+        return None, {"admitted": True}
+
+    token = read_token(request)
+    now = time.time()
+    if token is not None and token.get("admitted_until") and token["admitted_until"] <= now:
+        token = None
+    if token is None:
+        if not join:
+            return None, {"admitted": False, "queued": False}
+        token = {"position": get_store().issue(), "admitted_until": None}
+
+    if not token.get("admitted_until"):
+        served = get_store().served()
+        if token["position"] > served:
+            ahead = token["position"] - served
+            return token, {
+                "admitted": False,
+                "queued": True,
+                "ahead": ahead,
+                # Poll roughly twice before our turn, within 1-30 seconds
+                "retry_after": max(1, min(30, round(ahead / settings.WAITING_ROOM_ADMIT_RATE / 2))),
+            }
+        token = {**token, "admitted_until": int(now + settings.WAITING_ROOM_ADMISSION_TTL)}
+
+    return token, {"admitted": True, "admitted_until": token["admitted_until"]}
+
+
+def set_cookie(response, token):
+    if token is None:
+        return response
+    response.set_cookie(
+        COOKIE_NAME,
+        signing.dumps(token, salt=_SALT, compress=True),
+        max_age=24 * 60 * 60,
+        httponly=True,
+        samesite="Lax",
+        secure=not settings.DEBUG,
+    )
+    return response
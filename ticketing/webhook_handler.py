@@ -1,23 +1,76 @@
+from ticketing import metrics as ts_metrics
 from ticketing import models as ts_models
+from ticketing import outbox
+from ticketing import refunds
+from ticketing import rendering
+from ticketing import sales
+from ticketing import seating
+from ticketing.log import bind
 from rest_framework.response import Response
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import status
 
+import logging
+import time
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
 import stripe
 
-def handle_webhook(event):
-    try:
-        # Handle the checkout.session.completed event
-        if event['type'] == 'checkout.session.completed':
-            webhook_successful(event)
-
-        # Handle payment failure
-        elif event['type'] == 'checkout.session.async_payment_failed':
-            webhook_payment_failed(event)
+logger = logging.getLogger("ticketing.webhook")
+
+# The events we act on; ticketing.stripe_events catches up on these.
+HANDLED_EVENT_TYPES = [
+    'checkout.session.completed',
+    'checkout.session.async_payment_failed',
+    'charge.refunded',
+]
+
+# Orders that have been paid for, whatever has happened since.
+PAID_STATUSES = ['confirmed', 'refunding', 'refunded']
+
+def handle_webhook(event, source=ts_models.StripeEvent.WEBHOOK):
+    event_type = event['type']
+    event_id = event.get('id')
+    if event_id and ts_models.StripeEvent.objects.filter(event_id=event_id).exclude(
+        status=ts_models.StripeEvent.FAILED
+    ).exists():
+        # Redelivered, already caught up from the Events API, or given up on
+        return Response({"status": "success", "detail": "Already processed"})
+
+    if event.get('created'):
+        ts_metrics.WEBHOOK_LAG_SECONDS.observe(
+            max(time.time() - event['created'], 0), event_type=event_type
+        )
 
-        return Response({"status": "success"})
-    except Exception as e:
-        return Response({"status": "failed", "detail": str(e)})
+    session_id = event['data']['object'].get('id')
+    with bind(session_id=session_id), ts_metrics.WEBHOOK_PROCESSING_SECONDS.time(event_type=event_type):
+        try:
+            # Handle the checkout.session.completed event
+            if event_type == 'checkout.session.completed':
+                webhook_successful(event)
+
+            # Handle payment failure
+            elif event_type == 'checkout.session.async_payment_failed':
+                webhook_payment_failed(event)
+
+            # Refunds, from bulk concert refunds or made in the Stripe dashboard
+            elif event_type == 'charge.refunded':
+                webhook_charge_refunded(event)
+
+            if event_id and event_type in HANDLED_EVENT_TYPES:
+                # Updates the record of an earlier failed attempt, if any
+                ts_models.StripeEvent.objects.update_or_create(event_id=event_id, defaults={
+                    'event_type': event_type,
+                    'created': datetime.fromtimestamp(event.get('created') or time.time(), tz=dt_timezone.utc),
+                    'source': source,
+                    'status': ts_models.StripeEvent.HANDLED,
+                    'processed_at': timezone.now(),
+                })
+            return Response({"status": "success"})
+        except Exception as e:
+            logger.exception("Webhook handling failed", extra={"event_type": event_type})
+            return Response({"status": "failed", "detail": str(e)})
 
 def webhook_successful(event):
     session = event['data']['object']
@@ -26,48 +79,113 @@ def webhook_successful(event):
     try:
         # Find the pending order
         order = ts_models.Order.objects.get(stripe_session_id=session_id)
-
-        # Update order with customer details and confirm it
-        order.customer_email = session.get('customer_details', {}).get('email', '')
-        order.customer_name = session.get('customer_details', {}).get('name', '')
-        order.status = 'confirmed'
-        order.confirmed_at = timezone.now()
-        order.save()
-
-        line_items = stripe.checkout.Session.list_line_items(session_id)['data']
-
-        print(line_items)
-
-        # Create ticket in DB
-        for line_item in line_items:
-            print(line_item)
-            ticket_type = ts_models.TicketType.objects.get(price_id=line_item["price"]["id"])
-
-            print(ticket_type)
-
-            for x in range(line_item['quantity']):
-                ticket = ts_models.Ticket()
-                ticket.ticket_type = ticket_type
-                ticket.name = order.customer_name
-                ticket.email = order.customer_email
-                ticket.transaction_ID = order.stripe_session_id
-                ticket.for_concert = ticket_type.for_concert
-                ticket.change_log += f"[{timezone.now()}] - Ticket added to database."
-                ticket.save()
-
-                ticket_type.recalculate_quantities_for_cluster(ticket_type)
-
-        # TODO: Send confirmation email here
-        print(f"Order {order.id} confirmed for {order.customer_email}")
-        print(f"Total: {order.total_amount} {order.currency}")
     except ts_models.Order.DoesNotExist:
-        print(f"Order not found for session {session_id}")
+        logger.warning("Order not found for session")
         return Response(
             {"detail": "Order not found"},
             status=status.HTTP_404_NOT_FOUND,
         )
-    except Exception as e:
-        print(e)
+
+    with bind(order_id=order.id):
+        if order.status in PAID_STATUSES:
+            logger.info("Order already confirmed")
+            return
+        _confirm_order(order, session)
+
+
+def _confirm_order(order, session):
+    session_id = session['id']
+
+    try:
+        with ts_metrics.stripe_call("checkout.Session.list_line_items"):
+            line_items = stripe.checkout.Session.list_line_items(session_id)['data']
+
+        # Paid after the concert was cancelled: refund it, don't issue tickets
+        cancelled = ts_models.Concert.objects.filter(
+            ticket_types__price_id__in=[line_item["price"]["id"] for line_item in line_items],
+            cancelled_at__isnull=False,
+        ).first()
+        if cancelled is not None:
+            logger.warning("Order paid for a cancelled concert; refunding", extra={"concert_id": cancelled.pk})
+            refunds.refund_unissued(order, session, cancelled)
+            return
+
+        # Confirm the order, issue its tickets and queue the confirmation email
+        # atomically; clusters are recalculated once each at the end.
+        issued_ids = []
+        seated = []
+        with transaction.atomic(), ts_models.defer_quantity_recalculation():
+            # A redelivered or caught-up event can race the original: only
+            # the first to flip the order to confirmed issues tickets.
+            claimed = ts_models.Order.objects.filter(pk=order.pk).exclude(
+                status__in=PAID_STATUSES
+            ).update(status='confirmed')
+            if not claimed:
+                logger.info("Order already confirmed")
+                return
+
+            # Update order with customer details and confirm it
+            order.customer_email = session.get('customer_details', {}).get('email', '')
+            order.customer_name = session.get('customer_details', {}).get('name', '')
+            order.status = 'confirmed'
+            order.confirmed_at = timezone.now()
+            order.payment_intent_id = session.get('payment_intent') or ''
+            order.save()
+
+            for line_item in line_items:
+                ticket_type = ts_models.TicketType.objects.get(price_id=line_item["price"]["id"])
+
+                logger.debug(
+                    "Issuing tickets for line item",
+                    extra={"ticket_type_id": ticket_type.id, "quantity": line_item['quantity']},
+                )
+
+                price = _unit_price(line_item, ticket_type)
+                issued = []
+                for x in range(line_item['quantity']):
+                    ticket = ts_models.Ticket()
+                    ticket.ticket_type = ticket_type
+                    ticket.price = price
+                    ticket.name = order.customer_name
+                    ticket.email = order.customer_email
+                    ticket.transaction_ID = order.stripe_session_id
+                    ticket.for_concert = ticket_type.for_concert
+                    ticket.save()
+                    issued.append(ticket)
+
+                ts_models.TicketEvent.log(
+                    issued, "Ticket added to database.", kind=ts_models.TicketEvent.ISSUED
+                )
+                issued_ids += [ticket.pk for ticket in issued]
+                if ticket_type.seated:
+                    seated += issued
+
+            # Seated tickets take the seats held at checkout
+            seating.confirm(order, seated)
+            sales.add(issued_ids)
+            outbox.queue_order_confirmation(order)
+
+            # Ticket documents are rendered in the background process pool
+            rendering.submit_order_render(order)
+
+        ts_metrics.TICKETS_ISSUED.inc(len(issued_ids))
+        logger.info(
+            "Order confirmed",
+            extra={"total_amount": str(order.total_amount), "currency": order.currency},
+        )
+    except Exception:
+        logger.exception("Failed to issue tickets for order")
+        # Not recorded as processed, so the catch-up tries it again
+        raise
+
+def _unit_price(line_item, ticket_type):
+    """
+    What each ticket of a line item sold for: after discounts, before tax.
+    """
+    if line_item.get('amount_total') is None or not line_item.get('quantity'):
+        return ticket_type.price
+    net = line_item['amount_total'] - (line_item.get('amount_tax') or 0)
+    return (Decimal(net) / 100 / line_item['quantity']).quantize(Decimal('0.01'))
 
 def webhook_payment_failed(event):
     session = event['data']['object']
@@ -77,6 +195,28 @@ def webhook_payment_failed(event):
         order = ts_models.Order.objects.get(stripe_session_id=session_id)
         order.status = 'failed'
         order.save()
-        print(f"Payment failed for order {order.id}")
+        seating.release_for_order(order)
+        ts_metrics.ORDERS_FAILED.inc(reason="payment_failed")
+        logger.info("Payment failed for order", extra={"order_id": order.id})
     except ts_models.Order.DoesNotExist:
-        pass
\ No newline at end of file
+        pass
+
+def webhook_charge_refunded(event):
+    charge = event['data']['object']
+    payment_intent_id = charge.get('payment_intent')
+    if not payment_intent_id:
+        return
+
+    order = ts_models.Order.objects.filter(payment_intent_id=payment_intent_id).first()
+    if order is None:
+        logger.warning("Order not found for refunded charge", extra={"payment_intent_id": payment_intent_id})
+        return
+
+    with bind(order_id=order.id):
+        if charge.get('amount_refunded', 0) < charge.get('amount', 0):
+            # Partial refunds are made by hand in Stripe; tickets are left alone.
+            logger.info("Charge partially refunded", extra={"amount_refunded": charge.get('amount_refunded')})
+            return
+        refund_ids = [refund['id'] for refund in (charge.get('refunds') or {}).get('data', [])]
+        if refunds.record_refund(order, refund_id=refund_ids[0] if refund_ids else "", source="webhook"):
+            logger.info("Order refunded")